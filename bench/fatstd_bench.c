@@ -0,0 +1,1473 @@
+/*
+ * fatstd_bench: per-call latency/throughput microbenchmarks for the C API.
+ *
+ * Each case runs its operation in a calibrated loop (Go testing.B style) until
+ * the loop takes at least the target bench time, then reports ns/op, Go heap
+ * allocations/op (via fat_GoMemStats) and, for payload-driven cases, MB/s.
+ *
+ * Usage: fatstd_bench [--json] [--benchtime-ms N] [--filter SUBSTR]... [--list]
+ *
+ * A case runs if its "family/name" contains any --filter substring (all cases
+ * run when none is given).
+ *
+ * With --json, a single JSON document is written to stdout; this is the form
+ * consumed by scripts/python_tests/bench_fatstd_shared.py.
+ */
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "fat/base64.h"
+#include "fat/bytes.h"
+#include "fat/bytes_buffer.h"
+#include "fat/bytes_ring.h"
+#include "fat/conv.h"
+#include "fat/csv.h"
+#include "fat/error.h"
+#include "fat/go.h"
+#include "fat/gzip.h"
+#include "fat/json.h"
+#include "fat/matcher.h"
+#include "fat/replacer.h"
+#include "fat/socket.h"
+#include "fat/split_iter.h"
+#include "fat/string.h"
+#include "fat/string_rope.h"
+#include "fat/tar.h"
+#include "fat/tiled.h"
+#include "fat/version.h"
+#include "fat/xml.h"
+#include "fat/zip.h"
+#include "fat/zlib.h"
+
+typedef struct bench_Case {
+  const char *family;
+  const char *name;
+  size_t bytes_per_op; /* payload processed per op, 0 if not meaningful */
+  bool (*setup)(void);
+  bool (*run)(uint64_t n);
+  void (*teardown)(void);
+} bench_Case;
+
+static char bench_error[256];
+
+static bool bench_fail(const char *what, fat_Status st, fat_Error err) {
+  size_t n = (size_t)snprintf(bench_error, sizeof bench_error, "%s: status %d", what, (int)st);
+  if (err != 0) {
+    fat_String msg = fat_ErrorMessage(err);
+    if (n + 2 < sizeof bench_error) {
+      bench_error[n] = ':';
+      bench_error[n + 1] = ' ';
+      fat_StringCopyOutCStr(msg, bench_error + n + 2, sizeof bench_error - n - 2);
+    }
+    fat_StringFree(msg);
+    fat_ErrorFree(err);
+  }
+  return false;
+}
+
+/* Cleanup paths that cannot report anything useful still have to pass an
+ * out_err; the error, if any, is freed and dropped. */
+static fat_Error bench_discard;
+
+static void bench_ignore(fat_Status st) {
+  (void)st;
+  if (bench_discard != 0) {
+    fat_ErrorFree(bench_discard);
+    bench_discard = 0;
+  }
+}
+
+static uint64_t bench_now_ns(void) {
+  struct timespec ts;
+  timespec_get(&ts, TIME_UTC);
+  return (uint64_t)ts.tv_sec * 1000000000u + (uint64_t)ts.tv_nsec;
+}
+
+static void bench_fill(uint8_t *dst, size_t n) {
+  static const char alphabet[] = "The quick brown fox jumps over the lazy dog 0123456789\n";
+  for (size_t i = 0; i < n; i++) {
+    dst[i] = (uint8_t)alphabet[i % (sizeof alphabet - 1)];
+  }
+}
+
+/* ---- shared payloads ---------------------------------------------------- */
+
+enum {
+  BENCH_SMALL = 32,
+  BENCH_1K = 1024,
+  BENCH_4K = 4096,
+  BENCH_64K = 65536,
+};
+
+static uint8_t bench_payload[BENCH_64K];
+static uint8_t bench_scratch[BENCH_64K];
+
+/* ---- string ------------------------------------------------------------- */
+
+static fat_String bench_str_1k;
+static fat_String bench_str_needle;
+static fat_String bench_str_sep;
+static fat_StringArray bench_str_lines;
+static fat_StringRope bench_rope_64k;
+static fat_Replacer bench_replacer;
+
+static bool string_setup(void) {
+  bench_str_1k = fat_StringNewUTF8N((const char *)bench_payload, BENCH_1K);
+  bench_str_needle = fat_StringNewUTF8("lazy cat");
+  bench_str_sep = fat_StringNewUTF8("\n");
+  bench_str_lines = fat_StringSplit(bench_str_1k, bench_str_sep);
+  fat_String pairs = fat_StringNewUTF8("fox|cat|dog|wolf|lazy|busy|\n|\r\n");
+  fat_String bar = fat_StringNewUTF8("|");
+  fat_StringArray oldnew = fat_StringSplit(pairs, bar);
+  bench_replacer = fat_ReplacerNew(oldnew);
+  fat_StringArrayFree(oldnew);
+  fat_StringFree(bar);
+  fat_StringFree(pairs);
+  bench_rope_64k = fat_StringRopeNew();
+  fat_StringRopeInsertUTF8N(bench_rope_64k, 0, (const char *)bench_payload, BENCH_64K);
+  return true;
+}
+
+static void string_teardown(void) {
+  fat_StringFree(bench_str_1k);
+  fat_StringFree(bench_str_needle);
+  fat_StringFree(bench_str_sep);
+  fat_StringArrayFree(bench_str_lines);
+  fat_StringRopeFree(bench_rope_64k);
+  fat_ReplacerFree(bench_replacer);
+}
+
+static bool string_new_free(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringFree(fat_StringNewUTF8N((const char *)bench_payload, BENCH_SMALL));
+  }
+  return true;
+}
+
+static bool string_len(uint64_t n) {
+  size_t sink = 0;
+  for (uint64_t i = 0; i < n; i++) {
+    sink += fat_StringLenBytes(bench_str_1k);
+  }
+  return sink != 0;
+}
+
+static bool string_copy_out_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringCopyOut(bench_str_1k, bench_scratch, BENCH_1K);
+  }
+  return true;
+}
+
+static bool string_contains_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (fat_StringContains(bench_str_1k, bench_str_needle)) {
+      return bench_fail("fat_StringContains", FAT_OK, 0);
+    }
+  }
+  return true;
+}
+
+static bool string_to_lower_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringFree(fat_StringToLower(bench_str_1k));
+  }
+  return true;
+}
+
+static bool string_split_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringArrayFree(fat_StringSplit(bench_str_1k, bench_str_sep));
+  }
+  return true;
+}
+
+static bool string_split_borrow_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringArray lines = fat_StringSplit(bench_str_1k, bench_str_sep);
+    const size_t *offsets = NULL;
+    size_t count = 0;
+    fat_Borrow borrow = 0;
+    fat_StringArrayBorrow(lines, &offsets, &count, &borrow);
+    fat_BorrowRelease(borrow);
+    fat_StringArrayFree(lines);
+  }
+  return true;
+}
+
+static bool string_split_iter_1k(uint64_t n) {
+  size_t offsets[32];
+  size_t lens[32];
+  for (uint64_t i = 0; i < n; i++) {
+    fat_SplitIter it = fat_StringSplitIterNew(bench_str_1k, bench_str_sep, -1);
+    while (fat_SplitIterNextBatch(it, offsets, lens, 32) == 32) {
+    }
+    fat_SplitIterFree(it);
+  }
+  return true;
+}
+
+/* Tokenizes with repeated fat_StringCut; every handle is a view of the input. */
+static bool string_cut_lines_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_String rest = bench_str_1k;
+    bool more = true;
+    while (more) {
+      fat_String line = 0;
+      fat_String after = 0;
+      more = fat_StringCut(rest, bench_str_sep, &line, &after);
+      fat_StringFree(line);
+      if (rest != bench_str_1k) {
+        fat_StringFree(rest);
+      }
+      rest = after;
+    }
+    fat_StringFree(rest);
+  }
+  return true;
+}
+
+static bool string_replacer_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringFree(fat_ReplacerReplace(bench_replacer, bench_str_1k));
+  }
+  return true;
+}
+
+/* One small insert plus the matching delete into a 64 KiB document. */
+static bool string_rope_edit_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    size_t off = (size_t)((i * 7919u) % BENCH_64K);
+    fat_StringRopeInsertUTF8N(bench_rope_64k, off, "{{name}}", 8);
+    fat_StringRopeDelete(bench_rope_64k, off, 8);
+  }
+  return true;
+}
+
+static bool string_array_to_lower_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringArrayFree(fat_StringArrayToLower(bench_str_lines));
+  }
+  return true;
+}
+
+/* ---- bytes -------------------------------------------------------------- */
+
+static fat_Bytes bench_bytes_64k;
+static fat_Bytes bench_bytes_needle;
+static fat_Bytes bench_bytes_mixed_64k;
+static fat_Matcher bench_matcher;
+
+/* Mixed-script text: whole lines of Latin, Cyrillic and CJK, padded with
+ * ASCII so no rune is cut at the 64 KiB boundary. */
+static void bench_fill_mixed(uint8_t *dst, size_t n) {
+  static const char line[] = "Gr\xc3\xbc\xc3\x9f\x65 aus K\xc3\xb6ln, \xd0\xbf\xd1\x80\xd0\xb8\xd0\xb2"
+                             "\xd0\xb5\xd1\x82 \xe6\x97\xa5\xe6\x9c\xac\xe8\xaa\x9e text 42\n";
+  size_t i = 0;
+  for (; i + sizeof line - 1 <= n; i += sizeof line - 1) {
+    memcpy(dst + i, line, sizeof line - 1);
+  }
+  memset(dst + i, '.', n - i);
+}
+
+static bool bytes_setup(void) {
+  bench_bytes_64k = fat_BytesNewN(bench_payload, BENCH_64K);
+  bench_fill_mixed(bench_scratch, BENCH_64K);
+  bench_bytes_mixed_64k = fat_BytesNewN(bench_scratch, BENCH_64K);
+  bench_bytes_needle = fat_BytesNewN("lazy cat", 8);
+
+  fat_String words = fat_StringNewUTF8("fox dog lazy cat quick 42 jumps");
+  fat_StringArray patterns = fat_StringFields(words);
+  fat_Error err = 0;
+  fat_Status st = fat_MatcherNew(patterns, &bench_matcher, &err);
+  fat_StringArrayFree(patterns);
+  fat_StringFree(words);
+  if (st != FAT_OK) {
+    return bench_fail("fat_MatcherNew", st, err);
+  }
+  return true;
+}
+
+static void bytes_teardown(void) {
+  fat_BytesFree(bench_bytes_64k);
+  fat_BytesFree(bench_bytes_needle);
+  fat_BytesFree(bench_bytes_mixed_64k);
+  if (bench_matcher != 0) {
+    fat_MatcherFree(bench_matcher);
+    bench_matcher = 0;
+  }
+}
+
+static bool bytes_new_free_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_BytesFree(fat_BytesNewN(bench_payload, BENCH_1K));
+  }
+  return true;
+}
+
+static bool bytes_copy_out_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_BytesCopyOut(bench_bytes_64k, bench_scratch, BENCH_64K);
+  }
+  return true;
+}
+
+static bool bytes_borrow_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    size_t len = 0;
+    fat_Borrow borrow = 0;
+    fat_BytesBorrow(bench_bytes_64k, &len, &borrow);
+    fat_BorrowRelease(borrow);
+  }
+  return true;
+}
+
+static bool bytes_index_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (fat_BytesIndex(bench_bytes_64k, bench_bytes_needle) != -1) {
+      return bench_fail("fat_BytesIndex", FAT_OK, 0);
+    }
+  }
+  return true;
+}
+
+static bool bytes_matcher_count_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (fat_MatcherCountBytes(bench_matcher, bench_bytes_64k) == 0) {
+      return bench_fail("fat_MatcherCountBytes", FAT_OK, 0);
+    }
+  }
+  return true;
+}
+
+static bool bytes_is_valid_utf8_ascii_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (!fat_BytesIsValidUTF8(bench_bytes_64k)) {
+      return bench_fail("fat_BytesIsValidUTF8", FAT_OK, 0);
+    }
+  }
+  return true;
+}
+
+static bool bytes_is_valid_utf8_mixed_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (!fat_BytesIsValidUTF8(bench_bytes_mixed_64k)) {
+      return bench_fail("fat_BytesIsValidUTF8", FAT_OK, 0);
+    }
+  }
+  return true;
+}
+
+static bool bytes_to_lower_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_BytesFree(fat_BytesToLower(bench_bytes_64k));
+  }
+  return true;
+}
+
+/* ---- buffer ------------------------------------------------------------- */
+
+static fat_BytesBuffer bench_buffer;
+static fat_BytesRing bench_ring;
+
+static bool buffer_setup(void) {
+  bench_buffer = fat_BytesBufferNew();
+  fat_BytesBufferGrow(bench_buffer, BENCH_64K);
+  bench_ring = fat_BytesRingNew(BENCH_64K, false);
+  return true;
+}
+
+static void buffer_teardown(void) {
+  fat_BytesRingFree(bench_ring);
+  fat_BytesBufferFree(bench_buffer);
+}
+
+static bool buffer_write_64(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if ((i & 1023) == 0) {
+      fat_BytesBufferReset(bench_buffer);
+    }
+    fat_BytesBufferWrite(bench_buffer, bench_payload, 64);
+  }
+  return true;
+}
+
+static bool buffer_write_read(uint64_t n, size_t size) {
+  fat_BytesBufferReset(bench_buffer);
+  for (uint64_t i = 0; i < n; i++) {
+    bool eof = false;
+    fat_BytesBufferWrite(bench_buffer, bench_payload, size);
+    fat_BytesBufferRead(bench_buffer, bench_scratch, size, &eof);
+  }
+  return true;
+}
+
+static bool buffer_write_read_1k(uint64_t n) {
+  return buffer_write_read(n, BENCH_1K);
+}
+
+static bool buffer_write_read_64k(uint64_t n) {
+  return buffer_write_read(n, BENCH_64K);
+}
+
+/*
+ * Same round trip with the bytes filled and parsed in place, as a recv loop
+ * would: the memcpy stands in for recv writing into the reserved region.
+ */
+static bool buffer_reserve_peek(uint64_t n, size_t size) {
+  fat_BytesBufferReset(bench_buffer);
+  for (uint64_t i = 0; i < n; i++) {
+    size_t len = 0;
+    memcpy(fat_BytesBufferReserve(bench_buffer, size), bench_payload, size);
+    fat_BytesBufferCommit(bench_buffer, size);
+    const uint8_t *p = fat_BytesBufferPeek(bench_buffer, &len);
+    if (len != size || p[0] != bench_payload[0]) {
+      return bench_fail("fat_BytesBufferPeek", FAT_ERR_SYNTAX, 0);
+    }
+    fat_BytesBufferConsume(bench_buffer, len);
+  }
+  return true;
+}
+
+static bool buffer_reserve_peek_1k(uint64_t n) {
+  return buffer_reserve_peek(n, BENCH_1K);
+}
+
+static bool buffer_reserve_peek_64k(uint64_t n) {
+  return buffer_reserve_peek(n, BENCH_64K);
+}
+
+/* The same round trips through a fixed-capacity ring. */
+static bool buffer_ring_write_read(uint64_t n, size_t size) {
+  for (uint64_t i = 0; i < n; i++) {
+    bool eof = false;
+    fat_BytesRingWrite(bench_ring, bench_payload, size);
+    if (fat_BytesRingRead(bench_ring, bench_scratch, size, &eof) != size) {
+      return bench_fail("fat_BytesRingRead", FAT_ERR_SYNTAX, 0);
+    }
+  }
+  return true;
+}
+
+static bool buffer_ring_write_read_1k(uint64_t n) {
+  return buffer_ring_write_read(n, BENCH_1K);
+}
+
+static bool buffer_ring_write_read_64k(uint64_t n) {
+  return buffer_ring_write_read(n, BENCH_64K);
+}
+
+static bool buffer_ring_reserve_peek_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    uint8_t *dst = NULL;
+    uint8_t *dst2 = NULL;
+    const uint8_t *src = NULL;
+    const uint8_t *src2 = NULL;
+    size_t len = 0;
+    size_t len2 = 0;
+    bool eof = false;
+    fat_BytesRingReserve(bench_ring, &dst, &len, &dst2, &len2);
+    memcpy(dst, bench_payload, len);
+    fat_BytesRingCommit(bench_ring, len);
+    if (fat_BytesRingPeek(bench_ring, &src, &len, &src2, &len2, &eof) != BENCH_64K || src[0] != bench_payload[0]) {
+      return bench_fail("fat_BytesRingPeek", FAT_ERR_SYNTAX, 0);
+    }
+    fat_BytesRingConsume(bench_ring, len + len2);
+  }
+  return true;
+}
+
+/* Request-scoped scratch buffer: a fresh one per request versus the pool. */
+static bool buffer_new_free_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_BytesBuffer b = fat_BytesBufferNew();
+    fat_BytesBufferGrow(b, BENCH_64K);
+    fat_BytesBufferWrite(b, bench_payload, BENCH_1K);
+    fat_BytesBufferFree(b);
+  }
+  return true;
+}
+
+static bool buffer_acquire_release_64k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_BytesBuffer b = fat_BytesBufferAcquire(BENCH_64K);
+    fat_BytesBufferWrite(b, bench_payload, BENCH_1K);
+    fat_BytesBufferRelease(b);
+  }
+  return true;
+}
+
+static bool buffer_bytes_1k(uint64_t n) {
+  fat_BytesBufferReset(bench_buffer);
+  fat_BytesBufferWrite(bench_buffer, bench_payload, BENCH_1K);
+  for (uint64_t i = 0; i < n; i++) {
+    fat_BytesFree(fat_BytesBufferBytes(bench_buffer));
+  }
+  return true;
+}
+
+/* ---- conv --------------------------------------------------------------- */
+
+enum { BENCH_CONV_CELLS = 1024 };
+
+static fat_String bench_conv_int;
+static fat_String bench_conv_float;
+static fat_Bytes bench_conv_column;
+static fat_StringArray bench_conv_cells;
+static fat_StringArray bench_conv_readings;
+static int64_t bench_conv_values[BENCH_CONV_CELLS];
+static double bench_conv_doubles[BENCH_CONV_CELLS];
+static uint8_t bench_conv_status[BENCH_CONV_CELLS];
+static fat_BytesBuffer bench_conv_buffer;
+
+static bool conv_setup(void) {
+  bench_conv_int = fat_StringNewUTF8("-9223372036854775807");
+  bench_conv_float = fat_StringNewUTF8("3.14159265358979");
+  bench_conv_buffer = fat_BytesBufferNew();
+  fat_BytesBufferGrow(bench_conv_buffer, BENCH_64K);
+
+  /* One integer per line, as in a numeric CSV column. */
+  size_t len = 0;
+  for (int i = 0; i < BENCH_CONV_CELLS; i++) {
+    len += (size_t)snprintf((char *)bench_scratch + len, BENCH_64K - len, "%d\n", i * 7919 - 4000000);
+  }
+  bench_conv_column = fat_BytesNewN(bench_scratch, len - 1);
+  fat_String text = fat_StringNewUTF8N((const char *)bench_scratch, len - 1);
+  fat_String nl = fat_StringNewUTF8("\n");
+  bench_conv_cells = fat_StringSplit(text, nl);
+  fat_StringFree(text);
+
+  /* Sensor readings with a few decimals, as in a telemetry log. */
+  len = 0;
+  for (int i = 0; i < BENCH_CONV_CELLS; i++) {
+    bench_conv_doubles[i] = (double)(i * 7919 % 100000 - 50000) / 100.0;
+    len += (size_t)snprintf((char *)bench_scratch + len, BENCH_64K - len, "%.2f\n", bench_conv_doubles[i]);
+  }
+  text = fat_StringNewUTF8N((const char *)bench_scratch, len - 1);
+  bench_conv_readings = fat_StringSplit(text, nl);
+  fat_StringFree(nl);
+  fat_StringFree(text);
+  return true;
+}
+
+static void conv_teardown(void) {
+  fat_StringFree(bench_conv_int);
+  fat_StringFree(bench_conv_float);
+  fat_BytesFree(bench_conv_column);
+  fat_StringArrayFree(bench_conv_cells);
+  fat_StringArrayFree(bench_conv_readings);
+  fat_BytesBufferFree(bench_conv_buffer);
+}
+
+static bool conv_format_int(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringFree(fat_ConvFormatInt((int64_t)i, 10));
+  }
+  return true;
+}
+
+static bool conv_format_float(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringFree(fat_ConvFormatFloat((double)i * 0.1, 'g', -1, 64));
+  }
+  return true;
+}
+
+static bool conv_format_int_into(uint64_t n) {
+  char digits[24];
+  for (uint64_t i = 0; i < n; i++) {
+    fat_ConvFormatIntInto((int64_t)i, 10, digits, sizeof digits);
+  }
+  return true;
+}
+
+static bool conv_format_float_into(uint64_t n) {
+  char digits[32];
+  for (uint64_t i = 0; i < n; i++) {
+    fat_ConvFormatFloatInto((double)i * 0.1, 'g', -1, 64, digits, sizeof digits);
+  }
+  return true;
+}
+
+/* Metrics-emitter shape: append a value and a separator, reusing one buffer. */
+static bool conv_write_int(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if ((i & 4095) == 0) {
+      fat_BytesBufferReset(bench_conv_buffer);
+    }
+    fat_ConvWriteInt(bench_conv_buffer, (int64_t)i, 10);
+  }
+  return true;
+}
+
+static bool conv_parse_int(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    int64_t v = 0;
+    fat_Error err = 0;
+    fat_Status st = fat_ConvParseInt(bench_conv_int, 10, 64, &v, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_ConvParseInt", st, err);
+    }
+  }
+  return true;
+}
+
+static bool conv_parse_float(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    double v = 0;
+    fat_Error err = 0;
+    fat_Status st = fat_ConvParseFloat(bench_conv_float, 64, &v, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_ConvParseFloat", st, err);
+    }
+  }
+  return true;
+}
+
+static bool conv_parse_int_array_1024(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (fat_ConvParseIntArray(bench_conv_cells, 10, 64, bench_conv_values, bench_conv_status, BENCH_CONV_CELLS) != 0) {
+      return bench_fail("fat_ConvParseIntArray", FAT_ERR_SYNTAX, 0);
+    }
+  }
+  return true;
+}
+
+static bool conv_parse_int_delimited_1024(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    size_t count = 0;
+    size_t failed = fat_ConvParseIntDelimited(
+      bench_conv_column, '\n', 10, 64, bench_conv_values, bench_conv_status, BENCH_CONV_CELLS, &count
+    );
+    if (failed != 0 || count != BENCH_CONV_CELLS) {
+      return bench_fail("fat_ConvParseIntDelimited", FAT_ERR_SYNTAX, 0);
+    }
+  }
+  return true;
+}
+
+static bool conv_parse_float_array_1024(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    size_t failed =
+      fat_ConvParseFloatArray(bench_conv_readings, 64, bench_conv_doubles, bench_conv_status, BENCH_CONV_CELLS);
+    if (failed != 0) {
+      return bench_fail("fat_ConvParseFloatArray", FAT_ERR_SYNTAX, 0);
+    }
+  }
+  return true;
+}
+
+static bool conv_write_float_array_1024(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_BytesBufferReset(bench_conv_buffer);
+    fat_ConvWriteFloatArray(bench_conv_buffer, bench_conv_doubles, BENCH_CONV_CELLS, 'g', -1, 64, '\n');
+  }
+  return true;
+}
+
+/* ---- json --------------------------------------------------------------- */
+
+static fat_Bytes bench_json_doc;
+
+static bool json_setup(void) {
+  char doc[BENCH_4K];
+  size_t len = 0;
+  doc[len++] = '[';
+  for (int i = 0; i < 16; i++) {
+    len += (size_t)snprintf(doc + len, sizeof doc - len,
+                            "%s{\"id\": %d, \"name\": \"item-%d\", \"tags\": [\"a\", \"b\"], \"score\": %d.5}",
+                            i == 0 ? "" : ", ", i, i, i * 3);
+  }
+  doc[len++] = ']';
+  bench_json_doc = fat_BytesNewN(doc, len);
+  return true;
+}
+
+static void json_teardown(void) {
+  fat_BytesFree(bench_json_doc);
+}
+
+static bool json_valid(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (!fat_JsonValid(bench_json_doc)) {
+      return bench_fail("fat_JsonValid", FAT_ERR_SYNTAX, 0);
+    }
+  }
+  return true;
+}
+
+static bool json_unmarshal(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_JsonValue v = 0;
+    fat_Error err = 0;
+    fat_Status st = fat_JsonUnmarshal(bench_json_doc, &v, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_JsonUnmarshal", st, err);
+    }
+    fat_JsonValueFree(v);
+  }
+  return true;
+}
+
+static bool json_compact(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_Bytes out = 0;
+    fat_Error err = 0;
+    fat_Status st = fat_JsonCompact(bench_json_doc, &out, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_JsonCompact", st, err);
+    }
+    fat_BytesFree(out);
+  }
+  return true;
+}
+
+/* ---- xml ---------------------------------------------------------------- */
+
+static fat_Bytes bench_xml_doc;
+
+static bool xml_setup(void) {
+  char doc[BENCH_4K];
+  size_t len = (size_t)snprintf(doc, sizeof doc, "<?xml version=\"1.0\"?><items>");
+  for (int i = 0; i < 16; i++) {
+    len += (size_t)snprintf(doc + len, sizeof doc - len, "<item id=\"%d\" kind=\"k%d\">value %d &amp; more</item>",
+                            i, i % 4, i);
+  }
+  len += (size_t)snprintf(doc + len, sizeof doc - len, "</items>");
+  bench_xml_doc = fat_BytesNewN(doc, len);
+  return true;
+}
+
+static void xml_teardown(void) {
+  fat_BytesFree(bench_xml_doc);
+}
+
+static bool xml_decode_tokens(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_XmlDecoder dec = fat_XmlDecoderNewBytes(bench_xml_doc);
+    fat_Error err = 0;
+    fat_Status st;
+    for (;;) {
+      fat_XmlToken tok = 0;
+      st = fat_XmlDecoderToken(dec, &tok, &err);
+      if (st != FAT_OK) {
+        break;
+      }
+      fat_XmlTokenFree(tok);
+    }
+    if (st != FAT_ERR_EOF) {
+      bench_ignore(fat_XmlDecoderFree(dec, &bench_discard));
+      return bench_fail("fat_XmlDecoderToken", st, err);
+    }
+    st = fat_XmlDecoderFree(dec, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_XmlDecoderFree", st, err);
+    }
+  }
+  return true;
+}
+
+/* ---- csv ---------------------------------------------------------------- */
+
+static fat_Bytes bench_csv_doc;
+static fat_String bench_csv_fields[4];
+
+static bool csv_setup(void) {
+  char doc[BENCH_4K];
+  size_t len = (size_t)snprintf(doc, sizeof doc, "id,name,comment,score\n");
+  for (int i = 0; i < 32; i++) {
+    len += (size_t)snprintf(doc + len, sizeof doc - len, "%d,item-%d,\"quoted, with comma\",%d.25\n", i, i, i * 7);
+  }
+  bench_csv_doc = fat_BytesNewN(doc, len);
+  bench_csv_fields[0] = fat_StringNewUTF8("42");
+  bench_csv_fields[1] = fat_StringNewUTF8("item-42");
+  bench_csv_fields[2] = fat_StringNewUTF8("quoted, with comma");
+  bench_csv_fields[3] = fat_StringNewUTF8("294.25");
+  return true;
+}
+
+static void csv_teardown(void) {
+  fat_BytesFree(bench_csv_doc);
+  for (size_t i = 0; i < 4; i++) {
+    fat_StringFree(bench_csv_fields[i]);
+  }
+}
+
+static bool csv_read_all(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_CsvReader r = fat_CsvReaderNewBytes(bench_csv_doc);
+    fat_Error err = 0;
+    fat_Status st;
+    for (;;) {
+      fat_StringArray rec = 0;
+      bool eof = false;
+      st = fat_CsvReaderRead(r, &rec, &eof, &err);
+      if (st != FAT_OK) {
+        break;
+      }
+      fat_StringArrayFree(rec);
+    }
+    fat_CsvReaderFree(r);
+    if (st != FAT_ERR_EOF) {
+      return bench_fail("fat_CsvReaderRead", st, err);
+    }
+  }
+  return true;
+}
+
+static bool csv_write_record(uint64_t n) {
+  fat_BytesBuffer dst = fat_BytesBufferNew();
+  fat_CsvWriter w = fat_CsvWriterNewToBytesBuffer(dst);
+  for (uint64_t i = 0; i < n; i++) {
+    fat_Error err = 0;
+    fat_Status st = fat_CsvWriterWriteRecord(w, bench_csv_fields, 4, &err);
+    if (st != FAT_OK) {
+      fat_CsvWriterFree(w);
+      fat_BytesBufferFree(dst);
+      return bench_fail("fat_CsvWriterWriteRecord", st, err);
+    }
+  }
+  fat_CsvWriterFlush(w);
+  fat_CsvWriterFree(w);
+  fat_BytesBufferFree(dst);
+  return true;
+}
+
+/* ---- base64 ------------------------------------------------------------- */
+
+static fat_Base64Encoding bench_b64;
+static fat_Bytes bench_b64_plain;
+static fat_String bench_b64_encoded;
+
+static bool base64_setup(void) {
+  fat_Error err = 0;
+  fat_Status st = fat_Base64EncodingNewUTF8("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",
+                                            &bench_b64, &err);
+  if (st != FAT_OK) {
+    return bench_fail("fat_Base64EncodingNewUTF8", st, err);
+  }
+  bench_b64_plain = fat_BytesNewN(bench_payload, BENCH_1K);
+  bench_b64_encoded = fat_Base64EncodeToString(bench_b64, bench_b64_plain);
+  return true;
+}
+
+static void base64_teardown(void) {
+  fat_StringFree(bench_b64_encoded);
+  fat_BytesFree(bench_b64_plain);
+  fat_Base64EncodingFree(bench_b64);
+}
+
+static bool base64_encode_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_StringFree(fat_Base64EncodeToString(bench_b64, bench_b64_plain));
+  }
+  return true;
+}
+
+static bool base64_decode_1k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_Bytes out = 0;
+    fat_Error err = 0;
+    fat_Status st = fat_Base64DecodeString(bench_b64, bench_b64_encoded, &out, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_Base64DecodeString", st, err);
+    }
+    fat_BytesFree(out);
+  }
+  return true;
+}
+
+/* ---- compress ----------------------------------------------------------- */
+
+static fat_Bytes bench_plain_4k;
+static fat_Bytes bench_gzip_4k;
+static fat_Bytes bench_zlib_4k;
+
+static bool compress_setup(void) {
+  fat_Error err = 0;
+  fat_Status st;
+  bench_plain_4k = fat_BytesNewN(bench_payload, BENCH_4K);
+  st = fat_GzipCompress(bench_plain_4k, &bench_gzip_4k, &err);
+  if (st != FAT_OK) {
+    return bench_fail("fat_GzipCompress", st, err);
+  }
+  st = fat_ZlibCompress(bench_plain_4k, &bench_zlib_4k, &err);
+  if (st != FAT_OK) {
+    return bench_fail("fat_ZlibCompress", st, err);
+  }
+  return true;
+}
+
+static void compress_teardown(void) {
+  fat_BytesFree(bench_plain_4k);
+  fat_BytesFree(bench_gzip_4k);
+  fat_BytesFree(bench_zlib_4k);
+}
+
+static bool compress_round(uint64_t n, fat_Status (*fn)(fat_Bytes, fat_Bytes *, fat_Error *), fat_Bytes src,
+                           const char *what) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_Bytes out = 0;
+    fat_Error err = 0;
+    fat_Status st = fn(src, &out, &err);
+    if (st != FAT_OK) {
+      return bench_fail(what, st, err);
+    }
+    fat_BytesFree(out);
+  }
+  return true;
+}
+
+static bool compress_gzip_4k(uint64_t n) {
+  return compress_round(n, fat_GzipCompress, bench_plain_4k, "fat_GzipCompress");
+}
+
+static bool compress_gunzip_4k(uint64_t n) {
+  return compress_round(n, fat_GzipDecompress, bench_gzip_4k, "fat_GzipDecompress");
+}
+
+static bool compress_zlib_4k(uint64_t n) {
+  return compress_round(n, fat_ZlibCompress, bench_plain_4k, "fat_ZlibCompress");
+}
+
+static bool compress_unzlib_4k(uint64_t n) {
+  return compress_round(n, fat_ZlibDecompress, bench_zlib_4k, "fat_ZlibDecompress");
+}
+
+/* ---- archive ------------------------------------------------------------ */
+
+static fat_String bench_archive_name;
+static fat_Bytes bench_archive_data;
+static fat_Bytes bench_zip_blob;
+static fat_Bytes bench_tar_blob;
+
+static bool archive_write_zip(fat_Bytes *out) {
+  fat_BytesBuffer dst = fat_BytesBufferNew();
+  fat_ZipWriter w = 0;
+  fat_Error err = 0;
+  fat_Status st = fat_ZipWriterNewToBytesBuffer(dst, &w, &err);
+  if (st == FAT_OK) {
+    st = fat_ZipWriterAddBytes(w, bench_archive_name, bench_archive_data, &err);
+    if (st != FAT_OK) {
+      bench_ignore(fat_ZipWriterClose(w, &bench_discard));
+    } else {
+      st = fat_ZipWriterClose(w, &err);
+    }
+  }
+  if (st == FAT_OK && out != NULL) {
+    *out = fat_BytesBufferBytes(dst);
+  }
+  fat_BytesBufferFree(dst);
+  return st == FAT_OK || bench_fail("zip write", st, err);
+}
+
+static bool archive_write_tar(fat_Bytes *out) {
+  fat_BytesBuffer dst = fat_BytesBufferNew();
+  fat_TarWriter w = 0;
+  fat_Error err = 0;
+  fat_Status st = fat_TarWriterNewToBytesBuffer(dst, &w, &err);
+  if (st == FAT_OK) {
+    st = fat_TarWriterAddBytes(w, bench_archive_name, bench_archive_data, &err);
+    if (st != FAT_OK) {
+      bench_ignore(fat_TarWriterClose(w, &bench_discard));
+    } else {
+      st = fat_TarWriterClose(w, &err);
+    }
+  }
+  if (st == FAT_OK && out != NULL) {
+    *out = fat_BytesBufferBytes(dst);
+  }
+  fat_BytesBufferFree(dst);
+  return st == FAT_OK || bench_fail("tar write", st, err);
+}
+
+static bool archive_setup(void) {
+  bench_archive_name = fat_StringNewUTF8("payload.txt");
+  bench_archive_data = fat_BytesNewN(bench_payload, BENCH_4K);
+  return archive_write_zip(&bench_zip_blob) && archive_write_tar(&bench_tar_blob);
+}
+
+static void archive_teardown(void) {
+  fat_BytesFree(bench_zip_blob);
+  fat_BytesFree(bench_tar_blob);
+  fat_BytesFree(bench_archive_data);
+  fat_StringFree(bench_archive_name);
+}
+
+static bool archive_zip_write_4k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (!archive_write_zip(NULL)) {
+      return false;
+    }
+  }
+  return true;
+}
+
+static bool archive_tar_write_4k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (!archive_write_tar(NULL)) {
+      return false;
+    }
+  }
+  return true;
+}
+
+static bool archive_zip_read_4k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_ZipReader r = 0;
+    fat_ZipFileReader fr = 0;
+    fat_Error err = 0;
+    fat_Status st = fat_ZipReaderNewBytes(bench_zip_blob, &r, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_ZipReaderNewBytes", st, err);
+    }
+    fat_ZipFile f = fat_ZipReaderFileByIndex(r, 0);
+    st = fat_ZipFileOpen(f, &fr, &err);
+    while (st == FAT_OK) {
+      size_t got = 0;
+      bool eof = false;
+      st = fat_ZipFileReaderRead(fr, bench_scratch, sizeof bench_scratch, &got, &eof, &err);
+    }
+    if (fr != 0) {
+      bench_ignore(fat_ZipFileReaderClose(fr, &bench_discard));
+    }
+    fat_ZipFileFree(f);
+    bench_ignore(fat_ZipReaderFree(r, &bench_discard));
+    if (st != FAT_ERR_EOF) {
+      return bench_fail("zip read", st, err);
+    }
+  }
+  return true;
+}
+
+static bool archive_tar_read_4k(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    fat_TarReader r = 0;
+    fat_TarHeader h = 0;
+    bool eof = false;
+    fat_Error err = 0;
+    fat_Status st = fat_TarReaderNewBytes(bench_tar_blob, &r, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_TarReaderNewBytes", st, err);
+    }
+    st = fat_TarReaderNext(r, &h, &eof, &err);
+    if (st == FAT_OK) {
+      fat_TarHeaderFree(h);
+    }
+    while (st == FAT_OK) {
+      size_t got = 0;
+      st = fat_TarReaderRead(r, bench_scratch, sizeof bench_scratch, &got, &eof, &err);
+    }
+    bench_ignore(fat_TarReaderFree(r, &bench_discard));
+    if (st != FAT_ERR_EOF) {
+      return bench_fail("tar read", st, err);
+    }
+  }
+  return true;
+}
+
+/* ---- socket ------------------------------------------------------------- */
+
+static fat_TcpListener bench_tcp_listener;
+static fat_TcpConn bench_tcp_client;
+static fat_TcpConn bench_tcp_server;
+static fat_UdpConn bench_udp_server;
+static fat_UdpConn bench_udp_client;
+
+static void socket_teardown(void) {
+  if (bench_tcp_client != 0) {
+    bench_ignore(fat_TcpConnClose(bench_tcp_client, &bench_discard));
+  }
+  if (bench_tcp_server != 0) {
+    bench_ignore(fat_TcpConnClose(bench_tcp_server, &bench_discard));
+  }
+  if (bench_tcp_listener != 0) {
+    bench_ignore(fat_TcpListenerClose(bench_tcp_listener, &bench_discard));
+  }
+  if (bench_udp_client != 0) {
+    bench_ignore(fat_UdpConnClose(bench_udp_client, &bench_discard));
+  }
+  if (bench_udp_server != 0) {
+    bench_ignore(fat_UdpConnClose(bench_udp_server, &bench_discard));
+  }
+  bench_tcp_client = bench_tcp_server = bench_tcp_listener = 0;
+  bench_udp_client = bench_udp_server = 0;
+}
+
+static bool socket_setup(void) {
+  char addr[128];
+  fat_Error err = 0;
+  fat_Status st = fat_TcpListenerListenUTF8("127.0.0.1:0", &bench_tcp_listener, &err);
+  if (st != FAT_OK) {
+    return bench_fail("fat_TcpListenerListenUTF8", st, err);
+  }
+  fat_String s = fat_TcpListenerAddr(bench_tcp_listener);
+  fat_StringCopyOutCStr(s, addr, sizeof addr);
+  fat_StringFree(s);
+  /* The kernel completes the handshake from the listen backlog, so dial then
+   * accept works on a single thread. */
+  st = fat_TcpDialUTF8(addr, &bench_tcp_client, &err);
+  if (st == FAT_OK) {
+    st = fat_TcpListenerAccept(bench_tcp_listener, &bench_tcp_server, &err);
+  }
+  if (st == FAT_OK) {
+    st = fat_UdpListenUTF8("127.0.0.1:0", &bench_udp_server, &err);
+  }
+  if (st == FAT_OK) {
+    s = fat_UdpConnLocalAddr(bench_udp_server);
+    fat_StringCopyOutCStr(s, addr, sizeof addr);
+    fat_StringFree(s);
+    st = fat_UdpDialUTF8(addr, &bench_udp_client, &err);
+  }
+  if (st != FAT_OK) {
+    socket_teardown();
+    return bench_fail("socket setup", st, err);
+  }
+  return true;
+}
+
+static bool socket_tcp_transfer(fat_TcpConn from, fat_TcpConn to, size_t len) {
+  size_t done = 0;
+  fat_Error err = 0;
+  fat_Status st = fat_TcpConnWrite(from, bench_payload, len, &done, &err);
+  if (st != FAT_OK) {
+    return bench_fail("fat_TcpConnWrite", st, err);
+  }
+  for (done = 0; done < len;) {
+    size_t got = 0;
+    bool eof = false;
+    st = fat_TcpConnRead(to, bench_scratch + done, len - done, &got, &eof, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_TcpConnRead", st, err);
+    }
+    done += got;
+  }
+  return true;
+}
+
+static bool socket_tcp_pingpong_64(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (!socket_tcp_transfer(bench_tcp_client, bench_tcp_server, 64) ||
+        !socket_tcp_transfer(bench_tcp_server, bench_tcp_client, 64)) {
+      return false;
+    }
+  }
+  return true;
+}
+
+static bool socket_udp_datagram_64(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    size_t done = 0;
+    fat_String from = 0;
+    fat_Error err = 0;
+    fat_Status st = fat_UdpConnWrite(bench_udp_client, bench_payload, 64, &done, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_UdpConnWrite", st, err);
+    }
+    st = fat_UdpConnReadFrom(bench_udp_server, bench_scratch, sizeof bench_scratch, &done, &from, &err);
+    if (st != FAT_OK) {
+      return bench_fail("fat_UdpConnReadFrom", st, err);
+    }
+    fat_StringFree(from);
+  }
+  return true;
+}
+
+/* ---- tiled -------------------------------------------------------------- */
+
+static const char bench_tmx[] =
+  "<map version=\"1.10\" tiledversion=\"1.10.2\" orientation=\"orthogonal\" renderorder=\"right-down\"\n"
+  "     width=\"4\" height=\"4\" tilewidth=\"8\" tileheight=\"8\" infinite=\"0\">\n"
+  "  <tileset firstgid=\"1\" name=\"ts\" tilewidth=\"8\" tileheight=\"8\" tilecount=\"4\" columns=\"2\">\n"
+  "    <image source=\"tiles.png\" width=\"16\" height=\"16\"/>\n"
+  "  </tileset>\n"
+  "  <layer id=\"1\" name=\"ground\" width=\"4\" height=\"4\">\n"
+  "    <data encoding=\"csv\">1,2,3,4,4,3,2,1,1,1,2,2,3,3,4,4</data>\n"
+  "  </layer>\n"
+  "</map>\n";
+
+static fat_Bytes bench_tmx_bytes;
+
+static bool tiled_load_once(void) {
+  fat_TiledMap m = 0;
+  fat_Error err = 0;
+  fat_Status st = fat_TiledMapLoadReaderBytesUTF8(".", bench_tmx_bytes, &m, &err);
+  if (st != FAT_OK) {
+    return bench_fail("fat_TiledMapLoadReaderBytesUTF8", st, err);
+  }
+  fat_TiledMapFree(m);
+  return true;
+}
+
+static bool tiled_setup(void) {
+  bench_tmx_bytes = fat_BytesNewN(bench_tmx, sizeof bench_tmx - 1);
+  if (!tiled_load_once()) {
+    fat_BytesFree(bench_tmx_bytes);
+    return false;
+  }
+  return true;
+}
+
+static void tiled_teardown(void) {
+  fat_BytesFree(bench_tmx_bytes);
+}
+
+static bool tiled_load_bytes(uint64_t n) {
+  for (uint64_t i = 0; i < n; i++) {
+    if (!tiled_load_once()) {
+      return false;
+    }
+  }
+  return true;
+}
+
+/* ---- runner ------------------------------------------------------------- */
+
+static const bench_Case bench_cases[] = {
+  {"string", "new_free_32", BENCH_SMALL, string_setup, string_new_free, string_teardown},
+  {"string", "len", 0, string_setup, string_len, string_teardown},
+  {"string", "copy_out_1k", BENCH_1K, string_setup, string_copy_out_1k, string_teardown},
+  {"string", "contains_1k", BENCH_1K, string_setup, string_contains_1k, string_teardown},
+  {"string", "to_lower_1k", BENCH_1K, string_setup, string_to_lower_1k, string_teardown},
+  {"string", "split_lines_1k", BENCH_1K, string_setup, string_split_1k, string_teardown},
+  {"string", "split_borrow_1k", BENCH_1K, string_setup, string_split_borrow_1k, string_teardown},
+  {"string", "split_iter_1k", BENCH_1K, string_setup, string_split_iter_1k, string_teardown},
+  {"string", "cut_lines_1k", BENCH_1K, string_setup, string_cut_lines_1k, string_teardown},
+  {"string", "replacer_1k", BENCH_1K, string_setup, string_replacer_1k, string_teardown},
+  {"string", "rope_edit_64k", 0, string_setup, string_rope_edit_64k, string_teardown},
+  {"string", "array_to_lower_1k", BENCH_1K, string_setup, string_array_to_lower_1k, string_teardown},
+  {"bytes", "new_free_1k", BENCH_1K, bytes_setup, bytes_new_free_1k, bytes_teardown},
+  {"bytes", "copy_out_64k", BENCH_64K, bytes_setup, bytes_copy_out_64k, bytes_teardown},
+  {"bytes", "borrow_64k", BENCH_64K, bytes_setup, bytes_borrow_64k, bytes_teardown},
+  {"bytes", "index_miss_64k", BENCH_64K, bytes_setup, bytes_index_64k, bytes_teardown},
+  {"bytes", "matcher_count_64k", BENCH_64K, bytes_setup, bytes_matcher_count_64k, bytes_teardown},
+  {"bytes", "is_valid_utf8_ascii_64k", BENCH_64K, bytes_setup, bytes_is_valid_utf8_ascii_64k, bytes_teardown},
+  {"bytes", "is_valid_utf8_mixed_64k", BENCH_64K, bytes_setup, bytes_is_valid_utf8_mixed_64k, bytes_teardown},
+  {"bytes", "to_lower_64k", BENCH_64K, bytes_setup, bytes_to_lower_64k, bytes_teardown},
+  {"buffer", "write_64", 64, buffer_setup, buffer_write_64, buffer_teardown},
+  {"buffer", "write_read_1k", BENCH_1K, buffer_setup, buffer_write_read_1k, buffer_teardown},
+  {"buffer", "write_read_64k", BENCH_64K, buffer_setup, buffer_write_read_64k, buffer_teardown},
+  {"buffer", "reserve_peek_1k", BENCH_1K, buffer_setup, buffer_reserve_peek_1k, buffer_teardown},
+  {"buffer", "reserve_peek_64k", BENCH_64K, buffer_setup, buffer_reserve_peek_64k, buffer_teardown},
+  {"buffer", "ring_write_read_1k", BENCH_1K, buffer_setup, buffer_ring_write_read_1k, buffer_teardown},
+  {"buffer", "ring_write_read_64k", BENCH_64K, buffer_setup, buffer_ring_write_read_64k, buffer_teardown},
+  {"buffer", "ring_reserve_peek_64k", BENCH_64K, buffer_setup, buffer_ring_reserve_peek_64k, buffer_teardown},
+  {"buffer", "bytes_1k", BENCH_1K, buffer_setup, buffer_bytes_1k, buffer_teardown},
+  {"buffer", "new_free_64k", 0, buffer_setup, buffer_new_free_64k, buffer_teardown},
+  {"buffer", "acquire_release_64k", 0, buffer_setup, buffer_acquire_release_64k, buffer_teardown},
+  {"conv", "format_int", 0, conv_setup, conv_format_int, conv_teardown},
+  {"conv", "format_float", 0, conv_setup, conv_format_float, conv_teardown},
+  {"conv", "format_int_into", 0, conv_setup, conv_format_int_into, conv_teardown},
+  {"conv", "format_float_into", 0, conv_setup, conv_format_float_into, conv_teardown},
+  {"conv", "write_int", 0, conv_setup, conv_write_int, conv_teardown},
+  {"conv", "parse_int", 0, conv_setup, conv_parse_int, conv_teardown},
+  {"conv", "parse_float", 0, conv_setup, conv_parse_float, conv_teardown},
+  {"conv", "parse_int_array_1024", 0, conv_setup, conv_parse_int_array_1024, conv_teardown},
+  {"conv", "parse_int_delimited_1024", 0, conv_setup, conv_parse_int_delimited_1024, conv_teardown},
+  {"conv", "parse_float_array_1024", 0, conv_setup, conv_parse_float_array_1024, conv_teardown},
+  {"conv", "write_float_array_1024", 0, conv_setup, conv_write_float_array_1024, conv_teardown},
+  {"json", "valid", 0, json_setup, json_valid, json_teardown},
+  {"json", "unmarshal", 0, json_setup, json_unmarshal, json_teardown},
+  {"json", "compact", 0, json_setup, json_compact, json_teardown},
+  {"xml", "decode_tokens", 0, xml_setup, xml_decode_tokens, xml_teardown},
+  {"csv", "read_all", 0, csv_setup, csv_read_all, csv_teardown},
+  {"csv", "write_record", 0, csv_setup, csv_write_record, csv_teardown},
+  {"base64", "encode_1k", BENCH_1K, base64_setup, base64_encode_1k, base64_teardown},
+  {"base64", "decode_1k", BENCH_1K, base64_setup, base64_decode_1k, base64_teardown},
+  {"compress", "gzip_4k", BENCH_4K, compress_setup, compress_gzip_4k, compress_teardown},
+  {"compress", "gunzip_4k", BENCH_4K, compress_setup, compress_gunzip_4k, compress_teardown},
+  {"compress", "zlib_4k", BENCH_4K, compress_setup, compress_zlib_4k, compress_teardown},
+  {"compress", "unzlib_4k", BENCH_4K, compress_setup, compress_unzlib_4k, compress_teardown},
+  {"archive", "zip_write_4k", BENCH_4K, archive_setup, archive_zip_write_4k, archive_teardown},
+  {"archive", "zip_read_4k", BENCH_4K, archive_setup, archive_zip_read_4k, archive_teardown},
+  {"archive", "tar_write_4k", BENCH_4K, archive_setup, archive_tar_write_4k, archive_teardown},
+  {"archive", "tar_read_4k", BENCH_4K, archive_setup, archive_tar_read_4k, archive_teardown},
+  {"socket", "tcp_pingpong_64", 128, socket_setup, socket_tcp_pingpong_64, socket_teardown},
+  {"socket", "udp_datagram_64", 64, socket_setup, socket_udp_datagram_64, socket_teardown},
+  {"tiled", "load_bytes", 0, tiled_setup, tiled_load_bytes, tiled_teardown},
+};
+
+typedef struct bench_Result {
+  const char *status; /* "ok", "skipped" or "failed" */
+  uint64_t iterations;
+  double ns_per_op;
+  double allocs_per_op;
+  double bytes_per_op;
+} bench_Result;
+
+static bench_Result bench_measure(const bench_Case *c, uint64_t target_ns) {
+  bench_Result res = {"ok", 0, 0, 0, 0};
+  uint64_t n = 1;
+
+  bench_error[0] = '\0';
+  if (!c->setup()) {
+    res.status = "skipped";
+    return res;
+  }
+  for (;;) {
+    uint64_t allocs0, bytes0, allocs1, bytes1;
+    fat_GoMemStats(&allocs0, &bytes0);
+    uint64_t t0 = bench_now_ns();
+    bool ok = c->run(n);
+    uint64_t elapsed = bench_now_ns() - t0;
+    fat_GoMemStats(&allocs1, &bytes1);
+    if (!ok) {
+      res.status = "failed";
+      break;
+    }
+    res.iterations = n;
+    res.ns_per_op = (double)elapsed / (double)n;
+    res.allocs_per_op = (double)(allocs1 - allocs0) / (double)n;
+    res.bytes_per_op = (double)(bytes1 - bytes0) / (double)n;
+    if (elapsed >= target_ns || n >= 1000000000u) {
+      break;
+    }
+    /* Predict the count that fills the target, overshoot by 20%, and grow at
+     * least by one and at most 100x per round (as testing.B does). */
+    uint64_t per_op = elapsed / n;
+    uint64_t next = per_op == 0 ? n * 100 : target_ns / per_op;
+    next += next / 5;
+    if (next > n * 100) {
+      next = n * 100;
+    }
+    if (next <= n) {
+      next = n + 1;
+    }
+    n = next;
+  }
+  c->teardown();
+  return res;
+}
+
+static void bench_json_string(const char *s) {
+  putchar('"');
+  for (; *s != '\0'; s++) {
+    unsigned char ch = (unsigned char)*s;
+    if (ch == '"' || ch == '\\') {
+      printf("\\%c", ch);
+    } else if (ch < 0x20) {
+      printf("\\u%04x", ch);
+    } else {
+      putchar(ch);
+    }
+  }
+  putchar('"');
+}
+
+static void bench_usage(FILE *out) {
+  fprintf(out, "usage: fatstd_bench [--json] [--benchtime-ms N] [--filter SUBSTR]... [--list]\n");
+}
+
+static bool bench_selected(const char *full, char **filters, int n_filters) {
+  if (n_filters == 0) {
+    return true;
+  }
+  for (int i = 0; i < n_filters; i++) {
+    if (strstr(full, filters[i]) != NULL) {
+      return true;
+    }
+  }
+  return false;
+}
+
+int main(int argc, char **argv) {
+  bool json = false;
+  bool list = false;
+  char **filters = calloc((size_t)argc, sizeof *filters);
+  int n_filters = 0;
+  uint64_t benchtime_ms = 200;
+
+  for (int i = 1; i < argc; i++) {
+    if (strcmp(argv[i], "--json") == 0) {
+      json = true;
+    } else if (strcmp(argv[i], "--list") == 0) {
+      list = true;
+    } else if (strcmp(argv[i], "--filter") == 0 && i + 1 < argc) {
+      filters[n_filters++] = argv[++i];
+    } else if (strcmp(argv[i], "--benchtime-ms") == 0 && i + 1 < argc) {
+      benchtime_ms = strtoull(argv[++i], NULL, 10);
+    } else if (strcmp(argv[i], "--help") == 0 || strcmp(argv[i], "-h") == 0) {
+      bench_usage(stdout);
+      return 0;
+    } else {
+      bench_usage(stderr);
+      return 2;
+    }
+  }
+
+  bench_fill(bench_payload, sizeof bench_payload);
+
+  if (json) {
+    printf("{\"suite\": \"c\", \"version\": ");
+    bench_json_string(fat_VersionString());
+    printf(", \"benchtime_ms\": %llu, \"results\": [", (unsigned long long)benchtime_ms);
+  } else {
+    printf("%-10s %-18s %12s %12s %12s %12s %10s\n", "family", "name", "iterations", "ns/op", "allocs/op", "B/op",
+           "MB/s");
+  }
+
+  size_t emitted = 0;
+  int failures = 0;
+  for (size_t i = 0; i < sizeof bench_cases / sizeof bench_cases[0]; i++) {
+    const bench_Case *c = &bench_cases[i];
+    char full[64];
+    snprintf(full, sizeof full, "%s/%s", c->family, c->name);
+    if (!bench_selected(full, filters, n_filters)) {
+      continue;
+    }
+    if (list) {
+      printf("%s\n", full);
+      continue;
+    }
+
+    bench_Result r = bench_measure(c, benchtime_ms * 1000000u);
+    double mb_per_s = 0;
+    if (c->bytes_per_op != 0 && r.ns_per_op > 0) {
+      mb_per_s = (double)c->bytes_per_op * 1e3 / r.ns_per_op;
+    }
+    if (strcmp(r.status, "failed") == 0) {
+      failures++;
+    }
+
+    if (json) {
+      printf("%s\n  {\"suite\": \"c\", \"family\": \"%s\", \"name\": \"%s\", \"status\": \"%s\", ", emitted ? "," : "",
+             c->family, c->name, r.status);
+      printf("\"iterations\": %llu, \"ns_per_op\": %.3f, \"allocs_per_op\": %.3f, \"bytes_per_op\": %.3f, ",
+             (unsigned long long)r.iterations, r.ns_per_op, r.allocs_per_op, r.bytes_per_op);
+      if (mb_per_s > 0) {
+        printf("\"mb_per_s\": %.3f, ", mb_per_s);
+      } else {
+        printf("\"mb_per_s\": null, ");
+      }
+      printf("\"error\": ");
+      if (bench_error[0] != '\0') {
+        bench_json_string(bench_error);
+      } else {
+        printf("null");
+      }
+      printf("}");
+    } else if (strcmp(r.status, "ok") != 0) {
+      printf("%-10s %-18s %s: %s\n", c->family, c->name, r.status, bench_error);
+    } else {
+      printf("%-10s %-18s %12llu %12.1f %12.2f %12.1f", c->family, c->name, (unsigned long long)r.iterations,
+             r.ns_per_op, r.allocs_per_op, r.bytes_per_op);
+      if (mb_per_s > 0) {
+        printf(" %10.1f", mb_per_s);
+      }
+      printf("\n");
+    }
+    fflush(stdout);
+    emitted++;
+  }
+
+  if (json) {
+    printf("\n]}\n");
+  }
+  free(filters);
+  return failures == 0 ? 0 : 1;
+}
@@ -0,0 +1,110 @@
+#pragma once
+
+/**
+ * @file fat/arena.h
+ * @brief Scope-based bulk lifetimes for FatStd handles.
+ *
+ * An arena records every handle created on the calling thread while it is the
+ * innermost pushed arena, and frees them all in one call. This replaces long
+ * chains of per-handle `*_Free` calls in code that produces many short-lived
+ * objects (split results, JSON values, Tiled layers, ...).
+ *
+ * Arenas are per thread: fat_ArenaPush and fat_ArenaPop must be balanced on the
+ * same thread, and handles created on other threads are not recorded.
+ *
+ * All functions are fail-fast: invalid handles and contract violations are fatal.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#include "fat/export.h"
+#include "fat/handle.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Opaque handle to a FatStd handle arena.
+ *
+ * @note Ownership: free with fat_ArenaFree.
+ */
+typedef fat_Handle fat_Arena;
+
+/**
+ * @brief Creates a new, inactive, empty arena.
+ *
+ * @return A new fat_Arena handle (must be freed with fat_ArenaFree).
+ */
+FATSTD_API fat_Arena fat_ArenaNew(void);
+
+/**
+ * @brief Makes `a` the innermost active arena on the calling thread.
+ *
+ * Until the matching fat_ArenaPop, every handle created on this thread is
+ * recorded in `a`. Arenas nest: pushing another arena shadows `a` until it is
+ * popped.
+ *
+ * Handles may still be freed individually while recorded; release skips them.
+ *
+ * @param a Arena handle.
+ *
+ * @note Fatal if `a` is already active (on any thread).
+ */
+FATSTD_API void fat_ArenaPush(fat_Arena a);
+
+/**
+ * @brief Deactivates `a` on the calling thread.
+ *
+ * Recorded handles stay valid until fat_ArenaRelease or fat_ArenaFree.
+ *
+ * @param a Arena handle.
+ *
+ * @note Fatal if `a` is not the innermost active arena on the calling thread.
+ */
+FATSTD_API void fat_ArenaPop(fat_Arena a);
+
+/**
+ * @brief Returns the number of handles recorded in the arena.
+ *
+ * Handles freed individually after being recorded are still counted until the
+ * next release.
+ *
+ * @param a Arena handle.
+ * @return Number of recorded handles.
+ */
+FATSTD_API size_t fat_ArenaLen(fat_Arena a);
+
+/**
+ * @brief Frees every handle recorded in the arena and empties it.
+ *
+ * The arena stays valid and may be pushed again; its bookkeeping capacity is
+ * reused. To keep a value beyond the arena, clone it after fat_ArenaPop
+ * (e.g. fat_StringClone) or create it outside the arena.
+ *
+ * Recorded handles are freed as by fat_HandlesFree. Handles that must be
+ * released with their own Close/Free (files, sockets, writers, nested arenas)
+ * must be released before the arena is.
+ *
+ * @param a Arena handle.
+ *
+ * @note Fatal if `a` is active, or if a recorded handle is still live and
+ *       requires its own Close/Free. In that case nothing is freed.
+ */
+FATSTD_API void fat_ArenaRelease(fat_Arena a);
+
+/**
+ * @brief Releases the arena's recorded handles and frees the arena itself.
+ *
+ * After this call, the arena handle is invalid and must not be used.
+ *
+ * @param a Arena handle.
+ *
+ * @note Fatal under the same conditions as fat_ArenaRelease.
+ */
+FATSTD_API void fat_ArenaFree(fat_Arena a);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
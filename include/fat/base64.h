@@ -91,19 +91,19 @@ FATSTD_API fat_Status fat_Base64EncodingWithPadding(
  * @brief Returns the encoded length for an input of length n.
  *
  * @param enc Encoding handle.
- * @param n Input length in bytes.
+ * @param n Input length in bytes (fatal if the result would not fit).
  * @return Encoded length.
  */
-FATSTD_API int fat_Base64EncodedLen(fat_Base64Encoding enc, int n);
+FATSTD_API size_t fat_Base64EncodedLen(fat_Base64Encoding enc, size_t n);
 
 /**
  * @brief Returns the maximum decoded length for an input of length n.
  *
  * @param enc Encoding handle.
- * @param n Encoded length in bytes.
+ * @param n Encoded length in bytes (fatal if too large to size on this platform).
  * @return Maximum decoded length.
  */
-FATSTD_API int fat_Base64DecodedLen(fat_Base64Encoding enc, int n);
+FATSTD_API size_t fat_Base64DecodedLen(fat_Base64Encoding enc, size_t n);
 
 /**
  * @brief Encodes src and returns the base64 output as a new string.
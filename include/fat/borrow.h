@@ -0,0 +1,47 @@
+#pragma once
+
+/**
+ * @file fat/borrow.h
+ * @brief Release handle for zero-copy, read-only views of Go-owned data.
+ *
+ * Borrow APIs such as fat_BytesBorrow and fat_StringBorrow return a pointer and
+ * length into FatStd's internal storage instead of copying it out. The storage
+ * is pinned and kept alive until the matching fat_BorrowRelease, even if the
+ * handle it was borrowed from is freed first.
+ *
+ * Borrowed memory is read-only. Writing through a borrowed pointer, or using it
+ * after release, is undefined behavior.
+ *
+ * All functions are fail-fast: invalid handles and contract violations are fatal.
+ */
+
+#include <stdint.h>
+
+#include "fat/export.h"
+#include "fat/handle.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Opaque handle owning a borrowed view.
+ *
+ * Borrows are not released by fat_HandlesFree or arenas.
+ *
+ * @note Ownership: release with fat_BorrowRelease.
+ */
+typedef fat_Handle fat_Borrow;
+
+/**
+ * @brief Ends a borrowed view and unpins its memory.
+ *
+ * After this call, the borrow handle and the pointer it guarded are invalid.
+ *
+ * @param borrow Borrow handle.
+ */
+FATSTD_API void fat_BorrowRelease(fat_Borrow borrow);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
@@ -14,8 +14,11 @@
 #include <stddef.h>
 #include <stdint.h>
 
+#include "fat/borrow.h"
+#include "fat/error.h"
 #include "fat/export.h"
 #include "fat/handle.h"
+#include "fat/status.h"
 #include "fat/string.h"
 
 #ifdef __cplusplus
@@ -26,7 +29,7 @@ extern "C" {
  * @brief Opaque handle to a FatStd byte slice.
  *
  * The handle is an identity-only token. The underlying storage is Go-managed and
- * is never exposed directly to C.
+ * is only exposed to C through explicit read-only borrows (fat_BytesBorrow).
  *
  * @note Ownership: free with fat_BytesFree.
  */
@@ -53,6 +56,70 @@ typedef fat_Handle fat_BytesArray;
  */
 FATSTD_API fat_Bytes fat_BytesNewN(const void *bytes, size_t len);
 
+/**
+ * @brief Callback that releases memory adopted by fat_BytesNewAdopt.
+ *
+ * @param data The `data` pointer passed to fat_BytesNewAdopt.
+ * @param len The `len` passed to fat_BytesNewAdopt.
+ * @param user_data The `user_data` passed to fat_BytesNewAdopt.
+ */
+typedef void (*fat_BytesReleaseFunc)(void *data, size_t len, void *user_data);
+
+/**
+ * @brief Creates a byte slice that adopts caller memory without copying it.
+ *
+ * The returned handle reads `data` in place, so large inputs (to
+ * fat_GzipDecompress, fat_JsonUnmarshal, fat_ZipReaderNewBytes, ...) are not
+ * duplicated into the Go heap. Lengths are limited only by `size_t`.
+ * fat_BytesReaderNew is the exception: it copies its input.
+ *
+ * `release` is called exactly once, on the thread that drops the last
+ * reference: either fat_BytesFree, or the fat_BorrowRelease of the last
+ * outstanding borrow of the handle. Until then the memory must remain valid
+ * and unmodified.
+ *
+ * Subslice results such as fat_BytesTrimSpace alias the input and must be
+ * freed before the adopted handle. The bytes-backed readers
+ * (fat_ZipReaderNewBytes, fat_TarReaderNewBytes, fat_CsvReaderNewBytes,
+ * fat_XmlDecoderNewBytes) also read it in place, but hold their own reference,
+ * so they may be freed in either order; `release` then runs once the handle
+ * and every such reader are freed.
+ *
+ * @param data Pointer to bytes (may be NULL only if len == 0).
+ * @param len Number of bytes.
+ * @param release Release callback (may be NULL if the caller frees `data`
+ *        itself after fat_BytesFree).
+ * @param user_data Opaque pointer passed to `release`.
+ * @return A new fat_Bytes handle (must be freed with fat_BytesFree).
+ *
+ * @note Adopted handles are rejected by fat_HandlesFree and arena release so
+ *       the callback always runs through fat_BytesFree.
+ */
+FATSTD_API fat_Bytes fat_BytesNewAdopt(const void *data, size_t len, fat_BytesReleaseFunc release,
+                                       void *user_data);
+
+/**
+ * @brief Maps a file read-only into memory and returns it as a byte slice (UTF-8 path).
+ *
+ * The handle is usable anywhere a fat_Bytes is accepted, but pages are loaded
+ * on demand by the OS instead of being read into RAM up front, so multi-GB
+ * archives and logs can be scanned cheaply (e.g. with fat_TarReaderNewBytes or
+ * fat_ZipReaderNewBytes, which read the mapping in place). The file is
+ * unmapped when the handle is freed and every borrow of it and reader over it
+ * released; the same aliasing rules as fat_BytesNewAdopt apply.
+ *
+ * Empty files produce an empty slice.
+ *
+ * @param path UTF-8 path to an existing regular file (NUL-terminated).
+ * @param out_bytes Output: new bytes handle on success.
+ * @param out_err Output: error handle on failure, 0 on success.
+ * @return FAT_OK on success; non-OK on failure.
+ *
+ * @note The mapping is not a snapshot. Truncating the file while it is mapped
+ *       makes reads past the new end fault, which is fatal.
+ */
+FATSTD_API fat_Status fat_BytesMapFileUTF8(const char *path, fat_Bytes *out_bytes, fat_Error *out_err);
+
 /**
  * @brief Returns the number of bytes in the slice.
  *
@@ -75,6 +142,22 @@ FATSTD_API size_t fat_BytesLen(fat_Bytes b);
  */
 FATSTD_API size_t fat_BytesCopyOut(fat_Bytes b, void *dst, size_t dst_len);
 
+/**
+ * @brief Borrows a read-only view of the slice's bytes without copying.
+ *
+ * The returned pointer stays valid until fat_BorrowRelease(*out_borrow), even
+ * if `b` is freed first. One borrow crosses into Go once; use it instead of
+ * fat_BytesLen + fat_BytesCopyOut to consume large payloads in place.
+ *
+ * @param b Bytes handle.
+ * @param out_len Output: number of bytes in the view.
+ * @param out_borrow Output: borrow handle (must be released with fat_BorrowRelease).
+ * @return Pointer to the first byte, or NULL when the slice is empty.
+ *
+ * @note The view is read-only. Fatal if `out_len` or `out_borrow` is NULL.
+ */
+FATSTD_API const uint8_t *fat_BytesBorrow(fat_Bytes b, size_t *out_len, fat_Borrow *out_borrow);
+
 /**
  * @brief Returns a new byte slice handle with a cloned copy of `b`.
  *
@@ -310,7 +393,7 @@ FATSTD_API fat_Bytes fat_BytesToUpper(fat_Bytes s);
  * @param c Byte to search for.
  * @return Zero-based index, or -1 if not found.
  */
-FATSTD_API int fat_BytesIndexByte(fat_Bytes b, uint8_t c);
+FATSTD_API int64_t fat_BytesIndexByte(fat_Bytes b, uint8_t c);
 
 /**
  * @brief Returns the index of the first occurrence in `s` of any byte in `chars`.
@@ -322,7 +405,7 @@ FATSTD_API int fat_BytesIndexByte(fat_Bytes b, uint8_t c);
  * @param chars String handle containing the set of bytes to search for.
  * @return Zero-based index, or -1 if not found.
  */
-FATSTD_API int fat_BytesIndexAny(fat_Bytes s, fat_String chars);
+FATSTD_API int64_t fat_BytesIndexAny(fat_Bytes s, fat_String chars);
 
 /**
  * @brief Returns a copy of `s` with invalid UTF-8 sequences replaced.
@@ -335,6 +418,17 @@ FATSTD_API int fat_BytesIndexAny(fat_Bytes s, fat_String chars);
  */
 FATSTD_API fat_Bytes fat_BytesToValidUTF8(fat_Bytes s, fat_Bytes replacement);
 
+/**
+ * @brief Reports whether `s` is entirely valid UTF-8.
+ *
+ * Matches Go's utf8.Valid. Use it to skip fat_BytesToValidUTF8 (and the copy
+ * it returns) for input that is already clean.
+ *
+ * @param s Bytes handle.
+ * @return True if `s` is valid UTF-8; false otherwise.
+ */
+FATSTD_API bool fat_BytesIsValidUTF8(fat_Bytes s);
+
 /**
  * @brief Returns the index of the first instance of `sep` in `s`.
  *
@@ -342,7 +436,7 @@ FATSTD_API fat_Bytes fat_BytesToValidUTF8(fat_Bytes s, fat_Bytes replacement);
  * @param sep Subslice handle.
  * @return Zero-based byte index, or -1 if not found.
  */
-FATSTD_API int fat_BytesIndex(fat_Bytes s, fat_Bytes sep);
+FATSTD_API int64_t fat_BytesIndex(fat_Bytes s, fat_Bytes sep);
 
 /**
  * @brief Counts the number of non-overlapping instances of `sep` in `s`.
@@ -351,7 +445,7 @@ FATSTD_API int fat_BytesIndex(fat_Bytes s, fat_Bytes sep);
  * @param sep Subslice handle.
  * @return Count of occurrences.
  */
-FATSTD_API int fat_BytesCount(fat_Bytes s, fat_Bytes sep);
+FATSTD_API int64_t fat_BytesCount(fat_Bytes s, fat_Bytes sep);
 
 /**
  * @brief Lexicographically compares two byte slices.
@@ -8,6 +8,8 @@
  *
  * Design notes:
  * - APIs that would expose borrowed slices (Buffer.Bytes, Buffer.Next) return new fat_Bytes handles instead.
+ * - For zero-copy I/O, fat_BytesBufferReserve/fat_BytesBufferCommit let C fill spare capacity directly and
+ *   fat_BytesBufferPeek/fat_BytesBufferConsume let C parse unread bytes in place.
  * - APIs that take Go strings (NewBufferString, WriteString) use fat_String handles.
  * - io.Writer/io.Reader cannot cross the C boundary; only FatStd-specific variants are provided.
  *
@@ -82,6 +84,31 @@ FATSTD_API fat_BytesBuffer fat_BytesBufferNewString(fat_String s);
  */
 FATSTD_API void fat_BytesBufferFree(fat_BytesBuffer b);
 
+/**
+ * @brief Takes an empty buffer with room for at least `min_cap` bytes from a process-wide pool.
+ *
+ * Buffers come in power-of-two capacity classes from 1 KiB to 1 MiB and keep the capacity they
+ * grew to, so request-scoped encoders (fat_JsonEncoderNewToBytesBuffer, fat_CsvWriterNewToBytesBuffer,
+ * ...) reuse warmed-up storage instead of allocating per request. Requests above 1 MiB get an
+ * unpooled buffer. The pool is safe to use from any thread.
+ *
+ * @param min_cap Minimum capacity in bytes.
+ * @return A new fat_BytesBuffer handle (return it with fat_BytesBufferRelease, or drop it with
+ *         fat_BytesBufferFree).
+ */
+FATSTD_API fat_BytesBuffer fat_BytesBufferAcquire(size_t min_cap);
+
+/**
+ * @brief Empties a buffer and returns its storage to the fat_BytesBufferAcquire pool.
+ *
+ * Works for any buffer, pooled or not; buffers smaller than 1 KiB or larger than 1 MiB are
+ * dropped instead. Close or free every encoder writing into `b` first. After this call, the
+ * handle is invalid and must not be used.
+ *
+ * @param b Buffer handle to release.
+ */
+FATSTD_API void fat_BytesBufferRelease(fat_BytesBuffer b);
+
 /**
  * @brief Returns the number of unread bytes currently in the buffer.
  *
@@ -163,6 +190,38 @@ FATSTD_API size_t fat_BytesBufferWriteRune(fat_BytesBuffer b, uint32_t r);
  */
 FATSTD_API size_t fat_BytesBufferWriteString(fat_BytesBuffer b, fat_String s);
 
+/**
+ * @brief Returns `n` writable bytes of spare capacity after the buffer's contents.
+ *
+ * Grows the buffer if needed. Fill the region from C (recv, fread, a decoder...) and pass the
+ * number of bytes written to fat_BytesBufferCommit to append them; this replaces a staging
+ * buffer plus fat_BytesBufferWrite. The region stays valid until fat_BytesBufferCommit,
+ * the next fat_BytesBufferReserve, or fat_BytesBufferFree.
+ *
+ * No other write may happen between Reserve and Commit. Any write into the buffer is fatal until
+ * the reservation ends: fat_BytesBufferWrite*, Grow, Reset, Truncate, ReadFrom*, fat_ConvWrite*,
+ * WriteTo* calls targeting the buffer, replacers, escapers, and encoders attached to the buffer.
+ * Reads (Read, Peek, Consume, Next...) are allowed. Reserving 0 bytes cancels a pending reservation.
+ *
+ * Reserve and Peek pin the buffer's storage until the buffer is freed, so such a buffer must be
+ * freed with fat_BytesBufferFree, not fat_HandlesFree or an arena.
+ *
+ * @param b Buffer handle.
+ * @param n Number of bytes to reserve.
+ * @return Pointer to `n` writable bytes (NULL if n == 0).
+ */
+FATSTD_API uint8_t *fat_BytesBufferReserve(fat_BytesBuffer b, size_t n);
+
+/**
+ * @brief Appends the first `n` bytes of the last fat_BytesBufferReserve region.
+ *
+ * Ends the reservation; its pointer is invalid afterwards.
+ *
+ * @param b Buffer handle.
+ * @param n Bytes written into the region (0 <= n <= reserved size).
+ */
+FATSTD_API void fat_BytesBufferCommit(fat_BytesBuffer b, size_t n);
+
 /**
  * @brief Returns a snapshot of the buffer contents as a new bytes handle.
  *
@@ -205,6 +264,26 @@ FATSTD_API size_t fat_BytesBufferRead(fat_BytesBuffer b, void *dst, size_t len,
  */
 FATSTD_API fat_Bytes fat_BytesBufferNext(fat_BytesBuffer b, size_t n);
 
+/**
+ * @brief Returns a read-only view of the unread bytes without consuming them.
+ *
+ * Parse in place, then advance past what was used with fat_BytesBufferConsume. The view stays
+ * valid until the next call that writes to, reads from, or frees the buffer.
+ *
+ * @param b Buffer handle.
+ * @param out_len Output: number of unread bytes.
+ * @return Pointer to the unread bytes (NULL if there are none).
+ */
+FATSTD_API const uint8_t *fat_BytesBufferPeek(fat_BytesBuffer b, size_t *out_len);
+
+/**
+ * @brief Discards the next `n` unread bytes, ending any fat_BytesBufferPeek view.
+ *
+ * @param b Buffer handle.
+ * @param n Bytes to discard (0 <= n <= fat_BytesBufferLen(b)).
+ */
+FATSTD_API void fat_BytesBufferConsume(fat_BytesBuffer b, size_t n);
+
 /**
  * @brief Reads a single byte.
  *
@@ -0,0 +1,166 @@
+#pragma once
+
+/**
+ * @file fat/bytes_ring.h
+ * @brief Handle-backed fixed-capacity ring buffer of bytes.
+ *
+ * A ring is a bounded byte queue between a producer and a consumer. Its storage is allocated once and
+ * never grows or moves: writes wrap around the end of the array and reads follow them.
+ *
+ * Error handling is C-oriented:
+ * - Short writes and EOF are reported through return values and explicit out-parameters.
+ * - Contract violations (consuming or committing too much, invalid handles) are fail-fast.
+ */
+
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+
+#include "fat/export.h"
+#include "fat/handle.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Opaque handle to a FatStd bytes ring.
+ *
+ * One producer thread and one consumer thread may use a ring concurrently.
+ *
+ * @note Ownership: free with fat_BytesRingFree.
+ */
+typedef fat_Handle fat_BytesRing;
+
+/**
+ * @brief Creates a new ring with a fixed capacity.
+ *
+ * In blocking mode, Write waits for room until all bytes are written, and Read, Peek and Reserve wait
+ * until they have something to return. fat_BytesRingClose wakes every waiter.
+ *
+ * @param capacity Size of the ring in bytes (must be > 0).
+ * @param blocking Whether calls wait instead of returning short.
+ * @return A new fat_BytesRing handle (must be freed with fat_BytesRingFree).
+ */
+FATSTD_API fat_BytesRing fat_BytesRingNew(size_t capacity, bool blocking);
+
+/**
+ * @brief Frees a ring handle.
+ *
+ * No other thread may be using the ring. After this call, the handle and any regions obtained from it
+ * are invalid.
+ *
+ * @param r Ring handle to free.
+ */
+FATSTD_API void fat_BytesRingFree(fat_BytesRing r);
+
+/**
+ * @brief Returns the fixed capacity of the ring.
+ *
+ * @param r Ring handle.
+ * @return Capacity in bytes.
+ */
+FATSTD_API size_t fat_BytesRingCap(fat_BytesRing r);
+
+/**
+ * @brief Returns the number of unread bytes.
+ *
+ * @param r Ring handle.
+ * @return Unread length in bytes.
+ */
+FATSTD_API size_t fat_BytesRingLen(fat_BytesRing r);
+
+/**
+ * @brief Copies bytes into the ring.
+ *
+ * A non-blocking ring writes as much as fits. A blocking ring waits for room until all of len is written.
+ * A closed ring accepts nothing.
+ *
+ * @param r Ring handle.
+ * @param bytes Source bytes (may be NULL only if len == 0).
+ * @param len Number of bytes to write.
+ * @return Number of bytes written.
+ */
+FATSTD_API size_t fat_BytesRingWrite(fat_BytesRing r, const void *bytes, size_t len);
+
+/**
+ * @brief Copies up to len unread bytes out of the ring.
+ *
+ * A blocking ring waits until at least one byte is available or the ring is closed.
+ *
+ * @param r Ring handle.
+ * @param dst Destination buffer (may be NULL only if len == 0).
+ * @param len Size of dst.
+ * @param eof_out Set to true if the ring is closed and fully drained (must not be NULL).
+ * @return Number of bytes read.
+ */
+FATSTD_API size_t fat_BytesRingRead(fat_BytesRing r, void *dst, size_t len, bool *eof_out);
+
+/**
+ * @brief Returns the unread bytes in place as up to two contiguous regions.
+ *
+ * The data continues from the end of the first region to the start of the second. A blocking ring waits
+ * for data first. The regions stay valid until the bytes are released with fat_BytesRingConsume.
+ *
+ * @param r Ring handle.
+ * @param out_first Set to the first region, or NULL if empty (must not be NULL).
+ * @param out_first_len Set to the length of the first region (must not be NULL).
+ * @param out_second Set to the wrapped-around region, or NULL if empty (must not be NULL).
+ * @param out_second_len Set to the length of the second region (must not be NULL).
+ * @param eof_out Set to true if the ring is closed and fully drained (must not be NULL).
+ * @return Total length of both regions.
+ */
+FATSTD_API size_t fat_BytesRingPeek(fat_BytesRing r,
+                                    const uint8_t **out_first,
+                                    size_t *out_first_len,
+                                    const uint8_t **out_second,
+                                    size_t *out_second_len,
+                                    bool *eof_out);
+
+/**
+ * @brief Discards the next n unread bytes.
+ *
+ * @param r Ring handle.
+ * @param n Number of bytes to discard (must be <= fat_BytesRingLen).
+ */
+FATSTD_API void fat_BytesRingConsume(fat_BytesRing r, size_t n);
+
+/**
+ * @brief Returns the free space in place as up to two contiguous regions.
+ *
+ * Fill the regions in order, then publish the bytes with fat_BytesRingCommit. A blocking ring waits for
+ * room first. A closed ring reserves nothing.
+ *
+ * @param r Ring handle.
+ * @param out_first Set to the first region, or NULL if empty (must not be NULL).
+ * @param out_first_len Set to the length of the first region (must not be NULL).
+ * @param out_second Set to the wrapped-around region, or NULL if empty (must not be NULL).
+ * @param out_second_len Set to the length of the second region (must not be NULL).
+ * @return Total length of both regions.
+ */
+FATSTD_API size_t fat_BytesRingReserve(fat_BytesRing r,
+                                       uint8_t **out_first,
+                                       size_t *out_first_len,
+                                       uint8_t **out_second,
+                                       size_t *out_second_len);
+
+/**
+ * @brief Publishes the first n reserved bytes to the consumer.
+ *
+ * @param r Ring handle.
+ * @param n Number of bytes written into the reserved regions (must not exceed the free space).
+ */
+FATSTD_API void fat_BytesRingCommit(fat_BytesRing r, size_t n);
+
+/**
+ * @brief Marks the end of the stream.
+ *
+ * Unread bytes can still be read; after that reads report EOF. Blocked calls return.
+ *
+ * @param r Ring handle.
+ */
+FATSTD_API void fat_BytesRingClose(fat_BytesRing r);
+
+#ifdef __cplusplus
+}
+#endif
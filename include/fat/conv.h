@@ -8,7 +8,11 @@
  *
  * Design notes:
  * - Append* functions return a new fat_Bytes handle rather than mutating a borrowed slice.
+ * - *Into functions format into a caller buffer and Write* functions append to a
+ *   fat_BytesBuffer; neither allocates a handle.
  * - Parsing functions return fat_Status and optionally populate a fat_Error handle.
+ * - Batch parsers (*Array, *Delimited) fill caller buffers and report a per-element
+ *   fat_Status byte instead of allocating error handles.
  * - Contract violations (invalid handles, NULL out params) are fatal; parse failures are recoverable.
  */
 
@@ -17,6 +21,7 @@
 #include <stdint.h>
 
 #include "fat/bytes.h"
+#include "fat/bytes_buffer.h"
 #include "fat/error.h"
 #include "fat/export.h"
 #include "fat/status.h"
@@ -122,6 +127,137 @@ FATSTD_API fat_String fat_ConvFormatFloat(double f, uint8_t fmt, int prec, int b
  */
 FATSTD_API fat_String fat_ConvFormatComplex(double re, double im, uint8_t fmt, int prec, int bit_size);
 
+/**
+ * @brief Formats an integer into a caller buffer without allocating a handle.
+ *
+ * Writes the same text as fat_ConvFormatInt. Like snprintf, the return value is
+ * the full length of the text; when it exceeds `dst_len`, only the first
+ * `dst_len` bytes were written. No NUL terminator is written. Base 10 gives
+ * fat_ConvItoa's output.
+ *
+ * @param i Integer value.
+ * @param base Formatting base (2..36).
+ * @param dst Destination buffer (may be NULL only if dst_len == 0).
+ * @param dst_len Capacity of `dst` in bytes.
+ * @return Length of the formatted text.
+ */
+FATSTD_API size_t fat_ConvFormatIntInto(int64_t i, int base, char *dst, size_t dst_len);
+
+/**
+ * @brief Formats an unsigned integer into a caller buffer; see fat_ConvFormatIntInto.
+ *
+ * @param i Unsigned integer value.
+ * @param base Formatting base (2..36).
+ * @param dst Destination buffer (may be NULL only if dst_len == 0).
+ * @param dst_len Capacity of `dst` in bytes.
+ * @return Length of the formatted text.
+ */
+FATSTD_API size_t fat_ConvFormatUintInto(uint64_t i, int base, char *dst, size_t dst_len);
+
+/**
+ * @brief Formats a float into a caller buffer; see fat_ConvFormatIntInto.
+ *
+ * @param f Float value.
+ * @param fmt Format verb (e.g. 'f', 'g', 'e').
+ * @param prec Precision (-1 for the shortest text that round-trips).
+ * @param bit_size 32 or 64.
+ * @param dst Destination buffer (may be NULL only if dst_len == 0).
+ * @param dst_len Capacity of `dst` in bytes.
+ * @return Length of the formatted text.
+ */
+FATSTD_API size_t fat_ConvFormatFloatInto(double f, uint8_t fmt, int prec, int bit_size, char *dst, size_t dst_len);
+
+/**
+ * @brief Formats "true" or "false" into a caller buffer; see fat_ConvFormatIntInto.
+ *
+ * @param b Boolean value.
+ * @param dst Destination buffer (may be NULL only if dst_len == 0).
+ * @param dst_len Capacity of `dst` in bytes.
+ * @return Length of the formatted text.
+ */
+FATSTD_API size_t fat_ConvFormatBoolInto(bool b, char *dst, size_t dst_len);
+
+/**
+ * @brief Writes the Go-quoted form of `s` into a caller buffer; see fat_ConvFormatIntInto.
+ *
+ * @param s String handle.
+ * @param dst Destination buffer (may be NULL only if dst_len == 0).
+ * @param dst_len Capacity of `dst` in bytes.
+ * @return Length of the quoted text.
+ */
+FATSTD_API size_t fat_ConvQuoteInto(fat_String s, char *dst, size_t dst_len);
+
+/**
+ * @brief Appends a formatted integer to a bytes buffer.
+ *
+ * The digits are formatted directly into the buffer's spare capacity, so a
+ * buffer that has been grown once appends without allocating.
+ *
+ * @param dst Destination buffer handle.
+ * @param i Integer value.
+ * @param base Formatting base (2..36).
+ * @return Number of bytes appended.
+ */
+FATSTD_API size_t fat_ConvWriteInt(fat_BytesBuffer dst, int64_t i, int base);
+
+/**
+ * @brief Appends a formatted unsigned integer to a bytes buffer; see fat_ConvWriteInt.
+ *
+ * @param dst Destination buffer handle.
+ * @param i Unsigned integer value.
+ * @param base Formatting base (2..36).
+ * @return Number of bytes appended.
+ */
+FATSTD_API size_t fat_ConvWriteUint(fat_BytesBuffer dst, uint64_t i, int base);
+
+/**
+ * @brief Appends a formatted float to a bytes buffer; see fat_ConvWriteInt.
+ *
+ * @param dst Destination buffer handle.
+ * @param f Float value.
+ * @param fmt Format verb (e.g. 'f', 'g', 'e').
+ * @param prec Precision (-1 for the shortest text that round-trips).
+ * @param bit_size 32 or 64.
+ * @return Number of bytes appended.
+ */
+FATSTD_API size_t fat_ConvWriteFloat(fat_BytesBuffer dst, double f, uint8_t fmt, int prec, int bit_size);
+
+/**
+ * @brief Appends an array of floats to a bytes buffer, separated by `sep`.
+ *
+ * Formats like fat_ConvWriteFloat for each value, in one call. With `prec`
+ * -1 every value is written as the shortest text that parses back to it.
+ *
+ * @param dst Destination buffer handle.
+ * @param values Values to format (may be NULL only if `n` is 0).
+ * @param n Number of values.
+ * @param fmt Format verb (e.g. 'f', 'g', 'e').
+ * @param prec Precision (-1 for the shortest text that round-trips).
+ * @param bit_size 32 or 64.
+ * @param sep Byte written between consecutive values.
+ * @return Number of bytes appended.
+ */
+FATSTD_API size_t fat_ConvWriteFloatArray(fat_BytesBuffer dst, const double *values, size_t n, uint8_t fmt, int prec, int bit_size,
+                                          uint8_t sep);
+
+/**
+ * @brief Appends "true" or "false" to a bytes buffer.
+ *
+ * @param dst Destination buffer handle.
+ * @param b Boolean value.
+ * @return Number of bytes appended.
+ */
+FATSTD_API size_t fat_ConvWriteBool(fat_BytesBuffer dst, bool b);
+
+/**
+ * @brief Appends the Go-quoted form of `s` to a bytes buffer.
+ *
+ * @param dst Destination buffer handle.
+ * @param s String handle.
+ * @return Number of bytes appended.
+ */
+FATSTD_API size_t fat_ConvWriteQuote(fat_BytesBuffer dst, fat_String s);
+
 FATSTD_API bool fat_ConvIsGraphic(uint32_t r);
 FATSTD_API bool fat_ConvIsPrint(uint32_t r);
 FATSTD_API fat_String fat_ConvItoa(int i);
@@ -171,6 +307,132 @@ FATSTD_API fat_Status fat_ConvParseComplex(fat_String s, int bit_size, double *o
  */
 FATSTD_API fat_Status fat_ConvAtoi(fat_String s, int64_t *out_value, fat_Error *out_err);
 
+/**
+ * @brief Parses every element of a string array as an integer, in one call.
+ *
+ * Batch form of fat_ConvParseInt for columnar data. Instead of error handles,
+ * `out_status[i]` receives the fat_Status of element i (FAT_OK, FAT_ERR_SYNTAX or
+ * FAT_ERR_RANGE). `out[i]` receives what fat_ConvParseInt would compute: 0 on a
+ * syntax error, the clamped limit on a range error. Use base 10 and bit_size 0
+ * for fat_ConvAtoi semantics.
+ *
+ * @param a Array handle.
+ * @param base Parsing base (0 or 2..36).
+ * @param bit_size Result bit size (0, 8, 16, 32 or 64).
+ * @param out Receives one value per element, in array order.
+ * @param out_status Receives one fat_Status value per element.
+ * @param out_len Capacity of `out` and `out_status`; must be at least fat_StringArrayLen(a).
+ * @return Number of elements that failed to parse (0 when every status is FAT_OK).
+ *
+ * @note `out` and `out_status` may be NULL only when the array is empty.
+ */
+FATSTD_API size_t fat_ConvParseIntArray(fat_StringArray a, int base, int bit_size, int64_t *out, uint8_t *out_status, size_t out_len);
+
+/**
+ * @brief Parses every element of a string array as a float, in one call.
+ *
+ * Per-element results follow fat_ConvParseIntArray.
+ *
+ * @param a Array handle.
+ * @param bit_size 32 or 64.
+ * @param out Receives one value per element, in array order.
+ * @param out_status Receives one fat_Status value per element.
+ * @param out_len Capacity of `out` and `out_status`; must be at least fat_StringArrayLen(a).
+ * @return Number of elements that failed to parse.
+ */
+FATSTD_API size_t fat_ConvParseFloatArray(fat_StringArray a, int bit_size, double *out, uint8_t *out_status, size_t out_len);
+
+/**
+ * @brief Parses every element of a string array as a boolean (0 or 1), in one call.
+ *
+ * Per-element results follow fat_ConvParseIntArray.
+ *
+ * @param a Array handle.
+ * @param out Receives 0 or 1 per element, in array order.
+ * @param out_status Receives one fat_Status value per element.
+ * @param out_len Capacity of `out` and `out_status`; must be at least fat_StringArrayLen(a).
+ * @return Number of elements that failed to parse.
+ */
+FATSTD_API size_t fat_ConvParseBoolArray(fat_StringArray a, uint8_t *out, uint8_t *out_status, size_t out_len);
+
+/**
+ * @brief Parses the `sep`-delimited cells of `b` as integers, in one call.
+ *
+ * Parses a packed column such as one value per line without splitting it into
+ * handles first. A trailing separator does not start another cell, and empty
+ * input has no cells. At most `out_len` cells are parsed; `*out_count` receives
+ * the total number of cells so a caller can size its buffers and retry.
+ * Per-cell results follow fat_ConvParseIntArray.
+ *
+ * @param b Bytes handle holding the delimited cells.
+ * @param sep Separator byte (for example '\n' or ',').
+ * @param base Parsing base (0 or 2..36).
+ * @param bit_size Result bit size (0, 8, 16, 32 or 64).
+ * @param out Receives one value per parsed cell.
+ * @param out_status Receives one fat_Status value per parsed cell.
+ * @param out_len Capacity of `out` and `out_status`.
+ * @param out_count Output: number of cells in `b` (may exceed `out_len`).
+ * @return Number of parsed cells that failed.
+ *
+ * @note Fatal if `out_count` is NULL, or if `out`/`out_status` is NULL while `out_len > 0`.
+ */
+FATSTD_API size_t fat_ConvParseIntDelimited(
+  fat_Bytes b,
+  uint8_t sep,
+  int base,
+  int bit_size,
+  int64_t *out,
+  uint8_t *out_status,
+  size_t out_len,
+  size_t *out_count
+);
+
+/**
+ * @brief Parses the `sep`-delimited cells of `b` as floats, in one call.
+ *
+ * Cell splitting follows fat_ConvParseIntDelimited.
+ *
+ * @param b Bytes handle holding the delimited cells.
+ * @param sep Separator byte.
+ * @param bit_size 32 or 64.
+ * @param out Receives one value per parsed cell.
+ * @param out_status Receives one fat_Status value per parsed cell.
+ * @param out_len Capacity of `out` and `out_status`.
+ * @param out_count Output: number of cells in `b` (may exceed `out_len`).
+ * @return Number of parsed cells that failed.
+ */
+FATSTD_API size_t fat_ConvParseFloatDelimited(
+  fat_Bytes b,
+  uint8_t sep,
+  int bit_size,
+  double *out,
+  uint8_t *out_status,
+  size_t out_len,
+  size_t *out_count
+);
+
+/**
+ * @brief Parses the `sep`-delimited cells of `b` as booleans (0 or 1), in one call.
+ *
+ * Cell splitting follows fat_ConvParseIntDelimited.
+ *
+ * @param b Bytes handle holding the delimited cells.
+ * @param sep Separator byte.
+ * @param out Receives 0 or 1 per parsed cell.
+ * @param out_status Receives one fat_Status value per parsed cell.
+ * @param out_len Capacity of `out` and `out_status`.
+ * @param out_count Output: number of cells in `b` (may exceed `out_len`).
+ * @return Number of parsed cells that failed.
+ */
+FATSTD_API size_t fat_ConvParseBoolDelimited(
+  fat_Bytes b,
+  uint8_t sep,
+  uint8_t *out,
+  uint8_t *out_status,
+  size_t out_len,
+  size_t *out_count
+);
+
 FATSTD_API fat_Status fat_ConvUnquote(fat_String s, fat_String *out_value, fat_Error *out_err);
 FATSTD_API fat_Status fat_ConvQuotedPrefix(fat_String s, fat_String *out_value, fat_Error *out_err);
 
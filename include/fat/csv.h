@@ -65,6 +65,8 @@ FATSTD_API void fat_CsvReaderFree(fat_CsvReader r);
  *
  * On success, returns a new fat_StringArray handle containing the record fields.
  * At end-of-input, returns FAT_ERR_EOF and sets `*out_record` to 0.
+ * Header fields that repeat across inputs can be interned with
+ * fat_StringArrayGetInterned.
  *
  * @param r Reader handle.
  * @param out_record Output: new fat_StringArray on success, 0 on EOF/failure.
@@ -1,5 +1,7 @@
 #pragma once
 
+#include <stdint.h>
+
 #include "fat/export.h"
 
 #ifdef __cplusplus
@@ -8,7 +10,19 @@ extern "C" {
 
 FATSTD_API int fat_GoAdd(int a, int b);
 
+/**
+ * @brief Reports cumulative Go heap allocation counters.
+ *
+ * Both counters are monotonic since process start; diff two samples to
+ * measure the allocations made by the calls in between (e.g. allocs/op in
+ * benchmarks). Sampling briefly stops the Go world, so keep it out of hot
+ * loops.
+ *
+ * @param out_allocs Output: number of heap objects allocated (must be non-NULL).
+ * @param out_bytes Output: number of heap bytes allocated (must be non-NULL).
+ */
+FATSTD_API void fat_GoMemStats(uint64_t *out_allocs, uint64_t *out_bytes);
+
 #ifdef __cplusplus
 } /* extern "C" */
 #endif
-
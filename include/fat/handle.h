@@ -1,6 +1,120 @@
 #pragma once
 
+/**
+ * @file fat/handle.h
+ * @brief Canonical handle type for Go-backed FatStd objects, bulk release, and
+ *        registry diagnostics.
+ *
+ * All functions are fail-fast: invalid handles and contract violations are fatal.
+ */
+
+#include <stddef.h>
 #include <stdint.h>
 
+#include "fat/export.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
 typedef uintptr_t fat_Handle;
 
+/**
+ * @brief Frees an array of handles of mixed types in a single call.
+ *
+ * Equivalent to calling the matching `*_Free` on each element, but crosses into
+ * the Go runtime once and takes the registry locks once for the whole batch.
+ * Intended for workloads that produce many short-lived handles (strings, bytes,
+ * JSON values, XML tokens, tar headers, zip files, Tiled layers/tiles, ...).
+ *
+ * Every handle is validated before any is freed. Accepted types are those whose
+ * `*_Free` returns `void`. Handles that must be closed with a status-returning
+ * function (e.g. fat_TarReaderFree, fat_ZipWriterClose, fat_TcpConnClose,
+ * fat_XmlDecoderFree) are rejected.
+ *
+ * After this call, every handle in the array is invalid and must not be used.
+ * The array itself is borrowed and not modified.
+ *
+ * @param handles Array of handles (may be NULL only if n == 0).
+ * @param n Number of handles in the array.
+ *
+ * @note Fatal if any handle is 0, invalid, already freed, repeated within the
+ *       array, or of a type that requires its own Close/Free.
+ */
+FATSTD_API void fat_HandlesFree(const fat_Handle *handles, size_t n);
+
+/**
+ * @brief Handle registry tracking levels for fat_HandleSetTracking.
+ */
+typedef enum fat_HandleTrackMode {
+  /** Only process-wide register/free totals are kept (always on, near-zero cost). */
+  FAT_HANDLE_TRACK_OFF = 0,
+  /** Also keep exact per-type live counts, high-water marks and register/free totals. */
+  FAT_HANDLE_TRACK_COUNTS = 1,
+  /** Also record the creating export function (e.g. fatstd_go_string_new_utf8) of each live handle. */
+  FAT_HANDLE_TRACK_ORIGINS = 2,
+} fat_HandleTrackMode;
+
+/**
+ * @brief Sets the handle registry tracking level.
+ *
+ * Tracking adds a global lock (and, for FAT_HANDLE_TRACK_ORIGINS, a stack walk)
+ * to every handle creation and release; enable it for leak hunting, not in
+ * steady-state production.
+ *
+ * Enabling tracking seeds counts from the handles live at that moment, so
+ * high-water marks start at the current population and handles created earlier
+ * are reported with origin "(untracked)". Setting FAT_HANDLE_TRACK_OFF discards
+ * all tracked state.
+ *
+ * @param mode New tracking level.
+ *
+ * @note Fatal if `mode` is not a fat_HandleTrackMode value.
+ */
+FATSTD_API void fat_HandleSetTracking(fat_HandleTrackMode mode);
+
+/**
+ * @brief Returns the current handle registry tracking level.
+ *
+ * @return Current tracking level.
+ */
+FATSTD_API fat_HandleTrackMode fat_HandleTracking(void);
+
+/**
+ * @brief Reports process-wide handle registry totals.
+ *
+ * Totals are cumulative since the library was loaded; sample them periodically
+ * to derive register/free rates.
+ *
+ * @param out_live Output: number of live handles.
+ * @param out_registered Output: number of handles ever created.
+ * @param out_freed Output: number of handles ever freed.
+ * @param out_high_water Output: peak number of live handles since tracking was
+ *        enabled, or 0 when tracking is FAT_HANDLE_TRACK_OFF.
+ *
+ * @note Fatal if any out-param is NULL.
+ */
+FATSTD_API void fat_HandleStats(uint64_t *out_live, uint64_t *out_registered, uint64_t *out_freed,
+                                uint64_t *out_high_water);
+
+/**
+ * @brief Renders a human-readable registry report into a caller buffer.
+ *
+ * The report lists totals and average rates, live handles per Go type (with
+ * high-water marks and per-type totals while tracking), and, with
+ * FAT_HANDLE_TRACK_ORIGINS, live handles grouped by creating export function.
+ *
+ * Copies up to `dst_len - 1` bytes into `dst`, then writes a trailing `'\0'`
+ * when `dst_len > 0`. Call with `dst_len == 0` to size the buffer; the report
+ * is regenerated on every call, so allow some slack.
+ *
+ * @param dst Destination buffer (may be NULL only if dst_len == 0).
+ * @param dst_len Capacity of `dst` in bytes (including space for the terminator).
+ * @return Full report length in bytes (excluding the terminator); the output was
+ *         truncated if this is >= dst_len.
+ */
+FATSTD_API size_t fat_HandleStatsDump(char *dst, size_t dst_len);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
@@ -29,6 +29,7 @@
 #include "fat/handle.h"
 #include "fat/status.h"
 #include "fat/string.h"
+#include "fat/string_intern.h"
 
 #ifdef __cplusplus
 extern "C" {
@@ -221,6 +222,28 @@ FATSTD_API fat_JsonValue fat_JsonArrayGet(fat_JsonValue v, size_t idx);
  */
 FATSTD_API fat_StringArray fat_JsonObjectKeys(fat_JsonValue v);
 
+/**
+ * @brief Returns the number of fields in a JSON object.
+ *
+ * @param v Value handle (must be FAT_JSON_OBJECT).
+ * @return Field count.
+ */
+FATSTD_API size_t fat_JsonObjectLen(fat_JsonValue v);
+
+/**
+ * @brief Writes the sorted keys of a JSON object as interned handles.
+ *
+ * Keys that repeat across many objects share one handle instead of a fresh
+ * string per key per object.
+ *
+ * @param v Value handle (must be FAT_JSON_OBJECT).
+ * @param in Interner handle.
+ * @param out_keys Output: one interner-owned fat_String per key (must not be
+ *        freed; see fat/string_intern.h). May be NULL only if the object is empty.
+ * @param keys_len Capacity of out_keys (must be >= fat_JsonObjectLen(v)).
+ */
+FATSTD_API void fat_JsonObjectKeysInterned(fat_JsonValue v, fat_StringInterner in, fat_String *out_keys, size_t keys_len);
+
 /**
  * @brief Gets a field from a JSON object by key.
  *
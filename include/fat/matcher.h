@@ -0,0 +1,120 @@
+#pragma once
+
+/**
+ * @file fat/matcher.h
+ * @brief Precompiled multi-pattern substring search (Aho-Corasick).
+ *
+ * A fat_Matcher is built once from a set of patterns and then finds every
+ * occurrence of every pattern in a single linear pass over a haystack. Use it
+ * instead of calling fat_StringIndex/fat_BytesIndex once per needle when
+ * matching many fixed strings (e.g. indicator lists) against the same input.
+ *
+ * Patterns are matched as exact byte sequences. Matches may overlap, and a
+ * pattern that appears more than once in the pattern set is reported once per
+ * occurrence in the set.
+ *
+ * All functions are fail-fast: invalid handles and contract violations are fatal.
+ */
+
+#include <stdbool.h>
+#include <stddef.h>
+
+#include "fat/bytes.h"
+#include "fat/error.h"
+#include "fat/export.h"
+#include "fat/handle.h"
+#include "fat/status.h"
+#include "fat/string.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Opaque handle to a compiled pattern set.
+ *
+ * Matchers are immutable and may be shared across threads.
+ *
+ * @note Ownership: free with fat_MatcherFree.
+ */
+typedef fat_Handle fat_Matcher;
+
+/**
+ * @brief Compiles a matcher from a set of patterns.
+ *
+ * Pattern indices reported by the search functions are positions in `patterns`.
+ * The array is not retained; it may be freed after this call.
+ *
+ * @param patterns Pattern array (may be empty; such a matcher never matches).
+ * @param out_matcher Output: new matcher handle on success, 0 on failure.
+ * @param out_err Output: error handle on failure, 0 on success.
+ * @return FAT_OK on success; FAT_ERR_SYNTAX if any pattern is empty.
+ */
+FATSTD_API fat_Status fat_MatcherNew(fat_StringArray patterns, fat_Matcher *out_matcher, fat_Error *out_err);
+
+/**
+ * @brief Returns the number of patterns the matcher was built from.
+ */
+FATSTD_API size_t fat_MatcherPatternCount(fat_Matcher m);
+
+/**
+ * @brief Reports whether any pattern occurs in `b`.
+ *
+ * Stops at the first match.
+ */
+FATSTD_API bool fat_MatcherContainsBytes(fat_Matcher m, fat_Bytes b);
+
+/**
+ * @brief Reports whether any pattern occurs in `s`.
+ *
+ * Stops at the first match.
+ */
+FATSTD_API bool fat_MatcherContainsString(fat_Matcher m, fat_String s);
+
+/**
+ * @brief Counts all (possibly overlapping) pattern occurrences in `b`.
+ */
+FATSTD_API size_t fat_MatcherCountBytes(fat_Matcher m, fat_Bytes b);
+
+/**
+ * @brief Counts all (possibly overlapping) pattern occurrences in `s`.
+ */
+FATSTD_API size_t fat_MatcherCountString(fat_Matcher m, fat_String s);
+
+/**
+ * @brief Finds all (possibly overlapping) pattern occurrences in `b`.
+ *
+ * Match i is written as `out_patterns[i]` (pattern index) and `out_offsets[i]`
+ * (byte offset where the match starts). Matches are ordered by end offset;
+ * matches ending at the same offset are ordered longest first.
+ *
+ * At most `cap` matches are written, but the return value is always the total
+ * number of matches, so a caller can retry with a larger buffer (or size one
+ * with fat_MatcherCountBytes).
+ *
+ * @param m Matcher handle.
+ * @param b Haystack.
+ * @param out_patterns Output array of pattern indices (may be NULL if cap == 0).
+ * @param out_offsets Output array of start offsets (may be NULL if cap == 0).
+ * @param cap Capacity of both output arrays, in elements.
+ * @return Total number of matches in `b`.
+ */
+FATSTD_API size_t fat_MatcherFindAllBytes(fat_Matcher m, fat_Bytes b, size_t *out_patterns, size_t *out_offsets,
+                                          size_t cap);
+
+/**
+ * @brief Finds all (possibly overlapping) pattern occurrences in `s`.
+ *
+ * Same contract as fat_MatcherFindAllBytes.
+ */
+FATSTD_API size_t fat_MatcherFindAllString(fat_Matcher m, fat_String s, size_t *out_patterns, size_t *out_offsets,
+                                           size_t cap);
+
+/**
+ * @brief Frees a matcher handle.
+ */
+FATSTD_API void fat_MatcherFree(fat_Matcher m);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
@@ -0,0 +1,104 @@
+#pragma once
+
+/**
+ * @file fat/replacer.h
+ * @brief Precompiled multi-substitution replacer (Go strings.Replacer).
+ *
+ * A fat_Replacer is built once from a list of old/new pairs and then performs
+ * every substitution in a single pass over its input. Use it instead of
+ * chaining fat_StringReplaceAll calls, which allocate a new string per pair.
+ *
+ * Semantics follow Go's strings.NewReplacer: at each position the pairs are
+ * tried in argument order, the first match wins, and replaced text is not
+ * scanned again.
+ *
+ * All functions are fail-fast: invalid handles and contract violations are fatal.
+ */
+
+#include <stddef.h>
+
+#include "fat/bytes.h"
+#include "fat/bytes_buffer.h"
+#include "fat/export.h"
+#include "fat/handle.h"
+#include "fat/string.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Opaque handle to a compiled replacer.
+ *
+ * Replacers are immutable and may be shared across threads.
+ *
+ * @note Ownership: free with fat_ReplacerFree.
+ */
+typedef fat_Handle fat_Replacer;
+
+/**
+ * @brief Compiles a replacer from old/new string pairs.
+ *
+ * Element 2*i of `oldnew` is replaced by element 2*i+1. The array is not
+ * retained; it may be freed after this call.
+ *
+ * @param oldnew String array holding an even number of elements.
+ * @return A new fat_Replacer handle (must be freed with fat_ReplacerFree).
+ */
+FATSTD_API fat_Replacer fat_ReplacerNew(fat_StringArray oldnew);
+
+/**
+ * @brief Frees a replacer handle.
+ *
+ * @param r Replacer handle to free.
+ */
+FATSTD_API void fat_ReplacerFree(fat_Replacer r);
+
+/**
+ * @brief Returns a copy of `s` with all replacements performed.
+ *
+ * @param r Replacer handle.
+ * @param s Input string handle.
+ * @return A new fat_String handle (must be freed with fat_StringFree).
+ */
+FATSTD_API fat_String fat_ReplacerReplace(fat_Replacer r, fat_String s);
+
+/**
+ * @brief Returns a copy of `b` with all replacements performed.
+ *
+ * The input is scanned in place; only the output is allocated.
+ *
+ * @param r Replacer handle.
+ * @param b Input bytes handle.
+ * @return A new fat_Bytes handle (must be freed with fat_BytesFree).
+ */
+FATSTD_API fat_Bytes fat_ReplacerReplaceBytes(fat_Replacer r, fat_Bytes b);
+
+/**
+ * @brief Appends `s`, with all replacements performed, to a buffer.
+ *
+ * No intermediate string is allocated. Matches do not span calls, so split
+ * streamed input on boundaries no old string can cross (e.g. lines).
+ *
+ * @param r Replacer handle.
+ * @param dst Destination buffer handle.
+ * @param s Input string handle.
+ * @return Number of bytes appended to `dst`.
+ */
+FATSTD_API size_t fat_ReplacerWriteString(fat_Replacer r, fat_BytesBuffer dst, fat_String s);
+
+/**
+ * @brief Appends `b`, with all replacements performed, to a buffer.
+ *
+ * No intermediate copy of `b` is made. Matches do not span calls.
+ *
+ * @param r Replacer handle.
+ * @param dst Destination buffer handle.
+ * @param b Input bytes handle.
+ * @return Number of bytes appended to `dst`.
+ */
+FATSTD_API size_t fat_ReplacerWriteBytes(fat_Replacer r, fat_BytesBuffer dst, fat_Bytes b);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
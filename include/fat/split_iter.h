@@ -0,0 +1,112 @@
+#pragma once
+
+/**
+ * @file fat/split_iter.h
+ * @brief Streaming split/fields iteration over strings and byte slices.
+ *
+ * fat_StringSplit, fat_StringFields, fat_BytesSplit and fat_BytesFields build
+ * every piece before returning. A split iterator instead yields one piece at a
+ * time as an (offset, length) pair into the source, so memory stays constant
+ * no matter how many pieces the input has. To read the pieces without copying,
+ * borrow the source once (fat_StringBorrow / fat_BytesBorrow) and index into it.
+ *
+ * Pieces follow the same rules as the materializing APIs (Go's strings.SplitN
+ * and strings.Fields, or their bytes equivalents).
+ *
+ * The iterator keeps its source alive: the source handle may be freed before
+ * the iterator. Iterators are not safe for concurrent use.
+ *
+ * All functions are fail-fast: invalid handles and contract violations are fatal.
+ */
+
+#include <stdbool.h>
+#include <stddef.h>
+
+#include "fat/bytes.h"
+#include "fat/export.h"
+#include "fat/handle.h"
+#include "fat/string.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Opaque handle to a split iterator.
+ *
+ * @note Ownership: free with fat_SplitIterFree.
+ */
+typedef fat_Handle fat_SplitIter;
+
+/**
+ * @brief Iterates the pieces fat_StringSplitN(s, sep, n) would return.
+ *
+ * @param s Source string handle.
+ * @param sep Separator handle; an empty separator splits after each UTF-8 sequence.
+ * @param n Maximum number of pieces (n < 0 means no limit; n == 0 yields nothing).
+ * @return A new fat_SplitIter handle (must be freed with fat_SplitIterFree).
+ */
+FATSTD_API fat_SplitIter fat_StringSplitIterNew(fat_String s, fat_String sep, int n);
+
+/**
+ * @brief Iterates the pieces fat_StringFields(s) would return.
+ *
+ * @param s Source string handle.
+ * @return A new fat_SplitIter handle (must be freed with fat_SplitIterFree).
+ */
+FATSTD_API fat_SplitIter fat_StringFieldsIterNew(fat_String s);
+
+/**
+ * @brief Iterates the pieces of `b` separated by `sep`, like fat_BytesSplit with an optional limit.
+ *
+ * @param b Source bytes handle.
+ * @param sep Separator handle; an empty separator splits after each UTF-8 sequence.
+ * @param n Maximum number of pieces (n < 0 means no limit; n == 0 yields nothing).
+ * @return A new fat_SplitIter handle (must be freed with fat_SplitIterFree).
+ */
+FATSTD_API fat_SplitIter fat_BytesSplitIterNew(fat_Bytes b, fat_Bytes sep, int n);
+
+/**
+ * @brief Iterates the pieces fat_BytesFields(b) would return.
+ *
+ * @param b Source bytes handle.
+ * @return A new fat_SplitIter handle (must be freed with fat_SplitIterFree).
+ */
+FATSTD_API fat_SplitIter fat_BytesFieldsIterNew(fat_Bytes b);
+
+/**
+ * @brief Advances to the next piece.
+ *
+ * @param it Iterator handle.
+ * @param out_offset Output: byte offset of the piece within the source (0 when done).
+ * @param out_len Output: byte length of the piece (0 when done).
+ * @return True if a piece was produced; false once the input is exhausted.
+ *
+ * @note Fatal if `out_offset` or `out_len` is NULL.
+ */
+FATSTD_API bool fat_SplitIterNext(fat_SplitIter it, size_t *out_offset, size_t *out_len);
+
+/**
+ * @brief Produces up to `cap` pieces in one call.
+ *
+ * Prefer this over fat_SplitIterNext for inputs with many small pieces; each
+ * call crosses into Go once.
+ *
+ * @param it Iterator handle.
+ * @param out_offsets Receives piece offsets (may be NULL only if cap == 0).
+ * @param out_lens Receives piece lengths (may be NULL only if cap == 0).
+ * @param cap Capacity of both arrays.
+ * @return Number of pieces written; less than `cap` only once the input is exhausted.
+ */
+FATSTD_API size_t fat_SplitIterNextBatch(fat_SplitIter it, size_t *out_offsets, size_t *out_lens, size_t cap);
+
+/**
+ * @brief Frees a split iterator.
+ *
+ * @param it Iterator handle to free.
+ */
+FATSTD_API void fat_SplitIterFree(fat_SplitIter it);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
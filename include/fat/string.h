@@ -13,6 +13,7 @@
 #include <stddef.h>
 #include <stdbool.h>
 
+#include "fat/borrow.h"
 #include "fat/export.h"
 #include "fat/handle.h"
 
@@ -24,7 +25,13 @@ extern "C" {
  * @brief Opaque handle to a FatStd string.
  *
  * The handle is an identity-only token. The underlying storage is Go-managed and
- * is never exposed directly to C.
+ * is only exposed to C through explicit read-only borrows (fat_StringBorrow).
+ *
+ * Strings are immutable, so a handle may be a substring view that shares its
+ * bytes with the string it was cut from. fat_StringSlice and the trim/cut APIs
+ * return views; fat_StringOffsetIn recovers a view's position. Views are
+ * ordinary handles: each is freed on its own and stays valid after its parent
+ * is freed.
  *
  * @note Ownership: free with fat_StringFree.
  */
@@ -33,8 +40,12 @@ typedef fat_Handle fat_String;
 /**
  * @brief Opaque handle to a FatStd array of strings.
  *
- * Arrays are returned by APIs like split/fields. Elements are accessed with
- * fat_StringArrayGet (which returns newly allocated fat_String handles).
+ * Arrays are returned by APIs like split/fields. Elements are stored packed:
+ * one contiguous byte arena plus an offsets table, where element i is
+ * arena[offsets[i], offsets[i + 1]). Elements can be accessed one at a time with
+ * fat_StringArrayGet (which returns newly allocated fat_String handles), or all
+ * at once without per-element handles through fat_StringArrayBorrow or
+ * fat_StringArrayCopyOutAll.
  *
  * @note Ownership: free the array handle with fat_StringArrayFree.
  */
@@ -104,14 +115,63 @@ FATSTD_API size_t fat_StringCopyOut(fat_String s, void *dst, size_t dst_len);
  */
 FATSTD_API size_t fat_StringCopyOutCStr(fat_String s, char *dst, size_t dst_len);
 
+/**
+ * @brief Borrows a read-only view of the string's UTF-8 bytes without copying.
+ *
+ * The returned pointer stays valid until fat_BorrowRelease(*out_borrow), even
+ * if `s` is freed first.
+ *
+ * @param s String handle.
+ * @param out_len Output: byte length of the view.
+ * @param out_borrow Output: borrow handle (must be released with fat_BorrowRelease).
+ * @return Pointer to the first byte, or NULL when the string is empty.
+ *
+ * @note The view is read-only and is not NUL-terminated. Fatal if `out_len` or
+ *       `out_borrow` is NULL.
+ */
+FATSTD_API const char *fat_StringBorrow(fat_String s, size_t *out_len, fat_Borrow *out_borrow);
+
 /**
  * @brief Returns a new string handle whose bytes are a clone of `s`.
  *
+ * The clone never shares bytes with `s`; use it to detach a small view from a
+ * large parent so the parent's bytes can be released.
+ *
  * @param s String handle.
  * @return A new fat_String handle (must be freed with fat_StringFree).
  */
 FATSTD_API fat_String fat_StringClone(fat_String s);
 
+/**
+ * @brief Returns a view of bytes [off, off + n) of `s` without copying.
+ *
+ * Offsets are in bytes and may split a multi-byte UTF-8 sequence.
+ *
+ * @param s String handle.
+ * @param off Byte offset of the view.
+ * @param n Byte length of the view.
+ * @return A new fat_String handle sharing `s`'s bytes (must be freed with fat_StringFree).
+ *
+ * @note Fatal if `off + n` exceeds fat_StringLenBytes(s).
+ */
+FATSTD_API fat_String fat_StringSlice(fat_String s, size_t off, size_t n);
+
+/**
+ * @brief Reports whether `s` is a view lying within `parent`, and where.
+ *
+ * True when both handles view the same underlying string (for example `s` was
+ * produced from `parent`, or both were cut from a common string) and `s` lies
+ * inside `parent`'s range. Equal contents alone do not count.
+ *
+ * @param s String handle.
+ * @param parent String handle.
+ * @param out_off Output: byte offset of `s` within `parent`; written only on success.
+ * @return True if `s` is a view within `parent`.
+ *
+ * @note Fatal if `out_off` is NULL.
+ */
+FATSTD_API bool fat_StringOffsetIn(fat_String s, fat_String parent, size_t *out_off);
+
 /**
  * @brief Reports whether `substr` is within `s`.
  *
@@ -140,10 +200,12 @@ FATSTD_API bool fat_StringHasPrefix(fat_String s, fat_String prefix);
 FATSTD_API bool fat_StringHasSuffix(fat_String s, fat_String suffix);
 
 /**
- * @brief Returns a new string handle with a copy of `s` trimmed of leading/trailing Unicode whitespace.
+ * @brief Returns a view of `s` trimmed of leading/trailing Unicode whitespace.
+ *
+ * An all-whitespace `s` trims to the empty view at its end.
  *
  * @param s String handle.
- * @return A new fat_String handle (must be freed with fat_StringFree).
+ * @return A new fat_String handle sharing `s`'s bytes (must be freed with fat_StringFree).
  */
 FATSTD_API fat_String fat_StringTrimSpace(fat_String s);
 
@@ -201,6 +263,49 @@ FATSTD_API size_t fat_StringArrayLen(fat_StringArray a);
  */
 FATSTD_API fat_String fat_StringArrayGet(fat_StringArray a, size_t idx);
 
+/**
+ * @brief Returns the combined byte length of all elements (the size of the packed arena).
+ *
+ * @param a Array handle.
+ * @return Total bytes across all elements.
+ */
+FATSTD_API size_t fat_StringArrayTotalBytes(fat_StringArray a);
+
+/**
+ * @brief Borrows read-only views of the array's packed arena and offsets table without copying.
+ *
+ * Element i occupies bytes [(*out_offsets)[i], (*out_offsets)[i + 1]) of the
+ * returned arena. Both views stay valid until fat_BorrowRelease(*out_borrow),
+ * even if `a` is freed first.
+ *
+ * @param a Array handle.
+ * @param out_offsets Output: pointer to `*out_count + 1` element boundaries; (*out_offsets)[0] is 0.
+ * @param out_count Output: number of elements.
+ * @param out_borrow Output: borrow handle (must be released with fat_BorrowRelease).
+ * @return Pointer to the first arena byte, or NULL when every element is empty.
+ *
+ * @note The views are read-only and elements are not NUL-terminated. Fatal if
+ * any output pointer is NULL.
+ */
+FATSTD_API const char *fat_StringArrayBorrow(fat_StringArray a, const size_t **out_offsets, size_t *out_count, fat_Borrow *out_borrow);
+
+/**
+ * @brief Copies every element and the offsets table out in one call.
+ *
+ * The elements are written back to back into `dst`; element i occupies bytes
+ * [out_offsets[i], out_offsets[i + 1]).
+ *
+ * @param a Array handle.
+ * @param dst Destination buffer (may be NULL only if the total byte length is 0).
+ * @param dst_len Capacity of `dst`; must be at least fat_StringArrayTotalBytes(a).
+ * @param out_offsets Receives fat_StringArrayLen(a) + 1 offsets.
+ * @param offsets_len Capacity of `out_offsets`; must be at least fat_StringArrayLen(a) + 1.
+ * @return Number of bytes written to `dst`.
+ *
+ * @note Fatal if either buffer is too small. No NUL terminator is written.
+ */
+FATSTD_API size_t fat_StringArrayCopyOutAll(fat_StringArray a, char *dst, size_t dst_len, size_t *out_offsets, size_t offsets_len);
+
 /**
  * @brief Frees a string array handle.
  *
@@ -210,6 +315,99 @@ FATSTD_API fat_String fat_StringArrayGet(fat_StringArray a, size_t idx);
  */
 FATSTD_API void fat_StringArrayFree(fat_StringArray a);
 
+/**
+ * @brief Returns a new array with every element mapped to lower case.
+ *
+ * Batch form of fat_StringToLower: the whole array is processed in one call, so
+ * normalizing a large column costs one C-to-Go transition and one new handle
+ * instead of one per element.
+ *
+ * @param a Array handle.
+ * @return A new fat_StringArray handle (must be freed with fat_StringArrayFree).
+ */
+FATSTD_API fat_StringArray fat_StringArrayToLower(fat_StringArray a);
+
+/**
+ * @brief Returns a new array with every element mapped to upper case.
+ *
+ * @param a Array handle.
+ * @return A new fat_StringArray handle (must be freed with fat_StringArrayFree).
+ */
+FATSTD_API fat_StringArray fat_StringArrayToUpper(fat_StringArray a);
+
+/**
+ * @brief Returns a new array with leading and trailing white space removed from every element.
+ *
+ * @param a Array handle.
+ * @return A new fat_StringArray handle (must be freed with fat_StringArrayFree).
+ */
+FATSTD_API fat_StringArray fat_StringArrayTrimSpace(fat_StringArray a);
+
+/**
+ * @brief Reports, for every element of `a`, whether the element begins with `prefix`.
+ *
+ * @param a Array handle.
+ * @param prefix Prefix handle.
+ * @param out Receives one result per element, in array order.
+ * @param out_len Capacity of `out`; must be at least fat_StringArrayLen(a).
+ * @return Number of elements for which the result is true.
+ *
+ * @note `out` may be NULL only when the array is empty.
+ */
+FATSTD_API size_t fat_StringArrayHasPrefix(fat_StringArray a, fat_String prefix, bool *out, size_t out_len);
+
+/**
+ * @brief Reports, for every element of `a`, whether the element ends with `suffix`.
+ *
+ * @param a Array handle.
+ * @param suffix Suffix handle.
+ * @param out Receives one result per element, in array order.
+ * @param out_len Capacity of `out`; must be at least fat_StringArrayLen(a).
+ * @return Number of elements for which the result is true.
+ *
+ * @note `out` may be NULL only when the array is empty.
+ */
+FATSTD_API size_t fat_StringArrayHasSuffix(fat_StringArray a, fat_String suffix, bool *out, size_t out_len);
+
+/**
+ * @brief Reports, for every element of `a`, whether `substr` is within the element.
+ *
+ * @param a Array handle.
+ * @param substr Substring handle.
+ * @param out Receives one result per element, in array order.
+ * @param out_len Capacity of `out`; must be at least fat_StringArrayLen(a).
+ * @return Number of elements for which the result is true.
+ *
+ * @note `out` may be NULL only when the array is empty.
+ */
+FATSTD_API size_t fat_StringArrayContains(fat_StringArray a, fat_String substr, bool *out, size_t out_len);
+
+/**
+ * @brief Reports, for every element of `a`, whether the element equals `t` under Unicode case-folding.
+ *
+ * @param a Array handle.
+ * @param t String handle to compare against.
+ * @param out Receives one result per element, in array order.
+ * @param out_len Capacity of `out`; must be at least fat_StringArrayLen(a).
+ * @return Number of elements for which the result is true.
+ *
+ * @note `out` may be NULL only when the array is empty.
+ */
+FATSTD_API size_t fat_StringArrayEqualFold(fat_StringArray a, fat_String t, bool *out, size_t out_len);
+
+/**
+ * @brief Returns the index of the first instance of `substr` in every element of `a`.
+ *
+ * @param a Array handle.
+ * @param substr Substring handle.
+ * @param out Receives one zero-based byte index per element, or -1 where not found.
+ * @param out_len Capacity of `out`; must be at least fat_StringArrayLen(a).
+ * @return Number of elements that contain `substr`.
+ *
+ * @note `out` may be NULL only when the array is empty.
+ */
+FATSTD_API size_t fat_StringArrayIndex(fat_StringArray a, fat_String substr, int64_t *out, size_t out_len);
+
 /**
  * @brief Joins an array of strings using `sep`.
  *
@@ -265,7 +463,7 @@ FATSTD_API fat_String fat_StringToUpper(fat_String s);
  * @param substr Substring handle.
  * @return Zero-based byte index, or -1 if not found.
  */
-FATSTD_API int fat_StringIndex(fat_String s, fat_String substr);
+FATSTD_API int64_t fat_StringIndex(fat_String s, fat_String substr);
 
 /**
  * @brief Counts the number of non-overlapping instances of `substr` in `s`.
@@ -274,7 +472,7 @@ FATSTD_API int fat_StringIndex(fat_String s, fat_String substr);
  * @param substr Substring handle.
  * @return Count of occurrences.
  */
-FATSTD_API int fat_StringCount(fat_String s, fat_String substr);
+FATSTD_API int64_t fat_StringCount(fat_String s, fat_String substr);
 
 /**
  * @brief Lexicographically compares two strings.
@@ -295,28 +493,29 @@ FATSTD_API int fat_StringCompare(fat_String a, fat_String b);
 FATSTD_API bool fat_StringEqualFold(fat_String s, fat_String t);
 
 /**
- * @brief Returns a new string with the leading `prefix` removed, if present.
+ * @brief Returns a view of `s` with the leading `prefix` removed, if present.
  *
  * @param s String handle.
  * @param prefix Prefix handle.
- * @return A new fat_String handle (must be freed with fat_StringFree).
+ * @return A new fat_String handle sharing `s`'s bytes (must be freed with fat_StringFree).
  */
 FATSTD_API fat_String fat_StringTrimPrefix(fat_String s, fat_String prefix);
 
 /**
- * @brief Returns a new string with the trailing `suffix` removed, if present.
+ * @brief Returns a view of `s` with the trailing `suffix` removed, if present.
  *
  * @param s String handle.
  * @param suffix Suffix handle.
- * @return A new fat_String handle (must be freed with fat_StringFree).
+ * @return A new fat_String handle sharing `s`'s bytes (must be freed with fat_StringFree).
  */
 FATSTD_API fat_String fat_StringTrimSuffix(fat_String s, fat_String suffix);
 
 /**
  * @brief Splits `s` around the first instance of `sep`.
  *
- * Matches Go's strings.Cut semantics. Outputs are newly allocated fat_String handles
- * regardless of whether `sep` is found.
+ * Matches Go's strings.Cut semantics. Outputs are new handles viewing `s`'s bytes,
+ * set regardless of whether `sep` is found; when it is not, `after_out` is the empty
+ * view at the end of `s`.
  *
  * @param s String handle.
  * @param sep Separator handle.
@@ -331,8 +530,8 @@ FATSTD_API bool fat_StringCut(fat_String s, fat_String sep, fat_String *before_o
 /**
  * @brief Cuts `prefix` from the start of `s`.
  *
- * Matches Go's strings.CutPrefix semantics. `after_out` is a newly allocated fat_String handle
- * regardless of whether `prefix` is found.
+ * Matches Go's strings.CutPrefix semantics. `after_out` is a new handle viewing `s`'s
+ * bytes, set regardless of whether `prefix` is found.
  *
  * @param s String handle.
  * @param prefix Prefix handle.
@@ -346,8 +545,8 @@ FATSTD_API bool fat_StringCutPrefix(fat_String s, fat_String prefix, fat_String
 /**
  * @brief Cuts `suffix` from the end of `s`.
  *
- * Matches Go's strings.CutSuffix semantics. `after_out` is a newly allocated fat_String handle
- * regardless of whether `suffix` is found.
+ * Matches Go's strings.CutSuffix semantics. `after_out` is a new handle viewing `s`'s
+ * bytes, set regardless of whether `suffix` is found.
  *
  * @param s String handle.
  * @param suffix Suffix handle.
@@ -400,7 +599,8 @@ FATSTD_API bool fat_StringIndexAny(fat_String s, fat_String chars);
 /**
  * @brief Returns a copy of `s` with invalid UTF-8 sequences replaced.
  *
- * Matches Go's strings.ToValidUTF8.
+ * Matches Go's strings.ToValidUTF8. Already-valid input is not copied; the
+ * new handle shares the original bytes.
  *
  * @param s String handle.
  * @param replacement Replacement string.
@@ -408,6 +608,17 @@ FATSTD_API bool fat_StringIndexAny(fat_String s, fat_String chars);
  */
 FATSTD_API fat_String fat_StringToValidUTF8(fat_String s, fat_String replacement);
 
+/**
+ * @brief Reports whether `s` is entirely valid UTF-8.
+ *
+ * Matches Go's utf8.ValidString. Use it to skip fat_StringToValidUTF8 (and the
+ * handle it returns) for input that is already clean.
+ *
+ * @param s String handle.
+ * @return True if `s` is valid UTF-8; false otherwise.
+ */
+FATSTD_API bool fat_StringIsValidUTF8(fat_String s);
+
 /**
  * @brief Frees a FatStd string handle.
  *
@@ -0,0 +1,134 @@
+#pragma once
+
+/**
+ * @file fat/string_intern.h
+ * @brief Bounded interning table that maps equal strings to one shared handle.
+ *
+ * Keys and names such as JSON object keys, XML element names or CSV header
+ * fields repeat many times in typical inputs. Interning them stores each
+ * distinct value once and hands out the same fat_String handle for every
+ * occurrence, instead of a fresh string and handle per occurrence.
+ *
+ * Interned handles are owned by the interner, not the caller:
+ * - Do not free them with fat_StringFree (fatal) or fat_HandlesFree (rejected).
+ *   Arenas do not record them.
+ * - The lookup table holds at most `capacity` entries. Interning a new value
+ *   into a full table evicts the least recently used entry; a later lookup of
+ *   that value returns a new handle.
+ * - Evicted handles are not released: every handle stays valid until
+ *   fat_StringInternerReset or fat_StringInternerFree. Long-running callers
+ *   should reset at a point where they no longer use earlier handles (e.g.
+ *   between documents), since eviction bounds the table but not the handles.
+ *
+ * Using an interned handle after its interner is reset or freed is fatal
+ * (invalid handle). Callers that keep a handle for longer should take a
+ * private copy with fat_StringClone.
+ *
+ * Interners are safe for concurrent use.
+ *
+ * All functions are fail-fast: invalid handles and contract violations are fatal.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#include "fat/export.h"
+#include "fat/handle.h"
+#include "fat/string.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Opaque handle to a string interning table.
+ *
+ * @note Ownership: free with fat_StringInternerFree.
+ */
+typedef fat_Handle fat_StringInterner;
+
+/**
+ * @brief Creates an interning table holding at most `capacity` distinct strings.
+ *
+ * @param capacity Maximum number of entries (must be > 0).
+ * @return A new fat_StringInterner handle (must be freed with fat_StringInternerFree).
+ */
+FATSTD_API fat_StringInterner fat_StringInternerNew(size_t capacity);
+
+/**
+ * @brief Returns the interned handle for the contents of `s`.
+ *
+ * Equal strings yield the same handle while the entry stays in the table.
+ *
+ * @param in Interner handle.
+ * @param s String handle (not consumed; the caller still owns it).
+ * @return Interner-owned fat_String handle (must not be freed by the caller).
+ */
+FATSTD_API fat_String fat_StringIntern(fat_StringInterner in, fat_String s);
+
+/**
+ * @brief Returns the interned handle for `len` bytes at `bytes`.
+ *
+ * Hits do not copy or allocate, so decoders can intern names straight from
+ * their input buffer.
+ *
+ * @param in Interner handle.
+ * @param bytes Pointer to bytes (may be NULL only if len == 0).
+ * @param len Number of bytes.
+ * @return Interner-owned fat_String handle (must not be freed by the caller).
+ */
+FATSTD_API fat_String fat_StringInternUTF8N(fat_StringInterner in, const char *bytes, size_t len);
+
+/**
+ * @brief Returns element `idx` of a string array as an interned handle.
+ *
+ * Use this for fields that repeat across arrays, such as CSV header records
+ * from fat_CsvReaderRead or keys from fat_JsonObjectKeys. Hits do not copy or
+ * allocate.
+ *
+ * @param a Array handle.
+ * @param idx Element index (0 <= idx < fat_StringArrayLen(a)).
+ * @param in Interner handle.
+ * @return Interner-owned fat_String handle (must not be freed by the caller).
+ */
+FATSTD_API fat_String fat_StringArrayGetInterned(fat_StringArray a, size_t idx, fat_StringInterner in);
+
+/**
+ * @brief Returns the number of strings currently in the table.
+ *
+ * @param in Interner handle.
+ * @return Entry count (at most the capacity).
+ */
+FATSTD_API size_t fat_StringInternerLen(fat_StringInterner in);
+
+/**
+ * @brief Reports lookup counters since the interner was created.
+ *
+ * @param in Interner handle.
+ * @param out_hits Output: lookups that found an existing entry.
+ * @param out_misses Output: lookups that inserted a new entry.
+ * @param out_evictions Output: entries evicted to stay within capacity.
+ *
+ * @note Fatal if any output pointer is NULL.
+ */
+FATSTD_API void fat_StringInternerStats(fat_StringInterner in, uint64_t *out_hits, uint64_t *out_misses, uint64_t *out_evictions);
+
+/**
+ * @brief Empties the table and releases every handle the interner has handed out.
+ *
+ * Counters are kept. No other thread may be using handles from `in`.
+ *
+ * @param in Interner handle.
+ */
+FATSTD_API void fat_StringInternerReset(fat_StringInterner in);
+
+/**
+ * @brief Frees an interner and every handle it has handed out.
+ *
+ * @param in Interner handle to free.
+ */
+FATSTD_API void fat_StringInternerFree(fat_StringInterner in);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
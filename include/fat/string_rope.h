@@ -0,0 +1,128 @@
+#pragma once
+
+/**
+ * @file fat/string_rope.h
+ * @brief Editable text handle with logarithmic insert, delete and slice.
+ *
+ * fat_StringBuilder only appends, and fat_StringReplaceAll rebuilds the whole
+ * string, so applying many small edits to a large document through them costs
+ * O(document size) per edit. A rope stores the text as a balanced tree of
+ * pieces: inserting, deleting or slicing costs O(log pieces) and does not copy
+ * the document. Flatten with fat_StringRopeString when a fat_String is needed.
+ *
+ * All offsets and lengths are in bytes. Edits do not check UTF-8 boundaries.
+ *
+ * Ropes are mutable and not safe for concurrent use.
+ *
+ * All functions are fail-fast: invalid handles and contract violations are fatal.
+ */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#include "fat/export.h"
+#include "fat/handle.h"
+#include "fat/string.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * @brief Opaque handle to a FatStd rope.
+ *
+ * @note Ownership: free with fat_StringRopeFree.
+ */
+typedef fat_Handle fat_StringRope;
+
+/**
+ * @brief Creates a new empty rope.
+ *
+ * @return A new fat_StringRope handle (must be freed with fat_StringRopeFree).
+ */
+FATSTD_API fat_StringRope fat_StringRopeNew(void);
+
+/**
+ * @brief Creates a rope holding the contents of `s`.
+ *
+ * The rope shares the string's bytes instead of copying them.
+ *
+ * @param s String handle (not consumed; the caller still owns it).
+ * @return A new fat_StringRope handle (must be freed with fat_StringRopeFree).
+ */
+FATSTD_API fat_StringRope fat_StringRopeNewString(fat_String s);
+
+/**
+ * @brief Frees a rope handle.
+ *
+ * Slices taken from the rope remain valid.
+ *
+ * @param r Rope handle to free.
+ */
+FATSTD_API void fat_StringRopeFree(fat_StringRope r);
+
+/**
+ * @brief Returns the rope length in bytes.
+ *
+ * @param r Rope handle.
+ * @return Length in bytes.
+ */
+FATSTD_API size_t fat_StringRopeLen(fat_StringRope r);
+
+/**
+ * @brief Inserts the contents of `s` before byte offset `off`.
+ *
+ * @param r Rope handle.
+ * @param off Insertion offset (must be <= fat_StringRopeLen(r)).
+ * @param s String handle to insert (not consumed).
+ */
+FATSTD_API void fat_StringRopeInsert(fat_StringRope r, size_t off, fat_String s);
+
+/**
+ * @brief Inserts an explicit byte span before byte offset `off`.
+ *
+ * Copies exactly `len` bytes; embedded NULs are preserved.
+ *
+ * @param r Rope handle.
+ * @param off Insertion offset (must be <= fat_StringRopeLen(r)).
+ * @param bytes Pointer to bytes (may be NULL only if len == 0).
+ * @param len Number of bytes to insert.
+ */
+FATSTD_API void fat_StringRopeInsertUTF8N(fat_StringRope r, size_t off, const char *bytes, size_t len);
+
+/**
+ * @brief Removes `n` bytes starting at byte offset `off`.
+ *
+ * @param r Rope handle.
+ * @param off Start offset.
+ * @param n Number of bytes to remove (`off + n` must be <= fat_StringRopeLen(r)).
+ */
+FATSTD_API void fat_StringRopeDelete(fat_StringRope r, size_t off, size_t n);
+
+/**
+ * @brief Returns a new rope holding `n` bytes starting at byte offset `off`.
+ *
+ * The slice shares storage with `r`, so it costs O(log pieces) regardless of
+ * `n`. Later edits to either rope do not affect the other.
+ *
+ * @param r Rope handle.
+ * @param off Start offset.
+ * @param n Number of bytes (`off + n` must be <= fat_StringRopeLen(r)).
+ * @return A new fat_StringRope handle (must be freed with fat_StringRopeFree).
+ */
+FATSTD_API fat_StringRope fat_StringRopeSlice(fat_StringRope r, size_t off, size_t n);
+
+/**
+ * @brief Flattens the rope into a new FatStd string handle.
+ *
+ * The flattened text is cached until the next edit, and the rope collapses to
+ * a single piece, so flattening an unchanged rope again does not copy.
+ *
+ * @param r Rope handle.
+ * @return A new fat_String handle (must be freed with fat_StringFree).
+ */
+FATSTD_API fat_String fat_StringRopeString(fat_StringRope r);
+
+#ifdef __cplusplus
+} /* extern "C" */
+#endif
@@ -28,6 +28,7 @@
 #include "fat/handle.h"
 #include "fat/status.h"
 #include "fat/string.h"
+#include "fat/string_intern.h"
 
 #ifdef __cplusplus
 extern "C" {
@@ -155,6 +156,22 @@ FATSTD_API fat_String fat_XmlTokenNameLocal(fat_XmlToken tok);
  */
 FATSTD_API fat_String fat_XmlTokenNameSpace(fat_XmlToken tok);
 
+/**
+ * @brief Returns the local name for StartElement/EndElement as an interned handle.
+ *
+ * Repeated element names share one handle instead of allocating per token.
+ *
+ * @return Interner-owned fat_String handle (must not be freed; see fat/string_intern.h).
+ */
+FATSTD_API fat_String fat_XmlTokenNameLocalInterned(fat_XmlToken tok, fat_StringInterner in);
+
+/**
+ * @brief Returns the namespace space for StartElement/EndElement as an interned handle.
+ *
+ * @return Interner-owned fat_String handle (must not be freed; see fat/string_intern.h).
+ */
+FATSTD_API fat_String fat_XmlTokenNameSpaceInterned(fat_XmlToken tok, fat_StringInterner in);
+
 /**
  * @brief Returns the number of attributes on a StartElement token.
  */
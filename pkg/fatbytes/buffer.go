@@ -6,7 +6,8 @@ import (
 )
 
 type Buffer struct {
-	buf bytes.Buffer
+	buf      bytes.Buffer
+	reserved []byte
 }
 
 func NewBuffer(init []byte) *Buffer {
@@ -21,9 +22,41 @@ func (b *Buffer) Underlying() *bytes.Buffer {
 	if b == nil {
 		panic("fatbytes.Buffer.Underlying: receiver is nil")
 	}
+	b.checkNoReservation("fatbytes.Buffer.Underlying")
 	return &b.buf
 }
 
+// bufferWriter is the io.Writer view of a Buffer. Unlike the bytes.Buffer
+// from Underlying, it checks for a pending reservation on every write, so
+// encoders attached to a buffer cannot bypass Reserve/Commit.
+type bufferWriter struct {
+	b *Buffer
+}
+
+func (w bufferWriter) Write(p []byte) (int, error) {
+	w.b.checkNoReservation("fatbytes.Buffer.Writer")
+	return w.b.buf.Write(p)
+}
+
+func (w bufferWriter) WriteString(s string) (int, error) {
+	w.b.checkNoReservation("fatbytes.Buffer.Writer")
+	return w.b.buf.WriteString(s)
+}
+
+func (w bufferWriter) WriteByte(c byte) error {
+	w.b.checkNoReservation("fatbytes.Buffer.Writer")
+	return w.b.buf.WriteByte(c)
+}
+
+// Writer returns an io.Writer that appends to b. Use it to attach encoders
+// and other io.Writer consumers to b.
+func (b *Buffer) Writer() io.Writer {
+	if b == nil {
+		panic("fatbytes.Buffer.Writer: receiver is nil")
+	}
+	return bufferWriter{b}
+}
+
 func (b *Buffer) Bytes() []byte {
 	if b == nil {
 		panic("fatbytes.Buffer.Bytes: receiver is nil")
@@ -56,6 +89,7 @@ func (b *Buffer) Grow(n int) {
 	if b == nil {
 		panic("fatbytes.Buffer.Grow: receiver is nil")
 	}
+	b.checkNoReservation("fatbytes.Buffer.Grow")
 	b.buf.Grow(n)
 }
 
@@ -63,6 +97,7 @@ func (b *Buffer) Reset() {
 	if b == nil {
 		panic("fatbytes.Buffer.Reset: receiver is nil")
 	}
+	b.checkNoReservation("fatbytes.Buffer.Reset")
 	b.buf.Reset()
 }
 
@@ -70,6 +105,7 @@ func (b *Buffer) Truncate(n int) {
 	if b == nil {
 		panic("fatbytes.Buffer.Truncate: receiver is nil")
 	}
+	b.checkNoReservation("fatbytes.Buffer.Truncate")
 	b.buf.Truncate(n)
 }
 
@@ -77,6 +113,7 @@ func (b *Buffer) Write(p []byte) int {
 	if b == nil {
 		panic("fatbytes.Buffer.Write: receiver is nil")
 	}
+	b.checkNoReservation("fatbytes.Buffer.Write")
 	n, _ := b.buf.Write(p)
 	return n
 }
@@ -85,6 +122,7 @@ func (b *Buffer) WriteByte(c byte) {
 	if b == nil {
 		panic("fatbytes.Buffer.WriteByte: receiver is nil")
 	}
+	b.checkNoReservation("fatbytes.Buffer.WriteByte")
 	_ = b.buf.WriteByte(c)
 }
 
@@ -92,6 +130,7 @@ func (b *Buffer) WriteRune(r rune) int {
 	if b == nil {
 		panic("fatbytes.Buffer.WriteRune: receiver is nil")
 	}
+	b.checkNoReservation("fatbytes.Buffer.WriteRune")
 	n, _ := b.buf.WriteRune(r)
 	return n
 }
@@ -100,10 +139,82 @@ func (b *Buffer) WriteString(s string) int {
 	if b == nil {
 		panic("fatbytes.Buffer.WriteString: receiver is nil")
 	}
+	b.checkNoReservation("fatbytes.Buffer.WriteString")
 	n, _ := b.buf.WriteString(s)
 	return n
 }
 
+// AvailableBuffer returns an empty slice over b's unused capacity. Appending
+// to it and passing the result to Write appends without an extra copy.
+func (b *Buffer) AvailableBuffer() []byte {
+	if b == nil {
+		panic("fatbytes.Buffer.AvailableBuffer: receiver is nil")
+	}
+	b.checkNoReservation("fatbytes.Buffer.AvailableBuffer")
+	return b.buf.AvailableBuffer()
+}
+
+// checkNoReservation rejects writes between Reserve and Commit: they could
+// move b's array or land in the reserved bytes, so Commit would append stale
+// data.
+func (b *Buffer) checkNoReservation(name string) {
+	if b.reserved != nil {
+		panic(name + ": called between Reserve and Commit")
+	}
+}
+
+// Reserve returns n writable bytes after b's contents, growing b if needed.
+// Commit appends what was written there; until then the bytes are not part
+// of b, and writes to b panic. Reading is allowed. Reserving again replaces
+// the pending reservation, and reserving 0 bytes cancels it.
+func (b *Buffer) Reserve(n int) []byte {
+	if b == nil {
+		panic("fatbytes.Buffer.Reserve: receiver is nil")
+	}
+	if n < 0 {
+		panic("fatbytes.Buffer.Reserve: negative count")
+	}
+	if n == 0 {
+		b.reserved = nil
+		return nil
+	}
+	b.buf.Grow(n)
+	b.reserved = b.buf.AvailableBuffer()[:n]
+	return b.reserved
+}
+
+// Commit appends the first n bytes of the last Reserve region to b and ends
+// the reservation.
+func (b *Buffer) Commit(n int) {
+	if b == nil {
+		panic("fatbytes.Buffer.Commit: receiver is nil")
+	}
+	if n < 0 || n > len(b.reserved) {
+		panic("fatbytes.Buffer.Commit: count exceeds reservation")
+	}
+	unread := b.buf.Bytes()
+	m := len(unread)
+	if n > 0 && b.buf.Cap() == cap(unread) && cap(unread)-m >= n && &unread[:m+1][m] == &b.reserved[0] {
+		// The contents start the array and the region follows them, so
+		// extend the buffer over it instead of copying it onto itself.
+		b.buf = *bytes.NewBuffer(unread[:m+n])
+	} else {
+		b.buf.Write(b.reserved[:n])
+	}
+	b.reserved = nil
+}
+
+// Consume discards the next n unread bytes, like Next without the result.
+func (b *Buffer) Consume(n int) {
+	if b == nil {
+		panic("fatbytes.Buffer.Consume: receiver is nil")
+	}
+	if n < 0 || n > b.buf.Len() {
+		panic("fatbytes.Buffer.Consume: count exceeds unread length")
+	}
+	b.buf.Next(n)
+}
+
 func (b *Buffer) Read(p []byte) (int, error) {
 	if b == nil {
 		panic("fatbytes.Buffer.Read: receiver is nil")
@@ -136,6 +247,7 @@ func (b *Buffer) ReadFrom(r io.Reader) (int64, error) {
 	if b == nil {
 		panic("fatbytes.Buffer.ReadFrom: receiver is nil")
 	}
+	b.checkNoReservation("fatbytes.Buffer.ReadFrom")
 	return b.buf.ReadFrom(r)
 }
 
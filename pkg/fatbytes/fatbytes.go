@@ -1,9 +1,22 @@
 package fatbytes
 
-import "bytes"
+import (
+	"bytes"
+	"sync/atomic"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatstrings"
+)
 
 type Bytes struct {
 	value []byte
+	ext   *external
+}
+
+// external tracks memory that is not owned by the Go heap. release runs
+// exactly once, when the last reference is dropped.
+type external struct {
+	refs    atomic.Int64
+	release func()
 }
 
 type BytesArray struct {
@@ -14,6 +27,15 @@ func New(value []byte) *Bytes {
 	return &Bytes{value: value}
 }
 
+// NewExternal wraps memory owned outside the Go heap without copying it. The
+// wrapper starts with one reference; release (may be nil) runs when Release
+// drops the last one. value must stay valid until then.
+func NewExternal(value []byte, release func()) *Bytes {
+	b := &Bytes{value: value, ext: &external{release: release}}
+	b.ext.refs.Store(1)
+	return b
+}
+
 func NewArray(values [][]byte) *BytesArray {
 	return &BytesArray{values: values}
 }
@@ -25,6 +47,45 @@ func (b *Bytes) Value() []byte {
 	return b.value
 }
 
+func (b *Bytes) IsExternal() bool {
+	if b == nil {
+		panic("fatbytes.Bytes.IsExternal: receiver is nil")
+	}
+	return b.ext != nil
+}
+
+// Retain adds a reference to external memory. It is a no-op for Go-owned bytes.
+func (b *Bytes) Retain() {
+	if b == nil {
+		panic("fatbytes.Bytes.Retain: receiver is nil")
+	}
+	if b.ext == nil {
+		return
+	}
+	if b.ext.refs.Add(1) <= 1 {
+		panic("fatbytes.Bytes.Retain: external memory already released")
+	}
+}
+
+// Release drops a reference to external memory, running the release callback
+// when it was the last one. It is a no-op for Go-owned bytes.
+func (b *Bytes) Release() {
+	if b == nil {
+		panic("fatbytes.Bytes.Release: receiver is nil")
+	}
+	if b.ext == nil {
+		return
+	}
+	switch n := b.ext.refs.Add(-1); {
+	case n == 0:
+		if b.ext.release != nil {
+			b.ext.release()
+		}
+	case n < 0:
+		panic("fatbytes.Bytes.Release: external memory already released")
+	}
+}
+
 func (a *BytesArray) Len() int {
 	if a == nil {
 		panic("fatbytes.BytesArray.Len: receiver is nil")
@@ -118,11 +179,11 @@ func Repeat(b []byte, count int) []byte {
 }
 
 func ToLower(s []byte) []byte {
-	return bytes.ToLower(s)
+	return fatstrings.ToLowerBytes(s)
 }
 
 func ToUpper(s []byte) []byte {
-	return bytes.ToUpper(s)
+	return fatstrings.ToUpperBytes(s)
 }
 
 func IndexByte(b []byte, c byte) int {
@@ -134,7 +195,11 @@ func IndexAny(s []byte, chars string) int {
 }
 
 func ToValidUTF8(s, replacement []byte) []byte {
-	return bytes.ToValidUTF8(s, replacement)
+	return fatstrings.ToValidUTF8Bytes(s, replacement)
+}
+
+func ValidUTF8(b []byte) bool {
+	return fatstrings.ValidUTF8Bytes(b)
 }
 
 func Index(s, sep []byte) int {
@@ -0,0 +1,33 @@
+package fatbytes
+
+import "github.com/bluesentinelsec/FatStd/pkg/fatstrings"
+
+// The Aho-Corasick automaton lives in fatstrings; these are its []byte
+// entry points, so a payload is scanned in place without a string copy.
+
+func MatcherFindAll(m *fatstrings.Matcher, b []byte) []fatstrings.Match {
+	var matches []fatstrings.Match
+	m.ScanBytes(b, func(pattern, start int) bool {
+		matches = append(matches, fatstrings.Match{Pattern: pattern, Start: start})
+		return true
+	})
+	return matches
+}
+
+func MatcherCount(m *fatstrings.Matcher, b []byte) int {
+	n := 0
+	m.ScanBytes(b, func(int, int) bool {
+		n++
+		return true
+	})
+	return n
+}
+
+func MatcherContains(m *fatstrings.Matcher, b []byte) bool {
+	found := false
+	m.ScanBytes(b, func(int, int) bool {
+		found = true
+		return false
+	})
+	return found
+}
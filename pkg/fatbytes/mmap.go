@@ -0,0 +1,42 @@
+package fatbytes
+
+import (
+	"errors"
+	"math"
+	"os"
+)
+
+// MapFile maps a file read-only and wraps the mapping without copying it.
+// Releasing the last reference unmaps the file. Empty files yield ordinary
+// empty bytes, since zero-length mappings are not portable.
+//
+// The mapping reflects the file as it changes; truncating the file while it
+// is mapped makes reads past the new end fault.
+func MapFile(path string) (*Bytes, error) {
+	f, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+	defer f.Close()
+
+	info, err := f.Stat()
+	if err != nil {
+		return nil, err
+	}
+	if !info.Mode().IsRegular() {
+		return nil, &os.PathError{Op: "mmap", Path: path, Err: errors.New("not a regular file")}
+	}
+	size := info.Size()
+	if size == 0 {
+		return New([]byte{}), nil
+	}
+	if size > math.MaxInt {
+		return nil, &os.PathError{Op: "mmap", Path: path, Err: errors.New("file too large to map")}
+	}
+
+	data, err := mmapFile(f, int(size))
+	if err != nil {
+		return nil, &os.PathError{Op: "mmap", Path: path, Err: err}
+	}
+	return NewExternal(data, func() { munmapFile(data) }), nil
+}
@@ -0,0 +1,16 @@
+//go:build unix
+
+package fatbytes
+
+import (
+	"os"
+	"syscall"
+)
+
+func mmapFile(f *os.File, size int) ([]byte, error) {
+	return syscall.Mmap(int(f.Fd()), 0, size, syscall.PROT_READ, syscall.MAP_SHARED)
+}
+
+func munmapFile(data []byte) {
+	_ = syscall.Munmap(data)
+}
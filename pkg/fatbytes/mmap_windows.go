@@ -0,0 +1,38 @@
+//go:build windows
+
+package fatbytes
+
+import (
+	"os"
+	"syscall"
+	"unsafe"
+)
+
+func mmapFile(f *os.File, size int) ([]byte, error) {
+	mapping, err := syscall.CreateFileMapping(syscall.Handle(f.Fd()), nil, syscall.PAGE_READONLY, 0, 0, nil)
+	if err != nil {
+		return nil, err
+	}
+	defer syscall.CloseHandle(mapping)
+
+	addr, err := mapViewOfFile(mapping, size)
+	if err != nil {
+		return nil, err
+	}
+	return unsafe.Slice((*byte)(addr), size), nil
+}
+
+// mapViewOfFile wraps syscall.MapViewOfFile to return the view as a pointer.
+// The view lives outside the Go heap, so its address can be reinterpreted
+// without the GC ever needing to track or move it.
+func mapViewOfFile(mapping syscall.Handle, size int) (unsafe.Pointer, error) {
+	addr, err := syscall.MapViewOfFile(mapping, syscall.FILE_MAP_READ, 0, 0, uintptr(size))
+	if err != nil {
+		return nil, err
+	}
+	return *(*unsafe.Pointer)(unsafe.Pointer(&addr)), nil
+}
+
+func munmapFile(data []byte) {
+	_ = syscall.UnmapViewOfFile(uintptr(unsafe.Pointer(unsafe.SliceData(data))))
+}
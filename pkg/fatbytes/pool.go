@@ -0,0 +1,53 @@
+package fatbytes
+
+import (
+	"math/bits"
+	"sync"
+)
+
+// Pooled buffers are kept in power-of-two capacity classes from
+// 1<<minPooledShift up to MaxPooledCap. Larger buffers are left to the
+// garbage collector so one oversized payload cannot park its memory in the
+// pool.
+const (
+	minPooledShift = 10
+	maxPooledShift = 20
+
+	MaxPooledCap = 1 << maxPooledShift
+)
+
+var bufferPools [maxPooledShift - minPooledShift + 1]sync.Pool
+
+// AcquireBuffer returns an empty buffer with room for at least minCap bytes,
+// reusing one passed to ReleaseBuffer when possible.
+func AcquireBuffer(minCap int) *Buffer {
+	if minCap < 0 {
+		panic("fatbytes.AcquireBuffer: negative capacity")
+	}
+	if minCap > MaxPooledCap {
+		return NewBuffer(make([]byte, 0, minCap))
+	}
+	class := 0
+	if minCap > 1<<minPooledShift {
+		class = bits.Len(uint(minCap-1)) - minPooledShift
+	}
+	if b, ok := bufferPools[class].Get().(*Buffer); ok {
+		return b
+	}
+	return NewBuffer(make([]byte, 0, 1<<(class+minPooledShift)))
+}
+
+// ReleaseBuffer empties b and hands it back to AcquireBuffer. b must not be
+// used afterwards.
+func ReleaseBuffer(b *Buffer) {
+	if b == nil {
+		panic("fatbytes.ReleaseBuffer: buffer is nil")
+	}
+	b.buf.Reset()
+	b.reserved = nil
+	c := b.buf.Cap()
+	if c < 1<<minPooledShift || c > MaxPooledCap {
+		return
+	}
+	bufferPools[bits.Len(uint(c))-1-minPooledShift].Put(b)
+}
@@ -0,0 +1,36 @@
+package fatbytes
+
+import (
+	"bytes"
+	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatstrings"
+)
+
+// The replacement tables live in fatstrings. These entry points view the
+// input as a string without copying it; the replacer only reads its input
+// and writes the result to a buffer, so nothing retains the view.
+
+func bytesView(b []byte) string {
+	if len(b) == 0 {
+		return ""
+	}
+	return unsafe.String(&b[0], len(b))
+}
+
+func ReplacerReplace(r *fatstrings.Replacer, b []byte) []byte {
+	var out bytes.Buffer
+	out.Grow(len(b))
+	r.WriteString(&out, bytesView(b))
+	return out.Bytes()
+}
+
+// ReplacerWrite appends b, with all replacements performed, to dst and
+// returns the number of bytes written.
+func ReplacerWrite(r *fatstrings.Replacer, dst *Buffer, b []byte) int {
+	if dst == nil {
+		panic("fatbytes.ReplacerWrite: dst is nil")
+	}
+	n, _ := r.WriteString(dst.Writer(), bytesView(b))
+	return n
+}
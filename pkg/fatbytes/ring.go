@@ -0,0 +1,221 @@
+package fatbytes
+
+import "sync"
+
+// Ring is a fixed-capacity byte queue over one array that never grows or
+// moves: writes land after the unread bytes and reads take from the front,
+// wrapping around the end of the array. Methods are safe for one producer
+// and one consumer running concurrently. In blocking mode Write, Read,
+// Reserve and Peek wait for room or data instead of returning short, which
+// turns the ring into a bounded hand-off between threads.
+type Ring struct {
+	mu       sync.Mutex
+	readable sync.Cond
+	writable sync.Cond
+	buf      []byte
+	head     int
+	n        int
+	blocking bool
+	closed   bool
+}
+
+func NewRing(capacity int, blocking bool) *Ring {
+	if capacity <= 0 {
+		panic("fatbytes.NewRing: capacity must be positive")
+	}
+	r := &Ring{buf: make([]byte, capacity), blocking: blocking}
+	r.readable.L = &r.mu
+	r.writable.L = &r.mu
+	return r
+}
+
+func (r *Ring) Cap() int {
+	if r == nil {
+		panic("fatbytes.Ring.Cap: receiver is nil")
+	}
+	return len(r.buf)
+}
+
+func (r *Ring) Len() int {
+	if r == nil {
+		panic("fatbytes.Ring.Len: receiver is nil")
+	}
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	return r.n
+}
+
+// data returns the unread bytes as up to two regions, in order.
+func (r *Ring) data() (first, second []byte) {
+	end := r.head + r.n
+	if end <= len(r.buf) {
+		return r.buf[r.head:end], nil
+	}
+	return r.buf[r.head:], r.buf[:end-len(r.buf)]
+}
+
+// space returns the free bytes after the unread ones as up to two regions,
+// in order. An empty ring restarts at the front of the array so its space
+// is one region; only the producer calls space, so no reservation can be
+// outstanding when that happens.
+func (r *Ring) space() (first, second []byte) {
+	if r.n == 0 {
+		r.head = 0
+	}
+	tail := r.head + r.n
+	if tail >= len(r.buf) {
+		return r.buf[tail-len(r.buf) : r.head], nil
+	}
+	return r.buf[tail:], r.buf[:r.head]
+}
+
+func (r *Ring) waitData() {
+	for r.n == 0 && r.blocking && !r.closed {
+		r.readable.Wait()
+	}
+}
+
+func (r *Ring) waitSpace() {
+	for r.n == len(r.buf) && r.blocking && !r.closed {
+		r.writable.Wait()
+	}
+}
+
+func (r *Ring) consume(k int) {
+	r.head += k
+	if r.head >= len(r.buf) {
+		r.head -= len(r.buf)
+	}
+	r.n -= k
+	if k > 0 {
+		r.writable.Broadcast()
+	}
+}
+
+func (r *Ring) commit(k int) {
+	r.n += k
+	if k > 0 {
+		r.readable.Broadcast()
+	}
+}
+
+// Write copies as much of p as fits and returns the count. In blocking mode
+// it keeps waiting for room until all of p is written. A closed ring
+// accepts nothing.
+func (r *Ring) Write(p []byte) int {
+	if r == nil {
+		panic("fatbytes.Ring.Write: receiver is nil")
+	}
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	written := 0
+	for {
+		r.waitSpace()
+		if r.closed {
+			return written
+		}
+		first, second := r.space()
+		k := copy(first, p[written:])
+		k += copy(second, p[written+k:])
+		r.commit(k)
+		written += k
+		if written == len(p) || !r.blocking {
+			return written
+		}
+	}
+}
+
+// Read copies up to len(p) unread bytes into p. In blocking mode it waits
+// until at least one byte is available. eof reports a closed, drained ring.
+func (r *Ring) Read(p []byte) (n int, eof bool) {
+	if r == nil {
+		panic("fatbytes.Ring.Read: receiver is nil")
+	}
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	if len(p) == 0 {
+		return 0, r.n == 0 && r.closed
+	}
+	r.waitData()
+	if r.n == 0 {
+		return 0, r.closed
+	}
+	first, second := r.data()
+	n = copy(p, first)
+	n += copy(p[n:], second)
+	r.consume(n)
+	return n, false
+}
+
+// Peek returns the unread bytes as up to two regions without consuming
+// them; in blocking mode it first waits for data. The regions stay valid
+// until Consume releases them. eof reports a closed, drained ring.
+func (r *Ring) Peek() (first, second []byte, eof bool) {
+	if r == nil {
+		panic("fatbytes.Ring.Peek: receiver is nil")
+	}
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	r.waitData()
+	first, second = r.data()
+	return first, second, r.n == 0 && r.closed
+}
+
+// Consume discards the next n unread bytes.
+func (r *Ring) Consume(n int) {
+	if r == nil {
+		panic("fatbytes.Ring.Consume: receiver is nil")
+	}
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	if n < 0 || n > r.n {
+		panic("fatbytes.Ring.Consume: count exceeds unread length")
+	}
+	r.consume(n)
+}
+
+// Reserve returns the free space as up to two regions, in order; in
+// blocking mode it first waits for room. Bytes written there are added to
+// the ring by Commit. A closed ring reserves nothing.
+func (r *Ring) Reserve() (first, second []byte) {
+	if r == nil {
+		panic("fatbytes.Ring.Reserve: receiver is nil")
+	}
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	r.waitSpace()
+	if r.closed {
+		return nil, nil
+	}
+	return r.space()
+}
+
+// Commit adds the first n bytes of the regions returned by Reserve to the
+// unread data.
+func (r *Ring) Commit(n int) {
+	if r == nil {
+		panic("fatbytes.Ring.Commit: receiver is nil")
+	}
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	if n < 0 || n > len(r.buf)-r.n {
+		panic("fatbytes.Ring.Commit: count exceeds free space")
+	}
+	if r.closed {
+		return
+	}
+	r.commit(n)
+}
+
+// Close marks the end of the stream. Unread bytes can still be read; after
+// that reads report EOF. Blocked calls wake up.
+func (r *Ring) Close() {
+	if r == nil {
+		panic("fatbytes.Ring.Close: receiver is nil")
+	}
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	r.closed = true
+	r.readable.Broadcast()
+	r.writable.Broadcast()
+}
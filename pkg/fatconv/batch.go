@@ -0,0 +1,97 @@
+package fatconv
+
+import "strings"
+
+// Batch parsers walk a column of cells in one call and report a
+// ClassifyParseError code per cell in status instead of returning errors.
+// dst[i] receives whatever strconv returns for cell i, so a range error
+// leaves the clamped limit and a syntax error leaves zero.
+//
+// A column is either packed, with cell i at data[offsets[i]:offsets[i+1]]
+// (the layout of a fatstrings.StringArray), or delimited by a separator
+// byte. In delimited data a trailing separator does not start another cell
+// and empty data has no cells.
+
+func parseCells[T any](data string, offsets []int, dst []T, status []uint8, parse func(string) (T, error)) int {
+	failed := 0
+	for i := range dst {
+		v, err := parse(data[offsets[i]:offsets[i+1]])
+		dst[i] = v
+		status[i] = uint8(ClassifyParseError(err))
+		if err != nil {
+			failed++
+		}
+	}
+	return failed
+}
+
+func parseDelimited[T any](data string, sep byte, dst []T, status []uint8, parse func(string) (T, error)) (cells, failed int) {
+	for len(data) > 0 {
+		if cells == len(dst) {
+			cells += strings.Count(data, string(sep))
+			if data[len(data)-1] != sep {
+				cells++
+			}
+			break
+		}
+		cell := data
+		if i := strings.IndexByte(data, sep); i >= 0 {
+			cell, data = data[:i], data[i+1:]
+		} else {
+			data = ""
+		}
+		v, err := parse(cell)
+		dst[cells] = v
+		status[cells] = uint8(ClassifyParseError(err))
+		if err != nil {
+			failed++
+		}
+		cells++
+	}
+	return cells, failed
+}
+
+func parseIntFunc(base, bitSize int) func(string) (int64, error) {
+	return func(s string) (int64, error) { return ParseInt(s, base, bitSize) }
+}
+
+func parseFloatFunc(bitSize int) func(string) (float64, error) {
+	return func(s string) (float64, error) { return ParseFloat(s, bitSize) }
+}
+
+func parseBoolByte(s string) (uint8, error) {
+	v, err := ParseBool(s)
+	if v {
+		return 1, err
+	}
+	return 0, err
+}
+
+// ParseIntCells parses the len(dst) packed cells described by offsets and
+// returns how many failed.
+func ParseIntCells(data string, offsets []int, base, bitSize int, dst []int64, status []uint8) int {
+	return parseCells(data, offsets, dst, status, parseIntFunc(base, bitSize))
+}
+
+func ParseFloatCells(data string, offsets []int, bitSize int, dst []float64, status []uint8) int {
+	return parseCells(data, offsets, dst, status, parseFloatFunc(bitSize))
+}
+
+func ParseBoolCells(data string, offsets []int, dst []uint8, status []uint8) int {
+	return parseCells(data, offsets, dst, status, parseBoolByte)
+}
+
+// ParseIntDelimited parses up to len(dst) cells of data split at sep. It
+// returns the number of cells in data, which may exceed len(dst), and how
+// many of the parsed cells failed.
+func ParseIntDelimited(data string, sep byte, base, bitSize int, dst []int64, status []uint8) (cells, failed int) {
+	return parseDelimited(data, sep, dst, status, parseIntFunc(base, bitSize))
+}
+
+func ParseFloatDelimited(data string, sep byte, bitSize int, dst []float64, status []uint8) (cells, failed int) {
+	return parseDelimited(data, sep, dst, status, parseFloatFunc(bitSize))
+}
+
+func ParseBoolDelimited(data string, sep byte, dst []uint8, status []uint8) (cells, failed int) {
+	return parseDelimited(data, sep, dst, status, parseBoolByte)
+}
@@ -58,7 +58,6 @@ func UnquoteChar(s string, quote byte) (value rune, multibyte bool, tail string,
 
 func Atoi(s string) (int, error) { return strconv.Atoi(s) }
 func ParseBool(str string) (bool, error) { return strconv.ParseBool(str) }
-func ParseFloat(s string, bitSize int) (float64, error) { return strconv.ParseFloat(s, bitSize) }
 func ParseInt(s string, base int, bitSize int) (int64, error) { return strconv.ParseInt(s, base, bitSize) }
 func ParseUint(s string, base int, bitSize int) (uint64, error) { return strconv.ParseUint(s, base, bitSize) }
 func ParseComplex(s string, bitSize int) (complex128, error) { return strconv.ParseComplex(s, bitSize) }
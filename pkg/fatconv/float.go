@@ -0,0 +1,143 @@
+package fatconv
+
+import "strconv"
+
+// strconv already formats shortest round-trip text with Ryu and parses with
+// an Eisel-Lemire fast path. This file adds what the one-value-per-call
+// wrappers could not: batch formatting, and a cheaper front end for the short
+// decimal text that telemetry is made of.
+
+// float64Pow10 holds the powers of ten that are exact in a float64.
+var float64Pow10 = [...]float64{
+	1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9, 1e10, 1e11,
+	1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22,
+}
+
+// parseDecimalFast handles plain decimal text ([+-]digits[.digits][e[+-]digits])
+// whose significant digits fit in 2^53 and whose decimal exponent is within
+// +-22. Both the mantissa and the power of ten are then exact float64 values,
+// so one multiply or divide is correctly rounded (Clinger's fast path).
+// Anything else, including hex, underscores, inf and nan, reports ok=false.
+func parseDecimalFast(s string) (f float64, ok bool) {
+	i := 0
+	neg := false
+	if i < len(s) && (s[i] == '+' || s[i] == '-') {
+		neg = s[i] == '-'
+		i++
+	}
+
+	var mant uint64
+	digits, exp := 0, 0
+	sawDigit, sawDot := false, false
+	for ; i < len(s); i++ {
+		c := s[i]
+		if c == '.' {
+			if sawDot {
+				return 0, false
+			}
+			sawDot = true
+			continue
+		}
+		if c < '0' || c > '9' {
+			break
+		}
+		sawDigit = true
+		if c == '0' && mant == 0 {
+			// Leading zeros are not significant.
+			if sawDot {
+				exp--
+			}
+			continue
+		}
+		if digits == 19 {
+			return 0, false
+		}
+		mant = mant*10 + uint64(c-'0')
+		digits++
+		if sawDot {
+			exp--
+		}
+	}
+	if !sawDigit {
+		return 0, false
+	}
+
+	if i < len(s) && (s[i] == 'e' || s[i] == 'E') {
+		i++
+		expNeg := false
+		if i < len(s) && (s[i] == '+' || s[i] == '-') {
+			expNeg = s[i] == '-'
+			i++
+		}
+		if i == len(s) {
+			return 0, false
+		}
+		e := 0
+		for ; i < len(s); i++ {
+			c := s[i]
+			if c < '0' || c > '9' || e > 1000 {
+				return 0, false
+			}
+			e = e*10 + int(c-'0')
+		}
+		if expNeg {
+			e = -e
+		}
+		exp += e
+	}
+	if i != len(s) || mant > 1<<53 {
+		return 0, false
+	}
+
+	f = float64(mant)
+	switch {
+	case mant == 0:
+	case exp < -22 || exp > 22:
+		return 0, false
+	case exp < 0:
+		f /= float64Pow10[-exp]
+	default:
+		f *= float64Pow10[exp]
+	}
+	if neg {
+		f = -f
+	}
+	return f, true
+}
+
+// ParseFloat is strconv.ParseFloat with parseDecimalFast in front for 64-bit
+// results.
+func ParseFloat(s string, bitSize int) (float64, error) {
+	if bitSize == 64 {
+		if f, ok := parseDecimalFast(s); ok {
+			return f, nil
+		}
+	}
+	return strconv.ParseFloat(s, bitSize)
+}
+
+// AppendFloats appends values to dst formatted as by AppendFloat, with sep
+// between consecutive values. With prec -1 each value is the shortest text
+// that parses back to the same float.
+func AppendFloats(dst []byte, values []float64, fmt byte, prec, bitSize int, sep byte) []byte {
+	for i, v := range values {
+		if i > 0 {
+			dst = append(dst, sep)
+		}
+		dst = strconv.AppendFloat(dst, v, fmt, prec, bitSize)
+	}
+	return dst
+}
+
+// shortestFloatLen bounds the shortest 'g' text of a float64: 17 significant
+// digits, a sign, a point and a four-character exponent.
+const shortestFloatLen = 24
+
+// AppendFloatsCap estimates the room AppendFloats needs for n values in the
+// shortest format, so a buffer can be grown once up front.
+func AppendFloatsCap(n int) int {
+	if n <= 0 {
+		return 0
+	}
+	return n*(shortestFloatLen+1) - 1
+}
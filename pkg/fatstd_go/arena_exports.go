@@ -0,0 +1,186 @@
+package main
+
+/*
+#include <stddef.h>
+#include <stdint.h>
+*/
+import "C"
+
+import (
+	"sync"
+	"sync/atomic"
+)
+
+type fatArena struct {
+	mu      sync.Mutex
+	owner   uintptr // thread key while pushed; 0 when inactive
+	handles []uintptr
+}
+
+type fatArenaStack struct {
+	arenas []*fatArena
+}
+
+var (
+	// fatstdArenasActive counts pushed arenas across all threads so that
+	// handleRegistry.register can skip recording with a single atomic load.
+	fatstdArenasActive atomic.Int32
+	// fatstdArenaStacks maps a thread key to its *fatArenaStack. A stack is
+	// only mutated by its own thread, and its entry is deleted when it
+	// empties, so exited threads leave nothing behind for a later thread
+	// that reuses their key.
+	fatstdArenaStacks sync.Map
+)
+
+func fatstdArenaStackForThread(key uintptr) *fatArenaStack {
+	if v, ok := fatstdArenaStacks.Load(key); ok {
+		return v.(*fatArenaStack)
+	}
+	v, _ := fatstdArenaStacks.LoadOrStore(key, &fatArenaStack{})
+	return v.(*fatArenaStack)
+}
+
+// fatstdArenaRecord adds handle to the calling thread's innermost arena.
+// Handles registered from Go-owned threads (e.g. HTTP server goroutines)
+// have no arena stack and are not recorded.
+func fatstdArenaRecord(handle uintptr) {
+	v, ok := fatstdArenaStacks.Load(fatstdArenaThreadKey())
+	if !ok {
+		return
+	}
+	stack := v.(*fatArenaStack)
+	if len(stack.arenas) == 0 {
+		return
+	}
+	a := stack.arenas[len(stack.arenas)-1]
+	a.mu.Lock()
+	a.handles = append(a.handles, handle)
+	a.mu.Unlock()
+}
+
+func fatstdArenaFromHandle(handle uintptr) *fatArena {
+	if handle == 0 {
+		panic("fatstdArenaFromHandle: handle is 0")
+	}
+	value, ok := fatstdHandles.get(handle)
+	if !ok {
+		panic("fatstdArenaFromHandle: invalid handle")
+	}
+	a, ok := value.(*fatArena)
+	if !ok {
+		panic("fatstdArenaFromHandle: handle is not arena")
+	}
+	return a
+}
+
+// release frees every recorded handle that is still live and empties the
+// arena, keeping its capacity for reuse. Handles already freed individually
+// are skipped; generation tags guarantee they cannot alias newer objects.
+func (a *fatArena) release() handleBatchStatus {
+	a.mu.Lock()
+	defer a.mu.Unlock()
+
+	live := a.handles[:0]
+	for _, h := range a.handles {
+		if _, ok := fatstdHandles.get(h); ok {
+			live = append(live, h)
+		}
+	}
+	_, status := fatstdHandles.takeAll(live, fatstdHandleIsPlainFree)
+	if status == handleBatchOK {
+		a.handles = a.handles[:0]
+	}
+	return status
+}
+
+//export fatstd_go_arena_new
+func fatstd_go_arena_new() C.uintptr_t {
+	return C.uintptr_t(fatstdHandles.register(&fatArena{}))
+}
+
+//export fatstd_go_arena_push
+func fatstd_go_arena_push(handle C.uintptr_t) {
+	a := fatstdArenaFromHandle(uintptr(handle))
+	key := fatstdArenaThreadKey()
+
+	a.mu.Lock()
+	if a.owner != 0 {
+		a.mu.Unlock()
+		panic("fatstd_go_arena_push: arena is already active")
+	}
+	a.owner = key
+	a.mu.Unlock()
+
+	stack := fatstdArenaStackForThread(key)
+	stack.arenas = append(stack.arenas, a)
+	fatstdArenasActive.Add(1)
+}
+
+//export fatstd_go_arena_pop
+func fatstd_go_arena_pop(handle C.uintptr_t) {
+	a := fatstdArenaFromHandle(uintptr(handle))
+	key := fatstdArenaThreadKey()
+	v, ok := fatstdArenaStacks.Load(key)
+	if !ok {
+		panic("fatstd_go_arena_pop: arena is not the innermost active arena on this thread")
+	}
+	stack := v.(*fatArenaStack)
+	n := len(stack.arenas)
+	if n == 0 || stack.arenas[n-1] != a {
+		panic("fatstd_go_arena_pop: arena is not the innermost active arena on this thread")
+	}
+	stack.arenas[n-1] = nil
+	stack.arenas = stack.arenas[:n-1]
+	if n == 1 {
+		fatstdArenaStacks.Delete(key)
+	}
+	fatstdArenasActive.Add(-1)
+
+	a.mu.Lock()
+	a.owner = 0
+	a.mu.Unlock()
+}
+
+//export fatstd_go_arena_len
+func fatstd_go_arena_len(handle C.uintptr_t) C.size_t {
+	a := fatstdArenaFromHandle(uintptr(handle))
+	a.mu.Lock()
+	defer a.mu.Unlock()
+	return C.size_t(len(a.handles))
+}
+
+//export fatstd_go_arena_release
+func fatstd_go_arena_release(handle C.uintptr_t) {
+	a := fatstdArenaFromHandle(uintptr(handle))
+	a.mu.Lock()
+	active := a.owner != 0
+	a.mu.Unlock()
+	if active {
+		panic("fatstd_go_arena_release: arena is active")
+	}
+	if a.release() != handleBatchOK {
+		panic("fatstd_go_arena_release: arena holds a live handle that must be released with its own Close/Free")
+	}
+}
+
+//export fatstd_go_arena_free
+func fatstd_go_arena_free(handle C.uintptr_t) {
+	a := fatstdArenaFromHandle(uintptr(handle))
+	a.mu.Lock()
+	active := a.owner != 0
+	a.mu.Unlock()
+	if active {
+		panic("fatstd_go_arena_free: arena is active")
+	}
+	if a.release() != handleBatchOK {
+		panic("fatstd_go_arena_free: arena holds a live handle that must be released with its own Close/Free")
+	}
+
+	value, ok := fatstdHandles.take(uintptr(handle))
+	if !ok {
+		panic("fatstd_go_arena_free: invalid handle")
+	}
+	if _, ok := value.(*fatArena); !ok {
+		panic("fatstd_go_arena_free: handle is not arena")
+	}
+}
@@ -0,0 +1,21 @@
+package main
+
+// Kept out of arena_exports.go: cgo copies the preamble of files with
+// //export directives into fatstd_go.h.
+
+/*
+#include <stdint.h>
+
+static uintptr_t fatstd_arena_thread_key(void) {
+	static _Thread_local char key;
+	return (uintptr_t)&key;
+}
+*/
+import "C"
+
+// fatstdArenaThreadKey identifies the calling OS thread. Exported functions
+// run on the C caller's thread, so the address of a C thread-local is a
+// stable per-thread key.
+func fatstdArenaThreadKey() uintptr {
+	return uintptr(C.fatstd_arena_thread_key())
+}
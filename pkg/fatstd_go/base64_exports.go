@@ -11,6 +11,7 @@ import (
 	"encoding/base64"
 	"errors"
 	"io"
+	"math"
 	"unicode/utf8"
 	"unsafe"
 
@@ -143,15 +144,22 @@ func fatstd_go_base64_encoding_with_padding(encHandle C.uintptr_t, padding C.int
 }
 
 //export fatstd_go_base64_encoded_len
-func fatstd_go_base64_encoded_len(encHandle C.uintptr_t, n C.int) C.int {
+func fatstd_go_base64_encoded_len(encHandle C.uintptr_t, n C.size_t) C.size_t {
 	enc := fatstdBase64EncodingFromHandle(uintptr(encHandle))
-	return C.int(enc.EncodedLen(int(n)))
+	if n > C.size_t(math.MaxInt/4*3) {
+		panic("fatstd_go_base64_encoded_len: n too large")
+	}
+	return C.size_t(enc.EncodedLen(int(n)))
 }
 
 //export fatstd_go_base64_decoded_len
-func fatstd_go_base64_decoded_len(encHandle C.uintptr_t, n C.int) C.int {
+func fatstd_go_base64_decoded_len(encHandle C.uintptr_t, n C.size_t) C.size_t {
 	enc := fatstdBase64EncodingFromHandle(uintptr(encHandle))
-	return C.int(enc.DecodedLen(int(n)))
+	// Unpadded encodings compute n * 6 / 8.
+	if n > C.size_t(math.MaxInt/6) {
+		panic("fatstd_go_base64_decoded_len: n too large")
+	}
+	return C.size_t(enc.DecodedLen(int(n)))
 }
 
 //export fatstd_go_base64_encode_to_string
@@ -277,7 +285,7 @@ func fatstd_go_base64_encoder_new_to_bytes_buffer(encHandle C.uintptr_t, dstBuff
 	}
 	enc := fatstdBase64EncodingFromHandle(uintptr(encHandle))
 	dst := fatstdBytesBufferFromHandle(uintptr(dstBufferHandle))
-	w := base64.NewEncoder(enc, dst.Underlying())
+	w := base64.NewEncoder(enc, dst.Writer())
 	*outEncoder = C.uintptr_t(fatstdHandles.register(&fatBase64Encoder{w: w}))
 	*outErr = 0
 	return fatStatusOK
@@ -294,7 +302,7 @@ func fatstd_go_base64_encoder_write(handle C.uintptr_t, bytesPtr *C.char, len C.
 	if bytesPtr == nil && len != 0 {
 		panic("fatstd_go_base64_encoder_write: bytes is NULL but len > 0")
 	}
-	if len > C.size_t(2147483647) {
+	if len > C.size_t(math.MaxInt) {
 		panic("fatstd_go_base64_encoder_write: len too large")
 	}
 
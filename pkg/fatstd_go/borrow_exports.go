@@ -0,0 +1,60 @@
+package main
+
+/*
+#include <stddef.h>
+#include <stdint.h>
+*/
+import "C"
+
+import (
+	"runtime"
+	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
+)
+
+// fatBorrow keeps Go memory pinned while C reads it through a borrowed view.
+// The pinner also holds a reference, so the memory outlives the handle that
+// produced the view. Views of external memory hold a reference on the source
+// instead, which defers its release callback.
+type fatBorrow struct {
+	pinner   runtime.Pinner
+	external *fatbytes.Bytes
+}
+
+// fatstdBorrowNew pins ptrs and returns a borrow handle that owns the pins.
+// Nil ptrs (empty views) are skipped, so callers release every view the same
+// way.
+func fatstdBorrowNew(ptrs ...unsafe.Pointer) uintptr {
+	b := &fatBorrow{}
+	for _, ptr := range ptrs {
+		if ptr != nil {
+			b.pinner.Pin(ptr)
+		}
+	}
+	return fatstdHandles.register(b)
+}
+
+func fatstdBorrowNewExternal(b *fatbytes.Bytes) uintptr {
+	b.Retain()
+	return fatstdHandles.register(&fatBorrow{external: b})
+}
+
+//export fatstd_go_borrow_release
+func fatstd_go_borrow_release(handle C.uintptr_t) {
+	if handle == 0 {
+		panic("fatstd_go_borrow_release: handle is 0")
+	}
+	value, ok := fatstdHandles.take(uintptr(handle))
+	if !ok {
+		panic("fatstd_go_borrow_release: invalid handle")
+	}
+	b, ok := value.(*fatBorrow)
+	if !ok {
+		panic("fatstd_go_borrow_release: handle is not borrow")
+	}
+	b.pinner.Unpin()
+	if b.external != nil {
+		b.external.Release()
+	}
+}
@@ -9,11 +9,57 @@ import "C"
 
 import (
 	"io"
+	"math"
+	"runtime"
+	"sync"
 	"unsafe"
 
 	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
 )
 
+// fatBufferPin keeps the array behind a buffer's Reserve and Peek windows
+// pinned so C can use them after the call returns. The pin is only renewed
+// when the buffer moves to a new array, and is released by Free.
+type fatBufferPin struct {
+	pinner runtime.Pinner
+	end    uintptr // one past the pinned array
+}
+
+var fatstdBytesBufferPins sync.Map // *fatbytes.Buffer -> *fatBufferPin
+
+// fatstdBytesBufferPin pins the array window points into. window must extend
+// to the end of the buffer's array, as AvailableBuffer and Bytes do.
+func fatstdBytesBufferPin(b *fatbytes.Buffer, window []byte) unsafe.Pointer {
+	if len(window) == 0 {
+		return nil
+	}
+	ptr := unsafe.Pointer(unsafe.SliceData(window))
+	end := uintptr(ptr) + uintptr(cap(window))
+	value, ok := fatstdBytesBufferPins.Load(b)
+	if !ok {
+		value = new(fatBufferPin)
+		fatstdBytesBufferPins.Store(b, value)
+	}
+	pin := value.(*fatBufferPin)
+	if pin.end != end {
+		pin.pinner.Unpin()
+		pin.pinner.Pin(ptr)
+		pin.end = end
+	}
+	return ptr
+}
+
+func fatstdBytesBufferUnpin(b *fatbytes.Buffer) {
+	if value, ok := fatstdBytesBufferPins.LoadAndDelete(b); ok {
+		value.(*fatBufferPin).pinner.Unpin()
+	}
+}
+
+func fatstdBytesBufferPinned(b *fatbytes.Buffer) bool {
+	_, ok := fatstdBytesBufferPins.Load(b)
+	return ok
+}
+
 func fatstdBytesBufferNewFromGoBytes(value []byte) uintptr {
 	return fatstdHandles.register(fatbytes.NewBuffer(value))
 }
@@ -56,10 +102,10 @@ func fatstd_go_bytes_buffer_new_n(bytesPtr *C.char, len C.size_t) C.uintptr_t {
 		}
 		panic("fatstd_go_bytes_buffer_new_n: bytes is NULL but len > 0")
 	}
-	if len > C.size_t(2147483647) {
+	if len > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_buffer_new_n: len too large")
 	}
-	buf := C.GoBytes(unsafe.Pointer(bytesPtr), C.int(len))
+	buf := fatbytes.Clone(unsafe.Slice((*byte)(unsafe.Pointer(bytesPtr)), int(len)))
 	return C.uintptr_t(fatstdBytesBufferNewFromGoBytes(buf))
 }
 
@@ -83,7 +129,7 @@ func fatstd_go_bytes_buffer_cap(handle C.uintptr_t) C.size_t {
 
 //export fatstd_go_bytes_buffer_grow
 func fatstd_go_bytes_buffer_grow(handle C.uintptr_t, n C.size_t) {
-	if n > C.size_t(2147483647) {
+	if n > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_buffer_grow: n too large")
 	}
 	b := fatstdBytesBufferFromHandle(uintptr(handle))
@@ -98,7 +144,7 @@ func fatstd_go_bytes_buffer_reset(handle C.uintptr_t) {
 
 //export fatstd_go_bytes_buffer_truncate
 func fatstd_go_bytes_buffer_truncate(handle C.uintptr_t, n C.size_t) {
-	if n > C.size_t(2147483647) {
+	if n > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_buffer_truncate: n too large")
 	}
 	b := fatstdBytesBufferFromHandle(uintptr(handle))
@@ -113,12 +159,11 @@ func fatstd_go_bytes_buffer_write(handle C.uintptr_t, bytes *C.char, len C.size_
 		}
 		panic("fatstd_go_bytes_buffer_write: bytes is NULL but len > 0")
 	}
-	if len > C.size_t(2147483647) {
+	if len > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_buffer_write: len too large")
 	}
 	b := fatstdBytesBufferFromHandle(uintptr(handle))
-	buf := C.GoBytes(unsafe.Pointer(bytes), C.int(len))
-	return C.size_t(b.Write(buf))
+	return C.size_t(b.Write(unsafe.Slice((*byte)(unsafe.Pointer(bytes)), int(len))))
 }
 
 //export fatstd_go_bytes_buffer_write_byte
@@ -164,7 +209,7 @@ func fatstd_go_bytes_buffer_read(handle C.uintptr_t, dst *C.char, dstLen C.size_
 		}
 		panic("fatstd_go_bytes_buffer_read: dst is NULL but dstLen > 0")
 	}
-	if dstLen > C.size_t(2147483647) {
+	if dstLen > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_buffer_read: dstLen too large")
 	}
 
@@ -185,7 +230,7 @@ func fatstd_go_bytes_buffer_read(handle C.uintptr_t, dst *C.char, dstLen C.size_
 
 //export fatstd_go_bytes_buffer_next
 func fatstd_go_bytes_buffer_next(handle C.uintptr_t, n C.size_t) C.uintptr_t {
-	if n > C.size_t(2147483647) {
+	if n > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_buffer_next: n too large")
 	}
 	b := fatstdBytesBufferFromHandle(uintptr(handle))
@@ -193,6 +238,44 @@ func fatstd_go_bytes_buffer_next(handle C.uintptr_t, n C.size_t) C.uintptr_t {
 	return C.uintptr_t(fatstdBytesNewFromGoBytes(fatbytes.Clone(chunk)))
 }
 
+//export fatstd_go_bytes_buffer_reserve
+func fatstd_go_bytes_buffer_reserve(handle C.uintptr_t, n C.size_t) unsafe.Pointer {
+	if n > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_buffer_reserve: n too large")
+	}
+	b := fatstdBytesBufferFromHandle(uintptr(handle))
+	return fatstdBytesBufferPin(b, b.Reserve(int(n)))
+}
+
+//export fatstd_go_bytes_buffer_commit
+func fatstd_go_bytes_buffer_commit(handle C.uintptr_t, n C.size_t) {
+	if n > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_buffer_commit: n too large")
+	}
+	b := fatstdBytesBufferFromHandle(uintptr(handle))
+	b.Commit(int(n))
+}
+
+//export fatstd_go_bytes_buffer_peek
+func fatstd_go_bytes_buffer_peek(handle C.uintptr_t, outLen *C.size_t) unsafe.Pointer {
+	if outLen == nil {
+		panic("fatstd_go_bytes_buffer_peek: outLen is NULL")
+	}
+	b := fatstdBytesBufferFromHandle(uintptr(handle))
+	unread := b.Bytes()
+	*outLen = C.size_t(len(unread))
+	return fatstdBytesBufferPin(b, unread)
+}
+
+//export fatstd_go_bytes_buffer_consume
+func fatstd_go_bytes_buffer_consume(handle C.uintptr_t, n C.size_t) {
+	if n > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_buffer_consume: n too large")
+	}
+	b := fatstdBytesBufferFromHandle(uintptr(handle))
+	b.Consume(int(n))
+}
+
 //export fatstd_go_bytes_buffer_read_byte
 func fatstd_go_bytes_buffer_read_byte(handle C.uintptr_t, byteOut *C.uchar, eofOut *C.bool) C.bool {
 	if byteOut == nil {
@@ -220,7 +303,7 @@ func fatstd_go_bytes_buffer_read_byte(handle C.uintptr_t, byteOut *C.uchar, eofO
 func fatstd_go_bytes_buffer_write_to_bytes_buffer(srcHandle C.uintptr_t, dstHandle C.uintptr_t) C.longlong {
 	src := fatstdBytesBufferFromHandle(uintptr(srcHandle))
 	dst := fatstdBytesBufferFromHandle(uintptr(dstHandle))
-	n, err := src.WriteTo(dst.Underlying())
+	n, err := src.WriteTo(dst.Writer())
 	if err != nil {
 		panic("fatstd_go_bytes_buffer_write_to_bytes_buffer: unexpected error")
 	}
@@ -238,17 +321,39 @@ func fatstd_go_bytes_buffer_read_from_string_reader(dstHandle C.uintptr_t, reade
 	return C.longlong(n)
 }
 
-//export fatstd_go_bytes_buffer_free
-func fatstd_go_bytes_buffer_free(handle C.uintptr_t) {
+// fatstdBytesBufferTake removes a buffer handle from the registry and
+// releases any Reserve/Peek pin on its storage.
+func fatstdBytesBufferTake(name string, handle C.uintptr_t) *fatbytes.Buffer {
 	if handle == 0 {
-		panic("fatstd_go_bytes_buffer_free: handle is 0")
+		panic(name + ": handle is 0")
 	}
 	value, ok := fatstdHandles.take(uintptr(handle))
 	if !ok {
-		panic("fatstd_go_bytes_buffer_free: invalid handle")
+		panic(name + ": invalid handle")
+	}
+	b, ok := value.(*fatbytes.Buffer)
+	if !ok {
+		panic(name + ": handle is not fat bytes buffer")
 	}
-	if _, ok := value.(*fatbytes.Buffer); !ok {
-		panic("fatstd_go_bytes_buffer_free: handle is not fat bytes buffer")
+	fatstdBytesBufferUnpin(b)
+	return b
+}
+
+//export fatstd_go_bytes_buffer_free
+func fatstd_go_bytes_buffer_free(handle C.uintptr_t) {
+	fatstdBytesBufferTake("fatstd_go_bytes_buffer_free", handle)
+}
+
+//export fatstd_go_bytes_buffer_acquire
+func fatstd_go_bytes_buffer_acquire(minCap C.size_t) C.uintptr_t {
+	if minCap > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_buffer_acquire: minCap too large")
 	}
+	return C.uintptr_t(fatstdHandles.register(fatbytes.AcquireBuffer(int(minCap))))
+}
+
+//export fatstd_go_bytes_buffer_release
+func fatstd_go_bytes_buffer_release(handle C.uintptr_t) {
+	fatbytes.ReleaseBuffer(fatstdBytesBufferTake("fatstd_go_bytes_buffer_release", handle))
 }
 
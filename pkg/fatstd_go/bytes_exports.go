@@ -8,11 +8,14 @@ package main
 import "C"
 
 import (
+	"math"
 	"unsafe"
 
 	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
 )
 
+const fatBytesErrCodeIO = 120
+
 func fatstdBytesNewFromGoBytes(value []byte) uintptr {
 	return fatstdHandles.register(fatbytes.New(value))
 }
@@ -59,13 +62,47 @@ func fatstd_go_bytes_new_n(bytesPtr *C.char, len C.size_t) C.uintptr_t {
 		}
 		panic("fatstd_go_bytes_new_n: bytes is NULL but len > 0")
 	}
-	if len > C.size_t(2147483647) {
+	if len > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_new_n: len too large")
 	}
-	buf := C.GoBytes(unsafe.Pointer(bytesPtr), C.int(len))
+	buf := fatbytes.Clone(unsafe.Slice((*byte)(unsafe.Pointer(bytesPtr)), int(len)))
 	return C.uintptr_t(fatstdBytesNewFromGoBytes(buf))
 }
 
+//export fatstd_go_bytes_new_adopt
+func fatstd_go_bytes_new_adopt(data unsafe.Pointer, len C.size_t, release C.uintptr_t, userData unsafe.Pointer) C.uintptr_t {
+	if data == nil && len > 0 {
+		panic("fatstd_go_bytes_new_adopt: data is NULL but len > 0")
+	}
+	if len > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_new_adopt: len too large")
+	}
+	return C.uintptr_t(fatstdBytesNewExternal(data, int(len), uintptr(release), userData))
+}
+
+//export fatstd_go_bytes_map_file_utf8
+func fatstd_go_bytes_map_file_utf8(path *C.char, outBytes *C.uintptr_t, outErr *C.uintptr_t) C.int {
+	if outBytes == nil {
+		panic("fatstd_go_bytes_map_file_utf8: outBytes is NULL")
+	}
+	if outErr == nil {
+		panic("fatstd_go_bytes_map_file_utf8: outErr is NULL")
+	}
+	if path == nil {
+		panic("fatstd_go_bytes_map_file_utf8: path is NULL")
+	}
+
+	b, err := fatbytes.MapFile(C.GoString(path))
+	if err != nil {
+		*outBytes = 0
+		*outErr = C.uintptr_t(fatstdNewError(fatBytesErrCodeIO, err.Error()))
+		return fatStatusOther
+	}
+	*outBytes = C.uintptr_t(fatstdHandles.register(b))
+	*outErr = 0
+	return fatStatusOK
+}
+
 //export fatstd_go_bytes_len
 func fatstd_go_bytes_len(handle C.uintptr_t) C.size_t {
 	b := fatstdBytesFromHandle(uintptr(handle))
@@ -80,7 +117,7 @@ func fatstd_go_bytes_copy_out(handle C.uintptr_t, dst *C.char, dstLen C.size_t)
 		}
 		panic("fatstd_go_bytes_copy_out: dst is NULL but dstLen > 0")
 	}
-	if dstLen > C.size_t(2147483647) {
+	if dstLen > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_copy_out: dstLen too large")
 	}
 
@@ -94,6 +131,30 @@ func fatstd_go_bytes_copy_out(handle C.uintptr_t, dst *C.char, dstLen C.size_t)
 	return C.size_t(n)
 }
 
+//export fatstd_go_bytes_borrow
+func fatstd_go_bytes_borrow(handle C.uintptr_t, outLen *C.size_t, outBorrow *C.uintptr_t) unsafe.Pointer {
+	if outLen == nil {
+		panic("fatstd_go_bytes_borrow: outLen is NULL")
+	}
+	if outBorrow == nil {
+		panic("fatstd_go_bytes_borrow: outBorrow is NULL")
+	}
+
+	b := fatstdBytesFromHandle(uintptr(handle))
+	value := b.Value()
+	var ptr unsafe.Pointer
+	if len(value) > 0 {
+		ptr = unsafe.Pointer(unsafe.SliceData(value))
+	}
+	if b.IsExternal() {
+		*outBorrow = C.uintptr_t(fatstdBorrowNewExternal(b))
+	} else {
+		*outBorrow = C.uintptr_t(fatstdBorrowNew(ptr))
+	}
+	*outLen = C.size_t(len(value))
+	return ptr
+}
+
 //export fatstd_go_bytes_clone
 func fatstd_go_bytes_clone(handle C.uintptr_t) C.uintptr_t {
 	b := fatstdBytesFromHandle(uintptr(handle))
@@ -235,7 +296,7 @@ func fatstd_go_bytes_array_len(arrayHandle C.uintptr_t) C.size_t {
 //export fatstd_go_bytes_array_get
 func fatstd_go_bytes_array_get(arrayHandle C.uintptr_t, index C.size_t) C.uintptr_t {
 	a := fatstdBytesArrayFromHandle(uintptr(arrayHandle))
-	if index > C.size_t(2147483647) {
+	if index > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_array_get: index too large")
 	}
 	return C.uintptr_t(fatstdBytesNewFromGoBytes(a.Get(int(index))))
@@ -283,16 +344,16 @@ func fatstd_go_bytes_to_upper(sHandle C.uintptr_t) C.uintptr_t {
 }
 
 //export fatstd_go_bytes_index_byte
-func fatstd_go_bytes_index_byte(sHandle C.uintptr_t, c C.uchar) C.int {
+func fatstd_go_bytes_index_byte(sHandle C.uintptr_t, c C.uchar) C.int64_t {
 	s := fatstdBytesFromHandle(uintptr(sHandle))
-	return C.int(fatbytes.IndexByte(s.Value(), byte(c)))
+	return C.int64_t(fatbytes.IndexByte(s.Value(), byte(c)))
 }
 
 //export fatstd_go_bytes_index_any
-func fatstd_go_bytes_index_any(sHandle C.uintptr_t, charsHandle C.uintptr_t) C.int {
+func fatstd_go_bytes_index_any(sHandle C.uintptr_t, charsHandle C.uintptr_t) C.int64_t {
 	s := fatstdBytesFromHandle(uintptr(sHandle))
 	chars := fatstdStringFromHandle(uintptr(charsHandle))
-	return C.int(fatbytes.IndexAny(s.Value(), chars.Value()))
+	return C.int64_t(fatbytes.IndexAny(s.Value(), chars.Value()))
 }
 
 //export fatstd_go_bytes_to_valid_utf8
@@ -302,18 +363,27 @@ func fatstd_go_bytes_to_valid_utf8(sHandle C.uintptr_t, replacementHandle C.uint
 	return C.uintptr_t(fatstdBytesNewFromGoBytes(fatbytes.ToValidUTF8(s.Value(), repl.Value())))
 }
 
+//export fatstd_go_bytes_is_valid_utf8
+func fatstd_go_bytes_is_valid_utf8(sHandle C.uintptr_t) C.int {
+	s := fatstdBytesFromHandle(uintptr(sHandle))
+	if fatbytes.ValidUTF8(s.Value()) {
+		return 1
+	}
+	return 0
+}
+
 //export fatstd_go_bytes_index
-func fatstd_go_bytes_index(sHandle C.uintptr_t, sepHandle C.uintptr_t) C.int {
+func fatstd_go_bytes_index(sHandle C.uintptr_t, sepHandle C.uintptr_t) C.int64_t {
 	s := fatstdBytesFromHandle(uintptr(sHandle))
 	sep := fatstdBytesFromHandle(uintptr(sepHandle))
-	return C.int(fatbytes.Index(s.Value(), sep.Value()))
+	return C.int64_t(fatbytes.Index(s.Value(), sep.Value()))
 }
 
 //export fatstd_go_bytes_count
-func fatstd_go_bytes_count(sHandle C.uintptr_t, sepHandle C.uintptr_t) C.int {
+func fatstd_go_bytes_count(sHandle C.uintptr_t, sepHandle C.uintptr_t) C.int64_t {
 	s := fatstdBytesFromHandle(uintptr(sHandle))
 	sep := fatstdBytesFromHandle(uintptr(sepHandle))
-	return C.int(fatbytes.Count(s.Value(), sep.Value()))
+	return C.int64_t(fatbytes.Count(s.Value(), sep.Value()))
 }
 
 //export fatstd_go_bytes_compare
@@ -342,9 +412,11 @@ func fatstd_go_bytes_free(handle C.uintptr_t) {
 	if !ok {
 		panic("fatstd_go_bytes_free: invalid handle")
 	}
-	if _, ok := value.(*fatbytes.Bytes); !ok {
+	b, ok := value.(*fatbytes.Bytes)
+	if !ok {
 		panic("fatstd_go_bytes_free: handle is not fat bytes")
 	}
+	b.Release()
 }
 
 //export fatstd_go_bytes_array_free
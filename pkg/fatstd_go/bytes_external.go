@@ -0,0 +1,41 @@
+package main
+
+// Kept out of bytes_exports.go: cgo copies the preamble of files with
+// //export directives into fatstd_go.h.
+
+/*
+#include <stddef.h>
+#include <stdint.h>
+
+typedef void (*fatstd_bytes_release_fn)(void *data, size_t len, void *user_data);
+
+static void fatstd_bytes_call_release(uintptr_t fn, void *data, size_t len, void *user_data) {
+	((fatstd_bytes_release_fn)fn)(data, len, user_data);
+}
+*/
+import "C"
+
+import (
+	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
+)
+
+// fatstdBytesNewExternal registers a fat_Bytes over C memory. release is a C
+// function pointer (may be 0) invoked with (data, n, userData) once the handle
+// has been freed and every borrow of it released.
+func fatstdBytesNewExternal(data unsafe.Pointer, n int, release uintptr, userData unsafe.Pointer) uintptr {
+	var value []byte
+	if n > 0 {
+		value = unsafe.Slice((*byte)(data), n)
+	} else {
+		value = []byte{}
+	}
+	var onRelease func()
+	if release != 0 {
+		onRelease = func() {
+			C.fatstd_bytes_call_release(C.uintptr_t(release), data, C.size_t(n), userData)
+		}
+	}
+	return fatstdHandles.register(fatbytes.NewExternal(value, onRelease))
+}
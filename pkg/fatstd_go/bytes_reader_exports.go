@@ -9,6 +9,7 @@ import "C"
 
 import (
 	"io"
+	"math"
 	"unsafe"
 
 	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
@@ -70,7 +71,7 @@ func fatstd_go_bytes_reader_read(readerHandle C.uintptr_t, dst *C.char, dstLen C
 		}
 		panic("fatstd_go_bytes_reader_read: dst is NULL but dstLen > 0")
 	}
-	if dstLen > C.size_t(2147483647) {
+	if dstLen > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_reader_read: dstLen too large")
 	}
 
@@ -101,7 +102,7 @@ func fatstd_go_bytes_reader_read_at(readerHandle C.uintptr_t, dst *C.char, dstLe
 		}
 		panic("fatstd_go_bytes_reader_read_at: dst is NULL but dstLen > 0")
 	}
-	if dstLen > C.size_t(2147483647) {
+	if dstLen > C.size_t(math.MaxInt) {
 		panic("fatstd_go_bytes_reader_read_at: dstLen too large")
 	}
 
@@ -165,7 +166,7 @@ func fatstd_go_bytes_reader_seek(readerHandle C.uintptr_t, offset C.longlong, wh
 func fatstd_go_bytes_reader_write_to_bytes_buffer(readerHandle C.uintptr_t, bufferHandle C.uintptr_t) C.longlong {
 	r := fatstdBytesReaderFromHandle(uintptr(readerHandle))
 	b := fatstdBytesBufferFromHandle(uintptr(bufferHandle))
-	n, err := r.WriteTo(b.Underlying())
+	n, err := r.WriteTo(b.Writer())
 	if err != nil {
 		panic("fatstd_go_bytes_reader_write_to_bytes_buffer: unexpected error")
 	}
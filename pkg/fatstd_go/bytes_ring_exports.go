@@ -0,0 +1,174 @@
+package main
+
+/*
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+*/
+import "C"
+
+import (
+	"math"
+	"runtime"
+	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
+)
+
+// fatBytesRing pins the ring's fixed array for the life of the handle, so
+// the regions handed out by Peek and Reserve stay valid in C.
+type fatBytesRing struct {
+	ring   *fatbytes.Ring
+	pinner runtime.Pinner
+}
+
+func fatstdBytesRingFromHandle(handle uintptr) *fatbytes.Ring {
+	if handle == 0 {
+		panic("fatstdBytesRingFromHandle: handle is 0")
+	}
+	value, ok := fatstdHandles.get(handle)
+	if !ok {
+		panic("fatstdBytesRingFromHandle: invalid handle")
+	}
+	r, ok := value.(*fatBytesRing)
+	if !ok {
+		panic("fatstdBytesRingFromHandle: handle is not fat bytes ring")
+	}
+	return r.ring
+}
+
+// fatstdBytesRingRegions stores up to two regions in the C out-params and
+// returns their total length.
+func fatstdBytesRingRegions(name string, first, second []byte, outFirst *unsafe.Pointer, outFirstLen *C.size_t, outSecond *unsafe.Pointer, outSecondLen *C.size_t) C.size_t {
+	if outFirst == nil || outFirstLen == nil || outSecond == nil || outSecondLen == nil {
+		panic(name + ": out-params must not be NULL")
+	}
+	*outFirst, *outSecond = nil, nil
+	if len(first) > 0 {
+		*outFirst = unsafe.Pointer(unsafe.SliceData(first))
+	}
+	if len(second) > 0 {
+		*outSecond = unsafe.Pointer(unsafe.SliceData(second))
+	}
+	*outFirstLen = C.size_t(len(first))
+	*outSecondLen = C.size_t(len(second))
+	return C.size_t(len(first) + len(second))
+}
+
+//export fatstd_go_bytes_ring_new
+func fatstd_go_bytes_ring_new(capacity C.size_t, blocking C.bool) C.uintptr_t {
+	if capacity > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_ring_new: capacity too large")
+	}
+	r := &fatBytesRing{ring: fatbytes.NewRing(int(capacity), bool(blocking))}
+	// A new ring's free space is its whole array.
+	space, _ := r.ring.Reserve()
+	r.pinner.Pin(unsafe.SliceData(space))
+	return C.uintptr_t(fatstdHandles.register(r))
+}
+
+//export fatstd_go_bytes_ring_free
+func fatstd_go_bytes_ring_free(handle C.uintptr_t) {
+	if handle == 0 {
+		panic("fatstd_go_bytes_ring_free: handle is 0")
+	}
+	value, ok := fatstdHandles.take(uintptr(handle))
+	if !ok {
+		panic("fatstd_go_bytes_ring_free: invalid handle")
+	}
+	r, ok := value.(*fatBytesRing)
+	if !ok {
+		panic("fatstd_go_bytes_ring_free: handle is not fat bytes ring")
+	}
+	r.pinner.Unpin()
+}
+
+//export fatstd_go_bytes_ring_cap
+func fatstd_go_bytes_ring_cap(handle C.uintptr_t) C.size_t {
+	r := fatstdBytesRingFromHandle(uintptr(handle))
+	return C.size_t(r.Cap())
+}
+
+//export fatstd_go_bytes_ring_len
+func fatstd_go_bytes_ring_len(handle C.uintptr_t) C.size_t {
+	r := fatstdBytesRingFromHandle(uintptr(handle))
+	return C.size_t(r.Len())
+}
+
+//export fatstd_go_bytes_ring_write
+func fatstd_go_bytes_ring_write(handle C.uintptr_t, bytes *C.char, length C.size_t) C.size_t {
+	if bytes == nil {
+		if length == 0 {
+			return 0
+		}
+		panic("fatstd_go_bytes_ring_write: bytes is NULL but len > 0")
+	}
+	if length > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_ring_write: len too large")
+	}
+	r := fatstdBytesRingFromHandle(uintptr(handle))
+	return C.size_t(r.Write(unsafe.Slice((*byte)(unsafe.Pointer(bytes)), int(length))))
+}
+
+//export fatstd_go_bytes_ring_read
+func fatstd_go_bytes_ring_read(handle C.uintptr_t, dst *C.char, dstLen C.size_t, eofOut *C.bool) C.size_t {
+	if eofOut == nil {
+		panic("fatstd_go_bytes_ring_read: eofOut is NULL")
+	}
+	if dst == nil && dstLen > 0 {
+		panic("fatstd_go_bytes_ring_read: dst is NULL but dstLen > 0")
+	}
+	if dstLen > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_ring_read: dstLen too large")
+	}
+	r := fatstdBytesRingFromHandle(uintptr(handle))
+	var out []byte
+	if dst != nil {
+		out = unsafe.Slice((*byte)(unsafe.Pointer(dst)), int(dstLen))
+	}
+	n, eof := r.Read(out)
+	*eofOut = C.bool(eof)
+	return C.size_t(n)
+}
+
+//export fatstd_go_bytes_ring_peek
+func fatstd_go_bytes_ring_peek(handle C.uintptr_t, outFirst *unsafe.Pointer, outFirstLen *C.size_t, outSecond *unsafe.Pointer, outSecondLen *C.size_t, eofOut *C.bool) C.size_t {
+	if eofOut == nil {
+		panic("fatstd_go_bytes_ring_peek: eofOut is NULL")
+	}
+	r := fatstdBytesRingFromHandle(uintptr(handle))
+	first, second, eof := r.Peek()
+	*eofOut = C.bool(eof)
+	return fatstdBytesRingRegions("fatstd_go_bytes_ring_peek", first, second, outFirst, outFirstLen, outSecond, outSecondLen)
+}
+
+//export fatstd_go_bytes_ring_consume
+func fatstd_go_bytes_ring_consume(handle C.uintptr_t, n C.size_t) {
+	if n > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_ring_consume: n too large")
+	}
+	r := fatstdBytesRingFromHandle(uintptr(handle))
+	r.Consume(int(n))
+}
+
+//export fatstd_go_bytes_ring_reserve
+func fatstd_go_bytes_ring_reserve(handle C.uintptr_t, outFirst *unsafe.Pointer, outFirstLen *C.size_t, outSecond *unsafe.Pointer, outSecondLen *C.size_t) C.size_t {
+	r := fatstdBytesRingFromHandle(uintptr(handle))
+	first, second := r.Reserve()
+	return fatstdBytesRingRegions("fatstd_go_bytes_ring_reserve", first, second, outFirst, outFirstLen, outSecond, outSecondLen)
+}
+
+//export fatstd_go_bytes_ring_commit
+func fatstd_go_bytes_ring_commit(handle C.uintptr_t, n C.size_t) {
+	if n > C.size_t(math.MaxInt) {
+		panic("fatstd_go_bytes_ring_commit: n too large")
+	}
+	r := fatstdBytesRingFromHandle(uintptr(handle))
+	r.Commit(int(n))
+}
+
+//export fatstd_go_bytes_ring_close
+func fatstd_go_bytes_ring_close(handle C.uintptr_t) {
+	r := fatstdBytesRingFromHandle(uintptr(handle))
+	r.Close()
+}
@@ -2,12 +2,15 @@ package main
 
 /*
 #include <stdbool.h>
+#include <stddef.h>
 #include <stdint.h>
 */
 import "C"
 
 import (
+	"math"
 	"strconv"
+	"unsafe"
 
 	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
 	"github.com/bluesentinelsec/FatStd/pkg/fatconv"
@@ -369,6 +372,203 @@ func fatstd_go_conv_unquote_char(sHandle C.uintptr_t, quote C.uchar, outRune *C.
 	return fatStatusOK
 }
 
+// fatstdConvDst views a caller buffer as an empty slice whose capacity is the
+// buffer, so the formatting appenders write straight into C memory.
+func fatstdConvDst(name string, dst *C.char, dstLen C.size_t) []byte {
+	if dst == nil {
+		if dstLen == 0 {
+			return nil
+		}
+		panic(name + ": dst is NULL but dstLen > 0")
+	}
+	if dstLen > C.size_t(math.MaxInt) {
+		panic(name + ": dstLen too large")
+	}
+	return unsafe.Slice((*byte)(unsafe.Pointer(dst)), int(dstLen))[:0]
+}
+
+// fatstdConvFinishInto returns the full formatted length. out is dst after an
+// append; if the text outgrew dst the append moved it to the Go heap, and the
+// prefix that fits is copied back.
+func fatstdConvFinishInto(dst []byte, out []byte) C.size_t {
+	if len(out) > cap(dst) {
+		copy(dst[:cap(dst)], out)
+	}
+	return C.size_t(len(out))
+}
+
+//export fatstd_go_conv_format_bool_into
+func fatstd_go_conv_format_bool_into(b C.int, dst *C.char, dstLen C.size_t) C.size_t {
+	buf := fatstdConvDst("fatstd_go_conv_format_bool_into", dst, dstLen)
+	return fatstdConvFinishInto(buf, fatconv.AppendBool(buf, b != 0))
+}
+
+//export fatstd_go_conv_format_int_into
+func fatstd_go_conv_format_int_into(i C.longlong, base C.int, dst *C.char, dstLen C.size_t) C.size_t {
+	buf := fatstdConvDst("fatstd_go_conv_format_int_into", dst, dstLen)
+	return fatstdConvFinishInto(buf, fatconv.AppendInt(buf, int64(i), int(base)))
+}
+
+//export fatstd_go_conv_format_uint_into
+func fatstd_go_conv_format_uint_into(i C.ulonglong, base C.int, dst *C.char, dstLen C.size_t) C.size_t {
+	buf := fatstdConvDst("fatstd_go_conv_format_uint_into", dst, dstLen)
+	return fatstdConvFinishInto(buf, fatconv.AppendUint(buf, uint64(i), int(base)))
+}
+
+//export fatstd_go_conv_format_float_into
+func fatstd_go_conv_format_float_into(f C.double, fmt C.uchar, prec C.int, bitSize C.int, dst *C.char, dstLen C.size_t) C.size_t {
+	buf := fatstdConvDst("fatstd_go_conv_format_float_into", dst, dstLen)
+	return fatstdConvFinishInto(buf, fatconv.AppendFloat(buf, float64(f), byte(fmt), int(prec), int(bitSize)))
+}
+
+//export fatstd_go_conv_quote_into
+func fatstd_go_conv_quote_into(sHandle C.uintptr_t, dst *C.char, dstLen C.size_t) C.size_t {
+	s := fatstdStringFromHandle(uintptr(sHandle))
+	buf := fatstdConvDst("fatstd_go_conv_quote_into", dst, dstLen)
+	return fatstdConvFinishInto(buf, fatconv.AppendQuote(buf, s.Value()))
+}
+
+//export fatstd_go_conv_write_bool
+func fatstd_go_conv_write_bool(dstHandle C.uintptr_t, b C.int) C.size_t {
+	dst := fatstdBytesBufferFromHandle(uintptr(dstHandle))
+	return C.size_t(dst.Write(fatconv.AppendBool(dst.AvailableBuffer(), b != 0)))
+}
+
+//export fatstd_go_conv_write_int
+func fatstd_go_conv_write_int(dstHandle C.uintptr_t, i C.longlong, base C.int) C.size_t {
+	dst := fatstdBytesBufferFromHandle(uintptr(dstHandle))
+	return C.size_t(dst.Write(fatconv.AppendInt(dst.AvailableBuffer(), int64(i), int(base))))
+}
+
+//export fatstd_go_conv_write_uint
+func fatstd_go_conv_write_uint(dstHandle C.uintptr_t, i C.ulonglong, base C.int) C.size_t {
+	dst := fatstdBytesBufferFromHandle(uintptr(dstHandle))
+	return C.size_t(dst.Write(fatconv.AppendUint(dst.AvailableBuffer(), uint64(i), int(base))))
+}
+
+//export fatstd_go_conv_write_float
+func fatstd_go_conv_write_float(dstHandle C.uintptr_t, f C.double, fmt C.uchar, prec C.int, bitSize C.int) C.size_t {
+	dst := fatstdBytesBufferFromHandle(uintptr(dstHandle))
+	return C.size_t(dst.Write(fatconv.AppendFloat(dst.AvailableBuffer(), float64(f), byte(fmt), int(prec), int(bitSize))))
+}
+
+//export fatstd_go_conv_write_float_array
+func fatstd_go_conv_write_float_array(dstHandle C.uintptr_t, values *C.double, n C.size_t, fmt C.uchar, prec C.int, bitSize C.int, sep C.uchar) C.size_t {
+	dst := fatstdBytesBufferFromHandle(uintptr(dstHandle))
+	if n == 0 {
+		return 0
+	}
+	if values == nil {
+		panic("fatstd_go_conv_write_float_array: values is NULL")
+	}
+	vs := unsafe.Slice((*float64)(unsafe.Pointer(values)), int(n))
+	dst.Grow(fatconv.AppendFloatsCap(len(vs)))
+	return C.size_t(dst.Write(fatconv.AppendFloats(dst.AvailableBuffer(), vs, byte(fmt), int(prec), int(bitSize), byte(sep))))
+}
+
+//export fatstd_go_conv_write_quote
+func fatstd_go_conv_write_quote(dstHandle C.uintptr_t, sHandle C.uintptr_t) C.size_t {
+	dst := fatstdBytesBufferFromHandle(uintptr(dstHandle))
+	s := fatstdStringFromHandle(uintptr(sHandle))
+	return C.size_t(dst.Write(fatconv.AppendQuote(dst.AvailableBuffer(), s.Value())))
+}
+
+// fatstdConvColumnOut views the caller's value and status buffers as n-element
+// Go slices.
+func fatstdConvColumnOut[T any](name string, n int, out *T, outStatus *C.uint8_t) ([]T, []uint8) {
+	if n == 0 {
+		return nil, nil
+	}
+	if out == nil {
+		panic(name + ": out is NULL")
+	}
+	if outStatus == nil {
+		panic(name + ": outStatus is NULL")
+	}
+	return unsafe.Slice(out, n), unsafe.Slice((*uint8)(unsafe.Pointer(outStatus)), n)
+}
+
+// fatstdConvArrayColumn returns the packed cells of an array handle and
+// checks that outLen can hold one result per element.
+func fatstdConvArrayColumn(name string, arrayHandle C.uintptr_t, outLen C.size_t) (string, []int, int) {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	n := a.Len()
+	if outLen < C.size_t(n) {
+		panic(name + ": outLen is smaller than the array length")
+	}
+	return a.Arena(), a.Offsets(), n
+}
+
+// fatstdConvDelimitedColumn views a bytes handle as a string for the
+// delimited parsers; they only read it.
+func fatstdConvDelimitedColumn(name string, bytesHandle C.uintptr_t, outLen C.size_t, outCount *C.size_t) (string, int) {
+	if outCount == nil {
+		panic(name + ": outCount is NULL")
+	}
+	if outLen > C.size_t(math.MaxInt) {
+		panic(name + ": outLen too large")
+	}
+	b := fatstdBytesFromHandle(uintptr(bytesHandle)).Value()
+	if len(b) == 0 {
+		return "", int(outLen)
+	}
+	return unsafe.String(&b[0], len(b)), int(outLen)
+}
+
+//export fatstd_go_conv_parse_int_array
+func fatstd_go_conv_parse_int_array(arrayHandle C.uintptr_t, base C.int, bitSize C.int, out *C.longlong, outStatus *C.uint8_t, outLen C.size_t) C.size_t {
+	const name = "fatstd_go_conv_parse_int_array"
+	data, offsets, n := fatstdConvArrayColumn(name, arrayHandle, outLen)
+	dst, status := fatstdConvColumnOut(name, n, (*int64)(unsafe.Pointer(out)), outStatus)
+	return C.size_t(fatconv.ParseIntCells(data, offsets, int(base), int(bitSize), dst, status))
+}
+
+//export fatstd_go_conv_parse_float_array
+func fatstd_go_conv_parse_float_array(arrayHandle C.uintptr_t, bitSize C.int, out *C.double, outStatus *C.uint8_t, outLen C.size_t) C.size_t {
+	const name = "fatstd_go_conv_parse_float_array"
+	data, offsets, n := fatstdConvArrayColumn(name, arrayHandle, outLen)
+	dst, status := fatstdConvColumnOut(name, n, (*float64)(unsafe.Pointer(out)), outStatus)
+	return C.size_t(fatconv.ParseFloatCells(data, offsets, int(bitSize), dst, status))
+}
+
+//export fatstd_go_conv_parse_bool_array
+func fatstd_go_conv_parse_bool_array(arrayHandle C.uintptr_t, out *C.uint8_t, outStatus *C.uint8_t, outLen C.size_t) C.size_t {
+	const name = "fatstd_go_conv_parse_bool_array"
+	data, offsets, n := fatstdConvArrayColumn(name, arrayHandle, outLen)
+	dst, status := fatstdConvColumnOut(name, n, (*uint8)(unsafe.Pointer(out)), outStatus)
+	return C.size_t(fatconv.ParseBoolCells(data, offsets, dst, status))
+}
+
+//export fatstd_go_conv_parse_int_delimited
+func fatstd_go_conv_parse_int_delimited(bytesHandle C.uintptr_t, sep C.uchar, base C.int, bitSize C.int, out *C.longlong, outStatus *C.uint8_t, outLen C.size_t, outCount *C.size_t) C.size_t {
+	const name = "fatstd_go_conv_parse_int_delimited"
+	data, n := fatstdConvDelimitedColumn(name, bytesHandle, outLen, outCount)
+	dst, status := fatstdConvColumnOut(name, n, (*int64)(unsafe.Pointer(out)), outStatus)
+	cells, failed := fatconv.ParseIntDelimited(data, byte(sep), int(base), int(bitSize), dst, status)
+	*outCount = C.size_t(cells)
+	return C.size_t(failed)
+}
+
+//export fatstd_go_conv_parse_float_delimited
+func fatstd_go_conv_parse_float_delimited(bytesHandle C.uintptr_t, sep C.uchar, bitSize C.int, out *C.double, outStatus *C.uint8_t, outLen C.size_t, outCount *C.size_t) C.size_t {
+	const name = "fatstd_go_conv_parse_float_delimited"
+	data, n := fatstdConvDelimitedColumn(name, bytesHandle, outLen, outCount)
+	dst, status := fatstdConvColumnOut(name, n, (*float64)(unsafe.Pointer(out)), outStatus)
+	cells, failed := fatconv.ParseFloatDelimited(data, byte(sep), int(bitSize), dst, status)
+	*outCount = C.size_t(cells)
+	return C.size_t(failed)
+}
+
+//export fatstd_go_conv_parse_bool_delimited
+func fatstd_go_conv_parse_bool_delimited(bytesHandle C.uintptr_t, sep C.uchar, out *C.uint8_t, outStatus *C.uint8_t, outLen C.size_t, outCount *C.size_t) C.size_t {
+	const name = "fatstd_go_conv_parse_bool_delimited"
+	data, n := fatstdConvDelimitedColumn(name, bytesHandle, outLen, outCount)
+	dst, status := fatstdConvColumnOut(name, n, (*uint8)(unsafe.Pointer(out)), outStatus)
+	cells, failed := fatconv.ParseBoolDelimited(data, byte(sep), dst, status)
+	*outCount = C.size_t(cells)
+	return C.size_t(failed)
+}
+
 //export fatstd_go_conv_int_size
 func fatstd_go_conv_int_size() C.int {
 	return C.int(strconv.IntSize)
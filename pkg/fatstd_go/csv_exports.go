@@ -11,7 +11,10 @@ import (
 	"encoding/csv"
 	"errors"
 	"io"
+	"math"
 	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
 )
 
 const (
@@ -20,8 +23,8 @@ const (
 )
 
 type fatCsvReader struct {
-	r    *csv.Reader
-	data []byte
+	r   *csv.Reader
+	src *fatbytes.Bytes // retained input of bytes-backed readers, read in place
 }
 
 type fatCsvWriter struct {
@@ -84,9 +87,9 @@ func fatstdCsvStatusFromError(err error) C.int {
 //export fatstd_go_csv_reader_new_bytes
 func fatstd_go_csv_reader_new_bytes(bytesHandle C.uintptr_t) C.uintptr_t {
 	b := fatstdBytesFromHandle(uintptr(bytesHandle))
-	data := append([]byte(nil), b.Value()...)
-	r := csv.NewReader(bytes.NewReader(data))
-	return C.uintptr_t(fatstdHandles.register(&fatCsvReader{r: r, data: data}))
+	r := csv.NewReader(bytes.NewReader(b.Value()))
+	b.Retain()
+	return C.uintptr_t(fatstdHandles.register(&fatCsvReader{r: r, src: b}))
 }
 
 //export fatstd_go_csv_reader_free
@@ -98,9 +101,13 @@ func fatstd_go_csv_reader_free(handle C.uintptr_t) {
 	if !ok {
 		panic("fatstd_go_csv_reader_free: invalid handle")
 	}
-	if _, ok := value.(*fatCsvReader); !ok {
+	r, ok := value.(*fatCsvReader)
+	if !ok {
 		panic("fatstd_go_csv_reader_free: handle is not csv reader")
 	}
+	if r.src != nil {
+		r.src.Release()
+	}
 }
 
 //export fatstd_go_csv_reader_read
@@ -159,7 +166,7 @@ func fatstd_go_csv_reader_input_offset(handle C.uintptr_t) C.longlong {
 //export fatstd_go_csv_writer_new_to_bytes_buffer
 func fatstd_go_csv_writer_new_to_bytes_buffer(dstBufferHandle C.uintptr_t) C.uintptr_t {
 	dst := fatstdBytesBufferFromHandle(uintptr(dstBufferHandle))
-	w := csv.NewWriter(dst.Underlying())
+	w := csv.NewWriter(dst.Writer())
 	return C.uintptr_t(fatstdHandles.register(&fatCsvWriter{w: w}))
 }
 
@@ -171,7 +178,7 @@ func fatstd_go_csv_writer_write_record(handle C.uintptr_t, fields *C.uintptr_t,
 	if fields == nil && n != 0 {
 		panic("fatstd_go_csv_writer_write_record: fields is NULL but n > 0")
 	}
-	if n > C.size_t(2147483647) {
+	if n > C.size_t(math.MaxInt) {
 		panic("fatstd_go_csv_writer_write_record: n too large")
 	}
 
@@ -1,11 +1,32 @@
 package main
 
+/*
+#include <stdint.h>
+*/
 import "C"
 
+import "runtime"
+
 //export fatstd_go_add
 func fatstd_go_add(a, b C.int) C.int {
 	return a + b
 }
 
-func main() {}
+// fatstd_go_mem_stats reports cumulative Go heap allocations (objects and
+// bytes) since process start. Benchmarks diff two samples to get allocs/op.
+//
+//export fatstd_go_mem_stats
+func fatstd_go_mem_stats(outAllocs *C.uint64_t, outBytes *C.uint64_t) {
+	if outAllocs == nil {
+		panic("fatstd_go_mem_stats: outAllocs is NULL")
+	}
+	if outBytes == nil {
+		panic("fatstd_go_mem_stats: outBytes is NULL")
+	}
+	var ms runtime.MemStats
+	runtime.ReadMemStats(&ms)
+	*outAllocs = C.uint64_t(ms.Mallocs)
+	*outBytes = C.uint64_t(ms.TotalAlloc)
+}
 
+func main() {}
@@ -0,0 +1,129 @@
+package main
+
+/*
+#include <stddef.h>
+#include <stdint.h>
+*/
+import "C"
+
+import (
+	"math"
+	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
+	"github.com/bluesentinelsec/FatStd/pkg/fatstrings"
+)
+
+// fatstdHandleIsPlainFree reports whether a handle value's *_Free is a pure
+// registry release. Handles that own OS resources or must flush on close
+// (readers over files, writers, sockets, servers) are excluded: they have to
+// go through their own Close/Free so errors can be reported, as do bytes
+// over external memory, whose Free runs a release callback (likewise csv
+// readers holding a reference to such bytes), and buffers
+// pinned by Reserve or Peek, whose Free unpins them. Interned strings
+// belong to their interner and are never freed by the caller.
+func fatstdHandleIsPlainFree(value any) bool {
+	switch v := value.(type) {
+	case *fatbytes.Bytes:
+		return !v.IsExternal()
+	case *fatstrings.String:
+		return !v.IsInterned()
+	case *fatSplitIter:
+		return v.src == nil
+	case *fatbytes.Buffer:
+		return !fatstdBytesBufferPinned(v)
+	case *fatCsvReader:
+		return v.src == nil || !v.src.IsExternal()
+	case *fatstrings.StringArray,
+		*fatstrings.Builder,
+		*fatstrings.Rope,
+		*fatstrings.Replacer,
+		*fatstrings.Matcher,
+		*fatstrings.Reader,
+		*fatbytes.BytesArray,
+		*fatbytes.Reader,
+		*fatstdError,
+		*fatBase64Encoding,
+		*fatCsvWriter,
+		*fatJsonValue,
+		*fatJsonDecoder,
+		*fatJsonEncoder,
+		*fatXmlToken,
+		*fatTarHeader,
+		*fatZipFile,
+		*fatHttpClient,
+		*fatHttpResponse,
+		*fatHttpRequest,
+		*fatTiledMap,
+		*fatTiledLayer,
+		*fatTiledLayerTile,
+		*fatTiledProperties:
+		return true
+	}
+	return false
+}
+
+//export fatstd_go_handles_free
+func fatstd_go_handles_free(handles *C.uintptr_t, n C.size_t) {
+	if handles == nil {
+		if n == 0 {
+			return
+		}
+		panic("fatstd_go_handles_free: handles is NULL but n > 0")
+	}
+	if n > C.size_t(math.MaxInt) {
+		panic("fatstd_go_handles_free: n too large")
+	}
+
+	batch := unsafe.Slice((*uintptr)(unsafe.Pointer(handles)), int(n))
+	_, status := fatstdHandles.takeAll(batch, fatstdHandleIsPlainFree)
+	switch status {
+	case handleBatchInvalid:
+		panic("fatstd_go_handles_free: invalid handle")
+	case handleBatchRejected:
+		panic("fatstd_go_handles_free: handle type must be released with its own Close/Free")
+	}
+}
+
+//export fatstd_go_handle_set_tracking
+func fatstd_go_handle_set_tracking(mode C.int) {
+	if mode < C.int(handleTrackOff) || mode > C.int(handleTrackOrigins) {
+		panic("fatstd_go_handle_set_tracking: invalid mode")
+	}
+	fatstdHandles.setTracking(handleTrackMode(mode))
+}
+
+//export fatstd_go_handle_tracking
+func fatstd_go_handle_tracking() C.int {
+	return C.int(fatstdHandles.trackMode.Load())
+}
+
+//export fatstd_go_handle_stats
+func fatstd_go_handle_stats(outLive *C.uint64_t, outRegistered *C.uint64_t, outFreed *C.uint64_t, outHighWater *C.uint64_t) {
+	if outLive == nil || outRegistered == nil || outFreed == nil || outHighWater == nil {
+		panic("fatstd_go_handle_stats: out is NULL")
+	}
+	totals := fatstdHandles.totals()
+	*outLive = C.uint64_t(totals.live)
+	*outRegistered = C.uint64_t(totals.registered)
+	*outFreed = C.uint64_t(totals.taken)
+	*outHighWater = C.uint64_t(totals.high)
+}
+
+//export fatstd_go_handle_stats_dump
+func fatstd_go_handle_stats_dump(dst *C.char, dstLen C.size_t) C.size_t {
+	if dst == nil && dstLen != 0 {
+		panic("fatstd_go_handle_stats_dump: dst is NULL but dstLen > 0")
+	}
+	if dstLen > C.size_t(math.MaxInt) {
+		panic("fatstd_go_handle_stats_dump: dstLen too large")
+	}
+
+	report := fatstdHandles.report()
+	if dstLen > 0 {
+		out := unsafe.Slice((*byte)(unsafe.Pointer(dst)), int(dstLen))
+		n := copy(out[:len(out)-1], report)
+		out[n] = 0
+	}
+	return C.size_t(len(report))
+}
@@ -0,0 +1,323 @@
+package main
+
+import (
+	"fmt"
+	"reflect"
+	"runtime"
+	"sort"
+	"strings"
+	"sync"
+	"time"
+)
+
+type handleTrackMode int32
+
+const (
+	handleTrackOff handleTrackMode = iota
+	handleTrackCounts
+	handleTrackOrigins
+)
+
+const handleOriginUnknown = "(untracked)"
+
+type handleTypeStats struct {
+	live       uint64
+	high       uint64
+	registered uint64
+	taken      uint64
+}
+
+// handleTracker holds the opt-in diagnostics. Its methods are called with the
+// owning shard's lock held; setTracking holds every shard lock, so the tracker
+// always agrees with the registry contents while enabled.
+type handleTracker struct {
+	mu      sync.Mutex
+	since   time.Time
+	live    uint64
+	high    uint64
+	types   map[reflect.Type]*handleTypeStats
+	origins map[uintptr]string
+}
+
+func (t *handleTracker) typeStats(value any) *handleTypeStats {
+	typ := reflect.TypeOf(value)
+	ts := t.types[typ]
+	if ts == nil {
+		ts = &handleTypeStats{}
+		t.types[typ] = ts
+	}
+	return ts
+}
+
+func (t *handleTracker) registered(handle uintptr, value any, origin string) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	ts := t.typeStats(value)
+	ts.registered++
+	ts.live++
+	if ts.live > ts.high {
+		ts.high = ts.live
+	}
+	t.live++
+	if t.live > t.high {
+		t.high = t.live
+	}
+	if t.origins != nil {
+		if origin == "" {
+			origin = handleOriginUnknown
+		}
+		t.origins[handle] = origin
+	}
+}
+
+func (t *handleTracker) taken(handle uintptr, value any) {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	ts := t.typeStats(value)
+	ts.taken++
+	ts.live--
+	t.live--
+	if t.origins != nil {
+		delete(t.origins, handle)
+	}
+}
+
+// handleOrigin names the exported function that is registering a handle:
+// the nearest fatstd_go_* frame on the stack, or the registry's direct caller
+// when there is none (Go-side registrations, tests). skip is the number of
+// frames between handleOrigin's caller and the registry's caller.
+func handleOrigin(skip int) string {
+	var pcs [32]uintptr
+	n := runtime.Callers(3+skip, pcs[:])
+	frames := runtime.CallersFrames(pcs[:n])
+	fallback := ""
+	for {
+		frame, more := frames.Next()
+		name := frame.Function
+		if i := strings.LastIndexByte(name, '.'); i >= 0 && strings.HasPrefix(name[i+1:], "fatstd_go_") {
+			return name[i+1:]
+		}
+		if fallback == "" {
+			fallback = name
+		}
+		if !more {
+			break
+		}
+	}
+	if fallback == "" {
+		return handleOriginUnknown
+	}
+	return fallback
+}
+
+func (r *handleRegistry) lockAll() {
+	for i := range r.shards {
+		r.shards[i].mu.Lock()
+	}
+}
+
+func (r *handleRegistry) unlockAll() {
+	for i := range r.shards {
+		r.shards[i].mu.Unlock()
+	}
+}
+
+// forEachLive calls fn for every live entry. Caller must hold every shard lock.
+func (r *handleRegistry) forEachLive(fn func(handle uintptr, value any)) {
+	for si := range r.shards {
+		s := &r.shards[si]
+		for index := uint32(0); index < s.used; index++ {
+			e := s.slot(index).entry.Load()
+			if e == nil {
+				continue
+			}
+			fn(uintptr(uint64(e.gen)<<handleIndexBits|uint64(index)<<handleShardBits|uint64(si)), e.value)
+		}
+	}
+}
+
+// setTracking switches the diagnostics level. Moving up from off reseeds the
+// tracker from the live handles, so counts are exact from that point and high
+// water marks start at the current population; handles that already existed
+// have no recorded origin. Turning tracking off discards all tracked state.
+func (r *handleRegistry) setTracking(mode handleTrackMode) {
+	r.lockAll()
+	defer r.unlockAll()
+
+	t := &r.tracker
+	t.mu.Lock()
+	defer t.mu.Unlock()
+
+	old := handleTrackMode(r.trackMode.Load())
+	switch {
+	case mode == handleTrackOff:
+		t.types = nil
+		t.origins = nil
+		t.live, t.high = 0, 0
+	case old == handleTrackOff:
+		t.since = time.Now()
+		t.types = make(map[reflect.Type]*handleTypeStats)
+		t.live = 0
+		r.forEachLive(func(_ uintptr, value any) {
+			ts := t.typeStats(value)
+			ts.live++
+			ts.high = ts.live
+			t.live++
+		})
+		t.high = t.live
+	}
+	if mode == handleTrackOrigins && t.origins == nil {
+		t.origins = make(map[uintptr]string)
+		r.forEachLive(func(handle uintptr, _ any) {
+			t.origins[handle] = handleOriginUnknown
+		})
+	} else if mode != handleTrackOrigins {
+		t.origins = nil
+	}
+	r.trackMode.Store(int32(mode))
+}
+
+type handleTotals struct {
+	live       uint64
+	registered uint64
+	taken      uint64
+	high       uint64
+}
+
+// totals sums the always-on per-shard counters. high is only known while
+// tracking is enabled and is 0 otherwise.
+func (r *handleRegistry) totals() handleTotals {
+	var out handleTotals
+	for i := range r.shards {
+		s := &r.shards[i]
+		s.mu.Lock()
+		out.registered += s.registered
+		out.taken += s.taken
+		s.mu.Unlock()
+	}
+	out.live = out.registered - out.taken
+	if r.trackMode.Load() != int32(handleTrackOff) {
+		r.tracker.mu.Lock()
+		out.high = r.tracker.high
+		r.tracker.mu.Unlock()
+	}
+	return out
+}
+
+type handleTypeRow struct {
+	name string
+	handleTypeStats
+}
+
+type handleOriginRow struct {
+	origin string
+	typ    string
+	live   uint64
+}
+
+// report renders a human-readable snapshot: totals and rates, live counts per
+// Go type (with high-water marks while tracking), and, in origins mode, live
+// handles grouped by the export function that created them.
+func (r *handleRegistry) report() string {
+	r.lockAll()
+	mode := handleTrackMode(r.trackMode.Load())
+
+	var registered, taken uint64
+	for i := range r.shards {
+		registered += r.shards[i].registered
+		taken += r.shards[i].taken
+	}
+
+	byType := make(map[reflect.Type]*handleTypeRow)
+	originCounts := make(map[[2]string]uint64)
+	r.tracker.mu.Lock()
+	r.forEachLive(func(handle uintptr, value any) {
+		typ := reflect.TypeOf(value)
+		row := byType[typ]
+		if row == nil {
+			row = &handleTypeRow{name: typ.String()}
+			byType[typ] = row
+		}
+		row.live++
+		if mode == handleTrackOrigins {
+			originCounts[[2]string{r.tracker.origins[handle], row.name}]++
+		}
+	})
+	var high uint64
+	var since time.Time
+	if mode != handleTrackOff {
+		high = r.tracker.high
+		since = r.tracker.since
+		for typ, ts := range r.tracker.types {
+			row := byType[typ]
+			if row == nil {
+				row = &handleTypeRow{name: typ.String()}
+				byType[typ] = row
+			}
+			row.high = ts.high
+			row.registered = ts.registered
+			row.taken = ts.taken
+		}
+	}
+	r.tracker.mu.Unlock()
+	r.unlockAll()
+
+	rows := make([]*handleTypeRow, 0, len(byType))
+	for _, row := range byType {
+		rows = append(rows, row)
+	}
+	sort.Slice(rows, func(i, j int) bool {
+		if rows[i].live != rows[j].live {
+			return rows[i].live > rows[j].live
+		}
+		return rows[i].name < rows[j].name
+	})
+
+	var b strings.Builder
+	uptime := time.Since(r.created).Seconds()
+	fmt.Fprintf(&b, "handles: live=%d registered=%d freed=%d", registered-taken, registered, taken)
+	if mode != handleTrackOff {
+		fmt.Fprintf(&b, " high_water=%d", high)
+	}
+	fmt.Fprintf(&b, " tracking=%s\n", [...]string{"off", "counts", "origins"}[mode])
+	fmt.Fprintf(&b, "rates: uptime=%.3fs register=%.1f/s free=%.1f/s\n",
+		uptime, float64(registered)/uptime, float64(taken)/uptime)
+
+	if mode == handleTrackOff {
+		fmt.Fprintf(&b, "%-32s %10s\n", "type", "live")
+		for _, row := range rows {
+			fmt.Fprintf(&b, "%-32s %10d\n", row.name, row.live)
+		}
+		return b.String()
+	}
+
+	window := time.Since(since).Seconds()
+	fmt.Fprintf(&b, "%-32s %10s %10s %12s %12s %12s\n", "type", "live", "high", "registered", "freed", "register/s")
+	for _, row := range rows {
+		fmt.Fprintf(&b, "%-32s %10d %10d %12d %12d %12.1f\n",
+			row.name, row.live, row.high, row.registered, row.taken, float64(row.registered)/window)
+	}
+
+	if mode == handleTrackOrigins {
+		origins := make([]handleOriginRow, 0, len(originCounts))
+		for key, n := range originCounts {
+			origins = append(origins, handleOriginRow{origin: key[0], typ: key[1], live: n})
+		}
+		sort.Slice(origins, func(i, j int) bool {
+			if origins[i].live != origins[j].live {
+				return origins[i].live > origins[j].live
+			}
+			if origins[i].origin != origins[j].origin {
+				return origins[i].origin < origins[j].origin
+			}
+			return origins[i].typ < origins[j].typ
+		})
+		fmt.Fprintf(&b, "live handles by origin:\n")
+		for _, o := range origins {
+			fmt.Fprintf(&b, "  %-40s %-32s %10d\n", o.origin, o.typ, o.live)
+		}
+	}
+	return b.String()
+}
@@ -1,47 +1,259 @@
 package main
 
-import "sync"
+import (
+	"sync"
+	"sync/atomic"
+	"time"
+)
 
+// Handle layout (64-bit targets only, per docs/design.md):
+//
+//	bits 63..32  generation (never 0, so no live handle is ever 0)
+//	bits 31..4   slot index within the shard
+//	bits  3..0   shard
+//
+// A handle stays valid only while its slot holds an entry of the same
+// generation; freed and reused slots bump the generation, so stale handles
+// are rejected by get/take instead of aliasing a newer object.
+const (
+	handleShardBits  = 4
+	handleShardCount = 1 << handleShardBits
+	handleShardMask  = handleShardCount - 1
+
+	handleIndexBits = 32
+	handleIndexMask = 1<<handleIndexBits - 1
+	handleSlotLimit = 1 << (handleIndexBits - handleShardBits)
+
+	handleChunkBits = 9
+	handleChunkSize = 1 << handleChunkBits
+	handleChunkMask = handleChunkSize - 1
+)
+
+type handleEntry struct {
+	gen   uint32
+	value any
+}
+
+type handleSlot struct {
+	entry atomic.Pointer[handleEntry]
+	gen   uint32 // last generation issued; guarded by the owning shard's mu
+}
+
+type handleChunk [handleChunkSize]handleSlot
+
+// handleShard owns a dense slab of slots. Chunks are never moved once
+// allocated; growth only republishes the chunk directory, so readers can
+// index into it without holding mu.
+type handleShard struct {
+	mu         sync.Mutex
+	chunks     atomic.Pointer[[]*handleChunk]
+	free       []uint32
+	used       uint32
+	registered uint64
+	taken      uint64
+	_          [64]byte
+}
+
+// handleRegistry maps opaque C handles to Go values.
+//
+// get is lock-free: a shard mask, a bounds check on the chunk directory, one
+// atomic load and a generation compare. register and take lock only the
+// shard that owns the slot; new handles are spread round-robin across shards.
+//
+// Register/take totals are always counted per shard. Per-type counts and
+// creation sites are only maintained while tracking is enabled; see
+// handle_stats.go.
 type handleRegistry struct {
-	mu     sync.Mutex
-	next   uintptr
-	values map[uintptr]any
+	nextShard atomic.Uint32
+	shards    [handleShardCount]handleShard
+	created   time.Time
+	trackMode atomic.Int32
+	tracker   handleTracker
 }
 
 func newHandleRegistry() *handleRegistry {
-	return &handleRegistry{
-		next:   1,
-		values: make(map[uintptr]any),
+	r := &handleRegistry{created: time.Now()}
+	for i := range r.shards {
+		r.shards[i].chunks.Store(&[]*handleChunk{})
 	}
+	return r
+}
+
+func handleGeneration(handle uintptr) uint32 {
+	return uint32(uint64(handle) >> handleIndexBits)
+}
+
+func (s *handleShard) slot(index uint32) *handleSlot {
+	chunks := *s.chunks.Load()
+	c := index >> handleChunkBits
+	if c >= uint32(len(chunks)) {
+		return nil
+	}
+	return &chunks[c][index&handleChunkMask]
+}
+
+func (r *handleRegistry) lookup(handle uintptr) (*handleShard, uint32, *handleSlot) {
+	low := uint32(uint64(handle) & handleIndexMask)
+	s := &r.shards[low&handleShardMask]
+	index := low >> handleShardBits
+	return s, index, s.slot(index)
+}
+
+// allocSlot returns a free slot index, growing the slab if needed.
+// Caller must hold s.mu.
+func (s *handleShard) allocSlot() uint32 {
+	if n := len(s.free); n > 0 {
+		index := s.free[n-1]
+		s.free = s.free[:n-1]
+		return index
+	}
+	if s.used >= handleSlotLimit {
+		panic("handleRegistry.register: handle space exhausted")
+	}
+	index := s.used
+	s.used++
+	chunks := *s.chunks.Load()
+	if index>>handleChunkBits >= uint32(len(chunks)) {
+		grown := make([]*handleChunk, len(chunks), len(chunks)+1)
+		copy(grown, chunks)
+		grown = append(grown, new(handleChunk))
+		s.chunks.Store(&grown)
+	}
+	return index
 }
 
 func (r *handleRegistry) register(value any) uintptr {
-	r.mu.Lock()
-	defer r.mu.Unlock()
+	handle := r.registerFrom(value, 1)
+	if fatstdArenasActive.Load() != 0 {
+		fatstdArenaRecord(handle)
+	}
+	return handle
+}
 
-	handle := r.next
-	r.next++
-	r.values[handle] = value
+// registerUnscoped registers value without recording it in the calling
+// thread's arena. It is for handles whose lifetime belongs to another object
+// (such as strings owned by an interner) rather than to the caller.
+func (r *handleRegistry) registerUnscoped(value any) uintptr {
+	return r.registerFrom(value, 1)
+}
+
+// registerFrom does the work of register and registerUnscoped. skip is the
+// number of registry frames between registerFrom and the caller the origin
+// should be attributed to (1 for the register wrappers).
+func (r *handleRegistry) registerFrom(value any, skip int) uintptr {
+	var origin string
+	if handleTrackMode(r.trackMode.Load()) == handleTrackOrigins {
+		origin = handleOrigin(skip)
+	}
+
+	shardIndex := r.nextShard.Add(1) & handleShardMask
+	s := &r.shards[shardIndex]
+
+	s.mu.Lock()
+	index := s.allocSlot()
+	slot := s.slot(index)
+	slot.gen++
+	if slot.gen == 0 {
+		slot.gen = 1
+	}
+	gen := slot.gen
+	slot.entry.Store(&handleEntry{gen: gen, value: value})
+	s.registered++
+	handle := uintptr(uint64(gen)<<handleIndexBits | uint64(index)<<handleShardBits | uint64(shardIndex))
+	if r.trackMode.Load() != int32(handleTrackOff) {
+		r.tracker.registered(handle, value, origin)
+	}
+	s.mu.Unlock()
 	return handle
 }
 
 func (r *handleRegistry) take(handle uintptr) (any, bool) {
-	r.mu.Lock()
-	defer r.mu.Unlock()
+	s, index, slot := r.lookup(handle)
+	if slot == nil {
+		return nil, false
+	}
+
+	s.mu.Lock()
+	defer s.mu.Unlock()
 
-	value, ok := r.values[handle]
-	if !ok {
+	e := slot.entry.Load()
+	if e == nil || e.gen != handleGeneration(handle) {
 		return nil, false
 	}
-	delete(r.values, handle)
-	return value, true
+	slot.entry.Store(nil)
+	s.free = append(s.free, index)
+	s.taken++
+	if r.trackMode.Load() != int32(handleTrackOff) {
+		r.tracker.taken(handle, e.value)
+	}
+	return e.value, true
 }
 
-func (r *handleRegistry) get(handle uintptr) (any, bool) {
-	r.mu.Lock()
-	defer r.mu.Unlock()
+// handleBatchStatus reports why takeAll rejected a handle.
+type handleBatchStatus int
+
+const (
+	handleBatchOK handleBatchStatus = iota
+	handleBatchInvalid
+	handleBatchRejected
+)
 
-	value, ok := r.values[handle]
-	return value, ok
+// takeAll removes every handle in handles while holding each touched shard's
+// lock exactly once. All handles are validated (live, and accepted by
+// accept) before any is removed; on failure the position of the offending
+// handle is returned. A handle repeated within the batch is only detected
+// during removal and is reported as invalid at its second occurrence.
+func (r *handleRegistry) takeAll(handles []uintptr, accept func(any) bool) (int, handleBatchStatus) {
+	var touched uint32
+	for _, h := range handles {
+		touched |= 1 << (uint32(uint64(h)) & handleShardMask)
+	}
+	for i := range r.shards {
+		if touched&(1<<i) != 0 {
+			r.shards[i].mu.Lock()
+			defer r.shards[i].mu.Unlock()
+		}
+	}
+
+	for i, h := range handles {
+		_, _, slot := r.lookup(h)
+		if slot == nil {
+			return i, handleBatchInvalid
+		}
+		e := slot.entry.Load()
+		if e == nil || e.gen != handleGeneration(h) {
+			return i, handleBatchInvalid
+		}
+		if !accept(e.value) {
+			return i, handleBatchRejected
+		}
+	}
+
+	for i, h := range handles {
+		s, index, slot := r.lookup(h)
+		e := slot.entry.Load()
+		if e == nil || e.gen != handleGeneration(h) {
+			// Duplicate handle: the earlier occurrence has already been removed.
+			return i, handleBatchInvalid
+		}
+		slot.entry.Store(nil)
+		s.free = append(s.free, index)
+		s.taken++
+		if r.trackMode.Load() != int32(handleTrackOff) {
+			r.tracker.taken(h, e.value)
+		}
+	}
+	return len(handles), handleBatchOK
 }
 
+func (r *handleRegistry) get(handle uintptr) (any, bool) {
+	_, _, slot := r.lookup(handle)
+	if slot == nil {
+		return nil, false
+	}
+	e := slot.entry.Load()
+	if e == nil || e.gen != handleGeneration(handle) {
+		return nil, false
+	}
+	return e.value, true
+}
@@ -0,0 +1,321 @@
+package main
+
+import (
+	"fmt"
+	"reflect"
+	"strings"
+	"sync"
+	"testing"
+)
+
+type handleStore interface {
+	register(value any) uintptr
+	take(handle uintptr) (any, bool)
+	get(handle uintptr) (any, bool)
+}
+
+// mutexHandleRegistry is the original single-mutex registry, kept as the
+// benchmark baseline.
+type mutexHandleRegistry struct {
+	mu     sync.Mutex
+	next   uintptr
+	values map[uintptr]any
+}
+
+func newMutexHandleRegistry() *mutexHandleRegistry {
+	return &mutexHandleRegistry{next: 1, values: make(map[uintptr]any)}
+}
+
+func (r *mutexHandleRegistry) register(value any) uintptr {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	handle := r.next
+	r.next++
+	r.values[handle] = value
+	return handle
+}
+
+func (r *mutexHandleRegistry) take(handle uintptr) (any, bool) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	value, ok := r.values[handle]
+	if !ok {
+		return nil, false
+	}
+	delete(r.values, handle)
+	return value, true
+}
+
+func (r *mutexHandleRegistry) get(handle uintptr) (any, bool) {
+	r.mu.Lock()
+	defer r.mu.Unlock()
+	value, ok := r.values[handle]
+	return value, ok
+}
+
+var handleBenchStores = []struct {
+	name string
+	new  func() handleStore
+}{
+	{"mutex", func() handleStore { return newMutexHandleRegistry() }},
+	{"registry", func() handleStore { return newHandleRegistry() }},
+}
+
+var handleBenchThreads = []int{1, 8, 32}
+
+// runThreads splits b.N iterations across exactly `threads` goroutines.
+func runThreads(b *testing.B, threads int, fn func(worker, i int)) {
+	var wg sync.WaitGroup
+	per := b.N / threads
+	if per == 0 {
+		per = 1
+	}
+	b.ResetTimer()
+	for w := 0; w < threads; w++ {
+		wg.Add(1)
+		go func(worker int) {
+			defer wg.Done()
+			for i := 0; i < per; i++ {
+				fn(worker, i)
+			}
+		}(w)
+	}
+	wg.Wait()
+}
+
+func TestHandleRegistryConcurrent(t *testing.T) {
+	r := newHandleRegistry()
+	var wg sync.WaitGroup
+	for w := 0; w < 8; w++ {
+		wg.Add(1)
+		go func(worker int) {
+			defer wg.Done()
+			for i := 0; i < 1000; i++ {
+				h := r.register(worker*1000 + i)
+				if h == 0 {
+					t.Error("register returned handle 0")
+					return
+				}
+				v, ok := r.get(h)
+				if !ok || v.(int) != worker*1000+i {
+					t.Errorf("get(%d) = %v, %v", h, v, ok)
+					return
+				}
+				if _, ok := r.take(h); !ok {
+					t.Errorf("take(%d) failed", h)
+					return
+				}
+				if _, ok := r.get(h); ok {
+					t.Errorf("get(%d) succeeded after take", h)
+					return
+				}
+			}
+		}(w)
+	}
+	wg.Wait()
+}
+
+func TestHandleRegistryRejectsStaleHandles(t *testing.T) {
+	r := newHandleRegistry()
+	for _, h := range []uintptr{0, 1, 1 << 40, ^uintptr(0)} {
+		if _, ok := r.get(h); ok {
+			t.Fatalf("get(%#x) succeeded on empty registry", h)
+		}
+	}
+
+	stale := make([]uintptr, handleShardCount)
+	for i := range stale {
+		stale[i] = r.register(i)
+	}
+	for _, h := range stale {
+		if _, ok := r.take(h); !ok {
+			t.Fatalf("take(%#x) failed", h)
+		}
+	}
+	for i := range stale {
+		fresh := r.register(i)
+		if fresh == stale[i] {
+			t.Fatalf("slot reuse produced identical handle %#x", fresh)
+		}
+	}
+	for _, h := range stale {
+		if _, ok := r.get(h); ok {
+			t.Fatalf("stale handle %#x resolved after slot reuse", h)
+		}
+		if _, ok := r.take(h); ok {
+			t.Fatalf("stale handle %#x freed after slot reuse", h)
+		}
+	}
+}
+
+func TestHandleRegistryGrowsAcrossChunks(t *testing.T) {
+	r := newHandleRegistry()
+	n := handleShardCount*handleChunkSize*2 + 3
+	handles := make([]uintptr, n)
+	for i := range handles {
+		handles[i] = r.register(i)
+	}
+	for i, h := range handles {
+		v, ok := r.get(h)
+		if !ok || v.(int) != i {
+			t.Fatalf("get(%#x) = %v, %v; want %d", h, v, ok, i)
+		}
+	}
+}
+
+func TestHandleRegistryTakeAll(t *testing.T) {
+	r := newHandleRegistry()
+	handles := make([]uintptr, 100)
+	for i := range handles {
+		handles[i] = r.register(i)
+	}
+
+	pos, status := r.takeAll(handles, func(v any) bool { return v.(int) != 42 })
+	if status != handleBatchRejected || pos != 42 {
+		t.Fatalf("takeAll = %d, %v; want 42, rejected", pos, status)
+	}
+	for _, h := range handles {
+		if _, ok := r.get(h); !ok {
+			t.Fatalf("handle %#x removed by a rejected batch", h)
+		}
+	}
+
+	if _, status := r.takeAll(handles, func(any) bool { return true }); status != handleBatchOK {
+		t.Fatalf("takeAll status = %v; want ok", status)
+	}
+	for _, h := range handles {
+		if _, ok := r.get(h); ok {
+			t.Fatalf("handle %#x still live after takeAll", h)
+		}
+	}
+	if pos, status := r.takeAll(handles[:1], func(any) bool { return true }); status != handleBatchInvalid || pos != 0 {
+		t.Fatalf("second takeAll = %d, %v; want 0, invalid", pos, status)
+	}
+}
+
+func TestHandleRegistryTracking(t *testing.T) {
+	r := newHandleRegistry()
+	before := []uintptr{r.register(1), r.register("a")}
+
+	r.setTracking(handleTrackOrigins)
+	handles := make([]uintptr, 10)
+	for i := range handles {
+		handles[i] = r.register(i)
+	}
+	r.take(before[1])
+	r.takeAll(handles[:5], func(any) bool { return true })
+
+	totals := r.totals()
+	if totals.live != 6 || totals.registered != 12 || totals.taken != 6 || totals.high != 12 {
+		t.Fatalf("totals = %+v", totals)
+	}
+	ints := r.tracker.types[reflect.TypeOf(0)]
+	if ints.live != 6 || ints.high != 11 || ints.registered != 10 || ints.taken != 5 {
+		t.Fatalf("int stats = %+v", *ints)
+	}
+	if got := r.tracker.origins[before[0]]; got != handleOriginUnknown {
+		t.Fatalf("origin of pre-tracking handle = %q", got)
+	}
+	if got := r.tracker.origins[handles[9]]; !strings.HasSuffix(got, "TestHandleRegistryTracking") {
+		t.Fatalf("origin = %q", got)
+	}
+	if report := r.report(); !strings.Contains(report, "tracking=origins") {
+		t.Fatalf("report missing mode:\n%s", report)
+	}
+	unscoped := r.registerUnscoped("u")
+	if got := r.tracker.origins[unscoped]; !strings.HasSuffix(got, "TestHandleRegistryTracking") {
+		t.Fatalf("unscoped origin = %q", got)
+	}
+	r.take(unscoped)
+
+	r.setTracking(handleTrackOff)
+	if totals := r.totals(); totals.high != 0 || totals.live != 6 {
+		t.Fatalf("totals after disabling = %+v", totals)
+	}
+}
+
+func BenchmarkHandleRegistryGet(b *testing.B) {
+	for _, store := range handleBenchStores {
+		for _, threads := range handleBenchThreads {
+			b.Run(fmt.Sprintf("%s/threads=%d", store.name, threads), func(b *testing.B) {
+				r := store.new()
+				handles := make([]uintptr, 1024)
+				for i := range handles {
+					handles[i] = r.register(i)
+				}
+				runThreads(b, threads, func(worker, i int) {
+					if _, ok := r.get(handles[(worker*31+i)&1023]); !ok {
+						b.Error("get failed")
+					}
+				})
+			})
+		}
+	}
+}
+
+func BenchmarkHandleRegistryRegisterTake(b *testing.B) {
+	for _, store := range handleBenchStores {
+		for _, threads := range handleBenchThreads {
+			b.Run(fmt.Sprintf("%s/threads=%d", store.name, threads), func(b *testing.B) {
+				r := store.new()
+				runThreads(b, threads, func(worker, i int) {
+					h := r.register(i)
+					if _, ok := r.take(h); !ok {
+						b.Error("take failed")
+					}
+				})
+			})
+		}
+	}
+}
+
+// BenchmarkHandleRegistryMixed models a typical export call mix: many
+// lookups (Len/CopyOut/Contains) per short-lived handle.
+func BenchmarkHandleRegistryMixed(b *testing.B) {
+	for _, store := range handleBenchStores {
+		for _, threads := range handleBenchThreads {
+			b.Run(fmt.Sprintf("%s/threads=%d", store.name, threads), func(b *testing.B) {
+				r := store.new()
+				shared := make([]uintptr, 256)
+				for i := range shared {
+					shared[i] = r.register(i)
+				}
+				runThreads(b, threads, func(worker, i int) {
+					if i%8 == 0 {
+						h := r.register(i)
+						r.get(h)
+						r.take(h)
+						return
+					}
+					r.get(shared[(worker*17+i)&255])
+				})
+			})
+		}
+	}
+}
+
+func BenchmarkHandleRegistryFree(b *testing.B) {
+	const batch = 1024
+	accept := func(any) bool { return true }
+	for _, mode := range []string{"take", "takeAll"} {
+		b.Run(mode, func(b *testing.B) {
+			r := newHandleRegistry()
+			handles := make([]uintptr, batch)
+			b.ResetTimer()
+			for n := 0; n < b.N; n += batch {
+				b.StopTimer()
+				for i := range handles {
+					handles[i] = r.register(i)
+				}
+				b.StartTimer()
+				if mode == "take" {
+					for _, h := range handles {
+						r.take(h)
+					}
+				} else {
+					r.takeAll(handles, accept)
+				}
+			}
+		})
+	}
+}
@@ -12,8 +12,10 @@ import (
 	"encoding/json"
 	"errors"
 	"io"
+	"math"
 	"sort"
 	"strconv"
+	"unsafe"
 )
 
 const (
@@ -330,7 +332,7 @@ func fatstd_go_json_array_len(handle C.uintptr_t) C.size_t {
 func fatstd_go_json_array_get(handle C.uintptr_t, idx C.size_t) C.uintptr_t {
 	v := fatstdJsonValueFromHandle(uintptr(handle))
 	a := fatstdJsonArray(v.v)
-	if idx > C.size_t(2147483647) {
+	if idx > C.size_t(math.MaxInt) {
 		panic("fatstd_go_json_array_get: idx too large")
 	}
 	i := int(idx)
@@ -361,6 +363,37 @@ func fatstd_go_json_object_keys(handle C.uintptr_t) C.uintptr_t {
 	return C.uintptr_t(fatstdStringArrayNew(keys))
 }
 
+//export fatstd_go_json_object_len
+func fatstd_go_json_object_len(handle C.uintptr_t) C.size_t {
+	v := fatstdJsonValueFromHandle(uintptr(handle))
+	return C.size_t(len(fatstdJsonObject(v.v)))
+}
+
+//export fatstd_go_json_object_keys_interned
+func fatstd_go_json_object_keys_interned(handle C.uintptr_t, internerHandle C.uintptr_t, outKeys *C.uintptr_t, keysLen C.size_t) {
+	v := fatstdJsonValueFromHandle(uintptr(handle))
+	in := fatstdStringInternerFromHandle(uintptr(internerHandle))
+	m := fatstdJsonObject(v.v)
+	if keysLen < C.size_t(len(m)) {
+		panic("fatstd_go_json_object_keys_interned: keysLen is smaller than the object length")
+	}
+	if len(m) == 0 {
+		return
+	}
+	if outKeys == nil {
+		panic("fatstd_go_json_object_keys_interned: outKeys is NULL")
+	}
+	keys := make([]string, 0, len(m))
+	for k := range m {
+		keys = append(keys, k)
+	}
+	sort.Strings(keys)
+	dst := unsafe.Slice(outKeys, len(keys))
+	for i, k := range keys {
+		dst[i] = C.uintptr_t(in.internString(k))
+	}
+}
+
 //export fatstd_go_json_object_get
 func fatstd_go_json_object_get(handle C.uintptr_t, keyHandle C.uintptr_t, outFound *C.bool, outValue *C.uintptr_t) {
 	if outFound == nil {
@@ -467,7 +500,7 @@ func fatstd_go_json_decoder_decode_value(handle C.uintptr_t, outValue *C.uintptr
 //export fatstd_go_json_encoder_new_to_bytes_buffer
 func fatstd_go_json_encoder_new_to_bytes_buffer(dstBufferHandle C.uintptr_t) C.uintptr_t {
 	dst := fatstdBytesBufferFromHandle(uintptr(dstBufferHandle))
-	enc := json.NewEncoder(dst.Underlying())
+	enc := json.NewEncoder(dst.Writer())
 	return C.uintptr_t(fatstdHandles.register(&fatJsonEncoder{enc: enc}))
 }
 
@@ -0,0 +1,145 @@
+package main
+
+/*
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+*/
+import "C"
+
+import (
+	"math"
+	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
+	"github.com/bluesentinelsec/FatStd/pkg/fatstrings"
+)
+
+const fatMatcherErrCodeEmptyPattern = 140
+
+func fatstdMatcherFromHandle(handle uintptr) *fatstrings.Matcher {
+	if handle == 0 {
+		panic("fatstdMatcherFromHandle: handle is 0")
+	}
+	value, ok := fatstdHandles.get(handle)
+	if !ok {
+		panic("fatstdMatcherFromHandle: invalid handle")
+	}
+	m, ok := value.(*fatstrings.Matcher)
+	if !ok {
+		panic("fatstdMatcherFromHandle: handle is not a fat matcher")
+	}
+	return m
+}
+
+// fatstdMatcherCollect returns a Scan callback that writes up to cap matches
+// into the caller's arrays and keeps counting past the end, so callers can
+// size a retry from the return value.
+func fatstdMatcherCollect(name string, outPatterns *C.size_t, outOffsets *C.size_t, capacity C.size_t, total *int) func(int, int) bool {
+	if capacity > 0 && (outPatterns == nil || outOffsets == nil) {
+		panic(name + ": outPatterns/outOffsets is NULL but cap > 0")
+	}
+	if capacity > C.size_t(math.MaxInt) {
+		panic(name + ": cap too large")
+	}
+	var patterns, offsets []C.size_t
+	if capacity > 0 {
+		patterns = unsafe.Slice(outPatterns, int(capacity))
+		offsets = unsafe.Slice(outOffsets, int(capacity))
+	}
+	return func(pattern, start int) bool {
+		if *total < len(patterns) {
+			patterns[*total] = C.size_t(pattern)
+			offsets[*total] = C.size_t(start)
+		}
+		*total++
+		return true
+	}
+}
+
+//export fatstd_go_matcher_new
+func fatstd_go_matcher_new(patternsHandle C.uintptr_t, outMatcher *C.uintptr_t, outErr *C.uintptr_t) C.int {
+	if outMatcher == nil {
+		panic("fatstd_go_matcher_new: outMatcher is NULL")
+	}
+	if outErr == nil {
+		panic("fatstd_go_matcher_new: outErr is NULL")
+	}
+	patterns := fatstdStringArrayFromHandle(uintptr(patternsHandle))
+
+	m, err := fatstrings.NewMatcher(patterns.Values())
+	if err != nil {
+		*outMatcher = 0
+		*outErr = C.uintptr_t(fatstdNewError(fatMatcherErrCodeEmptyPattern, err.Error()))
+		return fatStatusSyntax
+	}
+	*outMatcher = C.uintptr_t(fatstdHandles.register(m))
+	*outErr = 0
+	return fatStatusOK
+}
+
+//export fatstd_go_matcher_pattern_count
+func fatstd_go_matcher_pattern_count(handle C.uintptr_t) C.size_t {
+	m := fatstdMatcherFromHandle(uintptr(handle))
+	return C.size_t(m.PatternCount())
+}
+
+//export fatstd_go_matcher_contains_bytes
+func fatstd_go_matcher_contains_bytes(handle C.uintptr_t, bytesHandle C.uintptr_t) C.bool {
+	m := fatstdMatcherFromHandle(uintptr(handle))
+	b := fatstdBytesFromHandle(uintptr(bytesHandle))
+	return C.bool(fatbytes.MatcherContains(m, b.Value()))
+}
+
+//export fatstd_go_matcher_contains_string
+func fatstd_go_matcher_contains_string(handle C.uintptr_t, stringHandle C.uintptr_t) C.bool {
+	m := fatstdMatcherFromHandle(uintptr(handle))
+	s := fatstdStringFromHandle(uintptr(stringHandle))
+	return C.bool(m.Contains(s.Value()))
+}
+
+//export fatstd_go_matcher_count_bytes
+func fatstd_go_matcher_count_bytes(handle C.uintptr_t, bytesHandle C.uintptr_t) C.size_t {
+	m := fatstdMatcherFromHandle(uintptr(handle))
+	b := fatstdBytesFromHandle(uintptr(bytesHandle))
+	return C.size_t(fatbytes.MatcherCount(m, b.Value()))
+}
+
+//export fatstd_go_matcher_count_string
+func fatstd_go_matcher_count_string(handle C.uintptr_t, stringHandle C.uintptr_t) C.size_t {
+	m := fatstdMatcherFromHandle(uintptr(handle))
+	s := fatstdStringFromHandle(uintptr(stringHandle))
+	return C.size_t(m.Count(s.Value()))
+}
+
+//export fatstd_go_matcher_find_all_bytes
+func fatstd_go_matcher_find_all_bytes(handle C.uintptr_t, bytesHandle C.uintptr_t, outPatterns *C.size_t, outOffsets *C.size_t, capacity C.size_t) C.size_t {
+	m := fatstdMatcherFromHandle(uintptr(handle))
+	b := fatstdBytesFromHandle(uintptr(bytesHandle))
+	total := 0
+	m.ScanBytes(b.Value(), fatstdMatcherCollect("fatstd_go_matcher_find_all_bytes", outPatterns, outOffsets, capacity, &total))
+	return C.size_t(total)
+}
+
+//export fatstd_go_matcher_find_all_string
+func fatstd_go_matcher_find_all_string(handle C.uintptr_t, stringHandle C.uintptr_t, outPatterns *C.size_t, outOffsets *C.size_t, capacity C.size_t) C.size_t {
+	m := fatstdMatcherFromHandle(uintptr(handle))
+	s := fatstdStringFromHandle(uintptr(stringHandle))
+	total := 0
+	m.Scan(s.Value(), fatstdMatcherCollect("fatstd_go_matcher_find_all_string", outPatterns, outOffsets, capacity, &total))
+	return C.size_t(total)
+}
+
+//export fatstd_go_matcher_free
+func fatstd_go_matcher_free(handle C.uintptr_t) {
+	if handle == 0 {
+		panic("fatstd_go_matcher_free: handle is 0")
+	}
+	value, ok := fatstdHandles.take(uintptr(handle))
+	if !ok {
+		panic("fatstd_go_matcher_free: invalid handle")
+	}
+	if _, ok := value.(*fatstrings.Matcher); !ok {
+		panic("fatstd_go_matcher_free: handle is not a fat matcher")
+	}
+}
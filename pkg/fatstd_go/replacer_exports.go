@@ -0,0 +1,81 @@
+package main
+
+/*
+#include <stddef.h>
+#include <stdint.h>
+*/
+import "C"
+
+import (
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
+	"github.com/bluesentinelsec/FatStd/pkg/fatstrings"
+)
+
+func fatstdReplacerFromHandle(handle uintptr) *fatstrings.Replacer {
+	if handle == 0 {
+		panic("fatstdReplacerFromHandle: handle is 0")
+	}
+	value, ok := fatstdHandles.get(handle)
+	if !ok {
+		panic("fatstdReplacerFromHandle: invalid handle")
+	}
+	r, ok := value.(*fatstrings.Replacer)
+	if !ok {
+		panic("fatstdReplacerFromHandle: handle is not a fat replacer")
+	}
+	return r
+}
+
+//export fatstd_go_replacer_new
+func fatstd_go_replacer_new(oldnewHandle C.uintptr_t) C.uintptr_t {
+	oldnew := fatstdStringArrayFromHandle(uintptr(oldnewHandle))
+	if oldnew.Len()%2 == 1 {
+		panic("fatstd_go_replacer_new: oldnew must hold an even number of strings")
+	}
+	return C.uintptr_t(fatstdHandles.register(fatstrings.NewReplacer(oldnew.Values())))
+}
+
+//export fatstd_go_replacer_free
+func fatstd_go_replacer_free(handle C.uintptr_t) {
+	if handle == 0 {
+		panic("fatstd_go_replacer_free: handle is 0")
+	}
+	value, ok := fatstdHandles.take(uintptr(handle))
+	if !ok {
+		panic("fatstd_go_replacer_free: invalid handle")
+	}
+	if _, ok := value.(*fatstrings.Replacer); !ok {
+		panic("fatstd_go_replacer_free: handle is not a fat replacer")
+	}
+}
+
+//export fatstd_go_replacer_replace
+func fatstd_go_replacer_replace(replacerHandle C.uintptr_t, sHandle C.uintptr_t) C.uintptr_t {
+	r := fatstdReplacerFromHandle(uintptr(replacerHandle))
+	s := fatstdStringFromHandle(uintptr(sHandle))
+	return C.uintptr_t(fatstdStringNewFromGoString(r.Replace(s.Value())))
+}
+
+//export fatstd_go_replacer_replace_bytes
+func fatstd_go_replacer_replace_bytes(replacerHandle C.uintptr_t, bHandle C.uintptr_t) C.uintptr_t {
+	r := fatstdReplacerFromHandle(uintptr(replacerHandle))
+	b := fatstdBytesFromHandle(uintptr(bHandle))
+	return C.uintptr_t(fatstdBytesNewFromGoBytes(fatbytes.ReplacerReplace(r, b.Value())))
+}
+
+//export fatstd_go_replacer_write_string
+func fatstd_go_replacer_write_string(replacerHandle C.uintptr_t, dstHandle C.uintptr_t, sHandle C.uintptr_t) C.size_t {
+	r := fatstdReplacerFromHandle(uintptr(replacerHandle))
+	dst := fatstdBytesBufferFromHandle(uintptr(dstHandle))
+	s := fatstdStringFromHandle(uintptr(sHandle))
+	n, _ := r.WriteString(dst.Writer(), s.Value())
+	return C.size_t(n)
+}
+
+//export fatstd_go_replacer_write_bytes
+func fatstd_go_replacer_write_bytes(replacerHandle C.uintptr_t, dstHandle C.uintptr_t, bHandle C.uintptr_t) C.size_t {
+	r := fatstdReplacerFromHandle(uintptr(replacerHandle))
+	dst := fatstdBytesBufferFromHandle(uintptr(dstHandle))
+	b := fatstdBytesFromHandle(uintptr(bHandle))
+	return C.size_t(fatbytes.ReplacerWrite(r, dst, b.Value()))
+}
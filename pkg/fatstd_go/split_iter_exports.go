@@ -0,0 +1,143 @@
+package main
+
+/*
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+*/
+import "C"
+
+import (
+	"bytes"
+	"math"
+	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
+	"github.com/bluesentinelsec/FatStd/pkg/fatstrings"
+)
+
+// fatSplitIter keeps the source alive by reference, so the handle it was
+// created from may be freed while iterating. Bytes over external memory are
+// retained until the iterator is freed.
+type fatSplitIter struct {
+	next func() (start, length int, ok bool)
+	src  *fatbytes.Bytes
+}
+
+func fatstdSplitIterFromHandle(handle uintptr) *fatSplitIter {
+	if handle == 0 {
+		panic("fatstdSplitIterFromHandle: handle is 0")
+	}
+	value, ok := fatstdHandles.get(handle)
+	if !ok {
+		panic("fatstdSplitIterFromHandle: invalid handle")
+	}
+	it, ok := value.(*fatSplitIter)
+	if !ok {
+		panic("fatstdSplitIterFromHandle: handle is not a fat split iterator")
+	}
+	return it
+}
+
+func fatstdSplitIterNewBytes(b *fatbytes.Bytes, sp *fatstrings.Splitter[[]byte]) C.uintptr_t {
+	it := &fatSplitIter{next: sp.Next}
+	if b.IsExternal() {
+		b.Retain()
+		it.src = b
+	}
+	return C.uintptr_t(fatstdHandles.register(it))
+}
+
+//export fatstd_go_string_split_iter_new
+func fatstd_go_string_split_iter_new(sHandle C.uintptr_t, sepHandle C.uintptr_t, n C.int) C.uintptr_t {
+	s := fatstdStringFromHandle(uintptr(sHandle))
+	sep := fatstdStringFromHandle(uintptr(sepHandle))
+	sp := fatstrings.NewSplitter(s.Value(), sep.Value(), int(n))
+	return C.uintptr_t(fatstdHandles.register(&fatSplitIter{next: sp.Next}))
+}
+
+//export fatstd_go_string_fields_iter_new
+func fatstd_go_string_fields_iter_new(sHandle C.uintptr_t) C.uintptr_t {
+	s := fatstdStringFromHandle(uintptr(sHandle))
+	sp := fatstrings.NewFieldsSplitter(s.Value())
+	return C.uintptr_t(fatstdHandles.register(&fatSplitIter{next: sp.Next}))
+}
+
+//export fatstd_go_bytes_split_iter_new
+func fatstd_go_bytes_split_iter_new(bHandle C.uintptr_t, sepHandle C.uintptr_t, n C.int) C.uintptr_t {
+	b := fatstdBytesFromHandle(uintptr(bHandle))
+	sep := fatstdBytesFromHandle(uintptr(sepHandle))
+	// The separator is copied so that only the source needs to be retained.
+	return fatstdSplitIterNewBytes(b, fatstrings.NewSplitter(b.Value(), bytes.Clone(sep.Value()), int(n)))
+}
+
+//export fatstd_go_bytes_fields_iter_new
+func fatstd_go_bytes_fields_iter_new(bHandle C.uintptr_t) C.uintptr_t {
+	b := fatstdBytesFromHandle(uintptr(bHandle))
+	return fatstdSplitIterNewBytes(b, fatstrings.NewFieldsSplitter(b.Value()))
+}
+
+//export fatstd_go_split_iter_next
+func fatstd_go_split_iter_next(handle C.uintptr_t, outOffset *C.size_t, outLen *C.size_t) C.bool {
+	if outOffset == nil {
+		panic("fatstd_go_split_iter_next: outOffset is NULL")
+	}
+	if outLen == nil {
+		panic("fatstd_go_split_iter_next: outLen is NULL")
+	}
+	it := fatstdSplitIterFromHandle(uintptr(handle))
+	start, length, ok := it.next()
+	if !ok {
+		*outOffset = 0
+		*outLen = 0
+		return false
+	}
+	*outOffset = C.size_t(start)
+	*outLen = C.size_t(length)
+	return true
+}
+
+//export fatstd_go_split_iter_next_batch
+func fatstd_go_split_iter_next_batch(handle C.uintptr_t, outOffsets *C.size_t, outLens *C.size_t, capacity C.size_t) C.size_t {
+	if capacity > 0 && (outOffsets == nil || outLens == nil) {
+		panic("fatstd_go_split_iter_next_batch: outOffsets/outLens is NULL but cap > 0")
+	}
+	if capacity > C.size_t(math.MaxInt) {
+		panic("fatstd_go_split_iter_next_batch: cap too large")
+	}
+	it := fatstdSplitIterFromHandle(uintptr(handle))
+	if capacity == 0 {
+		return 0
+	}
+	offsets := unsafe.Slice(outOffsets, int(capacity))
+	lens := unsafe.Slice(outLens, int(capacity))
+	n := 0
+	for n < len(offsets) {
+		start, length, ok := it.next()
+		if !ok {
+			break
+		}
+		offsets[n] = C.size_t(start)
+		lens[n] = C.size_t(length)
+		n++
+	}
+	return C.size_t(n)
+}
+
+//export fatstd_go_split_iter_free
+func fatstd_go_split_iter_free(handle C.uintptr_t) {
+	if handle == 0 {
+		panic("fatstd_go_split_iter_free: handle is 0")
+	}
+	value, ok := fatstdHandles.take(uintptr(handle))
+	if !ok {
+		panic("fatstd_go_split_iter_free: invalid handle")
+	}
+	it, ok := value.(*fatSplitIter)
+	if !ok {
+		panic("fatstd_go_split_iter_free: handle is not a fat split iterator")
+	}
+	if it.src != nil {
+		it.src.Release()
+	}
+}
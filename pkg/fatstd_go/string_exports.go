@@ -8,6 +8,7 @@ import "C"
 
 import (
 	"io"
+	"math"
 	"unsafe"
 
 	"github.com/bluesentinelsec/FatStd/pkg/fatstrings"
@@ -19,6 +20,12 @@ func fatstdStringNewFromGoString(value string) uintptr {
 	return fatstdHandles.register(fatstrings.NewUTF8(value))
 }
 
+// fatstdStringSubstring registers a view of s[off:off+n] that shares s's
+// bytes.
+func fatstdStringSubstring(s *fatstrings.String, off, n int) uintptr {
+	return fatstdHandles.register(s.Substring(off, n))
+}
+
 func fatstdStringArrayNew(values []string) uintptr {
 	return fatstdHandles.register(fatstrings.NewStringArray(values))
 }
@@ -108,12 +115,11 @@ func fatstd_go_string_new_utf8_n(bytes *C.char, len C.size_t) C.uintptr_t {
 		}
 		panic("fatstd_go_string_new_utf8_n: bytes is NULL but len > 0")
 	}
-	if len > C.size_t(2147483647) {
+	if len > C.size_t(math.MaxInt) {
 		panic("fatstd_go_string_new_utf8_n: len too large")
 	}
 
-	buf := C.GoBytes(unsafe.Pointer(bytes), C.int(len))
-	handle := fatstdStringNewFromGoString(string(buf))
+	handle := fatstdStringNewFromGoString(string(unsafe.Slice((*byte)(unsafe.Pointer(bytes)), int(len))))
 	return C.uintptr_t(handle)
 }
 
@@ -131,20 +137,35 @@ func fatstd_go_string_copy_out(handle C.uintptr_t, dst *C.char, dstLen C.size_t)
 		}
 		panic("fatstd_go_string_copy_out: dst is NULL but dstLen > 0")
 	}
-	if dstLen > C.size_t(2147483647) {
+	if dstLen > C.size_t(math.MaxInt) {
 		panic("fatstd_go_string_copy_out: dstLen too large")
 	}
 
 	s := fatstdStringFromHandle(uintptr(handle))
-	src := []byte(s.Value())
-	n := len(src)
-	if n > int(dstLen) {
-		n = int(dstLen)
-	}
-	copy(unsafe.Slice((*byte)(unsafe.Pointer(dst)), int(dstLen))[:n], src[:n])
+	n := copy(unsafe.Slice((*byte)(unsafe.Pointer(dst)), int(dstLen)), s.Value())
 	return C.size_t(n)
 }
 
+//export fatstd_go_string_borrow
+func fatstd_go_string_borrow(handle C.uintptr_t, outLen *C.size_t, outBorrow *C.uintptr_t) unsafe.Pointer {
+	if outLen == nil {
+		panic("fatstd_go_string_borrow: outLen is NULL")
+	}
+	if outBorrow == nil {
+		panic("fatstd_go_string_borrow: outBorrow is NULL")
+	}
+
+	s := fatstdStringFromHandle(uintptr(handle))
+	value := s.Value()
+	var ptr unsafe.Pointer
+	if len(value) > 0 {
+		ptr = unsafe.Pointer(unsafe.StringData(value))
+	}
+	*outBorrow = C.uintptr_t(fatstdBorrowNew(ptr))
+	*outLen = C.size_t(len(value))
+	return ptr
+}
+
 //export fatstd_go_string_clone
 func fatstd_go_string_clone(handle C.uintptr_t) C.uintptr_t {
 	s := fatstdStringFromHandle(uintptr(handle))
@@ -152,6 +173,31 @@ func fatstd_go_string_clone(handle C.uintptr_t) C.uintptr_t {
 	return C.uintptr_t(fatstdStringNewFromGoString(cloned))
 }
 
+//export fatstd_go_string_slice
+func fatstd_go_string_slice(handle C.uintptr_t, off C.size_t, n C.size_t) C.uintptr_t {
+	s := fatstdStringFromHandle(uintptr(handle))
+	size := C.size_t(len(s.Value()))
+	if off > size || n > size-off {
+		panic("fatstd_go_string_slice: range out of bounds")
+	}
+	return C.uintptr_t(fatstdStringSubstring(s, int(off), int(n)))
+}
+
+//export fatstd_go_string_offset_in
+func fatstd_go_string_offset_in(handle C.uintptr_t, parentHandle C.uintptr_t, outOff *C.size_t) C.int {
+	if outOff == nil {
+		panic("fatstd_go_string_offset_in: outOff is NULL")
+	}
+	s := fatstdStringFromHandle(uintptr(handle))
+	parent := fatstdStringFromHandle(uintptr(parentHandle))
+	off, ok := s.OffsetIn(parent)
+	if !ok {
+		return 0
+	}
+	*outOff = C.size_t(off)
+	return 1
+}
+
 //export fatstd_go_string_contains
 func fatstd_go_string_contains(aHandle C.uintptr_t, bHandle C.uintptr_t) C.int {
 	a := fatstdStringFromHandle(uintptr(aHandle))
@@ -185,8 +231,8 @@ func fatstd_go_string_has_suffix(sHandle C.uintptr_t, suffixHandle C.uintptr_t)
 //export fatstd_go_string_trim_space
 func fatstd_go_string_trim_space(handle C.uintptr_t) C.uintptr_t {
 	s := fatstdStringFromHandle(uintptr(handle))
-	trimmed := fatstrings.TrimSpace(s.Value())
-	return C.uintptr_t(fatstdStringNewFromGoString(trimmed))
+	off, n := fatstrings.TrimSpaceRange(s.Value())
+	return C.uintptr_t(fatstdStringSubstring(s, off, n))
 }
 
 //export fatstd_go_string_trim
@@ -201,14 +247,14 @@ func fatstd_go_string_trim(sHandle C.uintptr_t, cutsetHandle C.uintptr_t) C.uint
 func fatstd_go_string_split(sHandle C.uintptr_t, sepHandle C.uintptr_t) C.uintptr_t {
 	s := fatstdStringFromHandle(uintptr(sHandle))
 	sep := fatstdStringFromHandle(uintptr(sepHandle))
-	return C.uintptr_t(fatstdStringArrayNew(fatstrings.Split(s.Value(), sep.Value())))
+	return C.uintptr_t(fatstdHandles.register(fatstrings.SplitArray(s.Value(), sep.Value())))
 }
 
 //export fatstd_go_string_split_n
 func fatstd_go_string_split_n(sHandle C.uintptr_t, sepHandle C.uintptr_t, n C.int) C.uintptr_t {
 	s := fatstdStringFromHandle(uintptr(sHandle))
 	sep := fatstdStringFromHandle(uintptr(sepHandle))
-	return C.uintptr_t(fatstdStringArrayNew(fatstrings.SplitN(s.Value(), sep.Value(), int(n))))
+	return C.uintptr_t(fatstdHandles.register(fatstrings.SplitNArray(s.Value(), sep.Value(), int(n))))
 }
 
 //export fatstd_go_string_array_len
@@ -220,18 +266,169 @@ func fatstd_go_string_array_len(arrayHandle C.uintptr_t) C.size_t {
 //export fatstd_go_string_array_get
 func fatstd_go_string_array_get(arrayHandle C.uintptr_t, index C.size_t) C.uintptr_t {
 	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
-	if index > C.size_t(2147483647) {
+	if index > C.size_t(math.MaxInt) {
 		panic("fatstd_go_string_array_get: index too large")
 	}
 	value := a.Get(int(index))
 	return C.uintptr_t(fatstdStringNewFromGoString(value))
 }
 
+//export fatstd_go_string_array_total_bytes
+func fatstd_go_string_array_total_bytes(arrayHandle C.uintptr_t) C.size_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	return C.size_t(len(a.Arena()))
+}
+
+// Go's int and C's size_t have the same width on every platform Go supports,
+// so the offsets table is handed to C as-is.
+
+//export fatstd_go_string_array_borrow
+func fatstd_go_string_array_borrow(arrayHandle C.uintptr_t, outOffsets **C.size_t, outCount *C.size_t, outBorrow *C.uintptr_t) unsafe.Pointer {
+	if outOffsets == nil {
+		panic("fatstd_go_string_array_borrow: outOffsets is NULL")
+	}
+	if outCount == nil {
+		panic("fatstd_go_string_array_borrow: outCount is NULL")
+	}
+	if outBorrow == nil {
+		panic("fatstd_go_string_array_borrow: outBorrow is NULL")
+	}
+
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	arena := a.Arena()
+	offsets := a.Offsets()
+	var ptr unsafe.Pointer
+	if len(arena) > 0 {
+		ptr = unsafe.Pointer(unsafe.StringData(arena))
+	}
+	offsetsPtr := unsafe.Pointer(&offsets[0])
+	*outBorrow = C.uintptr_t(fatstdBorrowNew(ptr, offsetsPtr))
+	*outOffsets = (*C.size_t)(offsetsPtr)
+	*outCount = C.size_t(len(offsets) - 1)
+	return ptr
+}
+
+//export fatstd_go_string_array_copy_out_all
+func fatstd_go_string_array_copy_out_all(arrayHandle C.uintptr_t, dst *C.char, dstLen C.size_t, outOffsets *C.size_t, offsetsLen C.size_t) C.size_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	arena := a.Arena()
+	offsets := a.Offsets()
+	if dstLen < C.size_t(len(arena)) {
+		panic("fatstd_go_string_array_copy_out_all: dstLen is smaller than the total byte length")
+	}
+	if offsetsLen < C.size_t(len(offsets)) {
+		panic("fatstd_go_string_array_copy_out_all: offsetsLen is smaller than the array length + 1")
+	}
+	if outOffsets == nil {
+		panic("fatstd_go_string_array_copy_out_all: outOffsets is NULL")
+	}
+	if len(arena) > 0 {
+		if dst == nil {
+			panic("fatstd_go_string_array_copy_out_all: dst is NULL")
+		}
+		copy(unsafe.Slice((*byte)(unsafe.Pointer(dst)), len(arena)), arena)
+	}
+	dstOffsets := unsafe.Slice(outOffsets, len(offsets))
+	for i, off := range offsets {
+		dstOffsets[i] = C.size_t(off)
+	}
+	return C.size_t(len(arena))
+}
+
+// fatstdStringArrayBoolOut views the caller's result buffer for a batch
+// predicate; it must hold one entry per array element.
+func fatstdStringArrayBoolOut(name string, a *fatstrings.StringArray, out *C.bool, outLen C.size_t) []bool {
+	n := a.Len()
+	if outLen < C.size_t(n) {
+		panic(name + ": outLen is smaller than the array length")
+	}
+	if n == 0 {
+		return nil
+	}
+	if out == nil {
+		panic(name + ": out is NULL")
+	}
+	return unsafe.Slice((*bool)(unsafe.Pointer(out)), n)
+}
+
+//export fatstd_go_string_array_to_lower
+func fatstd_go_string_array_to_lower(arrayHandle C.uintptr_t) C.uintptr_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	return C.uintptr_t(fatstdHandles.register(a.ToLower()))
+}
+
+//export fatstd_go_string_array_to_upper
+func fatstd_go_string_array_to_upper(arrayHandle C.uintptr_t) C.uintptr_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	return C.uintptr_t(fatstdHandles.register(a.ToUpper()))
+}
+
+//export fatstd_go_string_array_trim_space
+func fatstd_go_string_array_trim_space(arrayHandle C.uintptr_t) C.uintptr_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	return C.uintptr_t(fatstdHandles.register(a.TrimSpace()))
+}
+
+//export fatstd_go_string_array_has_prefix
+func fatstd_go_string_array_has_prefix(arrayHandle C.uintptr_t, prefixHandle C.uintptr_t, out *C.bool, outLen C.size_t) C.size_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	prefix := fatstdStringFromHandle(uintptr(prefixHandle))
+	dst := fatstdStringArrayBoolOut("fatstd_go_string_array_has_prefix", a, out, outLen)
+	return C.size_t(a.HasPrefix(prefix.Value(), dst))
+}
+
+//export fatstd_go_string_array_has_suffix
+func fatstd_go_string_array_has_suffix(arrayHandle C.uintptr_t, suffixHandle C.uintptr_t, out *C.bool, outLen C.size_t) C.size_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	suffix := fatstdStringFromHandle(uintptr(suffixHandle))
+	dst := fatstdStringArrayBoolOut("fatstd_go_string_array_has_suffix", a, out, outLen)
+	return C.size_t(a.HasSuffix(suffix.Value(), dst))
+}
+
+//export fatstd_go_string_array_contains
+func fatstd_go_string_array_contains(arrayHandle C.uintptr_t, substrHandle C.uintptr_t, out *C.bool, outLen C.size_t) C.size_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	substr := fatstdStringFromHandle(uintptr(substrHandle))
+	dst := fatstdStringArrayBoolOut("fatstd_go_string_array_contains", a, out, outLen)
+	return C.size_t(a.Contains(substr.Value(), dst))
+}
+
+//export fatstd_go_string_array_equal_fold
+func fatstd_go_string_array_equal_fold(arrayHandle C.uintptr_t, tHandle C.uintptr_t, out *C.bool, outLen C.size_t) C.size_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	t := fatstdStringFromHandle(uintptr(tHandle))
+	dst := fatstdStringArrayBoolOut("fatstd_go_string_array_equal_fold", a, out, outLen)
+	return C.size_t(a.EqualFold(t.Value(), dst))
+}
+
+//export fatstd_go_string_array_index
+func fatstd_go_string_array_index(arrayHandle C.uintptr_t, substrHandle C.uintptr_t, out *C.int64_t, outLen C.size_t) C.size_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	substr := fatstdStringFromHandle(uintptr(substrHandle))
+	n := a.Len()
+	if outLen < C.size_t(n) {
+		panic("fatstd_go_string_array_index: outLen is smaller than the array length")
+	}
+	if n == 0 {
+		return 0
+	}
+	if out == nil {
+		panic("fatstd_go_string_array_index: out is NULL")
+	}
+	indexes := make([]int, n)
+	found := a.Index(substr.Value(), indexes)
+	dst := unsafe.Slice((*int64)(unsafe.Pointer(out)), n)
+	for i, idx := range indexes {
+		dst[i] = int64(idx)
+	}
+	return C.size_t(found)
+}
+
 //export fatstd_go_string_join
 func fatstd_go_string_join(arrayHandle C.uintptr_t, sepHandle C.uintptr_t) C.uintptr_t {
 	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
 	sep := fatstdStringFromHandle(uintptr(sepHandle))
-	return C.uintptr_t(fatstdStringNewFromGoString(fatstrings.Join(a.Values(), sep.Value())))
+	return C.uintptr_t(fatstdStringNewFromGoString(a.Join(sep.Value())))
 }
 
 //export fatstd_go_string_replace
@@ -265,17 +462,17 @@ func fatstd_go_string_to_upper(handle C.uintptr_t) C.uintptr_t {
 }
 
 //export fatstd_go_string_index
-func fatstd_go_string_index(sHandle C.uintptr_t, substrHandle C.uintptr_t) C.int {
+func fatstd_go_string_index(sHandle C.uintptr_t, substrHandle C.uintptr_t) C.int64_t {
 	s := fatstdStringFromHandle(uintptr(sHandle))
 	substr := fatstdStringFromHandle(uintptr(substrHandle))
-	return C.int(fatstrings.Index(s.Value(), substr.Value()))
+	return C.int64_t(fatstrings.Index(s.Value(), substr.Value()))
 }
 
 //export fatstd_go_string_count
-func fatstd_go_string_count(sHandle C.uintptr_t, substrHandle C.uintptr_t) C.int {
+func fatstd_go_string_count(sHandle C.uintptr_t, substrHandle C.uintptr_t) C.int64_t {
 	s := fatstdStringFromHandle(uintptr(sHandle))
 	substr := fatstdStringFromHandle(uintptr(substrHandle))
-	return C.int(fatstrings.Count(s.Value(), substr.Value()))
+	return C.int64_t(fatstrings.Count(s.Value(), substr.Value()))
 }
 
 //export fatstd_go_string_compare
@@ -299,14 +496,22 @@ func fatstd_go_string_equal_fold(sHandle C.uintptr_t, tHandle C.uintptr_t) C.int
 func fatstd_go_string_trim_prefix(sHandle C.uintptr_t, prefixHandle C.uintptr_t) C.uintptr_t {
 	s := fatstdStringFromHandle(uintptr(sHandle))
 	prefix := fatstdStringFromHandle(uintptr(prefixHandle))
-	return C.uintptr_t(fatstdStringNewFromGoString(fatstrings.TrimPrefix(s.Value(), prefix.Value())))
+	off := 0
+	if fatstrings.HasPrefix(s.Value(), prefix.Value()) {
+		off = len(prefix.Value())
+	}
+	return C.uintptr_t(fatstdStringSubstring(s, off, len(s.Value())-off))
 }
 
 //export fatstd_go_string_trim_suffix
 func fatstd_go_string_trim_suffix(sHandle C.uintptr_t, suffixHandle C.uintptr_t) C.uintptr_t {
 	s := fatstdStringFromHandle(uintptr(sHandle))
 	suffix := fatstdStringFromHandle(uintptr(suffixHandle))
-	return C.uintptr_t(fatstdStringNewFromGoString(fatstrings.TrimSuffix(s.Value(), suffix.Value())))
+	n := len(s.Value())
+	if fatstrings.HasSuffix(s.Value(), suffix.Value()) {
+		n -= len(suffix.Value())
+	}
+	return C.uintptr_t(fatstdStringSubstring(s, 0, n))
 }
 
 //export fatstd_go_string_cut
@@ -320,15 +525,17 @@ func fatstd_go_string_cut(sHandle C.uintptr_t, sepHandle C.uintptr_t, beforeOut
 
 	s := fatstdStringFromHandle(uintptr(sHandle))
 	sep := fatstdStringFromHandle(uintptr(sepHandle))
-	before, after, found := fatstrings.Cut(s.Value(), sep.Value())
-
-	*beforeOut = C.uintptr_t(fatstdStringNewFromGoString(before))
-	*afterOut = C.uintptr_t(fatstdStringNewFromGoString(after))
-
-	if found {
-		return 1
+	value := s.Value()
+	i := fatstrings.Index(value, sep.Value())
+	if i < 0 {
+		*beforeOut = C.uintptr_t(fatstdStringSubstring(s, 0, len(value)))
+		*afterOut = C.uintptr_t(fatstdStringSubstring(s, len(value), 0))
+		return 0
 	}
-	return 0
+	rest := i + len(sep.Value())
+	*beforeOut = C.uintptr_t(fatstdStringSubstring(s, 0, i))
+	*afterOut = C.uintptr_t(fatstdStringSubstring(s, rest, len(value)-rest))
+	return 1
 }
 
 //export fatstd_go_string_cut_prefix
@@ -339,13 +546,13 @@ func fatstd_go_string_cut_prefix(sHandle C.uintptr_t, prefixHandle C.uintptr_t,
 
 	s := fatstdStringFromHandle(uintptr(sHandle))
 	prefix := fatstdStringFromHandle(uintptr(prefixHandle))
-	after, found := fatstrings.CutPrefix(s.Value(), prefix.Value())
-
-	*afterOut = C.uintptr_t(fatstdStringNewFromGoString(after))
-	if found {
-		return 1
+	if !fatstrings.HasPrefix(s.Value(), prefix.Value()) {
+		*afterOut = C.uintptr_t(fatstdStringSubstring(s, 0, len(s.Value())))
+		return 0
 	}
-	return 0
+	off := len(prefix.Value())
+	*afterOut = C.uintptr_t(fatstdStringSubstring(s, off, len(s.Value())-off))
+	return 1
 }
 
 //export fatstd_go_string_cut_suffix
@@ -356,13 +563,12 @@ func fatstd_go_string_cut_suffix(sHandle C.uintptr_t, suffixHandle C.uintptr_t,
 
 	s := fatstdStringFromHandle(uintptr(sHandle))
 	suffix := fatstdStringFromHandle(uintptr(suffixHandle))
-	after, found := fatstrings.CutSuffix(s.Value(), suffix.Value())
-
-	*afterOut = C.uintptr_t(fatstdStringNewFromGoString(after))
-	if found {
-		return 1
+	if !fatstrings.HasSuffix(s.Value(), suffix.Value()) {
+		*afterOut = C.uintptr_t(fatstdStringSubstring(s, 0, len(s.Value())))
+		return 0
 	}
-	return 0
+	*afterOut = C.uintptr_t(fatstdStringSubstring(s, 0, len(s.Value())-len(suffix.Value())))
+	return 1
 }
 
 //export fatstd_go_string_fields
@@ -404,6 +610,15 @@ func fatstd_go_string_to_valid_utf8(sHandle C.uintptr_t, replacementHandle C.uin
 	return C.uintptr_t(fatstdStringNewFromGoString(fatstrings.ToValidUTF8(s.Value(), replacement.Value())))
 }
 
+//export fatstd_go_string_is_valid_utf8
+func fatstd_go_string_is_valid_utf8(sHandle C.uintptr_t) C.int {
+	s := fatstdStringFromHandle(uintptr(sHandle))
+	if fatstrings.ValidUTF8(s.Value()) {
+		return 1
+	}
+	return 0
+}
+
 //export fatstd_go_string_builder_new
 func fatstd_go_string_builder_new() C.uintptr_t {
 	return C.uintptr_t(fatstdStringBuilderNew())
@@ -417,7 +632,7 @@ func fatstd_go_string_builder_cap(handle C.uintptr_t) C.size_t {
 
 //export fatstd_go_string_builder_grow
 func fatstd_go_string_builder_grow(handle C.uintptr_t, n C.size_t) {
-	if n > C.size_t(2147483647) {
+	if n > C.size_t(math.MaxInt) {
 		panic("fatstd_go_string_builder_grow: n too large")
 	}
 	b := fatstdStringBuilderFromHandle(uintptr(handle))
@@ -450,12 +665,11 @@ func fatstd_go_string_builder_write(handle C.uintptr_t, bytes *C.char, len C.siz
 		}
 		panic("fatstd_go_string_builder_write: bytes is NULL but len > 0")
 	}
-	if len > C.size_t(2147483647) {
+	if len > C.size_t(math.MaxInt) {
 		panic("fatstd_go_string_builder_write: len too large")
 	}
 	b := fatstdStringBuilderFromHandle(uintptr(handle))
-	buf := C.GoBytes(unsafe.Pointer(bytes), C.int(len))
-	return C.size_t(b.Write(buf))
+	return C.size_t(b.Write(unsafe.Slice((*byte)(unsafe.Pointer(bytes)), int(len))))
 }
 
 //export fatstd_go_string_builder_write_byte
@@ -523,7 +737,7 @@ func fatstd_go_string_reader_read(readerHandle C.uintptr_t, bytes *C.char, len C
 		}
 		panic("fatstd_go_string_reader_read: bytes is NULL but len > 0")
 	}
-	if len > C.size_t(2147483647) {
+	if len > C.size_t(math.MaxInt) {
 		panic("fatstd_go_string_reader_read: len too large")
 	}
 
@@ -554,7 +768,7 @@ func fatstd_go_string_reader_read_at(readerHandle C.uintptr_t, bytes *C.char, le
 		}
 		panic("fatstd_go_string_reader_read_at: bytes is NULL but len > 0")
 	}
-	if len > C.size_t(2147483647) {
+	if len > C.size_t(math.MaxInt) {
 		panic("fatstd_go_string_reader_read_at: len too large")
 	}
 
@@ -661,11 +875,18 @@ func fatstd_go_string_free(handle C.uintptr_t) {
 		panic("fatstd_go_string_free: handle is 0")
 	}
 
-	value, ok := fatstdHandles.take(uintptr(handle))
+	value, ok := fatstdHandles.get(uintptr(handle))
 	if !ok {
 		panic("fatstd_go_string_free: invalid handle")
 	}
-	if _, ok := value.(*fatstrings.String); !ok {
+	s, ok := value.(*fatstrings.String)
+	if !ok {
 		panic("fatstd_go_string_free: handle is not a fat string")
 	}
+	if s.IsInterned() {
+		panic("fatstd_go_string_free: handle is owned by a string interner")
+	}
+	if _, ok := fatstdHandles.take(uintptr(handle)); !ok {
+		panic("fatstd_go_string_free: invalid handle")
+	}
 }
@@ -0,0 +1,179 @@
+package main
+
+/*
+#include <stddef.h>
+#include <stdint.h>
+*/
+import "C"
+
+import (
+	"math"
+	"sync"
+	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatstrings"
+)
+
+// fatStringInterner gives every canonical string one handle. Handles are
+// registered unscoped, so arenas never release them. An evicted entry's
+// handle moves to retired rather than being released, so handles stay valid
+// until Reset or Free and the LRU only bounds the lookup table.
+type fatStringInterner struct {
+	mu      sync.Mutex
+	table   *fatstrings.Interner
+	handles map[*fatstrings.String]uintptr
+	retired []uintptr
+}
+
+func fatstdStringInternerNew(capacity int) *fatStringInterner {
+	in := &fatStringInterner{handles: make(map[*fatstrings.String]uintptr, capacity)}
+	in.table = fatstrings.NewInterner(capacity, in.evict)
+	return in
+}
+
+// evict runs under the table lock, which is always taken inside in.mu.
+func (in *fatStringInterner) evict(s *fatstrings.String) {
+	handle, ok := in.handles[s]
+	if !ok {
+		return
+	}
+	delete(in.handles, s)
+	in.retired = append(in.retired, handle)
+}
+
+// reset empties the table and releases every handle it has handed out.
+func (in *fatStringInterner) reset() {
+	in.mu.Lock()
+	defer in.mu.Unlock()
+	in.table.Reset()
+	for _, handle := range in.retired {
+		fatstdHandles.take(handle)
+	}
+	in.retired = nil
+}
+
+func (in *fatStringInterner) handleFor(s *fatstrings.String) uintptr {
+	if handle, ok := in.handles[s]; ok {
+		return handle
+	}
+	handle := fatstdHandles.registerUnscoped(s)
+	in.handles[s] = handle
+	return handle
+}
+
+func (in *fatStringInterner) internString(value string) uintptr {
+	in.mu.Lock()
+	defer in.mu.Unlock()
+	return in.handleFor(in.table.Intern(value))
+}
+
+func (in *fatStringInterner) internBytes(value []byte) uintptr {
+	in.mu.Lock()
+	defer in.mu.Unlock()
+	return in.handleFor(in.table.InternBytes(value))
+}
+
+func fatstdStringInternerFromHandle(handle uintptr) *fatStringInterner {
+	if handle == 0 {
+		panic("fatstdStringInternerFromHandle: handle is 0")
+	}
+	value, ok := fatstdHandles.get(handle)
+	if !ok {
+		panic("fatstdStringInternerFromHandle: invalid handle")
+	}
+	in, ok := value.(*fatStringInterner)
+	if !ok {
+		panic("fatstdStringInternerFromHandle: handle is not a fat string interner")
+	}
+	return in
+}
+
+//export fatstd_go_string_interner_new
+func fatstd_go_string_interner_new(capacity C.size_t) C.uintptr_t {
+	if capacity == 0 {
+		panic("fatstd_go_string_interner_new: capacity is 0")
+	}
+	if capacity > C.size_t(math.MaxInt32) {
+		panic("fatstd_go_string_interner_new: capacity too large")
+	}
+	return C.uintptr_t(fatstdHandles.register(fatstdStringInternerNew(int(capacity))))
+}
+
+//export fatstd_go_string_intern
+func fatstd_go_string_intern(internerHandle C.uintptr_t, stringHandle C.uintptr_t) C.uintptr_t {
+	in := fatstdStringInternerFromHandle(uintptr(internerHandle))
+	s := fatstdStringFromHandle(uintptr(stringHandle))
+	return C.uintptr_t(in.internString(s.Value()))
+}
+
+//export fatstd_go_string_intern_utf8_n
+func fatstd_go_string_intern_utf8_n(internerHandle C.uintptr_t, bytes *C.char, length C.size_t) C.uintptr_t {
+	in := fatstdStringInternerFromHandle(uintptr(internerHandle))
+	if bytes == nil && length != 0 {
+		panic("fatstd_go_string_intern_utf8_n: bytes is NULL but len > 0")
+	}
+	if length > C.size_t(math.MaxInt) {
+		panic("fatstd_go_string_intern_utf8_n: len too large")
+	}
+	var value []byte
+	if length > 0 {
+		value = unsafe.Slice((*byte)(unsafe.Pointer(bytes)), int(length))
+	}
+	return C.uintptr_t(in.internBytes(value))
+}
+
+//export fatstd_go_string_interner_len
+func fatstd_go_string_interner_len(handle C.uintptr_t) C.size_t {
+	in := fatstdStringInternerFromHandle(uintptr(handle))
+	return C.size_t(in.table.Len())
+}
+
+//export fatstd_go_string_interner_stats
+func fatstd_go_string_interner_stats(handle C.uintptr_t, outHits *C.uint64_t, outMisses *C.uint64_t, outEvictions *C.uint64_t) {
+	if outHits == nil {
+		panic("fatstd_go_string_interner_stats: outHits is NULL")
+	}
+	if outMisses == nil {
+		panic("fatstd_go_string_interner_stats: outMisses is NULL")
+	}
+	if outEvictions == nil {
+		panic("fatstd_go_string_interner_stats: outEvictions is NULL")
+	}
+	in := fatstdStringInternerFromHandle(uintptr(handle))
+	hits, misses, evictions := in.table.Stats()
+	*outHits = C.uint64_t(hits)
+	*outMisses = C.uint64_t(misses)
+	*outEvictions = C.uint64_t(evictions)
+}
+
+//export fatstd_go_string_interner_reset
+func fatstd_go_string_interner_reset(handle C.uintptr_t) {
+	in := fatstdStringInternerFromHandle(uintptr(handle))
+	in.reset()
+}
+
+//export fatstd_go_string_array_get_interned
+func fatstd_go_string_array_get_interned(arrayHandle C.uintptr_t, index C.size_t, internerHandle C.uintptr_t) C.uintptr_t {
+	a := fatstdStringArrayFromHandle(uintptr(arrayHandle))
+	in := fatstdStringInternerFromHandle(uintptr(internerHandle))
+	if index > C.size_t(math.MaxInt) {
+		panic("fatstd_go_string_array_get_interned: index too large")
+	}
+	return C.uintptr_t(in.internString(a.Get(int(index))))
+}
+
+//export fatstd_go_string_interner_free
+func fatstd_go_string_interner_free(handle C.uintptr_t) {
+	if handle == 0 {
+		panic("fatstd_go_string_interner_free: handle is 0")
+	}
+	value, ok := fatstdHandles.take(uintptr(handle))
+	if !ok {
+		panic("fatstd_go_string_interner_free: invalid handle")
+	}
+	in, ok := value.(*fatStringInterner)
+	if !ok {
+		panic("fatstd_go_string_interner_free: handle is not a fat string interner")
+	}
+	in.reset()
+}
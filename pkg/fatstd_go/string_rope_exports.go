@@ -0,0 +1,116 @@
+package main
+
+/*
+#include <stddef.h>
+#include <stdint.h>
+*/
+import "C"
+
+import (
+	"math"
+	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatstrings"
+)
+
+func fatstdStringRopeFromHandle(handle uintptr) *fatstrings.Rope {
+	if handle == 0 {
+		panic("fatstdStringRopeFromHandle: handle is 0")
+	}
+	value, ok := fatstdHandles.get(handle)
+	if !ok {
+		panic("fatstdStringRopeFromHandle: invalid handle")
+	}
+	r, ok := value.(*fatstrings.Rope)
+	if !ok {
+		panic("fatstdStringRopeFromHandle: handle is not a fat string rope")
+	}
+	return r
+}
+
+func fatstdStringRopeCheckOffset(name string, r *fatstrings.Rope, off C.size_t) int {
+	if off > C.size_t(r.Len()) {
+		panic(name + ": offset out of range")
+	}
+	return int(off)
+}
+
+func fatstdStringRopeCheckRange(name string, r *fatstrings.Rope, off C.size_t, n C.size_t) (int, int) {
+	size := C.size_t(r.Len())
+	if off > size || n > size-off {
+		panic(name + ": range out of bounds")
+	}
+	return int(off), int(n)
+}
+
+//export fatstd_go_string_rope_new
+func fatstd_go_string_rope_new() C.uintptr_t {
+	return C.uintptr_t(fatstdHandles.register(fatstrings.NewRope("")))
+}
+
+//export fatstd_go_string_rope_new_string
+func fatstd_go_string_rope_new_string(stringHandle C.uintptr_t) C.uintptr_t {
+	s := fatstdStringFromHandle(uintptr(stringHandle))
+	return C.uintptr_t(fatstdHandles.register(fatstrings.NewRope(s.Value())))
+}
+
+//export fatstd_go_string_rope_free
+func fatstd_go_string_rope_free(handle C.uintptr_t) {
+	if handle == 0 {
+		panic("fatstd_go_string_rope_free: handle is 0")
+	}
+	value, ok := fatstdHandles.take(uintptr(handle))
+	if !ok {
+		panic("fatstd_go_string_rope_free: invalid handle")
+	}
+	if _, ok := value.(*fatstrings.Rope); !ok {
+		panic("fatstd_go_string_rope_free: handle is not a fat string rope")
+	}
+}
+
+//export fatstd_go_string_rope_len
+func fatstd_go_string_rope_len(handle C.uintptr_t) C.size_t {
+	r := fatstdStringRopeFromHandle(uintptr(handle))
+	return C.size_t(r.Len())
+}
+
+//export fatstd_go_string_rope_insert
+func fatstd_go_string_rope_insert(ropeHandle C.uintptr_t, off C.size_t, stringHandle C.uintptr_t) {
+	r := fatstdStringRopeFromHandle(uintptr(ropeHandle))
+	s := fatstdStringFromHandle(uintptr(stringHandle))
+	r.Insert(fatstdStringRopeCheckOffset("fatstd_go_string_rope_insert", r, off), s.Value())
+}
+
+//export fatstd_go_string_rope_insert_utf8_n
+func fatstd_go_string_rope_insert_utf8_n(handle C.uintptr_t, off C.size_t, bytes *C.char, length C.size_t) {
+	r := fatstdStringRopeFromHandle(uintptr(handle))
+	if bytes == nil && length != 0 {
+		panic("fatstd_go_string_rope_insert_utf8_n: bytes is NULL but len > 0")
+	}
+	if length > C.size_t(math.MaxInt) {
+		panic("fatstd_go_string_rope_insert_utf8_n: len too large")
+	}
+	at := fatstdStringRopeCheckOffset("fatstd_go_string_rope_insert_utf8_n", r, off)
+	if length == 0 {
+		return
+	}
+	r.Insert(at, string(unsafe.Slice((*byte)(unsafe.Pointer(bytes)), int(length))))
+}
+
+//export fatstd_go_string_rope_delete
+func fatstd_go_string_rope_delete(handle C.uintptr_t, off C.size_t, n C.size_t) {
+	r := fatstdStringRopeFromHandle(uintptr(handle))
+	r.Delete(fatstdStringRopeCheckRange("fatstd_go_string_rope_delete", r, off, n))
+}
+
+//export fatstd_go_string_rope_slice
+func fatstd_go_string_rope_slice(handle C.uintptr_t, off C.size_t, n C.size_t) C.uintptr_t {
+	r := fatstdStringRopeFromHandle(uintptr(handle))
+	return C.uintptr_t(fatstdHandles.register(r.Slice(fatstdStringRopeCheckRange("fatstd_go_string_rope_slice", r, off, n))))
+}
+
+//export fatstd_go_string_rope_string
+func fatstd_go_string_rope_string(handle C.uintptr_t) C.uintptr_t {
+	r := fatstdStringRopeFromHandle(uintptr(handle))
+	return C.uintptr_t(fatstdStringNewFromGoString(r.String()))
+}
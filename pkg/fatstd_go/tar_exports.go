@@ -12,8 +12,11 @@ import (
 	"bytes"
 	"errors"
 	"io"
+	"math"
 	"os"
 	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
 )
 
 const (
@@ -39,7 +42,7 @@ func fatstdTarStatusFromError(err error) C.int {
 type fatTarReader struct {
 	file *os.File
 	tr   *tar.Reader
-	data []byte
+	src  *fatbytes.Bytes // retained input of bytes-backed readers, read in place
 }
 
 type fatTarHeader struct {
@@ -105,10 +108,10 @@ func fatstd_go_tar_reader_new_bytes(bytesHandle C.uintptr_t, outReader *C.uintpt
 	}
 
 	b := fatstdBytesFromHandle(uintptr(bytesHandle))
-	data := append([]byte(nil), b.Value()...)
-	tr := tar.NewReader(bytes.NewReader(data))
+	tr := tar.NewReader(bytes.NewReader(b.Value()))
 
-	handle := fatstdHandles.register(&fatTarReader{file: nil, tr: tr, data: data})
+	b.Retain()
+	handle := fatstdHandles.register(&fatTarReader{file: nil, tr: tr, src: b})
 	*outReader = C.uintptr_t(handle)
 	*outErr = 0
 	return fatStatusOK
@@ -134,7 +137,7 @@ func fatstd_go_tar_reader_open_path_utf8(path *C.char, outReader *C.uintptr_t, o
 	}
 
 	tr := tar.NewReader(f)
-	handle := fatstdHandles.register(&fatTarReader{file: f, tr: tr, data: nil})
+	handle := fatstdHandles.register(&fatTarReader{file: f, tr: tr, src: nil})
 	*outReader = C.uintptr_t(handle)
 	*outErr = 0
 	return fatStatusOK
@@ -156,6 +159,9 @@ func fatstd_go_tar_reader_free(handle C.uintptr_t, outErr *C.uintptr_t) C.int {
 	if !ok {
 		panic("fatstd_go_tar_reader_free: handle is not tar reader")
 	}
+	if r.src != nil {
+		r.src.Release()
+	}
 	if r.file != nil {
 		if err := r.file.Close(); err != nil {
 			*outErr = C.uintptr_t(fatstdNewError(fatTarErrCodeIO, err.Error()))
@@ -221,7 +227,7 @@ func fatstd_go_tar_reader_read(
 	if dst == nil && dstLen != 0 {
 		panic("fatstd_go_tar_reader_read: dst is NULL but dstLen > 0")
 	}
-	if dstLen > C.size_t(2147483647) {
+	if dstLen > C.size_t(math.MaxInt) {
 		panic("fatstd_go_tar_reader_read: dstLen too large")
 	}
 
@@ -288,7 +294,7 @@ func fatstd_go_tar_writer_new_to_bytes_buffer(dstBufferHandle C.uintptr_t, outWr
 	}
 
 	dst := fatstdBytesBufferFromHandle(uintptr(dstBufferHandle))
-	tw := tar.NewWriter(dst.Underlying())
+	tw := tar.NewWriter(dst.Writer())
 	*outWriter = C.uintptr_t(fatstdHandles.register(&fatTarWriter{tw: tw}))
 	*outErr = 0
 	return fatStatusOK
@@ -11,6 +11,7 @@ import (
 	"bytes"
 	"errors"
 	"io"
+	"math"
 
 	gotiled "github.com/lafriks/go-tiled"
 )
@@ -317,7 +318,7 @@ func fatstd_go_tiled_map_layer_count(handle C.uintptr_t) C.size_t {
 //export fatstd_go_tiled_map_layer_at
 func fatstd_go_tiled_map_layer_at(handle C.uintptr_t, idx C.size_t) C.uintptr_t {
 	m := fatstdTiledMapFromHandle(uintptr(handle))
-	if idx > C.size_t(2147483647) {
+	if idx > C.size_t(math.MaxInt) {
 		panic("fatstd_go_tiled_map_layer_at: idx too large")
 	}
 	i := int(idx)
@@ -12,7 +12,10 @@ import (
 	"encoding/xml"
 	"errors"
 	"io"
+	"math"
 	"os"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
 )
 
 const (
@@ -24,7 +27,7 @@ const (
 type fatXmlDecoder struct {
 	file *os.File
 	dec  *xml.Decoder
-	data []byte
+	src  *fatbytes.Bytes // retained input of bytes-backed decoders, read in place
 }
 
 type fatXmlEncoder struct {
@@ -140,9 +143,9 @@ func fatstdXmlTokenKind(tok xml.Token) int {
 //export fatstd_go_xml_decoder_new_bytes
 func fatstd_go_xml_decoder_new_bytes(bytesHandle C.uintptr_t) C.uintptr_t {
 	b := fatstdBytesFromHandle(uintptr(bytesHandle))
-	data := append([]byte(nil), b.Value()...)
-	dec := xml.NewDecoder(bytes.NewReader(data))
-	return C.uintptr_t(fatstdHandles.register(&fatXmlDecoder{file: nil, dec: dec, data: data}))
+	dec := xml.NewDecoder(bytes.NewReader(b.Value()))
+	b.Retain()
+	return C.uintptr_t(fatstdHandles.register(&fatXmlDecoder{file: nil, dec: dec, src: b}))
 }
 
 //export fatstd_go_xml_decoder_open_path_utf8
@@ -164,7 +167,7 @@ func fatstd_go_xml_decoder_open_path_utf8(path *C.char, outDec *C.uintptr_t, out
 		return fatstdXmlStatusFromError(err)
 	}
 	dec := xml.NewDecoder(f)
-	*outDec = C.uintptr_t(fatstdHandles.register(&fatXmlDecoder{file: f, dec: dec, data: nil}))
+	*outDec = C.uintptr_t(fatstdHandles.register(&fatXmlDecoder{file: f, dec: dec, src: nil}))
 	*outErr = 0
 	return fatStatusOK
 }
@@ -185,6 +188,9 @@ func fatstd_go_xml_decoder_free(handle C.uintptr_t, outErr *C.uintptr_t) C.int {
 	if !ok {
 		panic("fatstd_go_xml_decoder_free: handle is not xml decoder")
 	}
+	if d.src != nil {
+		d.src.Release()
+	}
 	if d.file != nil {
 		if err := d.file.Close(); err != nil {
 			*outErr = C.uintptr_t(fatstdNewError(fatXmlErrCodeIO, err.Error()))
@@ -313,6 +319,20 @@ func fatstd_go_xml_token_name_local(handle C.uintptr_t) C.uintptr_t {
 	return C.uintptr_t(fatstdStringNewFromGoString(name.Local))
 }
 
+//export fatstd_go_xml_token_name_local_interned
+func fatstd_go_xml_token_name_local_interned(handle C.uintptr_t, internerHandle C.uintptr_t) C.uintptr_t {
+	t := fatstdXmlTokenFromHandle(uintptr(handle))
+	in := fatstdStringInternerFromHandle(uintptr(internerHandle))
+	return C.uintptr_t(in.internString(fatstdXmlTokenName(t.tok).Local))
+}
+
+//export fatstd_go_xml_token_name_space_interned
+func fatstd_go_xml_token_name_space_interned(handle C.uintptr_t, internerHandle C.uintptr_t) C.uintptr_t {
+	t := fatstdXmlTokenFromHandle(uintptr(handle))
+	in := fatstdStringInternerFromHandle(uintptr(internerHandle))
+	return C.uintptr_t(in.internString(fatstdXmlTokenName(t.tok).Space))
+}
+
 //export fatstd_go_xml_token_name_space
 func fatstd_go_xml_token_name_space(handle C.uintptr_t) C.uintptr_t {
 	t := fatstdXmlTokenFromHandle(uintptr(handle))
@@ -346,7 +366,7 @@ func fatstd_go_xml_start_element_attr_get(handle C.uintptr_t, idx C.size_t, outN
 	if !ok {
 		panic("fatstd_go_xml_start_element_attr_get: token is not start element")
 	}
-	if idx > C.size_t(2147483647) {
+	if idx > C.size_t(math.MaxInt) {
 		panic("fatstd_go_xml_start_element_attr_get: idx too large")
 	}
 	i := int(idx)
@@ -398,7 +418,7 @@ func fatstd_go_xml_proc_inst_inst_bytes(handle C.uintptr_t) C.uintptr_t {
 func fatstd_go_xml_escape_to_bytes_buffer(dstBufferHandle C.uintptr_t, srcHandle C.uintptr_t) {
 	dst := fatstdBytesBufferFromHandle(uintptr(dstBufferHandle))
 	src := fatstdBytesFromHandle(uintptr(srcHandle))
-	xml.Escape(dst.Underlying(), src.Value())
+	xml.Escape(dst.Writer(), src.Value())
 }
 
 //export fatstd_go_xml_escape_text_to_bytes_buffer
@@ -408,7 +428,7 @@ func fatstd_go_xml_escape_text_to_bytes_buffer(dstBufferHandle C.uintptr_t, srcH
 	}
 	dst := fatstdBytesBufferFromHandle(uintptr(dstBufferHandle))
 	src := fatstdBytesFromHandle(uintptr(srcHandle))
-	if err := xml.EscapeText(dst.Underlying(), src.Value()); err != nil {
+	if err := xml.EscapeText(dst.Writer(), src.Value()); err != nil {
 		*outErr = C.uintptr_t(fatstdNewError(fatXmlErrCodeOther, err.Error()))
 		return fatstdXmlStatusFromError(err)
 	}
@@ -419,7 +439,7 @@ func fatstd_go_xml_escape_text_to_bytes_buffer(dstBufferHandle C.uintptr_t, srcH
 //export fatstd_go_xml_encoder_new_to_bytes_buffer
 func fatstd_go_xml_encoder_new_to_bytes_buffer(dstBufferHandle C.uintptr_t) C.uintptr_t {
 	dst := fatstdBytesBufferFromHandle(uintptr(dstBufferHandle))
-	enc := xml.NewEncoder(dst.Underlying())
+	enc := xml.NewEncoder(dst.Writer())
 	return C.uintptr_t(fatstdHandles.register(&fatXmlEncoder{enc: enc}))
 }
 
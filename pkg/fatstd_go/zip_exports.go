@@ -12,7 +12,10 @@ import (
 	"bytes"
 	"errors"
 	"io"
+	"math"
 	"unsafe"
+
+	"github.com/bluesentinelsec/FatStd/pkg/fatbytes"
 )
 
 const (
@@ -38,9 +41,9 @@ func fatstdZipStatusFromError(err error) C.int {
 }
 
 type fatZipReader struct {
-	rc   *zip.ReadCloser // non-nil for path-based readers
-	r    *zip.Reader     // always non-nil
-	data []byte          // keeps bytes-backed archives alive
+	rc  *zip.ReadCloser // non-nil for path-based readers
+	r   *zip.Reader     // always non-nil
+	src *fatbytes.Bytes // retained input of bytes-backed archives, read in place
 }
 
 type fatZipFile struct {
@@ -49,7 +52,8 @@ type fatZipFile struct {
 }
 
 type fatZipFileReader struct {
-	rc io.ReadCloser
+	rc  io.ReadCloser
+	src *fatbytes.Bytes // retained archive input while the entry is open
 }
 
 type fatZipWriter struct {
@@ -159,7 +163,7 @@ func fatstd_go_zip_reader_new_bytes(bytesHandle C.uintptr_t, outReader *C.uintpt
 	}
 
 	b := fatstdBytesFromHandle(uintptr(bytesHandle))
-	data := append([]byte(nil), b.Value()...)
+	data := b.Value()
 	br := bytes.NewReader(data)
 
 	r, err := zip.NewReader(br, int64(len(data)))
@@ -169,7 +173,8 @@ func fatstd_go_zip_reader_new_bytes(bytesHandle C.uintptr_t, outReader *C.uintpt
 		return fatstdZipStatusFromError(err)
 	}
 
-	handle := fatstdHandles.register(&fatZipReader{rc: nil, r: r, data: data})
+	b.Retain()
+	handle := fatstdHandles.register(&fatZipReader{rc: nil, r: r, src: b})
 	*outReader = C.uintptr_t(handle)
 	*outErr = 0
 	return fatStatusZipOK
@@ -193,6 +198,9 @@ func fatstd_go_zip_reader_free(handle C.uintptr_t, outErr *C.uintptr_t) C.int {
 		panic("fatstd_go_zip_reader_free: handle is not zip reader")
 	}
 
+	if r.src != nil {
+		r.src.Release()
+	}
 	if r.rc != nil {
 		if err := r.rc.Close(); err != nil {
 			*outErr = C.uintptr_t(fatstdNewError(fatZipErrCodeIO, err.Error()))
@@ -212,7 +220,7 @@ func fatstd_go_zip_reader_num_files(handle C.uintptr_t) C.size_t {
 //export fatstd_go_zip_reader_file_by_index
 func fatstd_go_zip_reader_file_by_index(readerHandle C.uintptr_t, idx C.size_t) C.uintptr_t {
 	r := fatstdZipReaderFromHandle(uintptr(readerHandle))
-	if idx > C.size_t(2147483647) {
+	if idx > C.size_t(math.MaxInt) {
 		panic("fatstd_go_zip_reader_file_by_index: idx too large")
 	}
 	i := int(idx)
@@ -263,7 +271,13 @@ func fatstd_go_zip_file_open(handle C.uintptr_t, outReader *C.uintptr_t, outErr
 		*outErr = C.uintptr_t(fatstdNewError(fatZipErrCodeZip, err.Error()))
 		return fatstdZipStatusFromError(err)
 	}
-	*outReader = C.uintptr_t(fatstdHandles.register(&fatZipFileReader{rc: rc}))
+	// The entry reads the archive input directly, so it may outlive the
+	// zip reader only while it holds its own reference.
+	src := fatstdZipReaderFromHandle(f.readerHandle).src
+	if src != nil {
+		src.Retain()
+	}
+	*outReader = C.uintptr_t(fatstdHandles.register(&fatZipFileReader{rc: rc, src: src}))
 	*outErr = 0
 	return fatStatusZipOK
 }
@@ -289,7 +303,7 @@ func fatstd_go_zip_file_reader_read(
 	if dst == nil && dstLen != 0 {
 		panic("fatstd_go_zip_file_reader_read: dst is NULL but dstLen > 0")
 	}
-	if dstLen > C.size_t(2147483647) {
+	if dstLen > C.size_t(math.MaxInt) {
 		panic("fatstd_go_zip_file_reader_read: dstLen too large")
 	}
 
@@ -330,6 +344,9 @@ func fatstd_go_zip_file_reader_close(handle C.uintptr_t, outErr *C.uintptr_t) C.
 	if !ok {
 		panic("fatstd_go_zip_file_reader_close: handle is not zip file reader")
 	}
+	if r.src != nil {
+		defer r.src.Release()
+	}
 	if err := r.rc.Close(); err != nil {
 		*outErr = C.uintptr_t(fatstdNewError(fatZipErrCodeIO, err.Error()))
 		return fatStatusZipErr
@@ -348,7 +365,7 @@ func fatstd_go_zip_writer_new_to_bytes_buffer(dstBufferHandle C.uintptr_t, outWr
 	}
 
 	dst := fatstdBytesBufferFromHandle(uintptr(dstBufferHandle))
-	w := zip.NewWriter(dst.Underlying())
+	w := zip.NewWriter(dst.Writer())
 	*outWriter = C.uintptr_t(fatstdHandles.register(&fatZipWriter{w: w}))
 	*outErr = 0
 	return fatStatusZipOK
@@ -0,0 +1,161 @@
+package fatstrings
+
+import (
+	"strings"
+	"unicode/utf8"
+)
+
+// Batch operations apply one strings function to every element of an array,
+// so a whole column costs a single call from C instead of one per element.
+// Element-wise predicates write into a caller slice that must hold at least
+// Len() results and return how many elements matched.
+
+func (a *StringArray) mapValues(name string, fn func(string) string) *StringArray {
+	if a == nil {
+		panic("fatstrings.StringArray." + name + ": receiver is nil")
+	}
+	n := len(a.offsets) - 1
+	var arena strings.Builder
+	arena.Grow(len(a.arena))
+	offsets := make([]int, n+1)
+	for i := 0; i < n; i++ {
+		arena.WriteString(fn(a.arena[a.offsets[i]:a.offsets[i+1]]))
+		offsets[i+1] = arena.Len()
+	}
+	return &StringArray{arena: arena.String(), offsets: offsets}
+}
+
+func (a *StringArray) testValues(name string, out []bool, fn func(string) bool) int {
+	if a == nil {
+		panic("fatstrings.StringArray." + name + ": receiver is nil")
+	}
+	if len(out) < len(a.offsets)-1 {
+		panic("fatstrings.StringArray." + name + ": out is shorter than the array")
+	}
+	n := 0
+	for i := range out[:len(a.offsets)-1] {
+		ok := fn(a.arena[a.offsets[i]:a.offsets[i+1]])
+		out[i] = ok
+		if ok {
+			n++
+		}
+	}
+	return n
+}
+
+func (a *StringArray) ToLower() *StringArray {
+	return a.mapValues("ToLower", ToLower)
+}
+
+func (a *StringArray) ToUpper() *StringArray {
+	return a.mapValues("ToUpper", ToUpper)
+}
+
+func (a *StringArray) TrimSpace() *StringArray {
+	return a.mapValues("TrimSpace", strings.TrimSpace)
+}
+
+func (a *StringArray) HasPrefix(prefix string, out []bool) int {
+	return a.testValues("HasPrefix", out, func(s string) bool { return strings.HasPrefix(s, prefix) })
+}
+
+func (a *StringArray) HasSuffix(suffix string, out []bool) int {
+	return a.testValues("HasSuffix", out, func(s string) bool { return strings.HasSuffix(s, suffix) })
+}
+
+func (a *StringArray) Contains(substr string, out []bool) int {
+	return a.testValues("Contains", out, func(s string) bool { return strings.Contains(s, substr) })
+}
+
+func (a *StringArray) EqualFold(t string, out []bool) int {
+	return a.testValues("EqualFold", out, func(s string) bool { return EqualFold(s, t) })
+}
+
+// Index writes strings.Index for every element and returns how many elements
+// contain substr.
+func (a *StringArray) Index(substr string, out []int) int {
+	if a == nil {
+		panic("fatstrings.StringArray.Index: receiver is nil")
+	}
+	if len(out) < len(a.offsets)-1 {
+		panic("fatstrings.StringArray.Index: out is shorter than the array")
+	}
+	n := 0
+	for i := range out[:len(a.offsets)-1] {
+		out[i] = strings.Index(a.arena[a.offsets[i]:a.offsets[i+1]], substr)
+		if out[i] >= 0 {
+			n++
+		}
+	}
+	return n
+}
+
+// Join avoids re-gathering the elements when sep is empty: the arena already
+// is the result.
+func (a *StringArray) Join(sep string) string {
+	if a == nil {
+		panic("fatstrings.StringArray.Join: receiver is nil")
+	}
+	if sep == "" || len(a.offsets) <= 2 {
+		return a.arena
+	}
+	var b strings.Builder
+	b.Grow(len(a.arena) + len(sep)*(len(a.offsets)-2))
+	for i := 0; i+1 < len(a.offsets); i++ {
+		if i > 0 {
+			b.WriteString(sep)
+		}
+		b.WriteString(a.arena[a.offsets[i]:a.offsets[i+1]])
+	}
+	return b.String()
+}
+
+// SplitArray is Split producing a packed array directly, without the
+// intermediate []string.
+func SplitArray(s, sep string) *StringArray {
+	return SplitNArray(s, sep, -1)
+}
+
+// SplitNArray follows strings.SplitN. Splitting on an empty separator keeps s
+// itself as the arena, since the pieces are adjacent.
+func SplitNArray(s, sep string, n int) *StringArray {
+	if n == 0 {
+		return &StringArray{offsets: []int{0}}
+	}
+	if sep == "" {
+		if n < 0 || n > utf8.RuneCountInString(s) {
+			n = utf8.RuneCountInString(s)
+		}
+		offsets := make([]int, n+1)
+		pos := 0
+		for i := 1; i < n; i++ {
+			_, size := utf8.DecodeRuneInString(s[pos:])
+			pos += size
+			offsets[i] = pos
+		}
+		offsets[n] = len(s)
+		return &StringArray{arena: s, offsets: offsets}
+	}
+	if n < 0 {
+		n = strings.Count(s, sep) + 1
+	}
+	if n > len(s)+1 {
+		n = len(s) + 1
+	}
+
+	var arena strings.Builder
+	arena.Grow(len(s))
+	offsets := make([]int, 1, n+1)
+	for len(offsets) < n {
+		i := strings.Index(s, sep)
+		if i < 0 {
+			break
+		}
+		arena.WriteString(s[:i])
+		offsets = append(offsets, arena.Len())
+		s = s[i+len(sep):]
+	}
+	arena.WriteString(s)
+	offsets = append(offsets, arena.Len())
+	return &StringArray{arena: arena.String(), offsets: offsets}
+}
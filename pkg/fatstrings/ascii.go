@@ -0,0 +1,292 @@
+package fatstrings
+
+import (
+	"bytes"
+	"strings"
+	"unicode/utf8"
+	"unsafe"
+)
+
+// Word-at-a-time (SWAR) kernels for the ASCII-heavy inputs most callers
+// sanitize. Eight bytes are loaded into a uint64 and tested or case-mapped
+// together; anything that is not ASCII falls back to the stdlib. The kernels
+// take strings; the []byte entry points view their input as a string without
+// copying, since the kernels only read it.
+
+func bytesView(b []byte) string {
+	if len(b) == 0 {
+		return ""
+	}
+	return unsafe.String(&b[0], len(b))
+}
+
+const (
+	swarOnes = 0x0101010101010101
+	swarHigh = 0x8080808080808080
+)
+
+// load64 reads s[i:i+8] little-endian. The compiler merges the byte loads
+// into a single 64-bit load.
+func load64(s string, i int) uint64 {
+	s = s[i : i+8]
+	return uint64(s[0]) | uint64(s[1])<<8 | uint64(s[2])<<16 | uint64(s[3])<<24 |
+		uint64(s[4])<<32 | uint64(s[5])<<40 | uint64(s[6])<<48 | uint64(s[7])<<56
+}
+
+func store64(b []byte, i int, w uint64) {
+	b = b[i : i+8]
+	b[0] = byte(w)
+	b[1] = byte(w >> 8)
+	b[2] = byte(w >> 16)
+	b[3] = byte(w >> 24)
+	b[4] = byte(w >> 32)
+	b[5] = byte(w >> 40)
+	b[6] = byte(w >> 48)
+	b[7] = byte(w >> 56)
+}
+
+// swarInRange sets the high bit of every byte of w that lies in [lo, hi].
+// w must be all ASCII, so the additions cannot carry between bytes.
+func swarInRange(w uint64, lo, hi byte) uint64 {
+	geLo := w + uint64(0x80-lo)*swarOnes
+	gtHi := w + uint64(0x7f-hi)*swarOnes
+	return geLo &^ gtHi & swarHigh
+}
+
+// asciiScan reports whether s is all ASCII and, if so, whether any byte lies
+// in [lo, hi].
+func asciiScan(s string, lo, hi byte) (ascii, found bool) {
+	var hits uint64
+	i := 0
+	for ; i+8 <= len(s); i += 8 {
+		w := load64(s, i)
+		if w&swarHigh != 0 {
+			return false, false
+		}
+		hits |= swarInRange(w, lo, hi)
+	}
+	for ; i < len(s); i++ {
+		c := s[i]
+		if c >= utf8.RuneSelf {
+			return false, false
+		}
+		if lo <= c && c <= hi {
+			hits = 1
+		}
+	}
+	return true, hits != 0
+}
+
+// asciiFlipCase copies the ASCII text s into dst, toggling the case of every
+// letter in [lo, hi] ('A'-'Z' to lower, 'a'-'z' to upper).
+func asciiFlipCase(dst []byte, s string, lo, hi byte) {
+	i := 0
+	for ; i+8 <= len(s); i += 8 {
+		w := load64(s, i)
+		store64(dst, i, w^swarInRange(w, lo, hi)>>2)
+	}
+	for ; i < len(s); i++ {
+		c := s[i]
+		if lo <= c && c <= hi {
+			c ^= 0x20
+		}
+		dst[i] = c
+	}
+}
+
+func ToLower(s string) string {
+	ascii, found := asciiScan(s, 'A', 'Z')
+	if !ascii {
+		return strings.ToLower(s)
+	}
+	if !found {
+		return s
+	}
+	b := make([]byte, len(s))
+	asciiFlipCase(b, s, 'A', 'Z')
+	return unsafe.String(&b[0], len(b))
+}
+
+func ToUpper(s string) string {
+	ascii, found := asciiScan(s, 'a', 'z')
+	if !ascii {
+		return strings.ToUpper(s)
+	}
+	if !found {
+		return s
+	}
+	b := make([]byte, len(s))
+	asciiFlipCase(b, s, 'a', 'z')
+	return unsafe.String(&b[0], len(b))
+}
+
+// ToLowerBytes and ToUpperBytes always return a new slice, like
+// bytes.ToLower and bytes.ToUpper.
+func ToLowerBytes(s []byte) []byte {
+	if ascii, _ := asciiScan(bytesView(s), 'A', 'Z'); !ascii {
+		return bytes.ToLower(s)
+	}
+	b := make([]byte, len(s))
+	asciiFlipCase(b, bytesView(s), 'A', 'Z')
+	return b
+}
+
+func ToUpperBytes(s []byte) []byte {
+	if ascii, _ := asciiScan(bytesView(s), 'a', 'z'); !ascii {
+		return bytes.ToUpper(s)
+	}
+	b := make([]byte, len(s))
+	asciiFlipCase(b, bytesView(s), 'a', 'z')
+	return b
+}
+
+// EqualFold compares ASCII runs a word at a time and hands the rest to
+// strings.EqualFold at the first word holding a non-ASCII byte.
+func EqualFold(s, t string) bool {
+	i := 0
+	for ; i+8 <= len(s) && i+8 <= len(t); i += 8 {
+		a, b := load64(s, i), load64(t, i)
+		if (a|b)&swarHigh != 0 {
+			break
+		}
+		if a != b && a|swarInRange(a, 'A', 'Z')>>2 != b|swarInRange(b, 'A', 'Z')>>2 {
+			return false
+		}
+	}
+	return strings.EqualFold(s[i:], t[i:])
+}
+
+// utf8First describes a leading byte: the low nibble is the sequence length
+// (0 if the byte cannot start a multi-byte sequence) and the high nibble
+// indexes utf8Accept, the valid range for the second byte. The tables mirror
+// the ones behind utf8.DecodeRune.
+var utf8First = func() (t [256]uint8) {
+	for c := 0xC2; c < 0xE0; c++ {
+		t[c] = 0x02
+	}
+	for c := 0xE0; c < 0xF0; c++ {
+		t[c] = 0x03
+	}
+	t[0xE0] = 0x13
+	t[0xED] = 0x23
+	for c := 0xF0; c < 0xF5; c++ {
+		t[c] = 0x04
+	}
+	t[0xF0] = 0x34
+	t[0xF4] = 0x44
+	return t
+}()
+
+var utf8Accept = [5]struct{ lo, hi byte }{
+	{0x80, 0xBF},
+	{0xA0, 0xBF},
+	{0x80, 0x9F},
+	{0x90, 0xBF},
+	{0x80, 0x8F},
+}
+
+// utf8RuneLen returns the length of the valid multi-byte sequence starting at
+// s[i], or 0 if it is invalid.
+func utf8RuneLen(s string, i int) int {
+	x := utf8First[s[i]]
+	size := int(x & 0x0F)
+	if size == 0 || len(s)-i < size {
+		return 0
+	}
+	accept := utf8Accept[x>>4]
+	if c := s[i+1]; c < accept.lo || accept.hi < c {
+		return 0
+	}
+	if size > 2 && s[i+2]&0xC0 != 0x80 {
+		return 0
+	}
+	if size > 3 && s[i+3]&0xC0 != 0x80 {
+		return 0
+	}
+	return size
+}
+
+// validUTF8Prefix returns the length of the longest valid UTF-8 prefix of s.
+// utf8.Valid only skips ASCII a word at a time until the first multi-byte
+// rune; this goes back to the word loop after every multi-byte rune, so
+// mostly-ASCII and mixed-script text keep the fast path throughout.
+func validUTF8Prefix(s string) int {
+	n := len(s)
+	i := 0
+	for i+16 <= n && (load64(s, i)|load64(s, i+8))&swarHigh == 0 {
+		i += 16
+	}
+	for i < n {
+		c := s[i]
+		if c < utf8.RuneSelf {
+			i++
+			continue
+		}
+		x := utf8First[c]
+		size := int(x & 0x0F)
+		if size == 0 || n-i < size {
+			return i
+		}
+		accept := utf8Accept[x>>4]
+		if c1 := s[i+1]; c1 < accept.lo || accept.hi < c1 {
+			return i
+		}
+		if size > 2 && s[i+2]&0xC0 != 0x80 || size > 3 && s[i+3]&0xC0 != 0x80 {
+			return i
+		}
+		i += size
+		for i+8 <= n && load64(s, i)&swarHigh == 0 {
+			i += 8
+		}
+	}
+	return n
+}
+
+func ValidUTF8(s string) bool {
+	return validUTF8Prefix(s) == len(s)
+}
+
+func ValidUTF8Bytes(b []byte) bool {
+	return validUTF8Prefix(bytesView(b)) == len(b)
+}
+
+// appendValidUTF8 appends s to dst with each run of invalid bytes replaced by
+// one copy of replacement, as strings.ToValidUTF8 does.
+func appendValidUTF8(dst []byte, s, replacement string) []byte {
+	for len(s) > 0 {
+		n := validUTF8Prefix(s)
+		dst = append(dst, s[:n]...)
+		if n == len(s) {
+			break
+		}
+		for n < len(s) && s[n] >= utf8.RuneSelf && utf8RuneLen(s, n) == 0 {
+			n++
+		}
+		dst = append(dst, replacement...)
+		s = s[n:]
+	}
+	return dst
+}
+
+// ToValidUTF8 returns s itself when it is already valid.
+func ToValidUTF8(s, replacement string) string {
+	n := validUTF8Prefix(s)
+	if n == len(s) {
+		return s
+	}
+	b := make([]byte, n, len(s)+len(replacement))
+	copy(b, s[:n])
+	b = appendValidUTF8(b, s[n:], replacement)
+	return unsafe.String(unsafe.SliceData(b), len(b))
+}
+
+// ToValidUTF8Bytes always returns a new slice, like bytes.ToValidUTF8.
+func ToValidUTF8Bytes(s, replacement []byte) []byte {
+	n := validUTF8Prefix(bytesView(s))
+	if n == len(s) {
+		return append([]byte{}, s...)
+	}
+	b := make([]byte, n, len(s)+len(replacement))
+	copy(b, s[:n])
+	return appendValidUTF8(b, bytesView(s[n:]), bytesView(replacement))
+}
@@ -6,11 +6,20 @@ import (
 )
 
 type String struct {
-	value string
+	value    string
+	interned bool
+	// base is set on substring views: value is
+	// base.value[offset : offset+len(value)] and shares its bytes.
+	base   *String
+	offset int
 }
 
+// StringArray is packed: every element lives in one arena string, and
+// element i is arena[offsets[i]:offsets[i+1]]. Elements and the arena itself
+// can be handed out as substrings without copying.
 type StringArray struct {
-	values []string
+	arena   string
+	offsets []int
 }
 
 type Builder struct {
@@ -26,7 +35,18 @@ func NewUTF8(value string) *String {
 }
 
 func NewStringArray(values []string) *StringArray {
-	return &StringArray{values: values}
+	size := 0
+	for _, v := range values {
+		size += len(v)
+	}
+	var arena strings.Builder
+	arena.Grow(size)
+	offsets := make([]int, len(values)+1)
+	for i, v := range values {
+		arena.WriteString(v)
+		offsets[i+1] = arena.Len()
+	}
+	return &StringArray{arena: arena.String(), offsets: offsets}
 }
 
 func NewBuilder() *Builder {
@@ -44,28 +64,58 @@ func (s *String) Value() string {
 	return s.value
 }
 
+// IsInterned reports whether s is owned by an Interner.
+func (s *String) IsInterned() bool {
+	if s == nil {
+		panic("fatstrings.String.IsInterned: receiver is nil")
+	}
+	return s.interned
+}
+
 func (a *StringArray) Len() int {
 	if a == nil {
 		panic("fatstrings.StringArray.Len: receiver is nil")
 	}
-	return len(a.values)
+	return len(a.offsets) - 1
 }
 
 func (a *StringArray) Get(index int) string {
 	if a == nil {
 		panic("fatstrings.StringArray.Get: receiver is nil")
 	}
-	if index < 0 || index >= len(a.values) {
+	if index < 0 || index >= len(a.offsets)-1 {
 		panic("fatstrings.StringArray.Get: index out of range")
 	}
-	return a.values[index]
+	return a.arena[a.offsets[index]:a.offsets[index+1]]
 }
 
+// Values returns the elements as substrings of the arena.
 func (a *StringArray) Values() []string {
 	if a == nil {
 		panic("fatstrings.StringArray.Values: receiver is nil")
 	}
-	return a.values
+	values := make([]string, len(a.offsets)-1)
+	for i := range values {
+		values[i] = a.arena[a.offsets[i]:a.offsets[i+1]]
+	}
+	return values
+}
+
+// Arena returns the concatenation of all elements.
+func (a *StringArray) Arena() string {
+	if a == nil {
+		panic("fatstrings.StringArray.Arena: receiver is nil")
+	}
+	return a.arena
+}
+
+// Offsets returns the Len()+1 element boundaries within Arena. The slice is
+// shared with the array and must not be modified.
+func (a *StringArray) Offsets() []int {
+	if a == nil {
+		panic("fatstrings.StringArray.Offsets: receiver is nil")
+	}
+	return a.offsets
 }
 
 func (b *Builder) Cap() int {
@@ -240,14 +290,6 @@ func ReplaceAll(s, old, new string) string {
 	return strings.ReplaceAll(s, old, new)
 }
 
-func ToLower(s string) string {
-	return strings.ToLower(s)
-}
-
-func ToUpper(s string) string {
-	return strings.ToUpper(s)
-}
-
 func Index(s, substr string) int {
 	return strings.Index(s, substr)
 }
@@ -260,10 +302,6 @@ func Compare(a, b string) int {
 	return strings.Compare(a, b)
 }
 
-func EqualFold(s, t string) bool {
-	return strings.EqualFold(s, t)
-}
-
 func TrimPrefix(s, prefix string) string {
 	return strings.TrimPrefix(s, prefix)
 }
@@ -299,7 +337,3 @@ func ContainsAny(s, chars string) bool {
 func IndexAny(s, chars string) bool {
 	return strings.IndexAny(s, chars) >= 0
 }
-
-func ToValidUTF8(s, replacement string) string {
-	return strings.ToValidUTF8(s, replacement)
-}
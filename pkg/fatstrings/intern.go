@@ -0,0 +1,143 @@
+package fatstrings
+
+import (
+	"strings"
+	"sync"
+)
+
+// Interner maps equal strings to one canonical *String, so a name that
+// repeats millions of times is stored once. It holds at most capacity
+// entries; inserting into a full table evicts the least recently used one
+// and passes it to onEvict. It is safe for concurrent use.
+type Interner struct {
+	mu       sync.Mutex
+	capacity int
+	entries  map[string]*internEntry
+	lru      internEntry // sentinel: lru.next is the most recently used entry
+	onEvict  func(*String)
+
+	hits      uint64
+	misses    uint64
+	evictions uint64
+}
+
+type internEntry struct {
+	s          *String
+	prev, next *internEntry
+}
+
+func NewInterner(capacity int, onEvict func(*String)) *Interner {
+	if capacity <= 0 {
+		panic("fatstrings.NewInterner: capacity must be > 0")
+	}
+	t := &Interner{
+		capacity: capacity,
+		entries:  make(map[string]*internEntry, capacity),
+		onEvict:  onEvict,
+	}
+	t.lru.prev = &t.lru
+	t.lru.next = &t.lru
+	return t
+}
+
+func (t *Interner) unlink(e *internEntry) {
+	e.prev.next = e.next
+	e.next.prev = e.prev
+}
+
+func (t *Interner) pushFront(e *internEntry) {
+	e.prev = &t.lru
+	e.next = t.lru.next
+	t.lru.next.prev = e
+	t.lru.next = e
+}
+
+// hit must be called with mu held. Lookups index the map with string(b),
+// which does not allocate, so hits on the []byte path are copy-free.
+func (t *Interner) hit(e *internEntry) *String {
+	t.hits++
+	if t.lru.next != e {
+		t.unlink(e)
+		t.pushFront(e)
+	}
+	return e.s
+}
+
+// insert must be called with mu held. value must not alias caller memory.
+func (t *Interner) insert(value string) *String {
+	t.misses++
+	if len(t.entries) >= t.capacity {
+		victim := t.lru.prev
+		t.unlink(victim)
+		delete(t.entries, victim.s.value)
+		t.evictions++
+		if t.onEvict != nil {
+			t.onEvict(victim.s)
+		}
+	}
+	e := &internEntry{s: &String{value: value, interned: true}}
+	t.entries[value] = e
+	t.pushFront(e)
+	return e.s
+}
+
+// Intern returns the canonical String for s. New entries hold a private copy
+// of s, so interning a substring never pins the buffer it came from.
+func (t *Interner) Intern(s string) *String {
+	if t == nil {
+		panic("fatstrings.Interner.Intern: receiver is nil")
+	}
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	if e, ok := t.entries[s]; ok {
+		return t.hit(e)
+	}
+	return t.insert(strings.Clone(s))
+}
+
+func (t *Interner) InternBytes(b []byte) *String {
+	if t == nil {
+		panic("fatstrings.Interner.InternBytes: receiver is nil")
+	}
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	if e, ok := t.entries[string(b)]; ok {
+		return t.hit(e)
+	}
+	return t.insert(string(b))
+}
+
+func (t *Interner) Len() int {
+	if t == nil {
+		panic("fatstrings.Interner.Len: receiver is nil")
+	}
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	return len(t.entries)
+}
+
+func (t *Interner) Stats() (hits, misses, evictions uint64) {
+	if t == nil {
+		panic("fatstrings.Interner.Stats: receiver is nil")
+	}
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	return t.hits, t.misses, t.evictions
+}
+
+// Reset drops every entry, passing each to onEvict. Counters are kept.
+func (t *Interner) Reset() {
+	if t == nil {
+		panic("fatstrings.Interner.Reset: receiver is nil")
+	}
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	for e := t.lru.next; e != &t.lru; e = e.next {
+		if t.onEvict != nil {
+			t.onEvict(e.s)
+		}
+	}
+	t.entries = make(map[string]*internEntry, t.capacity)
+	t.lru.prev = &t.lru
+	t.lru.next = &t.lru
+}
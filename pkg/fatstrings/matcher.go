@@ -0,0 +1,271 @@
+package fatstrings
+
+import (
+	"errors"
+	"sort"
+)
+
+// Matcher finds every occurrence of a fixed set of patterns in one pass over
+// the input (Aho-Corasick). It is immutable after construction and safe for
+// concurrent use.
+//
+// The automaton is stored in flat arrays: a dense 256-entry row for the root,
+// sorted edge lists for every other state, failure links, and "dict" links
+// that skip straight to the next state on the failure chain that ends a
+// pattern. Memory is linear in the total pattern length. Small automatons
+// additionally get a dense state x byte table so scanning never walks
+// failure links.
+type Matcher struct {
+	lens []int
+
+	delta []int32
+
+	root      [256]int32
+	edgeStart []int32
+	edgeByte  []byte
+	edgeNext  []int32
+	fail      []int32
+	dict      []int32
+	hit       []int32
+	outStart  []int32
+	outs      []int32
+}
+
+// Match is one pattern occurrence: the pattern's index in the slice passed to
+// NewMatcher and the byte offset where it starts.
+type Match struct {
+	Pattern int
+	Start   int
+}
+
+var ErrEmptyPattern = errors.New("fatstrings: matcher patterns must not be empty")
+
+func NewMatcher(patterns []string) (*Matcher, error) {
+	type trieEdge struct {
+		c    byte
+		next int32
+	}
+	edges := [][]trieEdge{nil}
+	terminal := [][]int32{nil}
+
+	for id, p := range patterns {
+		if p == "" {
+			return nil, ErrEmptyPattern
+		}
+		state := int32(0)
+		for i := 0; i < len(p); i++ {
+			next := int32(-1)
+			for _, e := range edges[state] {
+				if e.c == p[i] {
+					next = e.next
+					break
+				}
+			}
+			if next < 0 {
+				next = int32(len(edges))
+				edges = append(edges, nil)
+				terminal = append(terminal, nil)
+				edges[state] = append(edges[state], trieEdge{c: p[i], next: next})
+			}
+			state = next
+		}
+		terminal[state] = append(terminal[state], int32(id))
+	}
+
+	n := len(edges)
+	m := &Matcher{
+		lens:      make([]int, len(patterns)),
+		edgeStart: make([]int32, n+1),
+		fail:      make([]int32, n),
+		dict:      make([]int32, n),
+		hit:       make([]int32, n),
+		outStart:  make([]int32, n+1),
+	}
+	for id, p := range patterns {
+		m.lens[id] = len(p)
+	}
+	for s := 0; s < n; s++ {
+		sort.Slice(edges[s], func(i, j int) bool { return edges[s][i].c < edges[s][j].c })
+		m.edgeStart[s] = int32(len(m.edgeByte))
+		for _, e := range edges[s] {
+			m.edgeByte = append(m.edgeByte, e.c)
+			m.edgeNext = append(m.edgeNext, e.next)
+		}
+		m.outStart[s] = int32(len(m.outs))
+		m.outs = append(m.outs, terminal[s]...)
+	}
+	m.edgeStart[n] = int32(len(m.edgeByte))
+	m.outStart[n] = int32(len(m.outs))
+
+	for _, e := range edges[0] {
+		m.root[e.c] = e.next
+	}
+
+	// Breadth-first, so a state's failure target is final before its children
+	// are linked.
+	m.dict[0] = -1
+	queue := make([]int32, 0, n)
+	for _, e := range edges[0] {
+		m.fail[e.next] = 0
+		m.dict[e.next] = -1
+		queue = append(queue, e.next)
+	}
+	for len(queue) > 0 {
+		u := queue[0]
+		queue = queue[1:]
+		for k := m.edgeStart[u]; k < m.edgeStart[u+1]; k++ {
+			c, v := m.edgeByte[k], m.edgeNext[k]
+			m.fail[v] = m.step(m.fail[u], c)
+			f := m.fail[v]
+			if m.outStart[f] != m.outStart[f+1] {
+				m.dict[v] = f
+			} else {
+				m.dict[v] = m.dict[f]
+			}
+			queue = append(queue, v)
+		}
+	}
+
+	// hit[s] is the first state on s's dictionary chain, s included, that
+	// ends a pattern, so states with nothing to report cost one load.
+	for s := 0; s < n; s++ {
+		if m.outStart[s] != m.outStart[s+1] {
+			m.hit[s] = int32(s)
+		} else {
+			m.hit[s] = m.dict[s]
+		}
+	}
+
+	if n <= matcherDenseStates {
+		m.delta = make([]int32, n*256)
+		for s := 0; s < n; s++ {
+			for c := 0; c < 256; c++ {
+				m.delta[s<<8|c] = m.step(int32(s), byte(c))
+			}
+		}
+	}
+	return m, nil
+}
+
+// matcherDenseStates caps the dense transition table at 1 MiB.
+const matcherDenseStates = 1024
+
+func (m *Matcher) next(state int32, c byte) int32 {
+	lo, hi := m.edgeStart[state], m.edgeStart[state+1]
+	for hi-lo > 8 {
+		mid := lo + (hi-lo)/2
+		if m.edgeByte[mid] < c {
+			lo = mid + 1
+		} else {
+			hi = mid
+		}
+	}
+	for ; lo < hi; lo++ {
+		if m.edgeByte[lo] == c {
+			return m.edgeNext[lo]
+		}
+	}
+	return -1
+}
+
+// step is the full automaton transition: follow failure links until some
+// state has an edge for c, bottoming out at the root's dense row.
+func (m *Matcher) step(state int32, c byte) int32 {
+	for state != 0 {
+		if next := m.next(state, c); next >= 0 {
+			return next
+		}
+		state = m.fail[state]
+	}
+	return m.root[c]
+}
+
+// scan reports matches in order of their end offset; matches ending at the
+// same offset are reported longest first. It stops early when fn returns false.
+func scan[T ~string | ~[]byte](m *Matcher, s T, fn func(pattern, start int) bool) {
+	state := int32(0)
+	for i := 0; i < len(s); i++ {
+		if m.delta != nil {
+			state = m.delta[int(state)<<8|int(s[i])]
+		} else {
+			state = m.step(state, s[i])
+		}
+		for out := m.hit[state]; out > 0; out = m.dict[out] {
+			for k := m.outStart[out]; k < m.outStart[out+1]; k++ {
+				id := int(m.outs[k])
+				if !fn(id, i+1-m.lens[id]) {
+					return
+				}
+			}
+		}
+	}
+}
+
+func (m *Matcher) PatternCount() int {
+	if m == nil {
+		panic("fatstrings.Matcher.PatternCount: receiver is nil")
+	}
+	return len(m.lens)
+}
+
+func (m *Matcher) PatternLen(index int) int {
+	if m == nil {
+		panic("fatstrings.Matcher.PatternLen: receiver is nil")
+	}
+	if index < 0 || index >= len(m.lens) {
+		panic("fatstrings.Matcher.PatternLen: index out of range")
+	}
+	return m.lens[index]
+}
+
+// Scan calls fn for every (possibly overlapping) match in s until fn returns false.
+func (m *Matcher) Scan(s string, fn func(pattern, start int) bool) {
+	if m == nil {
+		panic("fatstrings.Matcher.Scan: receiver is nil")
+	}
+	scan(m, s, fn)
+}
+
+// ScanBytes is Scan over a byte slice.
+func (m *Matcher) ScanBytes(b []byte, fn func(pattern, start int) bool) {
+	if m == nil {
+		panic("fatstrings.Matcher.ScanBytes: receiver is nil")
+	}
+	scan(m, b, fn)
+}
+
+func (m *Matcher) FindAll(s string) []Match {
+	if m == nil {
+		panic("fatstrings.Matcher.FindAll: receiver is nil")
+	}
+	var matches []Match
+	scan(m, s, func(pattern, start int) bool {
+		matches = append(matches, Match{Pattern: pattern, Start: start})
+		return true
+	})
+	return matches
+}
+
+func (m *Matcher) Count(s string) int {
+	if m == nil {
+		panic("fatstrings.Matcher.Count: receiver is nil")
+	}
+	n := 0
+	scan(m, s, func(int, int) bool {
+		n++
+		return true
+	})
+	return n
+}
+
+func (m *Matcher) Contains(s string) bool {
+	if m == nil {
+		panic("fatstrings.Matcher.Contains: receiver is nil")
+	}
+	found := false
+	scan(m, s, func(int, int) bool {
+		found = true
+		return false
+	})
+	return found
+}
@@ -0,0 +1,38 @@
+package fatstrings
+
+import (
+	"io"
+	"strings"
+)
+
+// Replacer applies a fixed list of old/new substitutions in one pass. The
+// lookup tables are compiled once by strings.NewReplacer; a Replacer is
+// immutable afterwards and safe for concurrent use.
+type Replacer struct {
+	r *strings.Replacer
+}
+
+// NewReplacer takes old/new pairs in the order strings.NewReplacer does.
+// Comparisons are done in argument order, without overlapping matches.
+func NewReplacer(oldnew []string) *Replacer {
+	if len(oldnew)%2 == 1 {
+		panic("fatstrings.NewReplacer: odd argument count")
+	}
+	return &Replacer{r: strings.NewReplacer(oldnew...)}
+}
+
+func (r *Replacer) Replace(s string) string {
+	if r == nil {
+		panic("fatstrings.Replacer.Replace: receiver is nil")
+	}
+	return r.r.Replace(s)
+}
+
+// WriteString writes s to w with all replacements performed, without
+// materializing the replaced string first.
+func (r *Replacer) WriteString(w io.Writer, s string) (int, error) {
+	if r == nil {
+		panic("fatstrings.Replacer.WriteString: receiver is nil")
+	}
+	return r.r.WriteString(w, s)
+}
@@ -0,0 +1,218 @@
+package fatstrings
+
+import "strings"
+
+// Rope is an editable text value for documents that take many small edits.
+// Text is held as pieces (substrings of immutable strings) in a treap ordered
+// by position, so Insert, Delete and Slice cost O(log n) expected in the number
+// of pieces and never copy document text. Nodes are never mutated once built,
+// which lets Slice share structure with the rope it came from.
+//
+// All offsets are byte offsets. A Rope is not safe for concurrent use.
+type Rope struct {
+	root  *ropeNode
+	seed  uint32
+	flat  string
+	dirty bool
+}
+
+type ropeNode struct {
+	piece       string
+	size        int
+	prio        uint32
+	left, right *ropeNode
+}
+
+func ropeSize(n *ropeNode) int {
+	if n == nil {
+		return 0
+	}
+	return n.size
+}
+
+func newRopeNode(piece string, prio uint32, left, right *ropeNode) *ropeNode {
+	return &ropeNode{
+		piece: piece,
+		size:  ropeSize(left) + len(piece) + ropeSize(right),
+		prio:  prio,
+		left:  left,
+		right: right,
+	}
+}
+
+// split returns the first k bytes of n and the rest. Cutting a piece keeps
+// the left half in place and inserts the right half into the right subtree
+// under a fresh priority; reusing the priority would leave runs of equal
+// priorities that degrade the treap into a list.
+func (r *Rope) split(n *ropeNode, k int) (*ropeNode, *ropeNode) {
+	if n == nil {
+		return nil, nil
+	}
+	ls := ropeSize(n.left)
+	switch {
+	case k <= ls:
+		a, b := r.split(n.left, k)
+		return a, ropeJoin(n.piece, n.prio, b, n.right)
+	case k >= ls+len(n.piece):
+		a, b := r.split(n.right, k-ls-len(n.piece))
+		return ropeJoin(n.piece, n.prio, n.left, a), b
+	default:
+		at := k - ls
+		return newRopeNode(n.piece[:at], n.prio, n.left, nil), r.insert(n.right, 0, r.newLeaf(n.piece[at:]))
+	}
+}
+
+// ropeJoin builds a node over left and right. A subtree rebuilt by split or
+// insert may be rooted at a freshly cut half whose priority outranks the node,
+// in which case the two are merged instead.
+func ropeJoin(piece string, prio uint32, left, right *ropeNode) *ropeNode {
+	if left != nil && left.prio > prio {
+		return ropeMerge(left, ropeJoin(piece, prio, nil, right))
+	}
+	if right != nil && right.prio > prio {
+		return ropeMerge(newRopeNode(piece, prio, left, nil), right)
+	}
+	return newRopeNode(piece, prio, left, right)
+}
+
+// insert places the single-piece node x at offset k, copying only the path
+// from the root to where x lands.
+func (r *Rope) insert(n *ropeNode, k int, x *ropeNode) *ropeNode {
+	if n == nil {
+		return x
+	}
+	if x.prio > n.prio {
+		a, b := r.split(n, k)
+		return ropeJoin(x.piece, x.prio, a, b)
+	}
+	ls := ropeSize(n.left)
+	switch {
+	case k <= ls:
+		return ropeJoin(n.piece, n.prio, r.insert(n.left, k, x), n.right)
+	case k >= ls+len(n.piece):
+		return ropeJoin(n.piece, n.prio, n.left, r.insert(n.right, k-ls-len(n.piece), x))
+	default:
+		a, b := r.split(n, k)
+		return ropeMerge(ropeMerge(a, x), b)
+	}
+}
+
+func ropeMerge(l, r *ropeNode) *ropeNode {
+	if l == nil {
+		return r
+	}
+	if r == nil {
+		return l
+	}
+	if l.prio >= r.prio {
+		return newRopeNode(l.piece, l.prio, l.left, ropeMerge(l.right, r))
+	}
+	return newRopeNode(r.piece, r.prio, ropeMerge(l, r.left), r.right)
+}
+
+func NewRope(s string) *Rope {
+	r := &Rope{seed: 0x9e3779b9}
+	if s != "" {
+		r.root = r.newLeaf(s)
+		r.flat = s
+	}
+	return r
+}
+
+func (r *Rope) newLeaf(piece string) *ropeNode {
+	return newRopeNode(piece, r.nextPrio(), nil, nil)
+}
+
+// nextPrio is a xorshift32 step; treap balance only needs the priorities to be
+// well spread, not unpredictable.
+func (r *Rope) nextPrio() uint32 {
+	x := r.seed
+	x ^= x << 13
+	x ^= x >> 17
+	x ^= x << 5
+	r.seed = x
+	return x
+}
+
+func (r *Rope) Len() int {
+	if r == nil {
+		panic("fatstrings.Rope.Len: receiver is nil")
+	}
+	return ropeSize(r.root)
+}
+
+// Insert inserts s before byte offset off. The rope keeps a reference to s
+// rather than copying it.
+func (r *Rope) Insert(off int, s string) {
+	if r == nil {
+		panic("fatstrings.Rope.Insert: receiver is nil")
+	}
+	if off < 0 || off > ropeSize(r.root) {
+		panic("fatstrings.Rope.Insert: offset out of range")
+	}
+	if s == "" {
+		return
+	}
+	r.root = r.insert(r.root, off, r.newLeaf(s))
+	r.dirty = true
+}
+
+// Delete removes the n bytes starting at off.
+func (r *Rope) Delete(off, n int) {
+	if r == nil {
+		panic("fatstrings.Rope.Delete: receiver is nil")
+	}
+	if off < 0 || n < 0 || n > ropeSize(r.root)-off {
+		panic("fatstrings.Rope.Delete: range out of bounds")
+	}
+	if n == 0 {
+		return
+	}
+	l, rest := r.split(r.root, off)
+	_, rest = r.split(rest, n)
+	r.root = ropeMerge(l, rest)
+	r.dirty = true
+}
+
+// Slice returns a new Rope holding the n bytes starting at off. It shares
+// pieces with r, so it costs O(log n) regardless of the slice length.
+func (r *Rope) Slice(off, n int) *Rope {
+	if r == nil {
+		panic("fatstrings.Rope.Slice: receiver is nil")
+	}
+	if off < 0 || n < 0 || n > ropeSize(r.root)-off {
+		panic("fatstrings.Rope.Slice: range out of bounds")
+	}
+	_, rest := r.split(r.root, off)
+	mid, _ := r.split(rest, n)
+	return &Rope{root: mid, seed: r.nextPrio(), dirty: mid != nil}
+}
+
+// String flattens the rope. The result is cached until the next edit, so
+// repeated calls on an unchanged rope do not copy.
+func (r *Rope) String() string {
+	if r == nil {
+		panic("fatstrings.Rope.String: receiver is nil")
+	}
+	if r.dirty {
+		var b strings.Builder
+		b.Grow(ropeSize(r.root))
+		ropeWrite(&b, r.root)
+		r.flat = b.String()
+		r.root = nil
+		if r.flat != "" {
+			// Collapsing to one piece keeps later edits cheap after a flatten.
+			r.root = r.newLeaf(r.flat)
+		}
+		r.dirty = false
+	}
+	return r.flat
+}
+
+func ropeWrite(b *strings.Builder, n *ropeNode) {
+	for n != nil {
+		ropeWrite(b, n.left)
+		b.WriteString(n.piece)
+		n = n.right
+	}
+}
@@ -0,0 +1,134 @@
+package fatstrings
+
+import (
+	"bytes"
+	"strings"
+	"unicode"
+	"unicode/utf8"
+)
+
+// Splitter walks the pieces of strings.SplitN / strings.Fields (or their
+// bytes equivalents) one at a time, reporting each as a byte offset and length
+// into the source instead of materializing an array. Memory use is constant.
+type Splitter[T string | []byte] struct {
+	s      T
+	sep    T
+	n      int
+	pos    int
+	done   bool
+	fields bool
+	index  func(s, sep T) int
+	decode func(s T) (rune, int)
+}
+
+func newSplitter[T string | []byte](s T) *Splitter[T] {
+	sp := &Splitter[T]{s: s}
+	switch any(s).(type) {
+	case string:
+		sp.index = any(strings.Index).(func(T, T) int)
+		sp.decode = any(utf8.DecodeRuneInString).(func(T) (rune, int))
+	case []byte:
+		sp.index = any(bytes.Index).(func(T, T) int)
+		sp.decode = any(utf8.DecodeRune).(func(T) (rune, int))
+	}
+	return sp
+}
+
+// NewSplitter yields the pieces strings.SplitN(s, sep, n) would return.
+func NewSplitter[T string | []byte](s, sep T, n int) *Splitter[T] {
+	sp := newSplitter(s)
+	sp.sep = sep
+	sp.n = n
+	return sp
+}
+
+// NewFieldsSplitter yields the pieces strings.Fields(s) would return.
+func NewFieldsSplitter[T string | []byte](s T) *Splitter[T] {
+	sp := newSplitter(s)
+	sp.fields = true
+	return sp
+}
+
+// Next returns the next piece as s[start:start+length].
+func (sp *Splitter[T]) Next() (start, length int, ok bool) {
+	if sp == nil {
+		panic("fatstrings.Splitter.Next: receiver is nil")
+	}
+	if sp.done {
+		return 0, 0, false
+	}
+	if sp.fields {
+		return sp.nextField()
+	}
+	if sp.n == 0 {
+		sp.done = true
+		return 0, 0, false
+	}
+
+	start = sp.pos
+	if len(sp.sep) == 0 {
+		if start >= len(sp.s) {
+			sp.done = true
+			return 0, 0, false
+		}
+		if sp.n == 1 {
+			sp.pos = len(sp.s)
+		} else {
+			_, size := sp.decode(sp.s[start:])
+			sp.pos += size
+		}
+		if sp.n > 0 {
+			sp.n--
+		}
+		return start, sp.pos - start, true
+	}
+
+	if sp.n != 1 {
+		if i := sp.index(sp.s[start:], sp.sep); i >= 0 {
+			sp.pos = start + i + len(sp.sep)
+			if sp.n > 0 {
+				sp.n--
+			}
+			return start, i, true
+		}
+	}
+	sp.done = true
+	sp.pos = len(sp.s)
+	return start, len(sp.s) - start, true
+}
+
+func (sp *Splitter[T]) isSpaceAt(i int) (space bool, size int) {
+	if c := sp.s[i]; c < utf8.RuneSelf {
+		return asciiSpace[c], 1
+	}
+	r, size := sp.decode(sp.s[i:])
+	return unicode.IsSpace(r), size
+}
+
+func (sp *Splitter[T]) nextField() (start, length int, ok bool) {
+	i := sp.pos
+	for i < len(sp.s) {
+		space, size := sp.isSpaceAt(i)
+		if !space {
+			break
+		}
+		i += size
+	}
+	if i >= len(sp.s) {
+		sp.done = true
+		sp.pos = i
+		return 0, 0, false
+	}
+	start = i
+	for i < len(sp.s) {
+		space, size := sp.isSpaceAt(i)
+		if space {
+			break
+		}
+		i += size
+	}
+	sp.pos = i
+	return start, i - start, true
+}
+
+var asciiSpace = [utf8.RuneSelf]bool{'\t': true, '\n': true, '\v': true, '\f': true, '\r': true, ' ': true}
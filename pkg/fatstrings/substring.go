@@ -0,0 +1,53 @@
+package fatstrings
+
+import "unsafe"
+
+// Substring returns a String viewing s[off:off+n]. The view shares s's bytes
+// and remembers where it came from; a view of a view points at the outermost
+// string, so offsets never chain.
+func (s *String) Substring(off, n int) *String {
+	if s == nil {
+		panic("fatstrings.String.Substring: receiver is nil")
+	}
+	if off < 0 || n < 0 || off > len(s.value)-n {
+		panic("fatstrings.String.Substring: range out of bounds")
+	}
+	base, baseOff := s, 0
+	if s.base != nil {
+		base, baseOff = s.base, s.offset
+	}
+	return &String{value: s.value[off : off+n], base: base, offset: baseOff + off}
+}
+
+// OffsetIn reports whether s is a substring view lying within parent and, if
+// so, the byte offset of s inside parent. Both may be views of a common
+// string.
+func (s *String) OffsetIn(parent *String) (int, bool) {
+	if s == nil {
+		panic("fatstrings.String.OffsetIn: receiver is nil")
+	}
+	if parent == nil {
+		panic("fatstrings.String.OffsetIn: parent is nil")
+	}
+	if s.base == nil {
+		return 0, false
+	}
+	parentBase, parentOff := parent, 0
+	if parent.base != nil {
+		parentBase, parentOff = parent.base, parent.offset
+	}
+	if s.base != parentBase || s.offset < parentOff || s.offset+len(s.value) > parentOff+len(parent.value) {
+		return 0, false
+	}
+	return s.offset - parentOff, true
+}
+
+// TrimSpaceRange is TrimSpace reported as the offset and length of the
+// trimmed text within s. An all-space s trims to the empty range at its end.
+func TrimSpaceRange(s string) (off, n int) {
+	t := TrimSpace(s)
+	if len(t) == 0 {
+		return len(s), 0
+	}
+	return int(uintptr(unsafe.Pointer(unsafe.StringData(t))) - uintptr(unsafe.Pointer(unsafe.StringData(s)))), len(t)
+}
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import platform
+import re
+import subprocess
+import sys
+from contextlib import ExitStack
+from pathlib import Path
+
+from fatstd_bench.cases import FAMILIES, new_api
+from fatstd_bench.harness import BenchSkip, measure, result_record
+from fatstd_test_support import FatStdTestContext, set_context
+from test_fatstd_shared import (
+    _discover_library_path,
+    _fatal,
+    _find_repo_root,
+    _load_library,
+    _project_version_from_cmakelists,
+)
+
+SCHEMA_VERSION = 1
+
+
+def _bench_binary_names() -> list[str]:
+    if platform.system().lower() == "windows":
+        return ["fatstd_bench.exe"]
+    return ["fatstd_bench"]
+
+
+def _discover_bench_binary(lib_path: Path, build_dir: Path) -> Path | None:
+    found: list[Path] = []
+    for root in (build_dir, lib_path.parent):
+        if not root.is_dir():
+            continue
+        for name in _bench_binary_names():
+            found.extend(p for p in root.rglob(name) if p.is_file())
+    if not found:
+        return None
+    return sorted(found, key=lambda p: (len(p.parts), str(p)))[0]
+
+
+def _print_result(r: dict) -> None:
+    label = f"{r['suite']:<6} {r['family']:<10} {r['name']:<18}"
+    if r["status"] != "ok":
+        print(f"{label} {r['status']}: {r['error']}", flush=True)
+        return
+    line = (
+        f"{label} {r['iterations']:>12} {r['ns_per_op']:>12.1f} ns/op"
+        f" {r['allocs_per_op']:>9.2f} allocs/op {r['bytes_per_op']:>10.1f} B/op"
+    )
+    if r["mb_per_s"] is not None:
+        line += f" {r['mb_per_s']:>10.1f} MB/s"
+    print(line, flush=True)
+
+
+def _run_ctypes_suite(family_filter: re.Pattern | None, name_filter: re.Pattern | None, benchtime_ns: int) -> list[dict]:
+    results: list[dict] = []
+    api = new_api()
+    for family, setup in FAMILIES.items():
+        if family_filter is not None and not family_filter.search(family):
+            continue
+        with ExitStack() as stack:
+            try:
+                cases = setup(api, stack)
+            except BenchSkip as exc:
+                r = result_record("ctypes", family, "*", status="skipped", error=str(exc))
+                _print_result(r)
+                results.append(r)
+                continue
+            for case in cases:
+                if name_filter is not None and not name_filter.search(f"{case.family}/{case.name}"):
+                    continue
+                try:
+                    r = measure(case, suite="ctypes", benchtime_ns=benchtime_ns)
+                except RuntimeError as exc:
+                    r = result_record("ctypes", case.family, case.name, status="failed", error=str(exc))
+                _print_result(r)
+                results.append(r)
+    return results
+
+
+def _run_c_suite(
+    bench_bin: Path, family_filter: re.Pattern | None, name_filter: re.Pattern | None, benchtime_ms: int
+) -> list[dict]:
+    listing = subprocess.run([str(bench_bin), "--list"], stdout=subprocess.PIPE, text=True, check=True)
+    selected = []
+    for full in listing.stdout.split():
+        family = full.split("/", 1)[0]
+        if family_filter is not None and not family_filter.search(family):
+            continue
+        if name_filter is not None and not name_filter.search(full):
+            continue
+        selected.append(full)
+    if not selected:
+        return []
+
+    cmd = [str(bench_bin), "--json", "--benchtime-ms", str(benchtime_ms)]
+    if family_filter is not None or name_filter is not None:
+        for full in selected:
+            cmd += ["--filter", full]
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, check=False)
+    try:
+        doc = json.loads(proc.stdout)
+    except json.JSONDecodeError as exc:
+        _fatal(f"{bench_bin} produced invalid JSON (exit {proc.returncode}): {exc}")
+    results = [r for r in doc["results"] if f"{r['family']}/{r['name']}" in selected]
+    for r in results:
+        _print_result(r)
+    return results
+
+
+def _compare(baseline_path: Path, results: list[dict], max_regression: float | None) -> bool:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    old = {(r["suite"], r["family"], r["name"]): r for r in baseline["results"] if r["status"] == "ok"}
+
+    print(f"\ncomparison against {baseline_path} ({baseline.get('fatstd_version', '?')}):")
+    print(f"{'benchmark':<38} {'old ns/op':>12} {'new ns/op':>12} {'delta':>8} {'old allocs':>10} {'new allocs':>10}")
+    ok = True
+    for r in results:
+        prev = old.get((r["suite"], r["family"], r["name"]))
+        if prev is None or r["status"] != "ok" or prev["ns_per_op"] == 0:
+            continue
+        delta = (r["ns_per_op"] - prev["ns_per_op"]) / prev["ns_per_op"] * 100.0
+        flag = ""
+        if max_regression is not None and delta > max_regression:
+            flag = "  REGRESSION"
+            ok = False
+        if r["allocs_per_op"] > prev["allocs_per_op"] + 0.5:
+            flag += "  MORE-ALLOCS"
+        name = f"{r['suite']}/{r['family']}/{r['name']}"
+        print(
+            f"{name:<38} {prev['ns_per_op']:>12.1f} {r['ns_per_op']:>12.1f} {delta:>+7.1f}%"
+            f" {prev['allocs_per_op']:>10.2f} {r['allocs_per_op']:>10.2f}{flag}"
+        )
+    return ok
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description="cgo call-overhead microbenchmarks for FatStd (C API and ctypes)")
+    parser.add_argument("--lib", type=Path, default=None, help="Path to shared library (overrides auto-discovery)")
+    parser.add_argument("--build-dir", type=Path, default=None, help="Build directory to search (default: <repo>/build)")
+    parser.add_argument(
+        "--bench-bin",
+        type=Path,
+        default=None,
+        help="Path to the fatstd_bench executable (default: search the build directory)",
+    )
+    parser.add_argument("--suite", choices=["all", "c", "ctypes"], default="all", help="Which suite(s) to run")
+    parser.add_argument("--family", default=None, help="Regex selecting export families (e.g. 'string|bytes')")
+    parser.add_argument("--filter", default=None, help="Regex selecting benchmarks by 'family/name'")
+    parser.add_argument("--benchtime-ms", type=int, default=200, help="Minimum measured time per benchmark")
+    parser.add_argument("--output", type=Path, default=None, help="Write machine-readable JSON results here")
+    parser.add_argument("--baseline", type=Path, default=None, help="Compare against a previous --output file")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=None,
+        help="With --baseline, exit non-zero if any ns/op regresses by more than this percentage",
+    )
+    args = parser.parse_args(argv)
+
+    repo_root = _find_repo_root(Path(__file__).resolve())
+    version = _project_version_from_cmakelists(repo_root / "CMakeLists.txt")
+    build_dir = args.build_dir if args.build_dir is not None else repo_root / "build"
+
+    if args.lib is not None:
+        lib_path = args.lib
+        if not lib_path.is_file():
+            _fatal(f"--lib path does not exist or is not a file: {lib_path}")
+    else:
+        lib_path = _discover_library_path(repo_root, build_dir)
+
+    family_filter = re.compile(args.family) if args.family else None
+    name_filter = re.compile(args.filter) if args.filter else None
+    results: list[dict] = []
+
+    if args.suite in ("all", "c"):
+        bench_bin = args.bench_bin or _discover_bench_binary(lib_path, build_dir)
+        if bench_bin is None:
+            message = "fatstd_bench not found; configure with -DFATSTD_BUILD_BENCH=ON (or use `make bench`)"
+            if args.suite == "c":
+                _fatal(message)
+            print(f"warning: {message}; skipping the C suite", file=sys.stderr)
+        else:
+            results.extend(_run_c_suite(bench_bin, family_filter, name_filter, args.benchtime_ms))
+
+    if args.suite in ("all", "ctypes"):
+        set_context(FatStdTestContext(lib=_load_library(lib_path), expected_version=version))
+        results.extend(_run_ctypes_suite(family_filter, name_filter, args.benchtime_ms * 1_000_000))
+
+    if args.output is not None:
+        doc = {
+            "schema": SCHEMA_VERSION,
+            "fatstd_version": version,
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "host": {
+                "system": platform.system(),
+                "machine": platform.machine(),
+                "python": platform.python_version(),
+            },
+            "library": str(lib_path),
+            "benchtime_ms": args.benchtime_ms,
+            "results": results,
+        }
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+        print(f"\nwrote {len(results)} results to {args.output}")
+
+    ok = all(r["status"] != "failed" for r in results)
+    if args.baseline is not None:
+        ok = _compare(args.baseline, results, args.max_regression) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,927 @@
+from __future__ import annotations
+
+import ctypes
+from contextlib import ExitStack
+from typing import Callable
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+from .harness import BenchCase, BenchSkip
+
+# The ctypes suite mirrors bench/fatstd_bench.c case for case, so the two
+# suites' numbers for the same family/name differ only by the cost of going
+# through ctypes.
+
+H = fat_string_handle_type()
+P = ctypes.POINTER
+FAT_OK = 0
+FAT_ERR_EOF = 3
+
+_PAYLOAD = (b"The quick brown fox jumps over the lazy dog 0123456789\n" * 1200)[:65536]
+_SCRATCH = ctypes.create_string_buffer(65536)
+# Whole lines of Latin, Cyrillic and CJK, padded with ASCII to 64 KiB.
+_MIXED_LINE = "Grüße aus Köln, привет 日本語 text 42\n".encode()
+_MIXED = (_MIXED_LINE * (65536 // len(_MIXED_LINE))).ljust(65536, b".")
+
+
+def _fn(name: str, restype, *argtypes):
+    return bind(name, argtypes=list(argtypes), restype=restype)
+
+
+class _Api:
+    """Lazily bound library functions, shared by every family."""
+
+    def __init__(self) -> None:
+        self.StringNewUTF8N = _fn("fat_StringNewUTF8N", H, ctypes.c_char_p, ctypes.c_size_t)
+        self.StringLenBytes = _fn("fat_StringLenBytes", ctypes.c_size_t, H)
+        self.StringCopyOut = _fn("fat_StringCopyOut", ctypes.c_size_t, H, ctypes.c_void_p, ctypes.c_size_t)
+        self.StringFree = _fn("fat_StringFree", None, H)
+        self.ErrorMessage = _fn("fat_ErrorMessage", H, H)
+        self.ErrorFree = _fn("fat_ErrorFree", None, H)
+        self.BytesNewN = _fn("fat_BytesNewN", H, ctypes.c_char_p, ctypes.c_size_t)
+        self.BytesFree = _fn("fat_BytesFree", None, H)
+        self.BufferNew = _fn("fat_BytesBufferNew", H)
+        self.BufferFree = _fn("fat_BytesBufferFree", None, H)
+        self.BufferBytes = _fn("fat_BytesBufferBytes", H, H)
+
+    def string(self, data: bytes) -> int:
+        return self.StringNewUTF8N(data, len(data))
+
+    def bytes(self, data: bytes) -> int:
+        return self.BytesNewN(data, len(data))
+
+    def to_py(self, s: int) -> str:
+        n = self.StringLenBytes(s)
+        buf = ctypes.create_string_buffer(n)
+        self.StringCopyOut(s, buf, n)
+        return buf.raw[:n].decode("utf-8", errors="replace")
+
+    def check(self, what: str, st: int, err: ctypes.c_size_t, *, ok: int = FAT_OK) -> None:
+        if st == ok:
+            return
+        msg = ""
+        if err.value:
+            s = self.ErrorMessage(err.value)
+            msg = ": " + self.to_py(s)
+            self.StringFree(s)
+            self.ErrorFree(err.value)
+        raise RuntimeError(f"{what}: status {st}{msg}")
+
+    def ignore(self, st: int, err: ctypes.c_size_t) -> None:
+        if err.value:
+            self.ErrorFree(err.value)
+
+
+Family = Callable[[_Api, ExitStack], list]
+
+
+def _string(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    contains = _fn("fat_StringContains", ctypes.c_bool, H, H)
+    to_lower = _fn("fat_StringToLower", H, H)
+    split = _fn("fat_StringSplit", H, H, H)
+    array_free = _fn("fat_StringArrayFree", None, H)
+    array_to_lower = _fn("fat_StringArrayToLower", H, H)
+    array_borrow = _fn("fat_StringArrayBorrow", ctypes.c_void_p, H, P(P(ctypes.c_size_t)), P(ctypes.c_size_t), P(H))
+    borrow_release = _fn("fat_BorrowRelease", None, H)
+    split_iter_new = _fn("fat_StringSplitIterNew", H, H, H, ctypes.c_int)
+    split_iter_next_batch = _fn(
+        "fat_SplitIterNextBatch", ctypes.c_size_t, H, P(ctypes.c_size_t), P(ctypes.c_size_t), ctypes.c_size_t
+    )
+    split_iter_free = _fn("fat_SplitIterFree", None, H)
+    cut = _fn("fat_StringCut", ctypes.c_bool, H, H, P(H), P(H))
+    replacer_new = _fn("fat_ReplacerNew", H, H)
+    replacer_free = _fn("fat_ReplacerFree", None, H)
+    replacer_replace = _fn("fat_ReplacerReplace", H, H, H)
+    rope_new = _fn("fat_StringRopeNew", H)
+    rope_free = _fn("fat_StringRopeFree", None, H)
+    rope_insert = _fn("fat_StringRopeInsertUTF8N", None, H, ctypes.c_size_t, ctypes.c_char_p, ctypes.c_size_t)
+    rope_delete = _fn("fat_StringRopeDelete", None, H, ctypes.c_size_t, ctypes.c_size_t)
+
+    s1k = api.string(_PAYLOAD[:1024])
+    needle = api.string(b"lazy cat")
+    sep = api.string(b"\n")
+    for h in (s1k, needle, sep):
+        stack.callback(api.StringFree, h)
+    lines = split(s1k, sep)
+    stack.callback(array_free, lines)
+    pairs, bar = api.string(b"fox|cat|dog|wolf|lazy|busy|\n|\r\n"), api.string(b"|")
+    oldnew = split(pairs, bar)
+    replacer = replacer_new(oldnew)
+    stack.callback(replacer_free, replacer)
+    array_free(oldnew)
+    api.StringFree(pairs)
+    api.StringFree(bar)
+    rope = rope_new()
+    stack.callback(rope_free, rope)
+    rope_insert(rope, 0, _PAYLOAD, len(_PAYLOAD))
+    small = _PAYLOAD[:32]
+
+    def new_free_32(n: int) -> None:
+        for _ in range(n):
+            api.StringFree(api.StringNewUTF8N(small, 32))
+
+    def length(n: int) -> None:
+        for _ in range(n):
+            api.StringLenBytes(s1k)
+
+    def copy_out_1k(n: int) -> None:
+        for _ in range(n):
+            api.StringCopyOut(s1k, _SCRATCH, 1024)
+
+    def contains_1k(n: int) -> None:
+        for _ in range(n):
+            contains(s1k, needle)
+
+    def to_lower_1k(n: int) -> None:
+        for _ in range(n):
+            api.StringFree(to_lower(s1k))
+
+    def split_lines_1k(n: int) -> None:
+        for _ in range(n):
+            array_free(split(s1k, sep))
+
+    def split_borrow_1k(n: int) -> None:
+        offsets, count, token = P(ctypes.c_size_t)(), ctypes.c_size_t(), H()
+        for _ in range(n):
+            arr = split(s1k, sep)
+            array_borrow(arr, ctypes.byref(offsets), ctypes.byref(count), ctypes.byref(token))
+            borrow_release(token.value)
+            array_free(arr)
+
+    def split_iter_1k(n: int) -> None:
+        offsets, lens = (ctypes.c_size_t * 32)(), (ctypes.c_size_t * 32)()
+        for _ in range(n):
+            it = split_iter_new(s1k, sep, -1)
+            while split_iter_next_batch(it, offsets, lens, 32) == 32:
+                pass
+            split_iter_free(it)
+
+    def cut_lines_1k(n: int) -> None:
+        line, after = H(), H()
+        for _ in range(n):
+            rest, more = s1k, True
+            while more:
+                more = cut(rest, sep, ctypes.byref(line), ctypes.byref(after))
+                api.StringFree(line.value)
+                if rest != s1k:
+                    api.StringFree(rest)
+                rest = after.value
+            api.StringFree(rest)
+
+    def replacer_1k(n: int) -> None:
+        for _ in range(n):
+            api.StringFree(replacer_replace(replacer, s1k))
+
+    def rope_edit_64k(n: int) -> None:
+        for i in range(n):
+            off = (i * 7919) % 65536
+            rope_insert(rope, off, b"{{name}}", 8)
+            rope_delete(rope, off, 8)
+
+    def array_to_lower_1k(n: int) -> None:
+        for _ in range(n):
+            array_free(array_to_lower(lines))
+
+    return [
+        BenchCase("string", "new_free_32", 32, new_free_32),
+        BenchCase("string", "len", 0, length),
+        BenchCase("string", "copy_out_1k", 1024, copy_out_1k),
+        BenchCase("string", "contains_1k", 1024, contains_1k),
+        BenchCase("string", "to_lower_1k", 1024, to_lower_1k),
+        BenchCase("string", "split_lines_1k", 1024, split_lines_1k),
+        BenchCase("string", "split_borrow_1k", 1024, split_borrow_1k),
+        BenchCase("string", "split_iter_1k", 1024, split_iter_1k),
+        BenchCase("string", "cut_lines_1k", 1024, cut_lines_1k),
+        BenchCase("string", "replacer_1k", 1024, replacer_1k),
+        BenchCase("string", "rope_edit_64k", 0, rope_edit_64k),
+        BenchCase("string", "array_to_lower_1k", 1024, array_to_lower_1k),
+    ]
+
+
+def _bytes(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    copy_out = _fn("fat_BytesCopyOut", ctypes.c_size_t, H, ctypes.c_void_p, ctypes.c_size_t)
+    borrow = _fn("fat_BytesBorrow", ctypes.c_void_p, H, P(ctypes.c_size_t), P(H))
+    borrow_release = _fn("fat_BorrowRelease", None, H)
+    index = _fn("fat_BytesIndex", ctypes.c_int64, H, H)
+    fields = _fn("fat_StringFields", H, H)
+    array_free = _fn("fat_StringArrayFree", None, H)
+    matcher_new = _fn("fat_MatcherNew", ctypes.c_int, H, P(H), P(H))
+    matcher_count = _fn("fat_MatcherCountBytes", ctypes.c_size_t, H, H)
+    matcher_free = _fn("fat_MatcherFree", None, H)
+    is_valid_utf8 = _fn("fat_BytesIsValidUTF8", ctypes.c_bool, H)
+    to_lower = _fn("fat_BytesToLower", H, H)
+
+    b64k = api.bytes(_PAYLOAD)
+    needle = api.bytes(b"lazy cat")
+    mixed = api.bytes(_MIXED)
+    stack.callback(api.BytesFree, b64k)
+    stack.callback(api.BytesFree, needle)
+    stack.callback(api.BytesFree, mixed)
+    words = api.string(b"fox dog lazy cat quick 42 jumps")
+    patterns = fields(words)
+    api.StringFree(words)
+    matcher, err = H(), H()
+    st = matcher_new(patterns, ctypes.byref(matcher), ctypes.byref(err))
+    array_free(patterns)
+    api.check("fat_MatcherNew", st, err)
+    stack.callback(matcher_free, matcher.value)
+    p1k = _PAYLOAD[:1024]
+
+    def new_free_1k(n: int) -> None:
+        for _ in range(n):
+            api.BytesFree(api.BytesNewN(p1k, 1024))
+
+    def copy_out_64k(n: int) -> None:
+        for _ in range(n):
+            copy_out(b64k, _SCRATCH, 65536)
+
+    def borrow_64k(n: int) -> None:
+        length, token = ctypes.c_size_t(), H()
+        for _ in range(n):
+            borrow(b64k, ctypes.byref(length), ctypes.byref(token))
+            borrow_release(token.value)
+
+    def index_miss_64k(n: int) -> None:
+        for _ in range(n):
+            index(b64k, needle)
+
+    def matcher_count_64k(n: int) -> None:
+        for _ in range(n):
+            matcher_count(matcher.value, b64k)
+
+    def is_valid_utf8_ascii_64k(n: int) -> None:
+        for _ in range(n):
+            is_valid_utf8(b64k)
+
+    def is_valid_utf8_mixed_64k(n: int) -> None:
+        for _ in range(n):
+            is_valid_utf8(mixed)
+
+    def to_lower_64k(n: int) -> None:
+        for _ in range(n):
+            api.BytesFree(to_lower(b64k))
+
+    return [
+        BenchCase("bytes", "new_free_1k", 1024, new_free_1k),
+        BenchCase("bytes", "copy_out_64k", 65536, copy_out_64k),
+        BenchCase("bytes", "borrow_64k", 65536, borrow_64k),
+        BenchCase("bytes", "index_miss_64k", 65536, index_miss_64k),
+        BenchCase("bytes", "matcher_count_64k", 65536, matcher_count_64k),
+        BenchCase("bytes", "is_valid_utf8_ascii_64k", 65536, is_valid_utf8_ascii_64k),
+        BenchCase("bytes", "is_valid_utf8_mixed_64k", 65536, is_valid_utf8_mixed_64k),
+        BenchCase("bytes", "to_lower_64k", 65536, to_lower_64k),
+    ]
+
+
+def _buffer(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    grow = _fn("fat_BytesBufferGrow", None, H, ctypes.c_size_t)
+    reset = _fn("fat_BytesBufferReset", None, H)
+    write = _fn("fat_BytesBufferWrite", ctypes.c_size_t, H, ctypes.c_char_p, ctypes.c_size_t)
+    read = _fn("fat_BytesBufferRead", ctypes.c_size_t, H, ctypes.c_void_p, ctypes.c_size_t, P(ctypes.c_bool))
+    reserve = _fn("fat_BytesBufferReserve", ctypes.c_void_p, H, ctypes.c_size_t)
+    commit = _fn("fat_BytesBufferCommit", None, H, ctypes.c_size_t)
+    peek = _fn("fat_BytesBufferPeek", ctypes.c_void_p, H, P(ctypes.c_size_t))
+    consume = _fn("fat_BytesBufferConsume", None, H, ctypes.c_size_t)
+    acquire = _fn("fat_BytesBufferAcquire", H, ctypes.c_size_t)
+    release = _fn("fat_BytesBufferRelease", None, H)
+    ring_new = _fn("fat_BytesRingNew", H, ctypes.c_size_t, ctypes.c_bool)
+    ring_write = _fn("fat_BytesRingWrite", ctypes.c_size_t, H, ctypes.c_char_p, ctypes.c_size_t)
+    ring_read = _fn("fat_BytesRingRead", ctypes.c_size_t, H, ctypes.c_void_p, ctypes.c_size_t, P(ctypes.c_bool))
+
+    buf = api.BufferNew()
+    stack.callback(api.BufferFree, buf)
+    grow(buf, 65536)
+    ring = ring_new(65536, False)
+    stack.callback(_fn("fat_BytesRingFree", None, H), ring)
+    p64, p1k = _PAYLOAD[:64], _PAYLOAD[:1024]
+
+    def write_64(n: int) -> None:
+        for i in range(n):
+            if i & 1023 == 0:
+                reset(buf)
+            write(buf, p64, 64)
+
+    def write_read(size: int) -> Callable[[int], None]:
+        payload = _PAYLOAD[:size]
+
+        def run(n: int) -> None:
+            eof = ctypes.c_bool()
+            reset(buf)
+            for _ in range(n):
+                write(buf, payload, size)
+                read(buf, _SCRATCH, size, ctypes.byref(eof))
+
+        return run
+
+    def reserve_peek(size: int) -> Callable[[int], None]:
+        payload = _PAYLOAD[:size]
+
+        def run(n: int) -> None:
+            length = ctypes.c_size_t()
+            reset(buf)
+            for _ in range(n):
+                ctypes.memmove(reserve(buf, size), payload, size)
+                commit(buf, size)
+                peek(buf, ctypes.byref(length))
+                consume(buf, length.value)
+
+        return run
+
+    def ring_write_read(size: int) -> Callable[[int], None]:
+        payload = _PAYLOAD[:size]
+
+        def run(n: int) -> None:
+            eof = ctypes.c_bool()
+            for _ in range(n):
+                ring_write(ring, payload, size)
+                ring_read(ring, _SCRATCH, size, ctypes.byref(eof))
+
+        return run
+
+    def bytes_1k(n: int) -> None:
+        reset(buf)
+        write(buf, p1k, 1024)
+        for _ in range(n):
+            api.BytesFree(api.BufferBytes(buf))
+
+    def new_free_64k(n: int) -> None:
+        for _ in range(n):
+            b = api.BufferNew()
+            grow(b, 65536)
+            write(b, p1k, 1024)
+            api.BufferFree(b)
+
+    def acquire_release_64k(n: int) -> None:
+        for _ in range(n):
+            b = acquire(65536)
+            write(b, p1k, 1024)
+            release(b)
+
+    return [
+        BenchCase("buffer", "write_64", 64, write_64),
+        BenchCase("buffer", "write_read_1k", 1024, write_read(1024)),
+        BenchCase("buffer", "write_read_64k", 65536, write_read(65536)),
+        BenchCase("buffer", "reserve_peek_1k", 1024, reserve_peek(1024)),
+        BenchCase("buffer", "reserve_peek_64k", 65536, reserve_peek(65536)),
+        BenchCase("buffer", "ring_write_read_1k", 1024, ring_write_read(1024)),
+        BenchCase("buffer", "ring_write_read_64k", 65536, ring_write_read(65536)),
+        BenchCase("buffer", "bytes_1k", 1024, bytes_1k),
+        BenchCase("buffer", "new_free_64k", 0, new_free_64k),
+        BenchCase("buffer", "acquire_release_64k", 0, acquire_release_64k),
+    ]
+
+
+def _conv(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    format_int = _fn("fat_ConvFormatInt", H, ctypes.c_int64, ctypes.c_int)
+    format_float = _fn("fat_ConvFormatFloat", H, ctypes.c_double, ctypes.c_uint8, ctypes.c_int, ctypes.c_int)
+    parse_int = _fn("fat_ConvParseInt", ctypes.c_int, H, ctypes.c_int, ctypes.c_int, P(ctypes.c_int64), P(H))
+    parse_float = _fn("fat_ConvParseFloat", ctypes.c_int, H, ctypes.c_int, P(ctypes.c_double), P(H))
+    format_int_into = _fn(
+        "fat_ConvFormatIntInto", ctypes.c_size_t, ctypes.c_int64, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t
+    )
+    format_float_into = _fn(
+        "fat_ConvFormatFloatInto",
+        ctypes.c_size_t,
+        ctypes.c_double,
+        ctypes.c_uint8,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_void_p,
+        ctypes.c_size_t,
+    )
+    write_int = _fn("fat_ConvWriteInt", ctypes.c_size_t, H, ctypes.c_int64, ctypes.c_int)
+    buffer_new = _fn("fat_BytesBufferNew", H)
+    buffer_grow = _fn("fat_BytesBufferGrow", None, H, ctypes.c_size_t)
+    buffer_reset = _fn("fat_BytesBufferReset", None, H)
+    buffer_free = _fn("fat_BytesBufferFree", None, H)
+    split = _fn("fat_StringSplit", H, H, H)
+    array_free = _fn("fat_StringArrayFree", None, H)
+    parse_int_array = _fn(
+        "fat_ConvParseIntArray",
+        ctypes.c_size_t,
+        H,
+        ctypes.c_int,
+        ctypes.c_int,
+        P(ctypes.c_int64),
+        P(ctypes.c_uint8),
+        ctypes.c_size_t,
+    )
+    parse_int_delimited = _fn(
+        "fat_ConvParseIntDelimited",
+        ctypes.c_size_t,
+        H,
+        ctypes.c_uint8,
+        ctypes.c_int,
+        ctypes.c_int,
+        P(ctypes.c_int64),
+        P(ctypes.c_uint8),
+        ctypes.c_size_t,
+        P(ctypes.c_size_t),
+    )
+    parse_float_array = _fn(
+        "fat_ConvParseFloatArray",
+        ctypes.c_size_t,
+        H,
+        ctypes.c_int,
+        P(ctypes.c_double),
+        P(ctypes.c_uint8),
+        ctypes.c_size_t,
+    )
+    write_float_array = _fn(
+        "fat_ConvWriteFloatArray",
+        ctypes.c_size_t,
+        H,
+        P(ctypes.c_double),
+        ctypes.c_size_t,
+        ctypes.c_uint8,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_uint8,
+    )
+
+    int_s = api.string(b"-9223372036854775807")
+    float_s = api.string(b"3.14159265358979")
+    stack.callback(api.StringFree, int_s)
+    stack.callback(api.StringFree, float_s)
+    # One integer per line, as in a numeric CSV column.
+    column_text = b"\n".join(b"%d" % (i * 7919 - 4000000) for i in range(1024))
+    column = api.bytes(column_text)
+    stack.callback(api.BytesFree, column)
+    text, nl = api.string(column_text), api.string(b"\n")
+    cells = split(text, nl)
+    stack.callback(array_free, cells)
+    api.StringFree(text)
+    # Sensor readings with a few decimals, as in a telemetry log.
+    doubles = (ctypes.c_double * 1024)(*((i * 7919 % 100000 - 50000) / 100.0 for i in range(1024)))
+    text = api.string(b"\n".join(b"%.2f" % v for v in doubles))
+    readings = split(text, nl)
+    stack.callback(array_free, readings)
+    api.StringFree(text)
+    api.StringFree(nl)
+    values, status = (ctypes.c_int64 * 1024)(), (ctypes.c_uint8 * 1024)()
+    buf = buffer_new()
+    stack.callback(buffer_free, buf)
+    buffer_grow(buf, 65536)
+
+    def format_int_(n: int) -> None:
+        for i in range(n):
+            api.StringFree(format_int(i, 10))
+
+    def format_float_(n: int) -> None:
+        for i in range(n):
+            api.StringFree(format_float(i * 0.1, ord("g"), -1, 64))
+
+    def format_int_into_(n: int) -> None:
+        for i in range(n):
+            format_int_into(i, 10, _SCRATCH, 24)
+
+    def format_float_into_(n: int) -> None:
+        for i in range(n):
+            format_float_into(i * 0.1, ord("g"), -1, 64, _SCRATCH, 32)
+
+    def write_int_(n: int) -> None:
+        for i in range(n):
+            if i & 4095 == 0:
+                buffer_reset(buf)
+            write_int(buf, i, 10)
+
+    def parse_int_(n: int) -> None:
+        v, err = ctypes.c_int64(), H()
+        for _ in range(n):
+            api.check("fat_ConvParseInt", parse_int(int_s, 10, 64, ctypes.byref(v), ctypes.byref(err)), err)
+
+    def parse_float_(n: int) -> None:
+        v, err = ctypes.c_double(), H()
+        for _ in range(n):
+            api.check("fat_ConvParseFloat", parse_float(float_s, 64, ctypes.byref(v), ctypes.byref(err)), err)
+
+    def parse_int_array_1024(n: int) -> None:
+        for _ in range(n):
+            parse_int_array(cells, 10, 64, values, status, 1024)
+
+    def parse_int_delimited_1024(n: int) -> None:
+        count = ctypes.c_size_t()
+        for _ in range(n):
+            parse_int_delimited(column, ord("\n"), 10, 64, values, status, 1024, ctypes.byref(count))
+
+    def parse_float_array_1024(n: int) -> None:
+        for _ in range(n):
+            parse_float_array(readings, 64, doubles, status, 1024)
+
+    def write_float_array_1024(n: int) -> None:
+        for _ in range(n):
+            buffer_reset(buf)
+            write_float_array(buf, doubles, 1024, ord("g"), -1, 64, ord("\n"))
+
+    return [
+        BenchCase("conv", "format_int", 0, format_int_),
+        BenchCase("conv", "format_float", 0, format_float_),
+        BenchCase("conv", "format_int_into", 0, format_int_into_),
+        BenchCase("conv", "format_float_into", 0, format_float_into_),
+        BenchCase("conv", "write_int", 0, write_int_),
+        BenchCase("conv", "parse_int", 0, parse_int_),
+        BenchCase("conv", "parse_float", 0, parse_float_),
+        BenchCase("conv", "parse_int_array_1024", 0, parse_int_array_1024),
+        BenchCase("conv", "parse_int_delimited_1024", 0, parse_int_delimited_1024),
+        BenchCase("conv", "parse_float_array_1024", 0, parse_float_array_1024),
+        BenchCase("conv", "write_float_array_1024", 0, write_float_array_1024),
+    ]
+
+
+def _json(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    valid = _fn("fat_JsonValid", ctypes.c_bool, H)
+    unmarshal = _fn("fat_JsonUnmarshal", ctypes.c_int, H, P(H), P(H))
+    value_free = _fn("fat_JsonValueFree", None, H)
+    compact = _fn("fat_JsonCompact", ctypes.c_int, H, P(H), P(H))
+
+    items = ", ".join(
+        f'{{"id": {i}, "name": "item-{i}", "tags": ["a", "b"], "score": {i * 3}.5}}' for i in range(16)
+    )
+    doc = api.bytes(f"[{items}]".encode())
+    stack.callback(api.BytesFree, doc)
+
+    def valid_(n: int) -> None:
+        for _ in range(n):
+            valid(doc)
+
+    def unmarshal_(n: int) -> None:
+        out, err = H(), H()
+        for _ in range(n):
+            api.check("fat_JsonUnmarshal", unmarshal(doc, ctypes.byref(out), ctypes.byref(err)), err)
+            value_free(out.value)
+
+    def compact_(n: int) -> None:
+        out, err = H(), H()
+        for _ in range(n):
+            api.check("fat_JsonCompact", compact(doc, ctypes.byref(out), ctypes.byref(err)), err)
+            api.BytesFree(out.value)
+
+    return [
+        BenchCase("json", "valid", 0, valid_),
+        BenchCase("json", "unmarshal", 0, unmarshal_),
+        BenchCase("json", "compact", 0, compact_),
+    ]
+
+
+def _xml(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    dec_new = _fn("fat_XmlDecoderNewBytes", H, H)
+    dec_free = _fn("fat_XmlDecoderFree", ctypes.c_int, H, P(H))
+    token = _fn("fat_XmlDecoderToken", ctypes.c_int, H, P(H), P(H))
+    token_free = _fn("fat_XmlTokenFree", None, H)
+
+    items = "".join(f'<item id="{i}" kind="k{i % 4}">value {i} &amp; more</item>' for i in range(16))
+    doc = api.bytes(f'<?xml version="1.0"?><items>{items}</items>'.encode())
+    stack.callback(api.BytesFree, doc)
+
+    def decode_tokens(n: int) -> None:
+        tok, err = H(), H()
+        for _ in range(n):
+            dec = dec_new(doc)
+            while True:
+                st = token(dec, ctypes.byref(tok), ctypes.byref(err))
+                if st != FAT_OK:
+                    break
+                token_free(tok.value)
+            api.check("fat_XmlDecoderToken", st, err, ok=FAT_ERR_EOF)
+            api.check("fat_XmlDecoderFree", dec_free(dec, ctypes.byref(err)), err)
+
+    return [BenchCase("xml", "decode_tokens", 0, decode_tokens)]
+
+
+def _csv(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    reader_new = _fn("fat_CsvReaderNewBytes", H, H)
+    reader_free = _fn("fat_CsvReaderFree", None, H)
+    read = _fn("fat_CsvReaderRead", ctypes.c_int, H, P(H), P(ctypes.c_bool), P(H))
+    array_free = _fn("fat_StringArrayFree", None, H)
+    writer_new = _fn("fat_CsvWriterNewToBytesBuffer", H, H)
+    write_record = _fn("fat_CsvWriterWriteRecord", ctypes.c_int, H, P(H), ctypes.c_size_t, P(H))
+    writer_flush = _fn("fat_CsvWriterFlush", None, H)
+    writer_free = _fn("fat_CsvWriterFree", None, H)
+
+    rows = "".join(f'{i},item-{i},"quoted, with comma",{i * 7}.25\n' for i in range(32))
+    doc = api.bytes(("id,name,comment,score\n" + rows).encode())
+    stack.callback(api.BytesFree, doc)
+    fields = (H * 4)(*(api.string(f) for f in (b"42", b"item-42", b"quoted, with comma", b"294.25")))
+    for h in fields:
+        stack.callback(api.StringFree, h)
+
+    def read_all(n: int) -> None:
+        rec, eof, err = H(), ctypes.c_bool(), H()
+        for _ in range(n):
+            r = reader_new(doc)
+            while True:
+                st = read(r, ctypes.byref(rec), ctypes.byref(eof), ctypes.byref(err))
+                if st != FAT_OK:
+                    break
+                array_free(rec.value)
+            reader_free(r)
+            api.check("fat_CsvReaderRead", st, err, ok=FAT_ERR_EOF)
+
+    def write_record_(n: int) -> None:
+        err = H()
+        dst = api.BufferNew()
+        w = writer_new(dst)
+        try:
+            for _ in range(n):
+                api.check("fat_CsvWriterWriteRecord", write_record(w, fields, 4, ctypes.byref(err)), err)
+            writer_flush(w)
+        finally:
+            writer_free(w)
+            api.BufferFree(dst)
+
+    return [
+        BenchCase("csv", "read_all", 0, read_all),
+        BenchCase("csv", "write_record", 0, write_record_),
+    ]
+
+
+def _base64(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    enc_new = _fn("fat_Base64EncodingNewUTF8", ctypes.c_int, ctypes.c_char_p, P(H), P(H))
+    enc_free = _fn("fat_Base64EncodingFree", None, H)
+    encode = _fn("fat_Base64EncodeToString", H, H, H)
+    decode = _fn("fat_Base64DecodeString", ctypes.c_int, H, H, P(H), P(H))
+
+    enc, err = H(), H()
+    api.check(
+        "fat_Base64EncodingNewUTF8",
+        enc_new(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/", ctypes.byref(enc), ctypes.byref(err)),
+        err,
+    )
+    stack.callback(enc_free, enc.value)
+    plain = api.bytes(_PAYLOAD[:1024])
+    stack.callback(api.BytesFree, plain)
+    encoded = encode(enc.value, plain)
+    stack.callback(api.StringFree, encoded)
+
+    def encode_1k(n: int) -> None:
+        for _ in range(n):
+            api.StringFree(encode(enc.value, plain))
+
+    def decode_1k(n: int) -> None:
+        out, err = H(), H()
+        for _ in range(n):
+            api.check("fat_Base64DecodeString", decode(enc.value, encoded, ctypes.byref(out), ctypes.byref(err)), err)
+            api.BytesFree(out.value)
+
+    return [
+        BenchCase("base64", "encode_1k", 1024, encode_1k),
+        BenchCase("base64", "decode_1k", 1024, decode_1k),
+    ]
+
+
+def _compress(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    def codec(name: str):
+        return _fn(name, ctypes.c_int, H, P(H), P(H))
+
+    def run_codec(fn, src: int, what: str) -> Callable[[int], None]:
+        def run(n: int) -> None:
+            out, err = H(), H()
+            for _ in range(n):
+                api.check(what, fn(src, ctypes.byref(out), ctypes.byref(err)), err)
+                api.BytesFree(out.value)
+
+        return run
+
+    gzip_c, gzip_d = codec("fat_GzipCompress"), codec("fat_GzipDecompress")
+    zlib_c, zlib_d = codec("fat_ZlibCompress"), codec("fat_ZlibDecompress")
+
+    plain = api.bytes(_PAYLOAD[:4096])
+    stack.callback(api.BytesFree, plain)
+    packed = {}
+    for key, fn in (("gzip", gzip_c), ("zlib", zlib_c)):
+        out, err = H(), H()
+        api.check(key, fn(plain, ctypes.byref(out), ctypes.byref(err)), err)
+        stack.callback(api.BytesFree, out.value)
+        packed[key] = out.value
+
+    return [
+        BenchCase("compress", "gzip_4k", 4096, run_codec(gzip_c, plain, "fat_GzipCompress")),
+        BenchCase("compress", "gunzip_4k", 4096, run_codec(gzip_d, packed["gzip"], "fat_GzipDecompress")),
+        BenchCase("compress", "zlib_4k", 4096, run_codec(zlib_c, plain, "fat_ZlibCompress")),
+        BenchCase("compress", "unzlib_4k", 4096, run_codec(zlib_d, packed["zlib"], "fat_ZlibDecompress")),
+    ]
+
+
+def _archive(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    zip_writer_new = _fn("fat_ZipWriterNewToBytesBuffer", ctypes.c_int, H, P(H), P(H))
+    zip_writer_add = _fn("fat_ZipWriterAddBytes", ctypes.c_int, H, H, H, P(H))
+    zip_writer_close = _fn("fat_ZipWriterClose", ctypes.c_int, H, P(H))
+    zip_reader_new = _fn("fat_ZipReaderNewBytes", ctypes.c_int, H, P(H), P(H))
+    zip_reader_free = _fn("fat_ZipReaderFree", ctypes.c_int, H, P(H))
+    zip_file_at = _fn("fat_ZipReaderFileByIndex", H, H, ctypes.c_size_t)
+    zip_file_free = _fn("fat_ZipFileFree", None, H)
+    zip_file_open = _fn("fat_ZipFileOpen", ctypes.c_int, H, P(H), P(H))
+    zip_file_read = _fn(
+        "fat_ZipFileReaderRead", ctypes.c_int, H, ctypes.c_void_p, ctypes.c_size_t, P(ctypes.c_size_t), P(ctypes.c_bool), P(H)
+    )
+    zip_file_close = _fn("fat_ZipFileReaderClose", ctypes.c_int, H, P(H))
+    tar_writer_new = _fn("fat_TarWriterNewToBytesBuffer", ctypes.c_int, H, P(H), P(H))
+    tar_writer_add = _fn("fat_TarWriterAddBytes", ctypes.c_int, H, H, H, P(H))
+    tar_writer_close = _fn("fat_TarWriterClose", ctypes.c_int, H, P(H))
+    tar_reader_new = _fn("fat_TarReaderNewBytes", ctypes.c_int, H, P(H), P(H))
+    tar_reader_free = _fn("fat_TarReaderFree", ctypes.c_int, H, P(H))
+    tar_next = _fn("fat_TarReaderNext", ctypes.c_int, H, P(H), P(ctypes.c_bool), P(H))
+    tar_read = _fn(
+        "fat_TarReaderRead", ctypes.c_int, H, ctypes.c_void_p, ctypes.c_size_t, P(ctypes.c_size_t), P(ctypes.c_bool), P(H)
+    )
+    tar_header_free = _fn("fat_TarHeaderFree", None, H)
+
+    name = api.string(b"payload.txt")
+    data = api.bytes(_PAYLOAD[:4096])
+    stack.callback(api.StringFree, name)
+    stack.callback(api.BytesFree, data)
+
+    def write_archive(new, add, close, what: str) -> int:
+        w, err, ignored = H(), H(), H()
+        dst = api.BufferNew()
+        try:
+            api.check(what, new(dst, ctypes.byref(w), ctypes.byref(err)), err)
+            st = add(w.value, name, data, ctypes.byref(err))
+            if st != FAT_OK:
+                api.ignore(close(w.value, ctypes.byref(ignored)), ignored)
+                api.check(what, st, err)
+            api.check(what, close(w.value, ctypes.byref(err)), err)
+            return api.BufferBytes(dst)
+        finally:
+            api.BufferFree(dst)
+
+    zip_blob = write_archive(zip_writer_new, zip_writer_add, zip_writer_close, "zip write")
+    tar_blob = write_archive(tar_writer_new, tar_writer_add, tar_writer_close, "tar write")
+    stack.callback(api.BytesFree, zip_blob)
+    stack.callback(api.BytesFree, tar_blob)
+
+    def zip_write_4k(n: int) -> None:
+        for _ in range(n):
+            api.BytesFree(write_archive(zip_writer_new, zip_writer_add, zip_writer_close, "zip write"))
+
+    def tar_write_4k(n: int) -> None:
+        for _ in range(n):
+            api.BytesFree(write_archive(tar_writer_new, tar_writer_add, tar_writer_close, "tar write"))
+
+    def zip_read_4k(n: int) -> None:
+        r, fr, got, eof, err, ignored = H(), H(), ctypes.c_size_t(), ctypes.c_bool(), H(), H()
+        for _ in range(n):
+            api.check("fat_ZipReaderNewBytes", zip_reader_new(zip_blob, ctypes.byref(r), ctypes.byref(err)), err)
+            f = zip_file_at(r.value, 0)
+            st = zip_file_open(f, ctypes.byref(fr), ctypes.byref(err))
+            opened = st == FAT_OK
+            while st == FAT_OK:
+                st = zip_file_read(fr.value, _SCRATCH, 65536, ctypes.byref(got), ctypes.byref(eof), ctypes.byref(err))
+            if opened:
+                api.ignore(zip_file_close(fr.value, ctypes.byref(ignored)), ignored)
+            zip_file_free(f)
+            api.ignore(zip_reader_free(r.value, ctypes.byref(ignored)), ignored)
+            api.check("zip read", st, err, ok=FAT_ERR_EOF)
+
+    def tar_read_4k(n: int) -> None:
+        r, hdr, got, eof, err, ignored = H(), H(), ctypes.c_size_t(), ctypes.c_bool(), H(), H()
+        for _ in range(n):
+            api.check("fat_TarReaderNewBytes", tar_reader_new(tar_blob, ctypes.byref(r), ctypes.byref(err)), err)
+            st = tar_next(r.value, ctypes.byref(hdr), ctypes.byref(eof), ctypes.byref(err))
+            if st == FAT_OK:
+                tar_header_free(hdr.value)
+            while st == FAT_OK:
+                st = tar_read(r.value, _SCRATCH, 65536, ctypes.byref(got), ctypes.byref(eof), ctypes.byref(err))
+            api.ignore(tar_reader_free(r.value, ctypes.byref(ignored)), ignored)
+            api.check("tar read", st, err, ok=FAT_ERR_EOF)
+
+    return [
+        BenchCase("archive", "zip_write_4k", 4096, zip_write_4k),
+        BenchCase("archive", "zip_read_4k", 4096, zip_read_4k),
+        BenchCase("archive", "tar_write_4k", 4096, tar_write_4k),
+        BenchCase("archive", "tar_read_4k", 4096, tar_read_4k),
+    ]
+
+
+def _socket(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    listen = _fn("fat_TcpListenerListenUTF8", ctypes.c_int, ctypes.c_char_p, P(H), P(H))
+    listener_addr = _fn("fat_TcpListenerAddr", H, H)
+    listener_close = _fn("fat_TcpListenerClose", ctypes.c_int, H, P(H))
+    accept = _fn("fat_TcpListenerAccept", ctypes.c_int, H, P(H), P(H))
+    dial = _fn("fat_TcpDialUTF8", ctypes.c_int, ctypes.c_char_p, P(H), P(H))
+    tcp_read = _fn(
+        "fat_TcpConnRead", ctypes.c_int, H, ctypes.c_void_p, ctypes.c_size_t, P(ctypes.c_size_t), P(ctypes.c_bool), P(H)
+    )
+    tcp_write = _fn("fat_TcpConnWrite", ctypes.c_int, H, ctypes.c_char_p, ctypes.c_size_t, P(ctypes.c_size_t), P(H))
+    tcp_close = _fn("fat_TcpConnClose", ctypes.c_int, H, P(H))
+    udp_listen = _fn("fat_UdpListenUTF8", ctypes.c_int, ctypes.c_char_p, P(H), P(H))
+    udp_dial = _fn("fat_UdpDialUTF8", ctypes.c_int, ctypes.c_char_p, P(H), P(H))
+    udp_local_addr = _fn("fat_UdpConnLocalAddr", H, H)
+    udp_write = _fn("fat_UdpConnWrite", ctypes.c_int, H, ctypes.c_char_p, ctypes.c_size_t, P(ctypes.c_size_t), P(H))
+    udp_read_from = _fn(
+        "fat_UdpConnReadFrom", ctypes.c_int, H, ctypes.c_void_p, ctypes.c_size_t, P(ctypes.c_size_t), P(H), P(H)
+    )
+    udp_close = _fn("fat_UdpConnClose", ctypes.c_int, H, P(H))
+
+    def closer(fn, h: int) -> None:
+        ignored = H()
+        api.ignore(fn(h, ctypes.byref(ignored)), ignored)
+
+    def addr_of(s: int) -> bytes:
+        try:
+            return api.to_py(s).encode()
+        finally:
+            api.StringFree(s)
+
+    listener, client, server, err = H(), H(), H(), H()
+    api.check("fat_TcpListenerListenUTF8", listen(b"127.0.0.1:0", ctypes.byref(listener), ctypes.byref(err)), err)
+    stack.callback(closer, listener_close, listener.value)
+    # The kernel completes the handshake from the listen backlog, so dial then
+    # accept works on a single thread.
+    api.check("fat_TcpDialUTF8", dial(addr_of(listener_addr(listener.value)), ctypes.byref(client), ctypes.byref(err)), err)
+    stack.callback(closer, tcp_close, client.value)
+    api.check("fat_TcpListenerAccept", accept(listener.value, ctypes.byref(server), ctypes.byref(err)), err)
+    stack.callback(closer, tcp_close, server.value)
+
+    udp_server, udp_client = H(), H()
+    api.check("fat_UdpListenUTF8", udp_listen(b"127.0.0.1:0", ctypes.byref(udp_server), ctypes.byref(err)), err)
+    stack.callback(closer, udp_close, udp_server.value)
+    api.check("fat_UdpDialUTF8", udp_dial(addr_of(udp_local_addr(udp_server.value)), ctypes.byref(udp_client), ctypes.byref(err)), err)
+    stack.callback(closer, udp_close, udp_client.value)
+
+    p64 = _PAYLOAD[:64]
+
+    def transfer(src: int, dst: int) -> None:
+        done, eof, err = ctypes.c_size_t(), ctypes.c_bool(), H()
+        api.check("fat_TcpConnWrite", tcp_write(src, p64, 64, ctypes.byref(done), ctypes.byref(err)), err)
+        total = 0
+        while total < 64:
+            api.check(
+                "fat_TcpConnRead",
+                tcp_read(dst, _SCRATCH, 64 - total, ctypes.byref(done), ctypes.byref(eof), ctypes.byref(err)),
+                err,
+            )
+            total += done.value
+
+    def tcp_pingpong_64(n: int) -> None:
+        for _ in range(n):
+            transfer(client.value, server.value)
+            transfer(server.value, client.value)
+
+    def udp_datagram_64(n: int) -> None:
+        done, sender, err = ctypes.c_size_t(), H(), H()
+        for _ in range(n):
+            api.check("fat_UdpConnWrite", udp_write(udp_client.value, p64, 64, ctypes.byref(done), ctypes.byref(err)), err)
+            api.check(
+                "fat_UdpConnReadFrom",
+                udp_read_from(udp_server.value, _SCRATCH, 65536, ctypes.byref(done), ctypes.byref(sender), ctypes.byref(err)),
+                err,
+            )
+            api.StringFree(sender.value)
+
+    return [
+        BenchCase("socket", "tcp_pingpong_64", 128, tcp_pingpong_64),
+        BenchCase("socket", "udp_datagram_64", 64, udp_datagram_64),
+    ]
+
+
+_TMX = b"""<map version="1.10" tiledversion="1.10.2" orientation="orthogonal" renderorder="right-down"
+     width="4" height="4" tilewidth="8" tileheight="8" infinite="0">
+  <tileset firstgid="1" name="ts" tilewidth="8" tileheight="8" tilecount="4" columns="2">
+    <image source="tiles.png" width="16" height="16"/>
+  </tileset>
+  <layer id="1" name="ground" width="4" height="4">
+    <data encoding="csv">1,2,3,4,4,3,2,1,1,1,2,2,3,3,4,4</data>
+  </layer>
+</map>
+"""
+
+
+def _tiled(api: _Api, stack: ExitStack) -> list[BenchCase]:
+    load = _fn("fat_TiledMapLoadReaderBytesUTF8", ctypes.c_int, ctypes.c_char_p, H, P(H), P(H))
+    map_free = _fn("fat_TiledMapFree", None, H)
+
+    tmx = api.bytes(_TMX)
+    stack.callback(api.BytesFree, tmx)
+
+    def load_bytes(n: int) -> None:
+        m, err = H(), H()
+        for _ in range(n):
+            api.check("fat_TiledMapLoadReaderBytesUTF8", load(b".", tmx, ctypes.byref(m), ctypes.byref(err)), err)
+            map_free(m.value)
+
+    try:
+        load_bytes(1)
+    except RuntimeError as exc:
+        raise BenchSkip(str(exc)) from exc
+    return [BenchCase("tiled", "load_bytes", 0, load_bytes)]
+
+
+FAMILIES: dict[str, Family] = {
+    "string": _string,
+    "bytes": _bytes,
+    "buffer": _buffer,
+    "conv": _conv,
+    "json": _json,
+    "xml": _xml,
+    "csv": _csv,
+    "base64": _base64,
+    "compress": _compress,
+    "archive": _archive,
+    "socket": _socket,
+    "tiled": _tiled,
+}
+
+
+def new_api() -> _Api:
+    return _Api()
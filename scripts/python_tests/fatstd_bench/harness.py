@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import ctypes
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from fatstd_test_support import bind
+
+
+class BenchSkip(Exception):
+    """Raised by a family's setup when it cannot run in this build."""
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    family: str
+    name: str
+    bytes_per_op: int
+    run: Callable[[int], None]
+
+
+def _mem_stats_fn():
+    return bind(
+        "fat_GoMemStats",
+        argtypes=[ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64)],
+        restype=None,
+    )
+
+
+def measure(case: BenchCase, *, suite: str, benchtime_ns: int) -> dict:
+    """Runs case.run with a growing iteration count until one run lasts at
+    least benchtime_ns, and returns the last run as a result record.
+
+    allocs/op and B/op count Go heap allocations only; Python-side overhead
+    (argument marshalling, ctypes objects) shows up in ns/op alone.
+    """
+    mem_stats = _mem_stats_fn()
+    allocs0, bytes0 = ctypes.c_uint64(), ctypes.c_uint64()
+    allocs1, bytes1 = ctypes.c_uint64(), ctypes.c_uint64()
+
+    n = 1
+    while True:
+        mem_stats(ctypes.byref(allocs0), ctypes.byref(bytes0))
+        t0 = time.perf_counter_ns()
+        case.run(n)
+        elapsed = time.perf_counter_ns() - t0
+        mem_stats(ctypes.byref(allocs1), ctypes.byref(bytes1))
+        if elapsed >= benchtime_ns or n >= 1_000_000_000:
+            break
+        per_op = elapsed // n
+        nxt = n * 100 if per_op == 0 else benchtime_ns // per_op
+        nxt += nxt // 5
+        n = max(n + 1, min(nxt, n * 100))
+
+    ns_per_op = elapsed / n
+    mb_per_s = None
+    if case.bytes_per_op and ns_per_op > 0:
+        mb_per_s = case.bytes_per_op * 1e3 / ns_per_op
+    return result_record(
+        suite,
+        case.family,
+        case.name,
+        status="ok",
+        iterations=n,
+        ns_per_op=ns_per_op,
+        allocs_per_op=(allocs1.value - allocs0.value) / n,
+        bytes_per_op=(bytes1.value - bytes0.value) / n,
+        mb_per_s=mb_per_s,
+    )
+
+
+def result_record(
+    suite: str,
+    family: str,
+    name: str,
+    *,
+    status: str,
+    iterations: int = 0,
+    ns_per_op: float = 0.0,
+    allocs_per_op: float = 0.0,
+    bytes_per_op: float = 0.0,
+    mb_per_s: float | None = None,
+    error: str | None = None,
+) -> dict:
+    return {
+        "suite": suite,
+        "family": family,
+        "name": name,
+        "status": status,
+        "iterations": iterations,
+        "ns_per_op": round(ns_per_op, 3),
+        "allocs_per_op": round(allocs_per_op, 3),
+        "bytes_per_op": round(bytes_per_op, 3),
+        "mb_per_s": None if mb_per_s is None else round(mb_per_s, 3),
+        "error": error,
+    }
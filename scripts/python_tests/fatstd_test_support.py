@@ -35,3 +35,21 @@ def bind(name: str, *, argtypes: list, restype):
     fn.restype = restype
     return fn
 
+
+
+HANDLE_TRACK_MODES = {"off": 0, "counts": 1, "origins": 2}
+
+
+def set_handle_tracking(mode: str) -> None:
+    bind("fat_HandleSetTracking", argtypes=[ctypes.c_int], restype=None)(HANDLE_TRACK_MODES[mode])
+
+
+def dump_handle_stats() -> str:
+    fn = bind("fat_HandleStatsDump", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=ctypes.c_size_t)
+    needed = fn(None, 0)
+    while True:
+        buf = ctypes.create_string_buffer(needed + 1024)
+        n = fn(buf, len(buf))
+        if n < len(buf):
+            return buf.raw[:n].decode("utf-8", errors="replace")
+        needed = n
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import ctypes
+import threading
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestArena(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_ArenaNew = bind("fat_ArenaNew", argtypes=[], restype=fat_handle)
+        cls.fat_ArenaPush = bind("fat_ArenaPush", argtypes=[fat_handle], restype=None)
+        cls.fat_ArenaPop = bind("fat_ArenaPop", argtypes=[fat_handle], restype=None)
+        cls.fat_ArenaLen = bind("fat_ArenaLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_ArenaRelease = bind("fat_ArenaRelease", argtypes=[fat_handle], restype=None)
+        cls.fat_ArenaFree = bind("fat_ArenaFree", argtypes=[fat_handle], restype=None)
+
+        cls.fat_StringNewUTF8 = bind(
+            "fat_StringNewUTF8", argtypes=[ctypes.c_char_p], restype=fat_handle
+        )
+        cls.fat_StringSplit = bind(
+            "fat_StringSplit", argtypes=[fat_handle, fat_handle], restype=fat_handle
+        )
+        cls.fat_StringLenBytes = bind(
+            "fat_StringLenBytes", argtypes=[fat_handle], restype=ctypes.c_size_t
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesBufferNew = bind("fat_BytesBufferNew", argtypes=[], restype=fat_handle)
+
+    def test_release_frees_recorded_handles(self) -> None:
+        outside = self.fat_StringNewUTF8(b"outside")
+        arena = self.fat_ArenaNew()
+
+        self.fat_ArenaPush(arena)
+        s = self.fat_StringNewUTF8(b"a,b,c")
+        sep = self.fat_StringNewUTF8(b",")
+        parts = self.fat_StringSplit(s, sep)
+        buf = self.fat_BytesBufferNew()
+        self.fat_ArenaPop(arena)
+
+        self.assertEqual(self.fat_ArenaLen(arena), 4)
+        self.assertEqual(self.fat_StringLenBytes(s), 5)
+        self.assertNotIn(parts, (s, sep, buf))
+
+        self.fat_ArenaRelease(arena)
+        self.assertEqual(self.fat_ArenaLen(arena), 0)
+        self.assertEqual(self.fat_StringLenBytes(outside), 7)
+
+        self.fat_ArenaFree(arena)
+        self.fat_StringFree(outside)
+
+    def test_release_skips_individually_freed(self) -> None:
+        arena = self.fat_ArenaNew()
+        self.fat_ArenaPush(arena)
+        handles = [self.fat_StringNewUTF8(b"x") for _ in range(100)]
+        self.fat_ArenaPop(arena)
+
+        for h in handles[::2]:
+            self.fat_StringFree(h)
+        # Reuse freed slots; new handles must not be swept by the arena.
+        survivors = [self.fat_StringNewUTF8(b"keep") for _ in range(50)]
+
+        self.fat_ArenaFree(arena)
+        for h in survivors:
+            self.assertEqual(self.fat_StringLenBytes(h), 4)
+            self.fat_StringFree(h)
+
+    def test_nested_arenas_record_innermost(self) -> None:
+        outer = self.fat_ArenaNew()
+        inner = self.fat_ArenaNew()
+
+        self.fat_ArenaPush(outer)
+        self.fat_StringNewUTF8(b"outer")
+        self.fat_ArenaPush(inner)
+        self.fat_StringNewUTF8(b"inner-1")
+        self.fat_StringNewUTF8(b"inner-2")
+        self.fat_ArenaPop(inner)
+        self.fat_StringNewUTF8(b"outer-2")
+        self.fat_ArenaPop(outer)
+
+        self.assertEqual(self.fat_ArenaLen(outer), 2)
+        self.assertEqual(self.fat_ArenaLen(inner), 2)
+        self.fat_ArenaFree(inner)
+        self.fat_ArenaFree(outer)
+
+    def test_arena_reuse(self) -> None:
+        arena = self.fat_ArenaNew()
+        for _ in range(3):
+            self.fat_ArenaPush(arena)
+            for _ in range(10):
+                self.fat_StringNewUTF8(b"tmp")
+            self.fat_ArenaPop(arena)
+            self.assertEqual(self.fat_ArenaLen(arena), 10)
+            self.fat_ArenaRelease(arena)
+        self.fat_ArenaFree(arena)
+
+    def test_short_lived_threads(self) -> None:
+        # Each thread's stack is dropped when its last arena pops, so threads that
+        # reuse an exited thread's key start with an empty stack.
+        arenas = [self.fat_ArenaNew() for _ in range(16)]
+
+        def work(arena: int) -> None:
+            self.fat_ArenaPush(arena)
+            self.fat_StringNewUTF8(b"scoped")
+            self.fat_ArenaPop(arena)
+            self.fat_StringFree(self.fat_StringNewUTF8(b"unscoped"))
+
+        for arena in arenas:
+            t = threading.Thread(target=work, args=(arena,))
+            t.start()
+            t.join()
+        for arena in arenas:
+            self.assertEqual(self.fat_ArenaLen(arena), 1)
+            self.fat_ArenaRelease(arena)
+            self.fat_ArenaFree(arena)
@@ -52,6 +52,12 @@ class TestBase64(unittest.TestCase):
             restype=ctypes.c_int,
         )
         cls.fat_Base64EncodingFree = bind("fat_Base64EncodingFree", argtypes=[fat_handle], restype=None)
+        cls.fat_Base64EncodedLen = bind(
+            "fat_Base64EncodedLen", argtypes=[fat_handle, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_Base64DecodedLen = bind(
+            "fat_Base64DecodedLen", argtypes=[fat_handle, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
 
         cls.fat_Base64EncodeToString = bind(
             "fat_Base64EncodeToString", argtypes=[fat_handle, fat_bytes], restype=fat_string
@@ -236,3 +242,10 @@ class TestBase64(unittest.TestCase):
         self.fat_Base64EncodingFree(out_enc.value)
         self.fat_Base64EncodingFree(enc)
 
+    def test_lengths_beyond_2gib(self) -> None:
+        enc = self._new_std_encoding()
+        n = 3 << 30
+        self.assertEqual(4 << 30, self.fat_Base64EncodedLen(enc, n))
+        self.assertEqual(n, self.fat_Base64DecodedLen(enc, 4 << 30))
+        self.assertEqual(4, self.fat_Base64EncodedLen(enc, 1))
+        self.fat_Base64EncodingFree(enc)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import ctypes
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestBorrow(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_BytesNewN = bind(
+            "fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesBorrow = bind(
+            "fat_BytesBorrow",
+            argtypes=[fat_handle, ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_void_p,
+        )
+        cls.fat_StringNewUTF8 = bind(
+            "fat_StringNewUTF8", argtypes=[ctypes.c_char_p], restype=fat_handle
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringBorrow = bind(
+            "fat_StringBorrow",
+            argtypes=[fat_handle, ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_void_p,
+        )
+        cls.fat_BorrowRelease = bind("fat_BorrowRelease", argtypes=[fat_handle], restype=None)
+
+    def _borrow(self, fn, handle: int) -> tuple[int | None, int, int]:
+        n = ctypes.c_size_t()
+        borrow = fat_string_handle_type()()
+        ptr = fn(handle, ctypes.byref(n), ctypes.byref(borrow))
+        self.assertNotEqual(borrow.value, 0)
+        return ptr, n.value, borrow.value
+
+    def test_bytes_borrow(self) -> None:
+        payload = bytes(range(256)) * 64
+        b = self.fat_BytesNewN(payload, len(payload))
+        ptr, n, borrow = self._borrow(self.fat_BytesBorrow, b)
+        self.assertEqual(n, len(payload))
+        self.assertEqual(ctypes.string_at(ptr, n), payload)
+        self.fat_BorrowRelease(borrow)
+        self.fat_BytesFree(b)
+
+    def test_borrow_outlives_source_handle(self) -> None:
+        b = self.fat_BytesNewN(b"a\x00b", 3)
+        ptr, n, borrow = self._borrow(self.fat_BytesBorrow, b)
+        self.fat_BytesFree(b)
+        self.assertEqual(ctypes.string_at(ptr, n), b"a\x00b")
+        self.fat_BorrowRelease(borrow)
+
+    def test_empty_borrow(self) -> None:
+        b = self.fat_BytesNewN(None, 0)
+        ptr, n, borrow = self._borrow(self.fat_BytesBorrow, b)
+        self.assertIsNone(ptr)
+        self.assertEqual(n, 0)
+        self.fat_BorrowRelease(borrow)
+        self.fat_BytesFree(b)
+
+    def test_string_borrow(self) -> None:
+        s = self.fat_StringNewUTF8("héllo".encode())
+        ptr, n, borrow = self._borrow(self.fat_StringBorrow, s)
+        self.assertEqual(ctypes.string_at(ptr, n).decode(), "héllo")
+        self.fat_StringFree(s)
+        self.fat_BorrowRelease(borrow)
@@ -94,19 +94,19 @@ class TestBytes(unittest.TestCase):
         cls.fat_BytesToLower = bind("fat_BytesToLower", argtypes=[fat_bytes], restype=fat_bytes)
         cls.fat_BytesToUpper = bind("fat_BytesToUpper", argtypes=[fat_bytes], restype=fat_bytes)
         cls.fat_BytesIndexByte = bind(
-            "fat_BytesIndexByte", argtypes=[fat_bytes, ctypes.c_uint8], restype=ctypes.c_int
+            "fat_BytesIndexByte", argtypes=[fat_bytes, ctypes.c_uint8], restype=ctypes.c_int64
         )
         cls.fat_BytesIndexAny = bind(
-            "fat_BytesIndexAny", argtypes=[fat_bytes, fat_string], restype=ctypes.c_int
+            "fat_BytesIndexAny", argtypes=[fat_bytes, fat_string], restype=ctypes.c_int64
         )
         cls.fat_BytesToValidUTF8 = bind(
             "fat_BytesToValidUTF8", argtypes=[fat_bytes, fat_bytes], restype=fat_bytes
         )
         cls.fat_BytesIndex = bind(
-            "fat_BytesIndex", argtypes=[fat_bytes, fat_bytes], restype=ctypes.c_int
+            "fat_BytesIndex", argtypes=[fat_bytes, fat_bytes], restype=ctypes.c_int64
         )
         cls.fat_BytesCount = bind(
-            "fat_BytesCount", argtypes=[fat_bytes, fat_bytes], restype=ctypes.c_int
+            "fat_BytesCount", argtypes=[fat_bytes, fat_bytes], restype=ctypes.c_int64
         )
         cls.fat_BytesCompare = bind(
             "fat_BytesCompare", argtypes=[fat_bytes, fat_bytes], restype=ctypes.c_int
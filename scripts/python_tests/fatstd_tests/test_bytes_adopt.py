@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import ctypes
+import mmap
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+_RELEASE_FUNC = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)
+
+
+class TestBytesAdopt(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_BytesNewAdopt = bind(
+            "fat_BytesNewAdopt",
+            argtypes=[ctypes.c_void_p, ctypes.c_size_t, _RELEASE_FUNC, ctypes.c_void_p],
+            restype=fat_handle,
+        )
+        cls.fat_BytesLen = bind("fat_BytesLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesCopyOut = bind(
+            "fat_BytesCopyOut",
+            argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesBorrow = bind(
+            "fat_BytesBorrow",
+            argtypes=[fat_handle, ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_void_p,
+        )
+        cls.fat_BorrowRelease = bind("fat_BorrowRelease", argtypes=[fat_handle], restype=None)
+        cls.fat_CsvReaderNewBytes = bind("fat_CsvReaderNewBytes", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_CsvReaderRead = bind(
+            "fat_CsvReaderRead",
+            argtypes=[fat_handle, ctypes.POINTER(fat_handle), ctypes.POINTER(ctypes.c_bool), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_int,
+        )
+        cls.fat_CsvReaderFree = bind("fat_CsvReaderFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringArrayLen = bind("fat_StringArrayLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringArrayFree = bind("fat_StringArrayFree", argtypes=[fat_handle], restype=None)
+
+    def setUp(self) -> None:
+        self.released: list[tuple[int, int, int]] = []
+        self.release = _RELEASE_FUNC(lambda data, n, user: self.released.append((data, n, user)))
+
+    def test_adopt_reads_in_place_and_releases_on_free(self) -> None:
+        buf = ctypes.create_string_buffer(b"adopted\x00bytes", 13)
+        addr = ctypes.addressof(buf)
+        b = self.fat_BytesNewAdopt(addr, 13, self.release, 42)
+        self.assertEqual(self.fat_BytesLen(b), 13)
+
+        n = ctypes.c_size_t()
+        borrow = fat_string_handle_type()()
+        ptr = self.fat_BytesBorrow(b, ctypes.byref(n), ctypes.byref(borrow))
+        self.assertEqual(ptr, addr)
+
+        buf[0] = b"A"
+        out = ctypes.create_string_buffer(13)
+        self.assertEqual(self.fat_BytesCopyOut(b, out, 13), 13)
+        self.assertEqual(out.raw, b"Adopted\x00bytes")
+
+        self.fat_BytesFree(b)
+        self.assertEqual(self.released, [], "release must wait for outstanding borrows")
+        self.fat_BorrowRelease(borrow)
+        self.assertEqual(self.released, [(addr, 13, 42)])
+
+    def test_reader_keeps_adopted_bytes_alive(self) -> None:
+        buf = ctypes.create_string_buffer(b"a,b,c\n1,2,3\n", 12)
+        addr = ctypes.addressof(buf)
+        b = self.fat_BytesNewAdopt(addr, 12, self.release, 7)
+        r = self.fat_CsvReaderNewBytes(b)
+        self.fat_BytesFree(b)
+        self.assertEqual(self.released, [], "release must wait for the reader")
+
+        fat_handle = fat_string_handle_type()
+        record, eof, err = fat_handle(), ctypes.c_bool(), fat_handle()
+        for _ in range(2):
+            self.assertEqual(0, self.fat_CsvReaderRead(r, ctypes.byref(record), ctypes.byref(eof), ctypes.byref(err)))
+            self.assertEqual(3, self.fat_StringArrayLen(record))
+            self.fat_StringArrayFree(record)
+
+        self.fat_CsvReaderFree(r)
+        self.assertEqual(self.released, [(addr, 12, 7)])
+
+    def test_adopt_without_release_callback(self) -> None:
+        buf = ctypes.create_string_buffer(b"abc", 3)
+        b = self.fat_BytesNewAdopt(ctypes.addressof(buf), 3, _RELEASE_FUNC(), None)
+        self.assertEqual(self.fat_BytesLen(b), 3)
+        self.fat_BytesFree(b)
+
+    def test_adopt_beyond_2gib(self) -> None:
+        size = 3 << 30
+        try:
+            region = mmap.mmap(-1, size, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+        except (OSError, ValueError, OverflowError) as exc:
+            self.skipTest(f"cannot reserve {size} bytes: {exc}")
+        view = ctypes.c_char.from_buffer(region)
+        try:
+            region[size - 3 :] = b"end"
+            b = self.fat_BytesNewAdopt(ctypes.addressof(view), size, self.release, None)
+            self.assertEqual(self.fat_BytesLen(b), size)
+
+            n = ctypes.c_size_t()
+            borrow = fat_string_handle_type()()
+            ptr = self.fat_BytesBorrow(b, ctypes.byref(n), ctypes.byref(borrow))
+            self.assertEqual(n.value, size)
+            self.assertEqual(ctypes.string_at(ptr + size - 3, 3), b"end")
+            self.fat_BorrowRelease(borrow)
+            self.fat_BytesFree(b)
+            self.assertEqual(len(self.released), 1)
+        finally:
+            del view
+            region.close()
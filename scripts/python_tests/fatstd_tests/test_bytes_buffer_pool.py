@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import ctypes
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+FAT_OK = 0
+
+
+class TestBytesBufferPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_StringNewUTF8 = bind("fat_StringNewUTF8", argtypes=[ctypes.c_char_p], restype=fat_handle)
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesLen = bind("fat_BytesLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesCopyOut = bind(
+            "fat_BytesCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesBufferNew = bind("fat_BytesBufferNew", argtypes=[], restype=fat_handle)
+        cls.fat_BytesBufferFree = bind("fat_BytesBufferFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesBufferLen = bind("fat_BytesBufferLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesBufferCap = bind("fat_BytesBufferCap", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesBufferWrite = bind(
+            "fat_BytesBufferWrite", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_BytesBufferBytes = bind("fat_BytesBufferBytes", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_BytesBufferReserve = bind(
+            "fat_BytesBufferReserve", argtypes=[fat_handle, ctypes.c_size_t], restype=ctypes.c_void_p
+        )
+        cls.fat_BytesBufferCommit = bind(
+            "fat_BytesBufferCommit", argtypes=[fat_handle, ctypes.c_size_t], restype=None
+        )
+
+        cls.fat_BytesBufferAcquire = bind(
+            "fat_BytesBufferAcquire", argtypes=[ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_BytesBufferRelease = bind("fat_BytesBufferRelease", argtypes=[fat_handle], restype=None)
+
+        cls.fat_CsvWriterNewToBytesBuffer = bind(
+            "fat_CsvWriterNewToBytesBuffer", argtypes=[fat_handle], restype=fat_handle
+        )
+        cls.fat_CsvWriterWriteRecord = bind(
+            "fat_CsvWriterWriteRecord",
+            argtypes=[fat_handle, ctypes.POINTER(fat_handle), ctypes.c_size_t, ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_int,
+        )
+        cls.fat_CsvWriterFlush = bind("fat_CsvWriterFlush", argtypes=[fat_handle], restype=None)
+        cls.fat_CsvWriterFree = bind("fat_CsvWriterFree", argtypes=[fat_handle], restype=None)
+
+    def _contents(self, buf: int) -> bytes:
+        b = self.fat_BytesBufferBytes(buf)
+        n = self.fat_BytesLen(b)
+        out = ctypes.create_string_buffer(n)
+        self.fat_BytesCopyOut(b, out, n)
+        self.fat_BytesFree(b)
+        return out.raw[:n]
+
+    def test_acquire_rounds_up_to_a_size_class(self) -> None:
+        for min_cap, want in ((0, 1024), (1024, 1024), (1025, 2048), (5000, 8192), (1 << 20, 1 << 20)):
+            buf = self.fat_BytesBufferAcquire(min_cap)
+            self.assertEqual(0, self.fat_BytesBufferLen(buf))
+            self.assertGreaterEqual(self.fat_BytesBufferCap(buf), want, min_cap)
+            self.fat_BytesBufferRelease(buf)
+
+        # Oversized requests are served but never pooled.
+        big = self.fat_BytesBufferAcquire((1 << 20) + 1)
+        self.assertGreaterEqual(self.fat_BytesBufferCap(big), (1 << 20) + 1)
+        self.fat_BytesBufferRelease(big)
+
+    def test_released_buffers_come_back_empty(self) -> None:
+        for _ in range(100):
+            buf = self.fat_BytesBufferAcquire(4096)
+            self.assertEqual(b"", self._contents(buf))
+            self.fat_BytesBufferWrite(buf, b"x" * 3000, 3000)
+            ctypes.memset(self.fat_BytesBufferReserve(buf, 100), ord("y"), 100)
+            self.fat_BytesBufferCommit(buf, 100)
+            self.assertEqual(3100, self.fat_BytesBufferLen(buf))
+            self.fat_BytesBufferRelease(buf)
+
+        # Plain buffers can be released into the pool too, and tiny ones are just dropped.
+        buf = self.fat_BytesBufferNew()
+        self.fat_BytesBufferWrite(buf, b"abc", 3)
+        self.fat_BytesBufferRelease(buf)
+
+    def test_encoder_into_acquired_buffer(self) -> None:
+        fields = (ctypes.c_size_t * 2)(self.fat_StringNewUTF8(b"id"), self.fat_StringNewUTF8(b"a,b"))
+        err = ctypes.c_size_t()
+        try:
+            for _ in range(3):
+                buf = self.fat_BytesBufferAcquire(1024)
+                w = self.fat_CsvWriterNewToBytesBuffer(buf)
+                self.assertEqual(FAT_OK, self.fat_CsvWriterWriteRecord(w, fields, 2, ctypes.byref(err)))
+                self.fat_CsvWriterFlush(w)
+                self.fat_CsvWriterFree(w)
+                self.assertEqual(b'id,"a,b"\n', self._contents(buf))
+                self.fat_BytesBufferRelease(buf)
+        finally:
+            for h in fields:
+                self.fat_StringFree(h)
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import ctypes
+import subprocess
+import sys
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type, get_context
+
+# Writes between Reserve and Commit are fatal, so they run in a child process.
+# argv[2] picks the write path; encoders attached to the buffer must be caught too.
+_WRITE_DURING_RESERVATION = """
+import ctypes, sys
+H = ctypes.c_size_t
+lib = ctypes.CDLL(sys.argv[1])
+lib.fat_BytesBufferNew.restype = H
+lib.fat_BytesBufferNewN.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
+lib.fat_BytesBufferNewN.restype = H
+lib.fat_BytesBufferReserve.argtypes = [H, ctypes.c_size_t]
+lib.fat_BytesBufferReserve.restype = ctypes.c_void_p
+lib.fat_BytesBufferWrite.argtypes = [H, ctypes.c_char_p, ctypes.c_size_t]
+lib.fat_BytesBufferWriteToBytesBuffer.argtypes = [H, H]
+lib.fat_CsvWriterNewToBytesBuffer.argtypes = [H]
+lib.fat_CsvWriterNewToBytesBuffer.restype = H
+lib.fat_CsvWriterFlush.argtypes = [H]
+lib.fat_StringNewUTF8.argtypes = [ctypes.c_char_p]
+lib.fat_StringNewUTF8.restype = H
+lib.fat_CsvWriterWriteRecord.argtypes = [H, ctypes.POINTER(H), ctypes.c_size_t, ctypes.POINTER(H)]
+buf = lib.fat_BytesBufferNewN(b"abc", 3)
+if sys.argv[2] == "csv":
+    w = lib.fat_CsvWriterNewToBytesBuffer(buf)
+ctypes.memmove(lib.fat_BytesBufferReserve(buf, 4), b"WXYZ", 4)
+if sys.argv[2] == "write":
+    lib.fat_BytesBufferWrite(buf, b"x", 1)
+elif sys.argv[2] == "write_to":
+    lib.fat_BytesBufferWriteToBytesBuffer(lib.fat_BytesBufferNewN(b"123456", 6), buf)
+elif sys.argv[2] == "csv":
+    err = H()
+    lib.fat_CsvWriterWriteRecord(w, (H * 1)(lib.fat_StringNewUTF8(b"x")), 1, ctypes.byref(err))
+    lib.fat_CsvWriterFlush(w)
+"""
+
+class TestBytesBufferReserve(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+        u8p = ctypes.POINTER(ctypes.c_uint8)
+
+        cls.fat_BytesLen = bind("fat_BytesLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesCopyOut = bind(
+            "fat_BytesCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_HandlesFree = bind(
+            "fat_HandlesFree", argtypes=[ctypes.POINTER(fat_handle), ctypes.c_size_t], restype=None
+        )
+        cls.fat_BytesBufferNew = bind("fat_BytesBufferNew", argtypes=[], restype=fat_handle)
+        cls.fat_BytesBufferNewN = bind(
+            "fat_BytesBufferNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_BytesBufferFree = bind("fat_BytesBufferFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesBufferLen = bind("fat_BytesBufferLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesBufferCap = bind("fat_BytesBufferCap", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesBufferWrite = bind(
+            "fat_BytesBufferWrite", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_BytesBufferBytes = bind("fat_BytesBufferBytes", argtypes=[fat_handle], restype=fat_handle)
+
+        cls.fat_BytesBufferReserve = bind(
+            "fat_BytesBufferReserve", argtypes=[fat_handle, ctypes.c_size_t], restype=u8p
+        )
+        cls.fat_BytesBufferCommit = bind(
+            "fat_BytesBufferCommit", argtypes=[fat_handle, ctypes.c_size_t], restype=None
+        )
+        cls.fat_BytesBufferPeek = bind(
+            "fat_BytesBufferPeek", argtypes=[fat_handle, ctypes.POINTER(ctypes.c_size_t)], restype=u8p
+        )
+        cls.fat_BytesBufferConsume = bind(
+            "fat_BytesBufferConsume", argtypes=[fat_handle, ctypes.c_size_t], restype=None
+        )
+
+    def _contents(self, buf: int) -> bytes:
+        b = self.fat_BytesBufferBytes(buf)
+        n = self.fat_BytesLen(b)
+        out = ctypes.create_string_buffer(n)
+        self.fat_BytesCopyOut(b, out, n)
+        self.fat_BytesFree(b)
+        return out.raw[:n]
+
+    def _peek(self, buf: int) -> bytes:
+        n = ctypes.c_size_t()
+        p = self.fat_BytesBufferPeek(buf, ctypes.byref(n))
+        if n.value == 0:
+            self.assertFalse(p)
+            return b""
+        return ctypes.string_at(p, n.value)
+
+    def test_reserve_commit_appends_in_place(self) -> None:
+        buf = self.fat_BytesBufferNewN(b"head:", 5)
+        try:
+            p = self.fat_BytesBufferReserve(buf, 16)
+            self.assertGreaterEqual(self.fat_BytesBufferCap(buf), 21)
+            self.assertEqual(5, self.fat_BytesBufferLen(buf))  # reserved bytes are not contents yet
+            ctypes.memmove(p, b"payload-and-junk", 16)
+            self.fat_BytesBufferCommit(buf, 7)
+            self.assertEqual(b"head:payload", self._contents(buf))
+
+            self.assertFalse(self.fat_BytesBufferReserve(buf, 0))
+            self.fat_BytesBufferCommit(buf, 0)
+
+            # Large reservations grow the buffer; committed bytes keep their order with plain writes.
+            p = self.fat_BytesBufferReserve(buf, 1 << 20)
+            ctypes.memset(p, ord("x"), 1 << 20)
+            self.fat_BytesBufferCommit(buf, 1 << 20)
+            self.fat_BytesBufferWrite(buf, b"!", 1)
+            data = self._contents(buf)
+            self.assertEqual(12 + (1 << 20) + 1, len(data))
+            self.assertTrue(data.startswith(b"head:payloadxxx"))
+            self.assertTrue(data.endswith(b"xx!"))
+        finally:
+            self.fat_BytesBufferFree(buf)
+
+    def test_peek_consume_parses_in_place(self) -> None:
+        buf = self.fat_BytesBufferNew()
+        try:
+            self.assertEqual(b"", self._peek(buf))
+
+            # Feed a line protocol in uneven chunks and split complete lines off the front.
+            stream = b"alpha\nbeta\ngamma\ndelta"
+            lines = []
+            for i in range(0, len(stream), 4):
+                chunk = stream[i : i + 4]
+                ctypes.memmove(self.fat_BytesBufferReserve(buf, 64), chunk, len(chunk))
+                self.fat_BytesBufferCommit(buf, len(chunk))
+                while b"\n" in (pending := self._peek(buf)):
+                    line = pending[: pending.index(b"\n")]
+                    lines.append(line)
+                    self.fat_BytesBufferConsume(buf, len(line) + 1)
+            self.assertEqual([b"alpha", b"beta", b"gamma"], lines)
+            self.assertEqual(b"delta", self._peek(buf))
+            self.assertEqual(5, self.fat_BytesBufferLen(buf))
+
+            self.fat_BytesBufferConsume(buf, 5)
+            self.assertEqual(b"", self._peek(buf))
+            self.fat_BytesBufferConsume(buf, 0)
+        finally:
+            self.fat_BytesBufferFree(buf)
+
+    def test_reads_allowed_during_reservation(self) -> None:
+        buf = self.fat_BytesBufferNewN(b"abc", 3)
+        try:
+            p = self.fat_BytesBufferReserve(buf, 4)
+            self.assertEqual(b"abc", self._peek(buf))
+            self.fat_BytesBufferConsume(buf, 3)
+            ctypes.memmove(p, b"wxyz", 4)
+            self.fat_BytesBufferCommit(buf, 4)
+            self.assertEqual(b"wxyz", self._peek(buf))
+
+            # Re-reserving replaces the pending region; reserving 0 cancels it, so writes work again.
+            self.fat_BytesBufferReserve(buf, 8)
+            ctypes.memmove(self.fat_BytesBufferReserve(buf, 2), b"!!", 2)
+            self.fat_BytesBufferCommit(buf, 2)
+            self.fat_BytesBufferReserve(buf, 16)
+            self.fat_BytesBufferReserve(buf, 0)
+            self.fat_BytesBufferWrite(buf, b"?", 1)
+            self.assertEqual(b"wxyz!!?", self._contents(buf))
+        finally:
+            self.fat_BytesBufferFree(buf)
+
+    def test_write_during_reservation_is_fatal(self) -> None:
+        for path, want in (
+            ("write", "fatbytes.Buffer.Write: called between Reserve and Commit"),
+            ("write_to", "fatbytes.Buffer.Writer: called between Reserve and Commit"),
+            ("csv", "fatbytes.Buffer.Writer: called between Reserve and Commit"),
+        ):
+            proc = subprocess.run(
+                [sys.executable, "-c", _WRITE_DURING_RESERVATION, get_context().lib._name, path],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            self.assertNotEqual(0, proc.returncode, path)
+            self.assertIn(want, proc.stderr, path)
+
+    def test_free_releases_pinned_storage(self) -> None:
+        for i in range(200):
+            buf = self.fat_BytesBufferNew()
+            ctypes.memset(self.fat_BytesBufferReserve(buf, 4096 + i), i & 0xFF, 4096 + i)
+            self.fat_BytesBufferCommit(buf, 4096 + i)
+            self.assertEqual(bytes([i & 0xFF]) * 4, self._peek(buf)[:4])
+            self.fat_BytesBufferFree(buf)
+
+        # Empty windows pin nothing, so the buffer can still go through a batch free.
+        buf = self.fat_BytesBufferNew()
+        self.assertEqual(b"", self._peek(buf))
+        self.fat_BytesBufferReserve(buf, 0)
+        self.fat_HandlesFree((ctypes.c_size_t * 1)(buf), 1)
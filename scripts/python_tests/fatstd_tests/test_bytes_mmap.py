@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import ctypes
+import os
+import tempfile
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestBytesMapFile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_BytesMapFileUTF8 = bind(
+            "fat_BytesMapFileUTF8",
+            argtypes=[ctypes.c_char_p, ctypes.POINTER(fat_handle), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_int,
+        )
+        cls.fat_BytesLen = bind("fat_BytesLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesCopyOut = bind(
+            "fat_BytesCopyOut",
+            argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_BytesBorrow = bind(
+            "fat_BytesBorrow",
+            argtypes=[fat_handle, ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_void_p,
+        )
+        cls.fat_BorrowRelease = bind("fat_BorrowRelease", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_ErrorFree = bind("fat_ErrorFree", argtypes=[fat_handle], restype=None)
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._tmp.name, name)
+
+    def _map(self, path: str) -> tuple[int, int, int]:
+        out = fat_string_handle_type()()
+        err = fat_string_handle_type()()
+        status = self.fat_BytesMapFileUTF8(path.encode(), ctypes.byref(out), ctypes.byref(err))
+        return status, out.value, err.value
+
+    def test_map_file(self) -> None:
+        path = self._path("data.bin")
+        payload = bytes(range(256)) * 100
+        with open(path, "wb") as f:
+            f.write(payload)
+
+        status, b, err = self._map(path)
+        self.assertEqual(status, 0)
+        self.assertEqual(err, 0)
+        self.assertEqual(self.fat_BytesLen(b), len(payload))
+        out = ctypes.create_string_buffer(len(payload))
+        self.assertEqual(self.fat_BytesCopyOut(b, out, len(payload)), len(payload))
+        self.assertEqual(out.raw, payload)
+
+        n = ctypes.c_size_t()
+        borrow = fat_string_handle_type()()
+        ptr = self.fat_BytesBorrow(b, ctypes.byref(n), ctypes.byref(borrow))
+        self.fat_BytesFree(b)
+        self.assertEqual(ctypes.string_at(ptr, n.value), payload)
+        self.fat_BorrowRelease(borrow)
+
+    def test_map_empty_file(self) -> None:
+        path = self._path("empty.bin")
+        open(path, "wb").close()
+        status, b, _ = self._map(path)
+        self.assertEqual(status, 0)
+        self.assertEqual(self.fat_BytesLen(b), 0)
+        self.fat_BytesFree(b)
+
+    def test_map_errors(self) -> None:
+        for path in (self._path("missing.bin"), self._tmp.name):
+            status, b, err = self._map(path)
+            self.assertNotEqual(status, 0)
+            self.assertEqual(b, 0)
+            self.assertNotEqual(err, 0)
+            self.fat_ErrorFree(err)
+
+    def test_map_sparse_file_beyond_2gib(self) -> None:
+        path = self._path("sparse.bin")
+        size = (3 << 30) + 5
+        with open(path, "wb") as f:
+            f.truncate(size)
+            f.seek(size - 5)
+            f.write(b"tail!")
+
+        status, b, _ = self._map(path)
+        self.assertEqual(status, 0)
+        self.assertEqual(self.fat_BytesLen(b), size)
+        n = ctypes.c_size_t()
+        borrow = fat_string_handle_type()()
+        ptr = self.fat_BytesBorrow(b, ctypes.byref(n), ctypes.byref(borrow))
+        self.assertEqual(ctypes.string_at(ptr + size - 5, 5), b"tail!")
+        self.fat_BorrowRelease(borrow)
+        self.fat_BytesFree(b)
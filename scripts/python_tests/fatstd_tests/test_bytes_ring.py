@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import ctypes
+import threading
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestBytesRing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+        u8p = ctypes.POINTER(ctypes.c_uint8)
+        size_p = ctypes.POINTER(ctypes.c_size_t)
+        bool_p = ctypes.POINTER(ctypes.c_bool)
+
+        cls.fat_BytesRingNew = bind("fat_BytesRingNew", argtypes=[ctypes.c_size_t, ctypes.c_bool], restype=fat_handle)
+        cls.fat_BytesRingFree = bind("fat_BytesRingFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesRingCap = bind("fat_BytesRingCap", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesRingLen = bind("fat_BytesRingLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesRingWrite = bind(
+            "fat_BytesRingWrite", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_BytesRingRead = bind(
+            "fat_BytesRingRead",
+            argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t, bool_p],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_BytesRingPeek = bind(
+            "fat_BytesRingPeek",
+            argtypes=[fat_handle, ctypes.POINTER(u8p), size_p, ctypes.POINTER(u8p), size_p, bool_p],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_BytesRingConsume = bind("fat_BytesRingConsume", argtypes=[fat_handle, ctypes.c_size_t], restype=None)
+        cls.fat_BytesRingReserve = bind(
+            "fat_BytesRingReserve",
+            argtypes=[fat_handle, ctypes.POINTER(u8p), size_p, ctypes.POINTER(u8p), size_p],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_BytesRingCommit = bind("fat_BytesRingCommit", argtypes=[fat_handle, ctypes.c_size_t], restype=None)
+        cls.fat_BytesRingClose = bind("fat_BytesRingClose", argtypes=[fat_handle], restype=None)
+
+    def _read(self, ring: int, n: int) -> tuple[bytes, bool]:
+        out = ctypes.create_string_buffer(n)
+        eof = ctypes.c_bool()
+        got = self.fat_BytesRingRead(ring, out, n, ctypes.byref(eof))
+        return out.raw[:got], eof.value
+
+    def _peek(self, ring: int) -> tuple[bytes, bytes, bool]:
+        first, second = ctypes.POINTER(ctypes.c_uint8)(), ctypes.POINTER(ctypes.c_uint8)()
+        first_len, second_len = ctypes.c_size_t(), ctypes.c_size_t()
+        eof = ctypes.c_bool()
+        total = self.fat_BytesRingPeek(
+            ring, ctypes.byref(first), ctypes.byref(first_len), ctypes.byref(second), ctypes.byref(second_len),
+            ctypes.byref(eof),
+        )
+        self.assertEqual(first_len.value + second_len.value, total)
+        a = ctypes.string_at(first, first_len.value) if first else b""
+        b = ctypes.string_at(second, second_len.value) if second else b""
+        return a, b, eof.value
+
+    def _reserve(self, ring: int) -> list[tuple[int, int]]:
+        first, second = ctypes.POINTER(ctypes.c_uint8)(), ctypes.POINTER(ctypes.c_uint8)()
+        first_len, second_len = ctypes.c_size_t(), ctypes.c_size_t()
+        total = self.fat_BytesRingReserve(
+            ring, ctypes.byref(first), ctypes.byref(first_len), ctypes.byref(second), ctypes.byref(second_len)
+        )
+        self.assertEqual(first_len.value + second_len.value, total)
+        regions = [(ctypes.addressof(first.contents), first_len.value)] if first else []
+        if second:
+            regions.append((ctypes.addressof(second.contents), second_len.value))
+        return regions
+
+    def test_write_read_wraps_around(self) -> None:
+        ring = self.fat_BytesRingNew(8, False)
+        try:
+            self.assertEqual(8, self.fat_BytesRingCap(ring))
+            self.assertEqual(6, self.fat_BytesRingWrite(ring, b"abcdef", 6))
+            self.assertEqual((b"abcd", False), self._read(ring, 4))
+
+            # Only six bytes are free; the write wraps past the end of the array.
+            self.assertEqual(6, self.fat_BytesRingWrite(ring, b"ghijklmn", 8))
+            self.assertEqual(8, self.fat_BytesRingLen(ring))
+            self.assertEqual(0, self.fat_BytesRingWrite(ring, b"x", 1))
+
+            self.assertEqual((b"efgh", b"ijkl", False), self._peek(ring))
+            self.fat_BytesRingConsume(ring, 5)
+            self.assertEqual((b"jkl", False), self._read(ring, 16))
+            self.assertEqual(0, self.fat_BytesRingLen(ring))
+        finally:
+            self.fat_BytesRingFree(ring)
+
+    def test_reserve_commit_fills_both_regions(self) -> None:
+        ring = self.fat_BytesRingNew(10, False)
+        try:
+            self.assertEqual([10], [n for _, n in self._reserve(ring)])
+            self.fat_BytesRingWrite(ring, b"0123456", 7)
+            self.assertEqual((b"01234", False), self._read(ring, 5))
+
+            regions = self._reserve(ring)
+            self.assertEqual([3, 5], [n for _, n in regions])
+            payload = b"ABCDEFG"
+            ctypes.memmove(regions[0][0], payload[:3], 3)
+            ctypes.memmove(regions[1][0], payload[3:], 4)
+            self.fat_BytesRingCommit(ring, 7)
+
+            self.assertEqual((b"56ABC", b"DEFG", False), self._peek(ring))
+            self.assertEqual((b"56ABCDEFG", False), self._read(ring, 64))
+
+            # A drained ring starts over at the front, so its space is one region again.
+            self.assertEqual([10], [n for _, n in self._reserve(ring)])
+            self.fat_BytesRingCommit(ring, 0)
+        finally:
+            self.fat_BytesRingFree(ring)
+
+    def test_close_drains_then_reports_eof(self) -> None:
+        for blocking in (False, True):
+            ring = self.fat_BytesRingNew(16, blocking)
+            try:
+                self.fat_BytesRingWrite(ring, b"tail", 4)
+                self.fat_BytesRingClose(ring)
+                self.assertEqual(0, self.fat_BytesRingWrite(ring, b"more", 4))
+                self.assertEqual([], self._reserve(ring))
+                self.assertEqual((b"tail", b"", False), self._peek(ring))
+                self.assertEqual((b"tail", False), self._read(ring, 16))
+                self.assertEqual((b"", True), self._read(ring, 16))
+                self.assertEqual((b"", b"", True), self._peek(ring))
+            finally:
+                self.fat_BytesRingFree(ring)
+
+        ring = self.fat_BytesRingNew(4, False)
+        self.assertEqual((b"", False), self._read(ring, 4))
+        self.fat_BytesRingFree(ring)
+
+    def test_blocking_hand_off_between_threads(self) -> None:
+        # ctypes releases the GIL around foreign calls, so both threads really block in the ring.
+        data = bytes(range(256)) * 4099
+        ring = self.fat_BytesRingNew(4096, True)
+
+        def produce() -> None:
+            for i in range(0, len(data), 10000):
+                chunk = data[i : i + 10000]
+                self.assertEqual(len(chunk), self.fat_BytesRingWrite(ring, chunk, len(chunk)))
+            self.fat_BytesRingClose(ring)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        received = bytearray()
+        try:
+            while True:
+                chunk, eof = self._read(ring, 3000)
+                if eof:
+                    break
+                self.assertTrue(chunk)
+                received += chunk
+        finally:
+            producer.join()
+            self.fat_BytesRingFree(ring)
+        self.assertEqual(data, bytes(received))
+
+    def test_blocking_zero_copy_pipeline(self) -> None:
+        data = b"".join(b"record %06d\n" % i for i in range(20000))
+        ring = self.fat_BytesRingNew(1000, True)
+
+        def produce() -> None:
+            sent = 0
+            while sent < len(data):
+                for addr, n in self._reserve(ring):
+                    n = min(n, len(data) - sent)
+                    ctypes.memmove(addr, data[sent : sent + n], n)
+                    self.fat_BytesRingCommit(ring, n)
+                    sent += n
+            self.fat_BytesRingClose(ring)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        received = bytearray()
+        try:
+            while True:
+                first, second, eof = self._peek(ring)
+                if eof:
+                    break
+                received += first + second
+                self.fat_BytesRingConsume(ring, len(first) + len(second))
+        finally:
+            producer.join()
+            self.fat_BytesRingFree(ring)
+        self.assertEqual(data, bytes(received))
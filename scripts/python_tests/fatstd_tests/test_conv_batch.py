@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import ctypes
+import random
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+FAT_OK = 0
+FAT_ERR_SYNTAX = 1
+FAT_ERR_RANGE = 2
+
+
+class TestConvBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+        u8p = ctypes.POINTER(ctypes.c_uint8)
+        sizep = ctypes.POINTER(ctypes.c_size_t)
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringSplit = bind("fat_StringSplit", argtypes=[fat_handle, fat_handle], restype=fat_handle)
+        cls.fat_StringArrayFree = bind("fat_StringArrayFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesNewN = bind("fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle)
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+
+        cls.fat_ConvParseIntArray = bind(
+            "fat_ConvParseIntArray",
+            argtypes=[fat_handle, ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_int64), u8p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_ConvParseFloatArray = bind(
+            "fat_ConvParseFloatArray",
+            argtypes=[fat_handle, ctypes.c_int, ctypes.POINTER(ctypes.c_double), u8p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_ConvParseBoolArray = bind(
+            "fat_ConvParseBoolArray", argtypes=[fat_handle, u8p, u8p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_ConvParseIntDelimited = bind(
+            "fat_ConvParseIntDelimited",
+            argtypes=[
+                fat_handle,
+                ctypes.c_uint8,
+                ctypes.c_int,
+                ctypes.c_int,
+                ctypes.POINTER(ctypes.c_int64),
+                u8p,
+                ctypes.c_size_t,
+                sizep,
+            ],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_ConvParseFloatDelimited = bind(
+            "fat_ConvParseFloatDelimited",
+            argtypes=[fat_handle, ctypes.c_uint8, ctypes.c_int, ctypes.POINTER(ctypes.c_double), u8p, ctypes.c_size_t, sizep],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_ConvParseBoolDelimited = bind(
+            "fat_ConvParseBoolDelimited",
+            argtypes=[fat_handle, ctypes.c_uint8, u8p, u8p, ctypes.c_size_t, sizep],
+            restype=ctypes.c_size_t,
+        )
+
+    def _array(self, cells: list[bytes]) -> int:
+        data = b"|".join(cells)
+        s = self.fat_StringNewUTF8N(data, len(data))
+        sep = self.fat_StringNewUTF8N(b"|", 1)
+        a = self.fat_StringSplit(s, sep)
+        self.fat_StringFree(sep)
+        self.fat_StringFree(s)
+        return a
+
+    def _bytes(self, data: bytes) -> int:
+        return self.fat_BytesNewN(data, len(data))
+
+    def test_parse_int_array(self) -> None:
+        a = self._array([b"42", b"-7", b"0x1f", b"", b"99999999999999999999", b"12a", b"127", b"128"])
+        n = 8
+        out, status = (ctypes.c_int64 * n)(), (ctypes.c_uint8 * n)()
+        try:
+            self.assertEqual(3, self.fat_ConvParseIntArray(a, 0, 64, out, status, n))
+            self.assertEqual([42, -7, 31, 0, 2**63 - 1, 0, 127, 128], list(out))
+            self.assertEqual(
+                [FAT_OK, FAT_OK, FAT_OK, FAT_ERR_SYNTAX, FAT_ERR_RANGE, FAT_ERR_SYNTAX, FAT_OK, FAT_OK], list(status)
+            )
+            # bit_size clamps like fat_ConvParseInt.
+            self.assertEqual(5, self.fat_ConvParseIntArray(a, 10, 8, out, status, n))
+            self.assertEqual((127, FAT_OK), (out[6], status[6]))
+            self.assertEqual((127, FAT_ERR_RANGE), (out[7], status[7]))
+        finally:
+            self.fat_StringArrayFree(a)
+
+    def test_parse_float_and_bool_array(self) -> None:
+        a = self._array([b"1.5", b"-2e3", b"inf", b"nan?", b"1e400"])
+        out, status = (ctypes.c_double * 5)(), (ctypes.c_uint8 * 5)()
+        self.assertEqual(2, self.fat_ConvParseFloatArray(a, 64, out, status, 5))
+        self.assertEqual([1.5, -2000.0, float("inf"), 0.0, float("inf")], list(out))
+        self.assertEqual([FAT_OK, FAT_OK, FAT_OK, FAT_ERR_SYNTAX, FAT_ERR_RANGE], list(status))
+        self.fat_StringArrayFree(a)
+
+        a = self._array([b"true", b"0", b"T", b"yes", b"FALSE"])
+        flags, status = (ctypes.c_uint8 * 5)(), (ctypes.c_uint8 * 5)()
+        self.assertEqual(1, self.fat_ConvParseBoolArray(a, flags, status, 5))
+        self.assertEqual([1, 0, 1, 0, 0], list(flags))
+        self.assertEqual([FAT_OK, FAT_OK, FAT_OK, FAT_ERR_SYNTAX, FAT_OK], list(status))
+        self.fat_StringArrayFree(a)
+
+    def test_parse_float_array_matches_python(self) -> None:
+        rng = random.Random(7)
+        cells = [b"0.1", b"-0", b"9007199254740993", b"1e22", b"1e23", b"123456789012345678901", b".5", b"5.", b"1..2"]
+        for _ in range(4000):
+            whole, frac = rng.randrange(10**rng.randrange(1, 9)), rng.randrange(10**6)
+            cells.append(b"%s%d.%0*d" % (rng.choice([b"", b"-"]), whole, rng.randrange(1, 7), frac))
+            cells.append(repr(rng.uniform(-1e6, 1e6) * 10.0 ** rng.randrange(-30, 30)).encode())
+        a = self._array(cells)
+        n = len(cells)
+        out, status = (ctypes.c_double * n)(), (ctypes.c_uint8 * n)()
+        try:
+            self.assertEqual(1, self.fat_ConvParseFloatArray(a, 64, out, status, n))
+            self.assertEqual(FAT_ERR_SYNTAX, status[8])
+            for i, cell in enumerate(cells):
+                if i != 8:
+                    self.assertEqual(float(cell), out[i], cell)
+            self.assertEqual("-0.0", repr(out[1]))
+        finally:
+            self.fat_StringArrayFree(a)
+
+    def test_parse_int_delimited(self) -> None:
+        b = self._bytes(b"10\n-20\nx\n30\n")
+        out, status, count = (ctypes.c_int64 * 8)(), (ctypes.c_uint8 * 8)(), ctypes.c_size_t()
+        try:
+            self.assertEqual(1, self.fat_ConvParseIntDelimited(b, ord("\n"), 10, 64, out, status, 8, ctypes.byref(count)))
+            self.assertEqual(4, count.value)
+            self.assertEqual([10, -20, 0, 30], list(out)[:4])
+            self.assertEqual([FAT_OK, FAT_OK, FAT_ERR_SYNTAX, FAT_OK], list(status)[:4])
+
+            # A short buffer parses what fits and still reports the full count.
+            out[2] = 555
+            self.assertEqual(0, self.fat_ConvParseIntDelimited(b, ord("\n"), 10, 64, out, status, 2, ctypes.byref(count)))
+            self.assertEqual(4, count.value)
+            self.assertEqual(555, out[2])
+            self.assertEqual(0, self.fat_ConvParseIntDelimited(b, ord("\n"), 10, 64, None, None, 0, ctypes.byref(count)))
+            self.assertEqual(4, count.value)
+        finally:
+            self.fat_BytesFree(b)
+
+        for data, cells in ((b"", 0), (b"1", 1), (b"1,", 1), (b",", 1), (b"1,,2", 3)):
+            b = self._bytes(data)
+            self.fat_ConvParseIntDelimited(b, ord(","), 10, 64, out, status, 8, ctypes.byref(count))
+            self.assertEqual(cells, count.value, data)
+            self.fat_BytesFree(b)
+
+    def test_parse_float_and_bool_delimited(self) -> None:
+        b = self._bytes(b"0.25,1e-3,-0,bad")
+        out, status, count = (ctypes.c_double * 4)(), (ctypes.c_uint8 * 4)(), ctypes.c_size_t()
+        self.assertEqual(1, self.fat_ConvParseFloatDelimited(b, ord(","), 64, out, status, 4, ctypes.byref(count)))
+        self.assertEqual(4, count.value)
+        self.assertEqual([0.25, 0.001, 0.0], list(out)[:3])
+        self.assertEqual([FAT_OK, FAT_OK, FAT_OK, FAT_ERR_SYNTAX], list(status))
+        self.fat_BytesFree(b)
+
+        b = self._bytes(b"1\tf\tTrue")
+        flags, status = (ctypes.c_uint8 * 3)(), (ctypes.c_uint8 * 3)()
+        self.assertEqual(0, self.fat_ConvParseBoolDelimited(b, ord("\t"), flags, status, 3, ctypes.byref(count)))
+        self.assertEqual((3, [1, 0, 1]), (count.value, list(flags)))
+        self.fat_BytesFree(b)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import ctypes
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestConvFormatInto(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesLen = bind("fat_BytesLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesCopyOut = bind(
+            "fat_BytesCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesBufferNew = bind("fat_BytesBufferNew", argtypes=[], restype=fat_handle)
+        cls.fat_BytesBufferBytes = bind("fat_BytesBufferBytes", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_BytesBufferFree = bind("fat_BytesBufferFree", argtypes=[fat_handle], restype=None)
+
+        cls.fat_ConvFormatIntInto = bind(
+            "fat_ConvFormatIntInto",
+            argtypes=[ctypes.c_int64, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_ConvFormatUintInto = bind(
+            "fat_ConvFormatUintInto",
+            argtypes=[ctypes.c_uint64, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_ConvFormatFloatInto = bind(
+            "fat_ConvFormatFloatInto",
+            argtypes=[ctypes.c_double, ctypes.c_uint8, ctypes.c_int, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_ConvFormatBoolInto = bind(
+            "fat_ConvFormatBoolInto", argtypes=[ctypes.c_bool, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_ConvQuoteInto = bind(
+            "fat_ConvQuoteInto", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_ConvWriteInt = bind(
+            "fat_ConvWriteInt", argtypes=[fat_handle, ctypes.c_int64, ctypes.c_int], restype=ctypes.c_size_t
+        )
+        cls.fat_ConvWriteUint = bind(
+            "fat_ConvWriteUint", argtypes=[fat_handle, ctypes.c_uint64, ctypes.c_int], restype=ctypes.c_size_t
+        )
+        cls.fat_ConvWriteFloat = bind(
+            "fat_ConvWriteFloat",
+            argtypes=[fat_handle, ctypes.c_double, ctypes.c_uint8, ctypes.c_int, ctypes.c_int],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_ConvWriteFloatArray = bind(
+            "fat_ConvWriteFloatArray",
+            argtypes=[
+                fat_handle,
+                ctypes.POINTER(ctypes.c_double),
+                ctypes.c_size_t,
+                ctypes.c_uint8,
+                ctypes.c_int,
+                ctypes.c_int,
+                ctypes.c_uint8,
+            ],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_ConvWriteBool = bind(
+            "fat_ConvWriteBool", argtypes=[fat_handle, ctypes.c_bool], restype=ctypes.c_size_t
+        )
+        cls.fat_ConvWriteQuote = bind(
+            "fat_ConvWriteQuote", argtypes=[fat_handle, fat_handle], restype=ctypes.c_size_t
+        )
+
+    def _buffer_contents(self, buf: int) -> bytes:
+        b = self.fat_BytesBufferBytes(buf)
+        n = self.fat_BytesLen(b)
+        out = ctypes.create_string_buffer(n)
+        self.fat_BytesCopyOut(b, out, n)
+        self.fat_BytesFree(b)
+        return out.raw[:n]
+
+    def test_format_into_buffer(self) -> None:
+        dst = ctypes.create_string_buffer(b"\xaa" * 64, 64)
+        self.assertEqual(20, self.fat_ConvFormatIntInto(-(2**63), 10, dst, 64))
+        self.assertEqual(b"-9223372036854775808", dst.raw[:20])
+        self.assertEqual(b"\xaa", dst.raw[20:21])  # no terminator
+        self.assertEqual(2, self.fat_ConvFormatIntInto(255, 16, dst, 64))
+        self.assertEqual(b"ff", dst.raw[:2])
+        self.assertEqual(20, self.fat_ConvFormatUintInto(2**64 - 1, 10, dst, 64))
+        self.assertEqual(b"18446744073709551615", dst.raw[:20])
+        self.assertEqual(3, self.fat_ConvFormatFloatInto(0.1, ord("g"), -1, 64, dst, 64))
+        self.assertEqual(b"0.1", dst.raw[:3])
+        self.assertEqual(5, self.fat_ConvFormatBoolInto(False, dst, 64))
+        self.assertEqual(b"false", dst.raw[:5])
+
+        s = self.fat_StringNewUTF8N(b'say "hi"\n', 9)
+        self.assertEqual(14, self.fat_ConvQuoteInto(s, dst, 64))
+        self.assertEqual(b'"say \\"hi\\"\\n"', dst.raw[:14])
+        self.fat_StringFree(s)
+
+    def test_truncation_reports_full_length(self) -> None:
+        dst = ctypes.create_string_buffer(b"\xaa" * 8, 8)
+        self.assertEqual(12, self.fat_ConvFormatIntInto(-12345678901, 10, dst, 4))
+        self.assertEqual(b"-123\xaa", dst.raw[:5])
+        # Long float text goes through the Go heap and only the prefix is copied.
+        self.assertEqual(309, self.fat_ConvFormatFloatInto(1e308, ord("f"), 0, 64, dst, 8))
+        self.assertEqual(b"10000000", dst.raw[:8])
+        self.assertEqual(4, self.fat_ConvFormatBoolInto(True, None, 0))
+
+    def test_write_appends_to_buffer(self) -> None:
+        buf = self.fat_BytesBufferNew()
+        s = self.fat_StringNewUTF8N(b"a\tb", 3)
+        try:
+            self.assertEqual(2, self.fat_ConvWriteInt(buf, 42, 10))
+            self.assertEqual(1, self.fat_ConvWriteUint(buf, 7, 8))
+            self.assertEqual(7, self.fat_ConvWriteFloat(buf, 1.5e-7, ord("e"), 1, 64))
+            self.assertEqual(4, self.fat_ConvWriteBool(buf, True))
+            self.assertEqual(6, self.fat_ConvWriteQuote(buf, s))
+            for i in range(1000):
+                self.fat_ConvWriteInt(buf, i, 10)
+            want = b"4271.5e-07true" + b'"a\\tb"' + b"".join(b"%d" % i for i in range(1000))
+            self.assertEqual(want, self._buffer_contents(buf))
+        finally:
+            self.fat_StringFree(s)
+            self.fat_BytesBufferFree(buf)
+
+    def test_write_float_array_round_trips(self) -> None:
+        values = [0.1, -0.0, 1e23, 5e-324, 1.7976931348623157e308, 23.47, 2.0 / 3.0, 100.0]
+        arr = (ctypes.c_double * len(values))(*values)
+        buf = self.fat_BytesBufferNew()
+        try:
+            n = self.fat_ConvWriteFloatArray(buf, arr, len(values), ord("g"), -1, 64, ord(","))
+            text = self._buffer_contents(buf)
+            self.assertEqual(len(text), n)
+            self.assertEqual(b"0.1,-0,1e+23,5e-324,1.7976931348623157e+308,23.47,0.6666666666666666,100", text)
+            self.assertEqual(values, [float(v) for v in text.split(b",")])
+
+            self.assertEqual(0, self.fat_ConvWriteFloatArray(buf, None, 0, ord("g"), -1, 64, ord(",")))
+            self.assertEqual(10, self.fat_ConvWriteFloatArray(buf, arr, 2, ord("f"), 2, 64, ord("\n")))
+            self.assertEqual(text + b"0.10\n-0.00", self._buffer_contents(buf))
+        finally:
+            self.fat_BytesBufferFree(buf)
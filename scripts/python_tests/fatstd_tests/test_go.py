@@ -12,8 +12,25 @@ class TestGo(unittest.TestCase):
         cls.fat_GoAdd = bind(
             "fat_GoAdd", argtypes=[ctypes.c_int, ctypes.c_int], restype=ctypes.c_int
         )
+        cls.fat_GoMemStats = bind(
+            "fat_GoMemStats",
+            argtypes=[ctypes.POINTER(ctypes.c_uint64), ctypes.POINTER(ctypes.c_uint64)],
+            restype=None,
+        )
+        cls.fat_StringNewUTF8 = bind("fat_StringNewUTF8", argtypes=[ctypes.c_char_p], restype=ctypes.c_size_t)
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[ctypes.c_size_t], restype=None)
 
     def test_fat_GoAdd(self) -> None:
         got = self.fat_GoAdd(2, 3)
         self.assertEqual(5, got)
 
+
+    def test_fat_GoMemStats_counts_allocations(self) -> None:
+        allocs0, bytes0 = ctypes.c_uint64(), ctypes.c_uint64()
+        allocs1, bytes1 = ctypes.c_uint64(), ctypes.c_uint64()
+        self.fat_GoMemStats(ctypes.byref(allocs0), ctypes.byref(bytes0))
+        for _ in range(100):
+            self.fat_StringFree(self.fat_StringNewUTF8(b"allocation probe"))
+        self.fat_GoMemStats(ctypes.byref(allocs1), ctypes.byref(bytes1))
+        self.assertGreaterEqual(allocs1.value - allocs0.value, 100)
+        self.assertGreater(bytes1.value, bytes0.value)
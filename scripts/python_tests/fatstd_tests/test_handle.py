@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import ctypes
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+def _handle_array(handles: list[int]):
+    return (fat_string_handle_type() * len(handles))(*handles)
+
+
+class TestHandle(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_HandlesFree = bind(
+            "fat_HandlesFree", argtypes=[ctypes.POINTER(fat_handle), ctypes.c_size_t], restype=None
+        )
+        cls.fat_StringNewUTF8 = bind(
+            "fat_StringNewUTF8", argtypes=[ctypes.c_char_p], restype=fat_handle
+        )
+        cls.fat_StringSplit = bind(
+            "fat_StringSplit", argtypes=[fat_handle, fat_handle], restype=fat_handle
+        )
+        cls.fat_StringLenBytes = bind(
+            "fat_StringLenBytes", argtypes=[fat_handle], restype=ctypes.c_size_t
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesNewN = bind(
+            "fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_BytesBufferNew = bind("fat_BytesBufferNew", argtypes=[], restype=fat_handle)
+
+    def test_free_empty_batch(self) -> None:
+        self.fat_HandlesFree(None, 0)
+
+    def test_free_mixed_types(self) -> None:
+        s = self.fat_StringNewUTF8(b"a,b,c")
+        sep = self.fat_StringNewUTF8(b",")
+        parts = self.fat_StringSplit(s, sep)
+        raw = ctypes.create_string_buffer(b"\x00\x01", 2)
+        b = self.fat_BytesNewN(ctypes.addressof(raw), 2)
+        buf = self.fat_BytesBufferNew()
+
+        handles = [s, sep, parts, b, buf]
+        self.assertEqual(len(handles), len(set(handles)))
+        self.fat_HandlesFree(_handle_array(handles), len(handles))
+
+    def test_free_many_strings(self) -> None:
+        keep = self.fat_StringNewUTF8(b"keep")
+        handles = [self.fat_StringNewUTF8(f"s{i}".encode()) for i in range(2000)]
+        self.fat_HandlesFree(_handle_array(handles), len(handles))
+
+        self.assertEqual(4, self.fat_StringLenBytes(keep))
+        fresh = self.fat_StringNewUTF8(b"fresh")
+        self.assertNotIn(fresh, handles)
+        self.assertEqual(5, self.fat_StringLenBytes(fresh))
+        self.fat_StringFree(fresh)
+        self.fat_StringFree(keep)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import ctypes
+import unittest
+
+from fatstd_test_support import bind, dump_handle_stats, fat_string_handle_type, set_handle_tracking
+
+
+class TestHandleStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+        u64p = ctypes.POINTER(ctypes.c_uint64)
+
+        cls.fat_HandleTracking = bind("fat_HandleTracking", argtypes=[], restype=ctypes.c_int)
+        cls.fat_HandleStats = bind("fat_HandleStats", argtypes=[u64p, u64p, u64p, u64p], restype=None)
+        cls.fat_StringNewUTF8 = bind(
+            "fat_StringNewUTF8", argtypes=[ctypes.c_char_p], restype=fat_handle
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesNewN = bind(
+            "fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+
+    def setUp(self) -> None:
+        self._previous = self.fat_HandleTracking()
+
+    def tearDown(self) -> None:
+        bind("fat_HandleSetTracking", argtypes=[ctypes.c_int], restype=None)(self._previous)
+
+    def _stats(self) -> tuple[int, int, int, int]:
+        out = [ctypes.c_uint64() for _ in range(4)]
+        self.fat_HandleStats(*(ctypes.byref(v) for v in out))
+        return tuple(v.value for v in out)
+
+    def test_totals_track_register_and_free(self) -> None:
+        live0, reg0, freed0, _ = self._stats()
+        handles = [self.fat_StringNewUTF8(b"x") for _ in range(10)]
+        live1, reg1, freed1, _ = self._stats()
+        self.assertEqual(reg1 - reg0, 10)
+        self.assertEqual(live1 - live0, 10)
+        for h in handles:
+            self.fat_StringFree(h)
+        live2, _, freed2, _ = self._stats()
+        self.assertEqual(freed2 - freed1, 10)
+        self.assertEqual(live2, live0)
+        self.assertGreaterEqual(freed1, freed0)
+
+    def test_high_water_requires_tracking(self) -> None:
+        set_handle_tracking("off")
+        self.assertEqual(self._stats()[3], 0)
+
+        set_handle_tracking("counts")
+        base = self._stats()[0]
+        handles = [self.fat_StringNewUTF8(b"x") for _ in range(25)]
+        for h in handles:
+            self.fat_StringFree(h)
+        live, _, _, high = self._stats()
+        self.assertEqual(live, base)
+        self.assertGreaterEqual(high, base + 25)
+
+    def test_dump_reports_types(self) -> None:
+        set_handle_tracking("counts")
+        s = self.fat_StringNewUTF8(b"leak?")
+        report = dump_handle_stats()
+        self.assertIn("tracking=counts", report)
+        self.assertIn("*fatstrings.String", report)
+        self.fat_StringFree(s)
+
+    def test_dump_reports_origins(self) -> None:
+        set_handle_tracking("origins")
+        leaked = [self.fat_BytesNewN(b"abc", 3) for _ in range(3)]
+        report = dump_handle_stats()
+        self.assertIn("tracking=origins", report)
+        line = next(l for l in report.splitlines() if "fatstd_go_bytes_new_n" in l)
+        self.assertIn("*fatbytes.Bytes", line)
+        self.assertGreaterEqual(int(line.split()[-1]), 3)
+        for h in leaked:
+            self.fat_BytesFree(h)
+        self.assertNotIn("fatstd_go_bytes_new_n", dump_handle_stats())
+
+    def test_dump_truncates_and_terminates(self) -> None:
+        fn = bind("fat_HandleStatsDump", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=ctypes.c_size_t)
+        buf = ctypes.create_string_buffer(b"\xff" * 8, 8)
+        n = fn(buf, 8)
+        self.assertGreater(n, 8)
+        self.assertEqual(buf.raw[7], 0)
+        self.assertEqual(buf.value, b"handles")
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import ctypes
+import mmap
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+_RELEASE_FUNC = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)
+
+# Anonymous private mappings read as the shared zero page until written, so
+# multi-GiB inputs cost almost no memory.
+_SIZE = 3 << 30
+_MARK = (5 << 29) + 7  # 2.5 GiB + 7
+
+
+class TestLargeLengths(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_BytesNewAdopt = bind(
+            "fat_BytesNewAdopt",
+            argtypes=[ctypes.c_void_p, ctypes.c_size_t, _RELEASE_FUNC, ctypes.c_void_p],
+            restype=fat_handle,
+        )
+        cls.fat_BytesNewN = bind(
+            "fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesIndexByte = bind(
+            "fat_BytesIndexByte", argtypes=[fat_handle, ctypes.c_uint8], restype=ctypes.c_int64
+        )
+        cls.fat_BytesIndex = bind(
+            "fat_BytesIndex", argtypes=[fat_handle, fat_handle], restype=ctypes.c_int64
+        )
+        cls.fat_BytesCount = bind(
+            "fat_BytesCount", argtypes=[fat_handle, fat_handle], restype=ctypes.c_int64
+        )
+        cls.fat_BytesCopyOut = bind(
+            "fat_BytesCopyOut",
+            argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_StringNewUTF8 = bind(
+            "fat_StringNewUTF8", argtypes=[ctypes.c_char_p], restype=fat_handle
+        )
+        cls.fat_StringCopyOut = bind(
+            "fat_StringCopyOut",
+            argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesReaderNew = bind("fat_BytesReaderNew", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_BytesReaderSize = bind(
+            "fat_BytesReaderSize", argtypes=[fat_handle], restype=ctypes.c_int64
+        )
+        cls.fat_BytesReaderSeek = bind(
+            "fat_BytesReaderSeek",
+            argtypes=[fat_handle, ctypes.c_int64, ctypes.c_int],
+            restype=ctypes.c_int64,
+        )
+        cls.fat_BytesReaderRead = bind(
+            "fat_BytesReaderRead",
+            argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t, ctypes.POINTER(ctypes.c_bool)],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_BytesReaderFree = bind("fat_BytesReaderFree", argtypes=[fat_handle], restype=None)
+
+    def setUp(self) -> None:
+        try:
+            self.region = mmap.mmap(-1, _SIZE, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+        except (OSError, ValueError, OverflowError) as exc:
+            self.skipTest(f"cannot reserve {_SIZE} bytes: {exc}")
+        self.view = ctypes.c_char.from_buffer(self.region)
+        self.addr = ctypes.addressof(self.view)
+
+        def _close() -> None:
+            del self.view
+            self.region.close()
+
+        self.addCleanup(_close)
+
+    def _adopt(self) -> int:
+        b = self.fat_BytesNewAdopt(self.addr, _SIZE, _RELEASE_FUNC(), None)
+        self.addCleanup(self.fat_BytesFree, b)
+        return b
+
+    def test_index_and_count_beyond_2gib(self) -> None:
+        self.region[_MARK : _MARK + 4] = b"\x7fEND"
+        b = self._adopt()
+        sep = self.fat_BytesNewN(b"\x7fEND", 4)
+        self.addCleanup(self.fat_BytesFree, sep)
+
+        self.assertEqual(self.fat_BytesIndexByte(b, 0x7F), _MARK)
+        self.assertEqual(self.fat_BytesIndex(b, sep), _MARK)
+        self.assertEqual(self.fat_BytesCount(b, sep), 1)
+
+    def test_reader_over_large_bytes(self) -> None:
+        self.region[_SIZE - 4 :] = b"tail"
+        r = self.fat_BytesReaderNew(self._adopt())
+        self.assertEqual(self.fat_BytesReaderSize(r), _SIZE)
+        self.assertEqual(self.fat_BytesReaderSeek(r, -4, 2), _SIZE - 4)
+        out = ctypes.create_string_buffer(8)
+        eof = ctypes.c_bool()
+        self.assertEqual(self.fat_BytesReaderRead(r, out, 8, ctypes.byref(eof)), 4)
+        self.assertEqual(out.raw[:4], b"tail")
+        self.fat_BytesReaderFree(r)
+
+    def test_copy_out_into_large_destination(self) -> None:
+        b = self.fat_BytesNewN(b"abc", 3)
+        self.assertEqual(self.fat_BytesCopyOut(b, self.addr, _SIZE), 3)
+        self.fat_BytesFree(b)
+        s = self.fat_StringNewUTF8(b"xyz!")
+        self.assertEqual(self.fat_StringCopyOut(s, self.addr + 3, _SIZE - 3), 4)
+        self.fat_StringFree(s)
+        self.assertEqual(self.region[:7], b"abcxyz!")
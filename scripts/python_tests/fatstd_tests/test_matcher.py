@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import ctypes
+import random
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+FAT_OK = 0
+FAT_ERR_SYNTAX = 1
+
+
+def _brute_force(patterns: list[bytes], haystack: bytes) -> list[tuple[int, int]]:
+    found = []
+    for pid, p in enumerate(patterns):
+        start = haystack.find(p)
+        while start >= 0:
+            found.append((pid, start))
+            start = haystack.find(p, start + 1)
+    return sorted(found, key=lambda m: (m[1] + len(patterns[m[0]]), -len(patterns[m[0]]), m[0]))
+
+
+class TestMatcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+        size_p = ctypes.POINTER(ctypes.c_size_t)
+        u64_p = ctypes.POINTER(ctypes.c_uint64)
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringSplit = bind("fat_StringSplit", argtypes=[fat_handle, fat_handle], restype=fat_handle)
+        cls.fat_StringFields = bind("fat_StringFields", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_StringArrayFree = bind("fat_StringArrayFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesNewN = bind(
+            "fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_ErrorFree = bind("fat_ErrorFree", argtypes=[fat_handle], restype=None)
+
+        cls.fat_MatcherNew = bind(
+            "fat_MatcherNew",
+            argtypes=[fat_handle, ctypes.POINTER(fat_handle), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_int,
+        )
+        cls.fat_MatcherPatternCount = bind(
+            "fat_MatcherPatternCount", argtypes=[fat_handle], restype=ctypes.c_size_t
+        )
+        cls.fat_MatcherContainsBytes = bind(
+            "fat_MatcherContainsBytes", argtypes=[fat_handle, fat_handle], restype=ctypes.c_bool
+        )
+        cls.fat_MatcherContainsString = bind(
+            "fat_MatcherContainsString", argtypes=[fat_handle, fat_handle], restype=ctypes.c_bool
+        )
+        cls.fat_MatcherCountBytes = bind(
+            "fat_MatcherCountBytes", argtypes=[fat_handle, fat_handle], restype=ctypes.c_size_t
+        )
+        cls.fat_MatcherCountString = bind(
+            "fat_MatcherCountString", argtypes=[fat_handle, fat_handle], restype=ctypes.c_size_t
+        )
+        cls.fat_MatcherFindAllBytes = bind(
+            "fat_MatcherFindAllBytes",
+            argtypes=[fat_handle, fat_handle, size_p, size_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_MatcherFindAllString = bind(
+            "fat_MatcherFindAllString",
+            argtypes=[fat_handle, fat_handle, size_p, size_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_MatcherFree = bind("fat_MatcherFree", argtypes=[fat_handle], restype=None)
+        cls.fat_HandlesFree = bind(
+            "fat_HandlesFree", argtypes=[ctypes.POINTER(fat_handle), ctypes.c_size_t], restype=None
+        )
+        cls.fat_HandleStats = bind("fat_HandleStats", argtypes=[u64_p, u64_p, u64_p, u64_p], restype=None)
+        cls.fat_ArenaNew = bind("fat_ArenaNew", argtypes=[], restype=fat_handle)
+        cls.fat_ArenaPush = bind("fat_ArenaPush", argtypes=[fat_handle], restype=None)
+        cls.fat_ArenaPop = bind("fat_ArenaPop", argtypes=[fat_handle], restype=None)
+        cls.fat_ArenaLen = bind("fat_ArenaLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_ArenaRelease = bind("fat_ArenaRelease", argtypes=[fat_handle], restype=None)
+        cls.fat_ArenaFree = bind("fat_ArenaFree", argtypes=[fat_handle], restype=None)
+
+    def _string(self, data: bytes) -> int:
+        return self.fat_StringNewUTF8N(data, len(data))
+
+    def _string_array(self, items: list[bytes]) -> int:
+        if not items:
+            blank = self._string(b" ")
+            try:
+                return self.fat_StringFields(blank)
+            finally:
+                self.fat_StringFree(blank)
+        assert all(b"|" not in item for item in items)
+        joined = self._string(b"|".join(items))
+        sep = self._string(b"|")
+        try:
+            return self.fat_StringSplit(joined, sep)
+        finally:
+            self.fat_StringFree(joined)
+            self.fat_StringFree(sep)
+
+    def _new_matcher(self, patterns: list[bytes]) -> int:
+        arr = self._string_array(patterns)
+        out = fat_string_handle_type()(0)
+        err = fat_string_handle_type()(0)
+        try:
+            st = self.fat_MatcherNew(arr, ctypes.byref(out), ctypes.byref(err))
+        finally:
+            self.fat_StringArrayFree(arr)
+        self.assertEqual(FAT_OK, st)
+        self.assertEqual(0, err.value)
+        self.assertNotEqual(0, out.value)
+        return out.value
+
+    def _freed(self) -> int:
+        out = [ctypes.c_uint64() for _ in range(4)]
+        self.fat_HandleStats(*(ctypes.byref(v) for v in out))
+        return out[2].value
+
+    def _find_all(self, fn, m: int, h: int, cap: int) -> tuple[int, list[tuple[int, int]]]:
+        patterns = (ctypes.c_size_t * max(cap, 1))()
+        offsets = (ctypes.c_size_t * max(cap, 1))()
+        total = fn(m, h, patterns, offsets, cap)
+        return total, [(patterns[i], offsets[i]) for i in range(min(total, cap))]
+
+    def test_classic_overlapping_matches(self) -> None:
+        patterns = [b"he", b"she", b"his", b"hers"]
+        m = self._new_matcher(patterns)
+        s = self._string(b"ushers")
+        try:
+            self.assertEqual(4, self.fat_MatcherPatternCount(m))
+            total, got = self._find_all(self.fat_MatcherFindAllString, m, s, 16)
+            self.assertEqual(3, total)
+            self.assertEqual([(1, 1), (0, 2), (3, 2)], got)
+            self.assertEqual(3, self.fat_MatcherCountString(m, s))
+            self.assertTrue(self.fat_MatcherContainsString(m, s))
+        finally:
+            self.fat_StringFree(s)
+            self.fat_MatcherFree(m)
+
+    def test_bytes_with_nul_and_truncated_output(self) -> None:
+        patterns = [b"\x00\x01", b"\x01", b"zz"]
+        m = self._new_matcher(patterns)
+        payload = b"a\x00\x01b\x00\x01"
+        b = self.fat_BytesNewN(payload, len(payload))
+        try:
+            total, got = self._find_all(self.fat_MatcherFindAllBytes, m, b, 2)
+            self.assertEqual(4, total)
+            self.assertEqual([(0, 1), (1, 2)], got)
+            self.assertEqual(4, self.fat_MatcherFindAllBytes(m, b, None, None, 0))
+            self.assertEqual(4, self.fat_MatcherCountBytes(m, b))
+            self.assertTrue(self.fat_MatcherContainsBytes(m, b))
+        finally:
+            self.fat_BytesFree(b)
+            self.fat_MatcherFree(m)
+
+    def test_no_match_and_empty_pattern_set(self) -> None:
+        m = self._new_matcher([b"needle"])
+        empty = self._string_array([])
+        out = fat_string_handle_type()(0)
+        err = fat_string_handle_type()(0)
+        st = self.fat_MatcherNew(empty, ctypes.byref(out), ctypes.byref(err))
+        self.fat_StringArrayFree(empty)
+        self.assertEqual(FAT_OK, st)
+        s = self._string(b"haystack without it")
+        try:
+            self.assertFalse(self.fat_MatcherContainsString(m, s))
+            self.assertEqual(0, self.fat_MatcherCountString(m, s))
+            self.assertEqual(0, self.fat_MatcherCountString(out.value, s))
+        finally:
+            self.fat_StringFree(s)
+            self.fat_MatcherFree(m)
+            self.fat_MatcherFree(out.value)
+
+    def test_empty_pattern_is_rejected(self) -> None:
+        arr = self._string_array([b"ok", b""])
+        out = fat_string_handle_type()(0)
+        err = fat_string_handle_type()(0)
+        st = self.fat_MatcherNew(arr, ctypes.byref(out), ctypes.byref(err))
+        self.fat_StringArrayFree(arr)
+        self.assertEqual(FAT_ERR_SYNTAX, st)
+        self.assertEqual(0, out.value)
+        self.assertNotEqual(0, err.value)
+        self.fat_ErrorFree(err.value)
+
+    def test_matches_brute_force(self) -> None:
+        rng = random.Random(1234)
+        patterns = list({bytes(rng.choice(b"abc") for _ in range(rng.randint(1, 5))) for _ in range(40)})
+        haystack = bytes(rng.choice(b"abcd") for _ in range(2000))
+        patterns.append(patterns[0])  # duplicates are reported per occurrence in the set
+        m = self._new_matcher(patterns)
+        b = self.fat_BytesNewN(haystack, len(haystack))
+        try:
+            want = _brute_force(patterns, haystack)
+            n = self.fat_MatcherCountBytes(m, b)
+            self.assertEqual(len(want), n)
+            total, got = self._find_all(self.fat_MatcherFindAllBytes, m, b, n)
+            self.assertEqual(n, total)
+            key = lambda x: (x[1] + len(patterns[x[0]]), -len(patterns[x[0]]), x[0])
+            self.assertEqual(want, sorted(got, key=key))
+            ends = [start + len(patterns[pid]) for pid, start in got]
+            self.assertEqual(sorted(ends), ends)
+        finally:
+            self.fat_BytesFree(b)
+            self.fat_MatcherFree(m)
+
+    def test_batch_free_and_arena_release(self) -> None:
+        m = self._new_matcher([b"a", b"b"])
+        freed = self._freed()
+        self.fat_HandlesFree((ctypes.c_size_t * 1)(m), 1)
+        self.assertEqual(freed + 1, self._freed())
+
+        arr = self._string_array([b"needle"])
+        out = fat_string_handle_type()(0)
+        err = fat_string_handle_type()(0)
+        arena = self.fat_ArenaNew()
+        self.fat_ArenaPush(arena)
+        st = self.fat_MatcherNew(arr, ctypes.byref(out), ctypes.byref(err))
+        self.fat_ArenaPop(arena)
+        self.fat_StringArrayFree(arr)
+        self.assertEqual(FAT_OK, st)
+        self.assertEqual(1, self.fat_ArenaLen(arena))
+        freed = self._freed()
+        self.fat_ArenaRelease(arena)
+        self.assertEqual(freed + 1, self._freed())
+        self.fat_ArenaFree(arena)
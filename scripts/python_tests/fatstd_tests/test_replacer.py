@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import ctypes
+import threading
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestReplacer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringLenBytes = bind("fat_StringLenBytes", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringCopyOut = bind(
+            "fat_StringCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringSplit = bind("fat_StringSplit", argtypes=[fat_handle, fat_handle], restype=fat_handle)
+        cls.fat_StringFields = bind("fat_StringFields", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_StringArrayFree = bind("fat_StringArrayFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesNewN = bind("fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle)
+        cls.fat_BytesLen = bind("fat_BytesLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesCopyOut = bind(
+            "fat_BytesCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesBufferNew = bind("fat_BytesBufferNew", argtypes=[], restype=fat_handle)
+        cls.fat_BytesBufferBytes = bind("fat_BytesBufferBytes", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_BytesBufferFree = bind("fat_BytesBufferFree", argtypes=[fat_handle], restype=None)
+
+        cls.fat_ReplacerNew = bind("fat_ReplacerNew", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_ReplacerFree = bind("fat_ReplacerFree", argtypes=[fat_handle], restype=None)
+        cls.fat_ReplacerReplace = bind("fat_ReplacerReplace", argtypes=[fat_handle, fat_handle], restype=fat_handle)
+        cls.fat_ReplacerReplaceBytes = bind(
+            "fat_ReplacerReplaceBytes", argtypes=[fat_handle, fat_handle], restype=fat_handle
+        )
+        cls.fat_ReplacerWriteString = bind(
+            "fat_ReplacerWriteString", argtypes=[fat_handle, fat_handle, fat_handle], restype=ctypes.c_size_t
+        )
+        cls.fat_ReplacerWriteBytes = bind(
+            "fat_ReplacerWriteBytes", argtypes=[fat_handle, fat_handle, fat_handle], restype=ctypes.c_size_t
+        )
+
+    def _string(self, data: bytes) -> int:
+        return self.fat_StringNewUTF8N(data, len(data))
+
+    def _str_to_py(self, s: int) -> bytes:
+        n = self.fat_StringLenBytes(s)
+        buf = ctypes.create_string_buffer(n)
+        self.fat_StringCopyOut(s, buf, n)
+        return buf.raw[:n]
+
+    def _bytes_to_py(self, b: int) -> bytes:
+        n = self.fat_BytesLen(b)
+        buf = ctypes.create_string_buffer(n)
+        self.fat_BytesCopyOut(b, buf, n)
+        return buf.raw[:n]
+
+    def _replacer(self, oldnew: list[bytes]) -> int:
+        if oldnew:
+            s = self._string(b"|".join(oldnew))
+            sep = self._string(b"|")
+            arr = self.fat_StringSplit(s, sep)
+            self.fat_StringFree(sep)
+        else:
+            s = self._string(b" ")
+            arr = self.fat_StringFields(s)
+        self.fat_StringFree(s)
+        r = self.fat_ReplacerNew(arr)
+        self.fat_StringArrayFree(arr)
+        return r
+
+    def _replace(self, r: int, data: bytes) -> bytes:
+        s = self._string(data)
+        out = self.fat_ReplacerReplace(r, s)
+        try:
+            return self._str_to_py(out)
+        finally:
+            self.fat_StringFree(out)
+            self.fat_StringFree(s)
+
+    def test_html_escape_in_one_pass(self) -> None:
+        r = self._replacer([b"&", b"&amp;", b"<", b"&lt;", b">", b"&gt;", b'"', b"&quot;"])
+        try:
+            self.assertEqual(b"&lt;a href=&quot;x&amp;y&quot;&gt;", self._replace(r, b'<a href="x&y">'))
+            self.assertEqual(b"plain", self._replace(r, b"plain"))
+            self.assertEqual(b"", self._replace(r, b""))
+        finally:
+            self.fat_ReplacerFree(r)
+
+    def test_go_semantics(self) -> None:
+        # Pairs are tried in argument order and replaced text is not rescanned.
+        r = self._replacer([b"a", b"1", b"aa", b"2", b"1", b"a"])
+        self.assertEqual(b"111a", self._replace(r, b"aaa1"))
+        self.fat_ReplacerFree(r)
+
+        r = self._replacer([b"", b"-"])
+        self.assertEqual(b"-a-b-", self._replace(r, b"ab"))
+        self.fat_ReplacerFree(r)
+
+        r = self._replacer([])
+        self.assertEqual(b"unchanged", self._replace(r, b"unchanged"))
+        self.fat_ReplacerFree(r)
+
+    def test_bytes_and_buffer(self) -> None:
+        r = self._replacer([b"{{name}}", b"fat", b"\x00", b"\\0"])
+        data = b"hello {{name}}\x00 and {{name}}"
+        b = self.fat_BytesNewN(data, len(data))
+        dst = self.fat_BytesBufferNew()
+        try:
+            out = self.fat_ReplacerReplaceBytes(r, b)
+            self.assertEqual(b"hello fat\\0 and fat", self._bytes_to_py(out))
+            self.fat_BytesFree(out)
+
+            self.assertEqual(19, self.fat_ReplacerWriteBytes(r, dst, b))
+            s = self._string(b"|{{name}}")
+            self.assertEqual(4, self.fat_ReplacerWriteString(r, dst, s))
+            self.fat_StringFree(s)
+            contents = self.fat_BytesBufferBytes(dst)
+            self.assertEqual(b"hello fat\\0 and fat|fat", self._bytes_to_py(contents))
+            self.fat_BytesFree(contents)
+        finally:
+            self.fat_BytesBufferFree(dst)
+            self.fat_BytesFree(b)
+            self.fat_ReplacerFree(r)
+
+    def test_shared_across_threads(self) -> None:
+        r = self._replacer([b"cat", b"dog", b"dog", b"cat"])
+        errors = []
+
+        def work() -> None:
+            for _ in range(200):
+                got = self._replace(r, b"cat chases dog")
+                if got != b"dog chases cat":
+                    errors.append(got)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.fat_ReplacerFree(r)
+        self.assertEqual([], errors)
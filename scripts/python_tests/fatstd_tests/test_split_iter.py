@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import ctypes
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+_RELEASE_FUNC = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p)
+
+
+class TestSplitIter(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+        size_p = ctypes.POINTER(ctypes.c_size_t)
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesNewN = bind("fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle)
+        cls.fat_BytesNewAdopt = bind(
+            "fat_BytesNewAdopt",
+            argtypes=[ctypes.c_void_p, ctypes.c_size_t, _RELEASE_FUNC, ctypes.c_void_p],
+            restype=fat_handle,
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+
+        cls.fat_StringSplitIterNew = bind(
+            "fat_StringSplitIterNew", argtypes=[fat_handle, fat_handle, ctypes.c_int], restype=fat_handle
+        )
+        cls.fat_StringFieldsIterNew = bind("fat_StringFieldsIterNew", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_BytesSplitIterNew = bind(
+            "fat_BytesSplitIterNew", argtypes=[fat_handle, fat_handle, ctypes.c_int], restype=fat_handle
+        )
+        cls.fat_BytesFieldsIterNew = bind("fat_BytesFieldsIterNew", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_SplitIterNext = bind(
+            "fat_SplitIterNext", argtypes=[fat_handle, size_p, size_p], restype=ctypes.c_bool
+        )
+        cls.fat_SplitIterNextBatch = bind(
+            "fat_SplitIterNextBatch", argtypes=[fat_handle, size_p, size_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_SplitIterFree = bind("fat_SplitIterFree", argtypes=[fat_handle], restype=None)
+
+    def _string(self, data: bytes) -> int:
+        return self.fat_StringNewUTF8N(data, len(data))
+
+    def _drain(self, it: int, data: bytes) -> list[bytes]:
+        off, n = ctypes.c_size_t(), ctypes.c_size_t()
+        out = []
+        while self.fat_SplitIterNext(it, ctypes.byref(off), ctypes.byref(n)):
+            out.append(data[off.value : off.value + n.value])
+        self.assertFalse(self.fat_SplitIterNext(it, ctypes.byref(off), ctypes.byref(n)))
+        self.assertEqual((0, 0), (off.value, n.value))
+        return out
+
+    def test_string_split_matches_python(self) -> None:
+        cases = [
+            (b"a,b,,c,", b",", -1),
+            (b"a,b,,c,", b",", 2),
+            (b"a,b,,c,", b",", 0),
+            (b"", b",", -1),
+            (b"no-sep", b",", -1),
+            (b"x--y--z", b"--", -1),
+        ]
+        for data, sep, n in cases:
+            s, sep_h = self._string(data), self._string(sep)
+            it = self.fat_StringSplitIterNew(s, sep_h, n)
+            self.fat_StringFree(s)
+            self.fat_StringFree(sep_h)
+            if n == 0:
+                want = []
+            elif n < 0:
+                want = data.split(sep)
+            else:
+                want = data.split(sep, n - 1)
+            self.assertEqual(want, self._drain(it, data), (data, sep, n))
+            self.fat_SplitIterFree(it)
+
+    def test_empty_separator_splits_utf8_sequences(self) -> None:
+        data = "añb".encode()
+        s, sep = self._string(data), self._string(b"")
+        it = self.fat_StringSplitIterNew(s, sep, -1)
+        self.assertEqual([b"a", "ñ".encode(), b"b"], self._drain(it, data))
+        self.fat_SplitIterFree(it)
+        self.fat_StringFree(s)
+        self.fat_StringFree(sep)
+
+    def test_fields(self) -> None:
+        data = "  alpha\tbeta gamma \n".encode()
+        s = self._string(data)
+        it = self.fat_StringFieldsIterNew(s)
+        self.assertEqual([b"alpha", b"beta", b"gamma"], self._drain(it, data))
+        self.fat_SplitIterFree(it)
+        self.fat_StringFree(s)
+
+        b = self.fat_BytesNewN(data, len(data))
+        it = self.fat_BytesFieldsIterNew(b)
+        self.fat_BytesFree(b)
+        self.assertEqual([b"alpha", b"beta", b"gamma"], self._drain(it, data))
+        self.fat_SplitIterFree(it)
+
+    def test_bytes_batch(self) -> None:
+        data = b"\n".join(b"line %d" % i for i in range(100))
+        b = self.fat_BytesNewN(data, len(data))
+        sep = self.fat_BytesNewN(b"\n", 1)
+        it = self.fat_BytesSplitIterNew(b, sep, -1)
+        self.fat_BytesFree(sep)
+        offsets = (ctypes.c_size_t * 32)()
+        lens = (ctypes.c_size_t * 32)()
+        got = []
+        while True:
+            n = self.fat_SplitIterNextBatch(it, offsets, lens, 32)
+            got.extend(data[offsets[i] : offsets[i] + lens[i]] for i in range(n))
+            if n < 32:
+                break
+        self.assertEqual(data.split(b"\n"), got)
+        self.assertEqual(0, self.fat_SplitIterNextBatch(it, offsets, lens, 32))
+        self.assertEqual(0, self.fat_SplitIterNextBatch(it, None, None, 0))
+        self.fat_SplitIterFree(it)
+        self.fat_BytesFree(b)
+
+    def test_iterator_retains_adopted_source(self) -> None:
+        released = []
+        release = _RELEASE_FUNC(lambda data, n, user: released.append(n))
+        buf = ctypes.create_string_buffer(b"k=v;k2=v2", 9)
+        b = self.fat_BytesNewAdopt(ctypes.addressof(buf), 9, release, None)
+        sep = self.fat_BytesNewN(b";", 1)
+        it = self.fat_BytesSplitIterNew(b, sep, -1)
+        self.fat_BytesFree(sep)
+        self.fat_BytesFree(b)
+        self.assertEqual([], released)
+        self.assertEqual([b"k=v", b"k2=v2"], self._drain(it, buf.raw))
+        self.fat_SplitIterFree(it)
+        self.assertEqual([9], released)
@@ -74,10 +74,10 @@ class TestString(unittest.TestCase):
         cls.fat_StringToLower = bind("fat_StringToLower", argtypes=[fat_string], restype=fat_string)
         cls.fat_StringToUpper = bind("fat_StringToUpper", argtypes=[fat_string], restype=fat_string)
         cls.fat_StringIndex = bind(
-            "fat_StringIndex", argtypes=[fat_string, fat_string], restype=ctypes.c_int
+            "fat_StringIndex", argtypes=[fat_string, fat_string], restype=ctypes.c_int64
         )
         cls.fat_StringCount = bind(
-            "fat_StringCount", argtypes=[fat_string, fat_string], restype=ctypes.c_int
+            "fat_StringCount", argtypes=[fat_string, fat_string], restype=ctypes.c_int64
         )
         cls.fat_StringCompare = bind(
             "fat_StringCompare", argtypes=[fat_string, fat_string], restype=ctypes.c_int
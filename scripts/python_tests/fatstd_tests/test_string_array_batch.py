@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import ctypes
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestStringArrayBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+        bool_p = ctypes.POINTER(ctypes.c_bool)
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringLenBytes = bind("fat_StringLenBytes", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringCopyOut = bind(
+            "fat_StringCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringSplit = bind("fat_StringSplit", argtypes=[fat_handle, fat_handle], restype=fat_handle)
+        cls.fat_StringFields = bind("fat_StringFields", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_StringArrayLen = bind("fat_StringArrayLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringArrayGet = bind(
+            "fat_StringArrayGet", argtypes=[fat_handle, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringArrayFree = bind("fat_StringArrayFree", argtypes=[fat_handle], restype=None)
+
+        for name in ("ToLower", "ToUpper", "TrimSpace"):
+            setattr(cls, f"fat_StringArray{name}", bind(f"fat_StringArray{name}", argtypes=[fat_handle], restype=fat_handle))
+        for name in ("HasPrefix", "HasSuffix", "Contains", "EqualFold"):
+            setattr(
+                cls,
+                f"fat_StringArray{name}",
+                bind(
+                    f"fat_StringArray{name}",
+                    argtypes=[fat_handle, fat_handle, bool_p, ctypes.c_size_t],
+                    restype=ctypes.c_size_t,
+                ),
+            )
+        cls.fat_StringArrayIndex = bind(
+            "fat_StringArrayIndex",
+            argtypes=[fat_handle, fat_handle, ctypes.POINTER(ctypes.c_int64), ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+
+    def _string(self, data: bytes) -> int:
+        return self.fat_StringNewUTF8N(data, len(data))
+
+    def _array(self, items: list[bytes]) -> int:
+        if not items:
+            blank = self._string(b" ")
+            try:
+                return self.fat_StringFields(blank)
+            finally:
+                self.fat_StringFree(blank)
+        joined = self._string(b"|".join(items))
+        sep = self._string(b"|")
+        try:
+            return self.fat_StringSplit(joined, sep)
+        finally:
+            self.fat_StringFree(joined)
+            self.fat_StringFree(sep)
+
+    def _values(self, arr: int) -> list[bytes]:
+        out = []
+        for i in range(self.fat_StringArrayLen(arr)):
+            s = self.fat_StringArrayGet(arr, i)
+            n = self.fat_StringLenBytes(s)
+            buf = ctypes.create_string_buffer(n)
+            self.fat_StringCopyOut(s, buf, n)
+            self.fat_StringFree(s)
+            out.append(buf.raw[:n])
+        return out
+
+    def test_map_operations_return_new_arrays(self) -> None:
+        items = [b"  Hello ", b"WORLD", "\tÉcole\n".encode(), b""]
+        arr = self._array(items)
+        try:
+            cases = [
+                (self.fat_StringArrayToLower, [b"  hello ", b"world", "\técole\n".encode(), b""]),
+                (self.fat_StringArrayToUpper, [b"  HELLO ", b"WORLD", "\tÉCOLE\n".encode(), b""]),
+                (self.fat_StringArrayTrimSpace, [b"Hello", b"WORLD", "École".encode(), b""]),
+            ]
+            for fn, want in cases:
+                out = fn(arr)
+                try:
+                    self.assertNotEqual(arr, out)
+                    self.assertEqual(want, self._values(out))
+                finally:
+                    self.fat_StringArrayFree(out)
+            self.assertEqual(items, self._values(arr))
+        finally:
+            self.fat_StringArrayFree(arr)
+
+    def test_predicates_fill_bool_buffer(self) -> None:
+        items = [b"apple", b"Apricot", b"banana", b"APPLE", b"pineapple"]
+        arr = self._array(items)
+        out = (ctypes.c_bool * len(items))()
+        cases = [
+            (self.fat_StringArrayHasPrefix, b"ap", [True, False, False, False, False]),
+            (self.fat_StringArrayHasSuffix, b"apple", [True, False, False, False, True]),
+            (self.fat_StringArrayContains, b"an", [False, False, True, False, False]),
+            (self.fat_StringArrayEqualFold, b"apple", [True, False, False, True, False]),
+        ]
+        try:
+            for fn, arg, want in cases:
+                s = self._string(arg)
+                try:
+                    n = fn(arr, s, out, len(out))
+                finally:
+                    self.fat_StringFree(s)
+                self.assertEqual(want, list(out))
+                self.assertEqual(sum(want), n)
+        finally:
+            self.fat_StringArrayFree(arr)
+
+    def test_index_fills_int64_buffer(self) -> None:
+        arr = self._array([b"abcabc", b"xyz", b"cab"])
+        out = (ctypes.c_int64 * 3)()
+        s = self._string(b"ab")
+        try:
+            self.assertEqual(2, self.fat_StringArrayIndex(arr, s, out, 3))
+            self.assertEqual([0, -1, 1], list(out))
+        finally:
+            self.fat_StringFree(s)
+            self.fat_StringArrayFree(arr)
+
+    def test_empty_array(self) -> None:
+        arr = self._array([])
+        s = self._string(b"x")
+        try:
+            self.assertEqual(0, self.fat_StringArrayHasPrefix(arr, s, None, 0))
+            self.assertEqual(0, self.fat_StringArrayIndex(arr, s, None, 0))
+            lower = self.fat_StringArrayToLower(arr)
+            self.assertEqual(0, self.fat_StringArrayLen(lower))
+            self.fat_StringArrayFree(lower)
+        finally:
+            self.fat_StringFree(s)
+            self.fat_StringArrayFree(arr)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import ctypes
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestStringArrayPacked(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+        size_p = ctypes.POINTER(ctypes.c_size_t)
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringLenBytes = bind("fat_StringLenBytes", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringCopyOut = bind(
+            "fat_StringCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringSplit = bind("fat_StringSplit", argtypes=[fat_handle, fat_handle], restype=fat_handle)
+        cls.fat_StringFields = bind("fat_StringFields", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_StringJoin = bind("fat_StringJoin", argtypes=[fat_handle, fat_handle], restype=fat_handle)
+        cls.fat_StringArrayLen = bind("fat_StringArrayLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringArrayGet = bind(
+            "fat_StringArrayGet", argtypes=[fat_handle, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringArrayFree = bind("fat_StringArrayFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringArrayTotalBytes = bind(
+            "fat_StringArrayTotalBytes", argtypes=[fat_handle], restype=ctypes.c_size_t
+        )
+        cls.fat_StringArrayBorrow = bind(
+            "fat_StringArrayBorrow",
+            argtypes=[fat_handle, ctypes.POINTER(size_p), size_p, ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_void_p,
+        )
+        cls.fat_StringArrayCopyOutAll = bind(
+            "fat_StringArrayCopyOutAll",
+            argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t, size_p, ctypes.c_size_t],
+            restype=ctypes.c_size_t,
+        )
+        cls.fat_BorrowRelease = bind("fat_BorrowRelease", argtypes=[fat_handle], restype=None)
+
+    def _string(self, data: bytes) -> int:
+        return self.fat_StringNewUTF8N(data, len(data))
+
+    def _to_py(self, s: int) -> bytes:
+        n = self.fat_StringLenBytes(s)
+        buf = ctypes.create_string_buffer(n)
+        self.fat_StringCopyOut(s, buf, n)
+        return buf.raw[:n]
+
+    def _split(self, data: bytes, sep: bytes) -> int:
+        s = self._string(data)
+        sep_h = self._string(sep)
+        try:
+            return self.fat_StringSplit(s, sep_h)
+        finally:
+            self.fat_StringFree(s)
+            self.fat_StringFree(sep_h)
+
+    def _borrow(self, arr: int) -> tuple[list[bytes], int]:
+        offsets = ctypes.POINTER(ctypes.c_size_t)()
+        count = ctypes.c_size_t()
+        borrow = fat_string_handle_type()()
+        ptr = self.fat_StringArrayBorrow(arr, ctypes.byref(offsets), ctypes.byref(count), ctypes.byref(borrow))
+        self.assertNotEqual(0, borrow.value)
+        self.assertEqual(0, offsets[0])
+        total = offsets[count.value]
+        arena = ctypes.string_at(ptr, total) if total else b""
+        if total == 0:
+            self.assertIsNone(ptr)
+        items = [arena[offsets[i] : offsets[i + 1]] for i in range(count.value)]
+        return items, borrow.value
+
+    def test_split_borrow_and_get_agree(self) -> None:
+        want = [b"alpha", b"", b"be\x00ta", "γάμμα".encode()]
+        arr = self._split(b",".join(want), b",")
+        try:
+            self.assertEqual(sum(map(len, want)), self.fat_StringArrayTotalBytes(arr))
+            items, borrow = self._borrow(arr)
+            self.assertEqual(want, items)
+            self.fat_BorrowRelease(borrow)
+
+            got = []
+            for i in range(self.fat_StringArrayLen(arr)):
+                s = self.fat_StringArrayGet(arr, i)
+                got.append(self._to_py(s))
+                self.fat_StringFree(s)
+            self.assertEqual(want, got)
+        finally:
+            self.fat_StringArrayFree(arr)
+
+    def test_borrow_outlives_array(self) -> None:
+        arr = self._split(b"x y z", b" ")
+        offsets = ctypes.POINTER(ctypes.c_size_t)()
+        count = ctypes.c_size_t()
+        borrow = fat_string_handle_type()()
+        ptr = self.fat_StringArrayBorrow(arr, ctypes.byref(offsets), ctypes.byref(count), ctypes.byref(borrow))
+        self.fat_StringArrayFree(arr)
+        self.assertEqual(3, count.value)
+        self.assertEqual([0, 1, 2, 3], [offsets[i] for i in range(4)])
+        self.assertEqual(b"xyz", ctypes.string_at(ptr, 3))
+        self.fat_BorrowRelease(borrow)
+
+    def test_copy_out_all(self) -> None:
+        s = self._string(b"  one two\tthree\n")
+        arr = self.fat_StringFields(s)
+        self.fat_StringFree(s)
+        try:
+            n = self.fat_StringArrayLen(arr)
+            total = self.fat_StringArrayTotalBytes(arr)
+            dst = ctypes.create_string_buffer(total)
+            offsets = (ctypes.c_size_t * (n + 1))()
+            self.assertEqual(total, self.fat_StringArrayCopyOutAll(arr, dst, total, offsets, n + 1))
+            self.assertEqual(b"onetwothree", dst.raw)
+            self.assertEqual([0, 3, 6, 11], list(offsets))
+        finally:
+            self.fat_StringArrayFree(arr)
+
+    def test_empty_elements_and_empty_array(self) -> None:
+        arr = self._split(b",,", b",")
+        try:
+            items, borrow = self._borrow(arr)
+            self.assertEqual([b"", b"", b""], items)
+            self.fat_BorrowRelease(borrow)
+            offsets = (ctypes.c_size_t * 4)()
+            self.assertEqual(0, self.fat_StringArrayCopyOutAll(arr, None, 0, offsets, 4))
+            self.assertEqual([0, 0, 0, 0], list(offsets))
+        finally:
+            self.fat_StringArrayFree(arr)
+
+        blank = self._string(b" ")
+        arr = self.fat_StringFields(blank)
+        self.fat_StringFree(blank)
+        try:
+            items, borrow = self._borrow(arr)
+            self.assertEqual([], items)
+            self.fat_BorrowRelease(borrow)
+        finally:
+            self.fat_StringArrayFree(arr)
+
+    def test_join_uses_packed_elements(self) -> None:
+        arr = self._split(b"a-b-c", b"-")
+        try:
+            for sep, want in ((b"", b"abc"), (b"::", b"a::b::c")):
+                sep_h = self._string(sep)
+                joined = self.fat_StringJoin(arr, sep_h)
+                self.assertEqual(want, self._to_py(joined))
+                self.fat_StringFree(joined)
+                self.fat_StringFree(sep_h)
+        finally:
+            self.fat_StringArrayFree(arr)
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import ctypes
+import threading
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+FAT_OK = 0
+FAT_ERR_EOF = 3
+FAT_XML_START_ELEMENT = 1
+FAT_XML_END_ELEMENT = 2
+
+
+class TestStringIntern(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+        u64_p = ctypes.POINTER(ctypes.c_uint64)
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringLenBytes = bind("fat_StringLenBytes", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringCopyOut = bind(
+            "fat_StringCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringClone = bind("fat_StringClone", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_HandleStats = bind("fat_HandleStats", argtypes=[u64_p, u64_p, u64_p, u64_p], restype=None)
+        cls.fat_ArenaNew = bind("fat_ArenaNew", argtypes=[], restype=fat_handle)
+        cls.fat_ArenaPush = bind("fat_ArenaPush", argtypes=[fat_handle], restype=None)
+        cls.fat_ArenaPop = bind("fat_ArenaPop", argtypes=[fat_handle], restype=None)
+        cls.fat_ArenaLen = bind("fat_ArenaLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_ArenaFree = bind("fat_ArenaFree", argtypes=[fat_handle], restype=None)
+
+        cls.fat_StringInternerNew = bind("fat_StringInternerNew", argtypes=[ctypes.c_size_t], restype=fat_handle)
+        cls.fat_StringIntern = bind("fat_StringIntern", argtypes=[fat_handle, fat_handle], restype=fat_handle)
+        cls.fat_StringInternUTF8N = bind(
+            "fat_StringInternUTF8N", argtypes=[fat_handle, ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringInternerLen = bind("fat_StringInternerLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringInternerStats = bind(
+            "fat_StringInternerStats", argtypes=[fat_handle, u64_p, u64_p, u64_p], restype=None
+        )
+        cls.fat_StringInternerReset = bind("fat_StringInternerReset", argtypes=[fat_handle], restype=None)
+        cls.fat_StringInternerFree = bind("fat_StringInternerFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringArrayGetInterned = bind(
+            "fat_StringArrayGetInterned", argtypes=[fat_handle, ctypes.c_size_t, fat_handle], restype=fat_handle
+        )
+        cls.fat_StringArrayFree = bind("fat_StringArrayFree", argtypes=[fat_handle], restype=None)
+
+        cls.fat_BytesNewN = bind("fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle)
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_ErrorFree = bind("fat_ErrorFree", argtypes=[fat_handle], restype=None)
+        cls.fat_XmlDecoderNewBytes = bind("fat_XmlDecoderNewBytes", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_XmlDecoderFree = bind(
+            "fat_XmlDecoderFree", argtypes=[fat_handle, ctypes.POINTER(fat_handle)], restype=ctypes.c_int
+        )
+        cls.fat_XmlDecoderToken = bind(
+            "fat_XmlDecoderToken",
+            argtypes=[fat_handle, ctypes.POINTER(fat_handle), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_int,
+        )
+        cls.fat_XmlTokenType = bind("fat_XmlTokenType", argtypes=[fat_handle], restype=ctypes.c_int)
+        cls.fat_XmlTokenFree = bind("fat_XmlTokenFree", argtypes=[fat_handle], restype=None)
+        cls.fat_XmlTokenNameLocalInterned = bind(
+            "fat_XmlTokenNameLocalInterned", argtypes=[fat_handle, fat_handle], restype=fat_handle
+        )
+        cls.fat_JsonUnmarshal = bind(
+            "fat_JsonUnmarshal",
+            argtypes=[fat_handle, ctypes.POINTER(fat_handle), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_int,
+        )
+        cls.fat_JsonValueFree = bind("fat_JsonValueFree", argtypes=[fat_handle], restype=None)
+        cls.fat_JsonArrayGet = bind("fat_JsonArrayGet", argtypes=[fat_handle, ctypes.c_size_t], restype=fat_handle)
+        cls.fat_JsonObjectLen = bind("fat_JsonObjectLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_JsonObjectKeysInterned = bind(
+            "fat_JsonObjectKeysInterned",
+            argtypes=[fat_handle, fat_handle, ctypes.POINTER(fat_handle), ctypes.c_size_t],
+            restype=None,
+        )
+        cls.fat_CsvReaderNewBytes = bind("fat_CsvReaderNewBytes", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_CsvReaderRead = bind(
+            "fat_CsvReaderRead",
+            argtypes=[fat_handle, ctypes.POINTER(fat_handle), ctypes.POINTER(ctypes.c_bool), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_int,
+        )
+        cls.fat_CsvReaderFree = bind("fat_CsvReaderFree", argtypes=[fat_handle], restype=None)
+
+    def _to_py(self, s: int) -> bytes:
+        n = self.fat_StringLenBytes(s)
+        buf = ctypes.create_string_buffer(n)
+        self.fat_StringCopyOut(s, buf, n)
+        return buf.raw[:n]
+
+    def _live_handles(self) -> int:
+        live, registered, freed, high = (ctypes.c_uint64() for _ in range(4))
+        self.fat_HandleStats(ctypes.byref(live), ctypes.byref(registered), ctypes.byref(freed), ctypes.byref(high))
+        return live.value
+
+    def _stats(self, table: int) -> tuple[int, int, int]:
+        hits, misses, evictions = ctypes.c_uint64(), ctypes.c_uint64(), ctypes.c_uint64()
+        self.fat_StringInternerStats(table, ctypes.byref(hits), ctypes.byref(misses), ctypes.byref(evictions))
+        return hits.value, misses.value, evictions.value
+
+    def test_equal_strings_share_one_handle(self) -> None:
+        table = self.fat_StringInternerNew(16)
+        a = self.fat_StringNewUTF8N(b"name", 4)
+        b = self.fat_StringNewUTF8N(b"name", 4)
+        try:
+            ia = self.fat_StringIntern(table, a)
+            ib = self.fat_StringIntern(table, b)
+            ic = self.fat_StringInternUTF8N(table, b"name", 4)
+            self.assertEqual(ia, ib)
+            self.assertEqual(ia, ic)
+            self.assertNotIn(ia, (a, b))
+            self.assertEqual(b"name", self._to_py(ia))
+
+            other = self.fat_StringInternUTF8N(table, b"na\x00me", 5)
+            self.assertNotEqual(ia, other)
+            self.assertEqual(b"na\x00me", self._to_py(other))
+            self.assertEqual(ia, self.fat_StringInternUTF8N(table, b"name", 4))
+            empty = self.fat_StringInternUTF8N(table, None, 0)
+            self.assertEqual(b"", self._to_py(empty))
+
+            self.assertEqual(3, self.fat_StringInternerLen(table))
+            self.assertEqual((3, 3, 0), self._stats(table))
+        finally:
+            self.fat_StringFree(a)
+            self.fat_StringFree(b)
+            self.fat_StringInternerFree(table)
+
+    def test_lru_eviction_keeps_handles_valid(self) -> None:
+        before = self._live_handles()
+        table = self.fat_StringInternerNew(2)
+        a = self.fat_StringInternUTF8N(table, b"a", 1)
+        b = self.fat_StringInternUTF8N(table, b"b", 1)
+        self.assertEqual(a, self.fat_StringInternUTF8N(table, b"a", 1))  # "b" is now least recent
+        c = self.fat_StringInternUTF8N(table, b"c", 1)
+        self.assertEqual(2, self.fat_StringInternerLen(table))
+        self.assertEqual((1, 3, 1), self._stats(table))
+        self.assertEqual(before + 4, self._live_handles())  # table + "a" + "b" + "c"
+        self.assertEqual(b"b", self._to_py(b))
+
+        self.assertEqual(a, self.fat_StringInternUTF8N(table, b"a", 1))
+        self.assertEqual(c, self.fat_StringInternUTF8N(table, b"c", 1))
+        b2 = self.fat_StringInternUTF8N(table, b"b", 1)
+        self.assertNotEqual(b, b2)
+        self.assertEqual(b"b", self._to_py(b2))
+        self.assertEqual(b"b", self._to_py(b))
+
+        self.fat_StringInternerFree(table)
+        self.assertEqual(before, self._live_handles())
+
+    def test_reset_releases_every_handle(self) -> None:
+        before = self._live_handles()
+        table = self.fat_StringInternerNew(1)
+        first = self.fat_StringInternUTF8N(table, b"first", 5)
+        self.fat_StringInternUTF8N(table, b"second", 6)  # evicts `first`, which stays valid
+        self.assertEqual(b"first", self._to_py(first))
+        self.assertEqual(before + 3, self._live_handles())
+
+        self.fat_StringInternerReset(table)
+        self.assertEqual(0, self.fat_StringInternerLen(table))
+        self.assertEqual((0, 2, 1), self._stats(table))
+        self.assertEqual(before + 1, self._live_handles())
+
+        again = self.fat_StringInternUTF8N(table, b"first", 5)
+        self.assertEqual(b"first", self._to_py(again))
+        self.fat_StringInternerFree(table)
+        self.assertEqual(before, self._live_handles())
+
+    def test_concurrent_interning_keeps_handles_valid(self) -> None:
+        table = self.fat_StringInternerNew(4)
+        names = [b"name%d" % i for i in range(16)]
+        failures: list[bytes] = []
+
+        def work() -> None:
+            for _ in range(50):
+                for name in names:
+                    h = self.fat_StringInternUTF8N(table, name, len(name))
+                    if self._to_py(h) != name:
+                        failures.append(name)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual([], failures)
+        self.assertEqual(4, self.fat_StringInternerLen(table))
+        self.fat_StringInternerFree(table)
+
+    def test_arena_does_not_release_interned_handles(self) -> None:
+        table = self.fat_StringInternerNew(4)
+        arena = self.fat_ArenaNew()
+        self.fat_ArenaPush(arena)
+        s = self.fat_StringInternUTF8N(table, b"kept", 4)
+        self.fat_ArenaPop(arena)
+        self.assertEqual(0, self.fat_ArenaLen(arena))
+        self.fat_ArenaFree(arena)
+        self.assertEqual(b"kept", self._to_py(s))
+        self.fat_StringInternerFree(table)
+
+    def test_xml_element_names(self) -> None:
+        doc = b"<rows><row><id>1</id></row><row><id>2</id></row></rows>"
+        data = self.fat_BytesNewN(doc, len(doc))
+        dec = self.fat_XmlDecoderNewBytes(data)
+        table = self.fat_StringInternerNew(8)
+        names = []
+        try:
+            while True:
+                tok = fat_string_handle_type()(0)
+                err = fat_string_handle_type()(0)
+                st = self.fat_XmlDecoderToken(dec, ctypes.byref(tok), ctypes.byref(err))
+                if st == FAT_ERR_EOF:
+                    break
+                self.assertEqual(FAT_OK, st)
+                if self.fat_XmlTokenType(tok.value) in (FAT_XML_START_ELEMENT, FAT_XML_END_ELEMENT):
+                    names.append(self.fat_XmlTokenNameLocalInterned(tok.value, table))
+                self.fat_XmlTokenFree(tok.value)
+            self.assertEqual(10, len(names))
+            self.assertEqual(3, len(set(names)))
+            self.assertEqual(3, self.fat_StringInternerLen(table))
+            self.assertEqual(b"row", self._to_py(names[1]))
+        finally:
+            err = fat_string_handle_type()(0)
+            self.assertEqual(FAT_OK, self.fat_XmlDecoderFree(dec, ctypes.byref(err)))
+            self.fat_BytesFree(data)
+            self.fat_StringInternerFree(table)
+
+    def test_json_object_keys(self) -> None:
+        doc = b'[{"id": 1, "name": "a"}, {"name": "b", "id": 2}, {}]'
+        data = self.fat_BytesNewN(doc, len(doc))
+        value, err = fat_string_handle_type()(0), fat_string_handle_type()(0)
+        self.assertEqual(FAT_OK, self.fat_JsonUnmarshal(data, ctypes.byref(value), ctypes.byref(err)))
+        table = self.fat_StringInternerNew(8)
+        try:
+            rows = []
+            for i in range(3):
+                obj = self.fat_JsonArrayGet(value.value, i)
+                n = self.fat_JsonObjectLen(obj)
+                keys = (fat_string_handle_type() * max(n, 1))()
+                self.fat_JsonObjectKeysInterned(obj, table, keys if n else None, n)
+                rows.append(list(keys[:n]))
+                self.fat_JsonValueFree(obj)
+            self.assertEqual(rows[0], rows[1])
+            self.assertEqual([], rows[2])
+            self.assertEqual([b"id", b"name"], [self._to_py(k) for k in rows[0]])
+            self.assertEqual((2, 2, 0), self._stats(table))
+        finally:
+            self.fat_JsonValueFree(value.value)
+            self.fat_BytesFree(data)
+            self.fat_StringInternerFree(table)
+
+    def test_csv_header_fields(self) -> None:
+        table = self.fat_StringInternerNew(8)
+        headers = []
+        for doc in (b"id,name\n1,a\n", b"id,name\n2,b\n"):
+            data = self.fat_BytesNewN(doc, len(doc))
+            r = self.fat_CsvReaderNewBytes(data)
+            record, eof, err = fat_string_handle_type()(0), ctypes.c_bool(), fat_string_handle_type()(0)
+            self.assertEqual(FAT_OK, self.fat_CsvReaderRead(r, ctypes.byref(record), ctypes.byref(eof), ctypes.byref(err)))
+            headers.append([self.fat_StringArrayGetInterned(record.value, i, table) for i in range(2)])
+            self.fat_StringArrayFree(record.value)
+            self.fat_CsvReaderFree(r)
+            self.fat_BytesFree(data)
+        self.assertEqual(headers[0], headers[1])
+        self.assertEqual([b"id", b"name"], [self._to_py(h) for h in headers[0]])
+        self.fat_StringInternerFree(table)
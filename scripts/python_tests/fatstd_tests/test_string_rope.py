@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import ctypes
+import random
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestStringRope(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringLenBytes = bind("fat_StringLenBytes", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringCopyOut = bind(
+            "fat_StringCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+
+        cls.fat_StringRopeNew = bind("fat_StringRopeNew", argtypes=[], restype=fat_handle)
+        cls.fat_StringRopeNewString = bind("fat_StringRopeNewString", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_StringRopeFree = bind("fat_StringRopeFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringRopeLen = bind("fat_StringRopeLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringRopeInsert = bind(
+            "fat_StringRopeInsert", argtypes=[fat_handle, ctypes.c_size_t, fat_handle], restype=None
+        )
+        cls.fat_StringRopeInsertUTF8N = bind(
+            "fat_StringRopeInsertUTF8N",
+            argtypes=[fat_handle, ctypes.c_size_t, ctypes.c_char_p, ctypes.c_size_t],
+            restype=None,
+        )
+        cls.fat_StringRopeDelete = bind(
+            "fat_StringRopeDelete", argtypes=[fat_handle, ctypes.c_size_t, ctypes.c_size_t], restype=None
+        )
+        cls.fat_StringRopeSlice = bind(
+            "fat_StringRopeSlice", argtypes=[fat_handle, ctypes.c_size_t, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringRopeString = bind("fat_StringRopeString", argtypes=[fat_handle], restype=fat_handle)
+
+    def _to_py(self, s: int) -> bytes:
+        n = self.fat_StringLenBytes(s)
+        buf = ctypes.create_string_buffer(n)
+        self.fat_StringCopyOut(s, buf, n)
+        return buf.raw[:n]
+
+    def _flatten(self, r: int) -> bytes:
+        s = self.fat_StringRopeString(r)
+        try:
+            return self._to_py(s)
+        finally:
+            self.fat_StringFree(s)
+
+    def test_insert_delete_and_flatten(self) -> None:
+        doc = self.fat_StringNewUTF8N(b"Hello, world", 12)
+        r = self.fat_StringRopeNewString(doc)
+        self.fat_StringFree(doc)
+        try:
+            self.fat_StringRopeInsertUTF8N(r, 7, b"big \x00", 5)
+            self.fat_StringRopeInsertUTF8N(r, 0, b">> ", 3)
+            name = self.fat_StringNewUTF8N(b"!", 1)
+            self.fat_StringRopeInsert(r, self.fat_StringRopeLen(r), name)
+            self.fat_StringFree(name)
+            self.assertEqual(b">> Hello, big \x00world!", self._flatten(r))
+
+            self.fat_StringRopeDelete(r, 0, 3)
+            self.fat_StringRopeDelete(r, 10, 2)
+            self.fat_StringRopeDelete(r, 4, 0)
+            self.assertEqual(b"Hello, bigworld!", self._flatten(r))
+            self.assertEqual(16, self.fat_StringRopeLen(r))
+        finally:
+            self.fat_StringRopeFree(r)
+
+    def test_slice_is_independent(self) -> None:
+        r = self.fat_StringRopeNew()
+        self.fat_StringRopeInsertUTF8N(r, 0, b"abcdef", 6)
+        self.fat_StringRopeInsertUTF8N(r, 3, b"XYZ", 3)
+        part = self.fat_StringRopeSlice(r, 2, 5)
+        self.fat_StringRopeDelete(r, 0, 9)
+        self.fat_StringRopeFree(r)
+        try:
+            self.assertEqual(b"cXYZd", self._flatten(part))
+            self.fat_StringRopeInsertUTF8N(part, 5, b"!", 1)
+            self.assertEqual(b"cXYZd!", self._flatten(part))
+            empty = self.fat_StringRopeSlice(part, 6, 0)
+            self.assertEqual(0, self.fat_StringRopeLen(empty))
+            self.assertEqual(b"", self._flatten(empty))
+            self.fat_StringRopeFree(empty)
+        finally:
+            self.fat_StringRopeFree(part)
+
+    def test_many_small_edits_match_python(self) -> None:
+        rng = random.Random(16)
+        want = bytearray(b"x" * 4096)
+        r = self.fat_StringRopeNew()
+        self.fat_StringRopeInsertUTF8N(r, 0, bytes(want), len(want))
+        try:
+            for _ in range(2000):
+                off = rng.randrange(len(want) + 1)
+                if rng.random() < 0.7:
+                    piece = bytes(rng.choice(b"abc{}") for _ in range(rng.randrange(1, 6)))
+                    self.fat_StringRopeInsertUTF8N(r, off, piece, len(piece))
+                    want[off:off] = piece
+                else:
+                    n = min(rng.randrange(4), len(want) - off)
+                    self.fat_StringRopeDelete(r, off, n)
+                    del want[off : off + n]
+            self.assertEqual(len(want), self.fat_StringRopeLen(r))
+            self.assertEqual(bytes(want), self._flatten(r))
+            # Flattening is cached until the next edit.
+            self.assertEqual(bytes(want), self._flatten(r))
+        finally:
+            self.fat_StringRopeFree(r)
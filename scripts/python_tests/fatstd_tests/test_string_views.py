@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import ctypes
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+
+class TestStringViews(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringLenBytes = bind("fat_StringLenBytes", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringCopyOut = bind(
+            "fat_StringCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_StringBorrow = bind(
+            "fat_StringBorrow",
+            argtypes=[fat_handle, ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_void_p,
+        )
+        cls.fat_BorrowRelease = bind("fat_BorrowRelease", argtypes=[fat_handle], restype=None)
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringClone = bind("fat_StringClone", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_StringSlice = bind(
+            "fat_StringSlice", argtypes=[fat_handle, ctypes.c_size_t, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringOffsetIn = bind(
+            "fat_StringOffsetIn",
+            argtypes=[fat_handle, fat_handle, ctypes.POINTER(ctypes.c_size_t)],
+            restype=ctypes.c_bool,
+        )
+        cls.fat_StringTrimSpace = bind("fat_StringTrimSpace", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_StringTrimPrefix = bind(
+            "fat_StringTrimPrefix", argtypes=[fat_handle, fat_handle], restype=fat_handle
+        )
+        cls.fat_StringTrimSuffix = bind(
+            "fat_StringTrimSuffix", argtypes=[fat_handle, fat_handle], restype=fat_handle
+        )
+        cls.fat_StringCut = bind(
+            "fat_StringCut",
+            argtypes=[fat_handle, fat_handle, ctypes.POINTER(fat_handle), ctypes.POINTER(fat_handle)],
+            restype=ctypes.c_bool,
+        )
+        cls.fat_StringCutPrefix = bind(
+            "fat_StringCutPrefix", argtypes=[fat_handle, fat_handle, ctypes.POINTER(fat_handle)], restype=ctypes.c_bool
+        )
+        cls.fat_StringCutSuffix = bind(
+            "fat_StringCutSuffix", argtypes=[fat_handle, fat_handle, ctypes.POINTER(fat_handle)], restype=ctypes.c_bool
+        )
+        cls.fat_handle = fat_handle
+
+    def _string(self, data: bytes) -> int:
+        return self.fat_StringNewUTF8N(data, len(data))
+
+    def _to_py(self, s: int) -> bytes:
+        n = self.fat_StringLenBytes(s)
+        buf = ctypes.create_string_buffer(n)
+        self.fat_StringCopyOut(s, buf, n)
+        return buf.raw[:n]
+
+    def _offset_in(self, s: int, parent: int) -> int | None:
+        off = ctypes.c_size_t(12345)
+        if not self.fat_StringOffsetIn(s, parent, ctypes.byref(off)):
+            self.assertEqual(12345, off.value)
+            return None
+        return off.value
+
+    def _borrow_ptr(self, s: int) -> int:
+        n, borrow = ctypes.c_size_t(), self.fat_handle()
+        ptr = self.fat_StringBorrow(s, ctypes.byref(n), ctypes.byref(borrow))
+        self.fat_BorrowRelease(borrow)
+        return ptr
+
+    def test_trim_results_are_views(self) -> None:
+        line = self._string(b"  key = value \t")
+        prefix, suffix = self._string(b"  key"), self._string(b"\t")
+        try:
+            trimmed = self.fat_StringTrimSpace(line)
+            self.assertEqual(b"key = value", self._to_py(trimmed))
+            self.assertEqual(2, self._offset_in(trimmed, line))
+            self.assertEqual(self._borrow_ptr(line) + 2, self._borrow_ptr(trimmed))
+
+            rest = self.fat_StringTrimPrefix(line, prefix)
+            self.assertEqual(5, self._offset_in(rest, line))
+            # A view of a view is placed relative to any view that contains it.
+            value = self.fat_StringTrimSpace(rest)
+            self.assertEqual(b"= value", self._to_py(value))
+            self.assertEqual(1, self._offset_in(value, rest))
+            self.assertEqual(4, self._offset_in(value, trimmed))
+            self.assertIsNone(self._offset_in(rest, trimmed))
+            self.fat_StringFree(value)
+            head = self.fat_StringTrimSuffix(line, suffix)
+            self.assertEqual(b"  key = value ", self._to_py(head))
+            self.assertEqual(0, self._offset_in(head, line))
+            for h in (trimmed, rest, head):
+                self.fat_StringFree(h)
+
+            blank = self._string(b" \n ")
+            empty = self.fat_StringTrimSpace(blank)
+            self.assertEqual(0, self.fat_StringLenBytes(empty))
+            self.assertEqual(3, self._offset_in(empty, blank))
+            self.fat_StringFree(empty)
+            self.fat_StringFree(blank)
+        finally:
+            for h in (line, prefix, suffix):
+                self.fat_StringFree(h)
+
+    def test_cut_outputs_are_views(self) -> None:
+        line = self._string(b"name=fat std")
+        eq, missing, name = self._string(b"="), self._string(b"#"), self._string(b"name")
+        before, after = self.fat_handle(), self.fat_handle()
+        try:
+            self.assertTrue(self.fat_StringCut(line, eq, ctypes.byref(before), ctypes.byref(after)))
+            self.assertEqual((b"name", 0), (self._to_py(before), self._offset_in(before, line)))
+            self.assertEqual((b"fat std", 5), (self._to_py(after), self._offset_in(after, line)))
+            self.assertIsNone(self._offset_in(before, after))
+            self.fat_StringFree(before.value)
+            self.fat_StringFree(after.value)
+
+            self.assertFalse(self.fat_StringCut(line, missing, ctypes.byref(before), ctypes.byref(after)))
+            self.assertEqual(0, self._offset_in(before, line))
+            self.assertEqual(12, self._offset_in(after, line))
+            self.assertEqual(b"", self._to_py(after))
+            self.fat_StringFree(before.value)
+            self.fat_StringFree(after.value)
+
+            self.assertTrue(self.fat_StringCutPrefix(line, name, ctypes.byref(after)))
+            self.assertEqual((b"=fat std", 4), (self._to_py(after), self._offset_in(after, line)))
+            self.fat_StringFree(after.value)
+            self.assertFalse(self.fat_StringCutSuffix(line, name, ctypes.byref(after)))
+            self.assertEqual((b"name=fat std", 0), (self._to_py(after), self._offset_in(after, line)))
+            self.fat_StringFree(after.value)
+        finally:
+            for h in (line, eq, missing, name):
+                self.fat_StringFree(h)
+
+    def test_slice_outlives_parent(self) -> None:
+        data = b"alpha beta gamma"
+        parent = self._string(data)
+        word = self.fat_StringSlice(parent, 6, 4)
+        inner = self.fat_StringSlice(word, 1, 2)
+        other = self._string(b"beta")
+        try:
+            self.assertEqual(1, self._offset_in(inner, word))
+            self.assertEqual(7, self._offset_in(inner, parent))
+            self.assertIsNone(self._offset_in(word, inner))
+            # Equal bytes are not enough: the handles must share storage.
+            self.assertIsNone(self._offset_in(other, parent))
+            self.assertIsNone(self._offset_in(parent, parent))
+            copy = self.fat_StringClone(word)
+            self.assertIsNone(self._offset_in(copy, parent))
+            self.fat_StringFree(copy)
+
+            self.fat_StringFree(parent)
+            parent = 0
+            self.assertEqual(b"beta", self._to_py(word))
+            self.assertEqual(b"et", self._to_py(inner))
+            end = self.fat_StringSlice(word, 4, 0)
+            self.assertEqual(b"", self._to_py(end))
+            self.fat_StringFree(end)
+        finally:
+            for h in (parent, word, inner, other):
+                if h:
+                    self.fat_StringFree(h)
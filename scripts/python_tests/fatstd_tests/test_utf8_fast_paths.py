@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import ctypes
+import random
+import unittest
+
+from fatstd_test_support import bind, fat_string_handle_type
+
+# Pieces chosen to land on and across the 8/16-byte word boundaries the ASCII
+# fast paths work in, including every class of invalid sequence.
+_PIECES = [
+    b"a",
+    b"Z",
+    b"0 ",
+    b"Hello, World",
+    "é".encode(),
+    "Ж".encode(),
+    "日本".encode(),
+    "\U0001F600".encode(),
+    "K".encode(),  # Kelvin sign folds to ASCII k
+    b"\xff",
+    b"\x80",
+    b"\xc0\xaf",  # overlong
+    b"\xed\xa0\x80",  # surrogate
+    b"\xf4\x90\x80\x80",  # above U+10FFFF
+    b"\xe2\x82",  # truncated
+]
+
+
+def _go_to_valid(data: bytes, repl: bytes) -> bytes:
+    # Go's ToValidUTF8 replaces each run of invalid bytes with one replacement.
+    out = bytearray()
+    i = 0
+    in_run = False
+    while i < len(data):
+        for size in (1, 2, 3, 4):
+            try:
+                data[i : i + size].decode("utf-8")
+            except UnicodeDecodeError:
+                continue
+            out += data[i : i + size]
+            i += size
+            in_run = False
+            break
+        else:
+            if not in_run:
+                out += repl
+            in_run = True
+            i += 1
+    return bytes(out)
+
+
+def _is_valid(data: bytes) -> bool:
+    try:
+        data.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+class TestUTF8FastPaths(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        fat_handle = fat_string_handle_type()
+
+        cls.fat_StringNewUTF8N = bind(
+            "fat_StringNewUTF8N", argtypes=[ctypes.c_char_p, ctypes.c_size_t], restype=fat_handle
+        )
+        cls.fat_StringLenBytes = bind("fat_StringLenBytes", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_StringCopyOut = bind(
+            "fat_StringCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_StringFree = bind("fat_StringFree", argtypes=[fat_handle], restype=None)
+        cls.fat_StringIsValidUTF8 = bind("fat_StringIsValidUTF8", argtypes=[fat_handle], restype=ctypes.c_bool)
+        cls.fat_StringToValidUTF8 = bind(
+            "fat_StringToValidUTF8", argtypes=[fat_handle, fat_handle], restype=fat_handle
+        )
+        cls.fat_StringToLower = bind("fat_StringToLower", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_StringToUpper = bind("fat_StringToUpper", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_StringEqualFold = bind(
+            "fat_StringEqualFold", argtypes=[fat_handle, fat_handle], restype=ctypes.c_bool
+        )
+
+        cls.fat_BytesNewN = bind("fat_BytesNewN", argtypes=[ctypes.c_void_p, ctypes.c_size_t], restype=fat_handle)
+        cls.fat_BytesLen = bind("fat_BytesLen", argtypes=[fat_handle], restype=ctypes.c_size_t)
+        cls.fat_BytesCopyOut = bind(
+            "fat_BytesCopyOut", argtypes=[fat_handle, ctypes.c_void_p, ctypes.c_size_t], restype=ctypes.c_size_t
+        )
+        cls.fat_BytesFree = bind("fat_BytesFree", argtypes=[fat_handle], restype=None)
+        cls.fat_BytesIsValidUTF8 = bind("fat_BytesIsValidUTF8", argtypes=[fat_handle], restype=ctypes.c_bool)
+        cls.fat_BytesToValidUTF8 = bind(
+            "fat_BytesToValidUTF8", argtypes=[fat_handle, fat_handle], restype=fat_handle
+        )
+        cls.fat_BytesToLower = bind("fat_BytesToLower", argtypes=[fat_handle], restype=fat_handle)
+        cls.fat_BytesToUpper = bind("fat_BytesToUpper", argtypes=[fat_handle], restype=fat_handle)
+
+    def _string(self, data: bytes) -> int:
+        return self.fat_StringNewUTF8N(data, len(data))
+
+    def _bytes(self, data: bytes) -> int:
+        return self.fat_BytesNewN(data, len(data))
+
+    def _take_string(self, s: int) -> bytes:
+        n = self.fat_StringLenBytes(s)
+        buf = ctypes.create_string_buffer(n)
+        self.fat_StringCopyOut(s, buf, n)
+        self.fat_StringFree(s)
+        return buf.raw[:n]
+
+    def _take_bytes(self, b: int) -> bytes:
+        n = self.fat_BytesLen(b)
+        buf = ctypes.create_string_buffer(n)
+        self.fat_BytesCopyOut(b, buf, n)
+        self.fat_BytesFree(b)
+        return buf.raw[:n]
+
+    def _corpus(self) -> list[bytes]:
+        rng = random.Random(18)
+        corpus = [b"", b"x" * 15, b"x" * 16, b"x" * 17, b"MiXeD cAsE ascii text of forty bytes!!!"]
+        for _ in range(400):
+            corpus.append(b"".join(rng.choice(_PIECES) for _ in range(rng.randrange(12))))
+        for pos in range(33):
+            corpus.append(b"A" * pos + b"\xff" + b"b" * 20)
+            corpus.append(b"A" * pos + "é".encode() + b"b" * 20)
+        return corpus
+
+    def test_validity_matches_python(self) -> None:
+        repl = b"?"
+        srepl, brepl = self._string(repl), self._bytes(repl)
+        try:
+            for data in self._corpus():
+                s, b = self._string(data), self._bytes(data)
+                self.assertEqual(_is_valid(data), self.fat_StringIsValidUTF8(s), data)
+                self.assertEqual(_is_valid(data), self.fat_BytesIsValidUTF8(b), data)
+                want = _go_to_valid(data, repl)
+                self.assertEqual(want, self._take_string(self.fat_StringToValidUTF8(s, srepl)), data)
+                self.assertEqual(want, self._take_bytes(self.fat_BytesToValidUTF8(b, brepl)), data)
+                self.fat_StringFree(s)
+                self.fat_BytesFree(b)
+        finally:
+            self.fat_StringFree(srepl)
+            self.fat_BytesFree(brepl)
+
+    def test_ascii_case_mapping(self) -> None:
+        for data in self._corpus():
+            if not data.isascii():
+                continue
+            s, b = self._string(data), self._bytes(data)
+            self.assertEqual(data.lower(), self._take_string(self.fat_StringToLower(s)))
+            self.assertEqual(data.upper(), self._take_string(self.fat_StringToUpper(s)))
+            self.assertEqual(data.lower(), self._take_bytes(self.fat_BytesToLower(b)))
+            self.assertEqual(data.upper(), self._take_bytes(self.fat_BytesToUpper(b)))
+            self.fat_StringFree(s)
+            self.fat_BytesFree(b)
+
+        # Non-ASCII input still gets full Unicode case mapping.
+        s = self._string("Grüße ЖУК".encode())
+        self.assertEqual("grüße жук".encode(), self._take_string(self.fat_StringToLower(s)))
+        self.fat_StringFree(s)
+
+    def test_equal_fold(self) -> None:
+        cases = [
+            (b"Content-Type: text/html; charset=utf-8", b"content-type: TEXT/HTML; CHARSET=UTF-8", True),
+            (b"Content-Type: text/html; charset=utf-8", b"content-type: TEXT/HTML; CHARSET=UTF-9", False),
+            (b"abcdefgh@", b"ABCDEFGH`", False),  # '@'/'`' differ by 0x20 but are not letters
+            (b"[\\]^_", b"{|}~\x7f", False),
+            (b"kelvin kelvin kelvin", "kelvin kelvin Kelvin".encode(), True),
+            (b"short", b"SHORT", True),
+            (b"", b"", True),
+            (b"abc", b"abcd", False),
+        ]
+        for a, b, want in cases:
+            sa, sb = self._string(a), self._string(b)
+            self.assertEqual(want, self.fat_StringEqualFold(sa, sb), (a, b))
+            self.fat_StringFree(sa)
+            self.fat_StringFree(sb)
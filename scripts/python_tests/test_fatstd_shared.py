@@ -11,7 +11,13 @@ import sys
 import unittest
 from pathlib import Path
 
-from fatstd_test_support import FatStdTestContext, set_context
+from fatstd_test_support import (
+    HANDLE_TRACK_MODES,
+    FatStdTestContext,
+    dump_handle_stats,
+    set_context,
+    set_handle_tracking,
+)
 
 
 def _fatal(message: str, *, exit_code: int = 2) -> "None":
@@ -110,6 +116,12 @@ def main(argv: list[str]) -> int:
         help="Build directory to search (default: <repo>/build)",
     )
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose test output")
+    parser.add_argument(
+        "--handle-stats",
+        choices=sorted(HANDLE_TRACK_MODES),
+        default=None,
+        help="Enable handle registry tracking and print a report to stderr after the run",
+    )
     args, unittest_args = parser.parse_known_args(argv)
 
     repo_root = _find_repo_root(Path(__file__).resolve())
@@ -126,6 +138,8 @@ def main(argv: list[str]) -> int:
     lib = _load_library(lib_path)
 
     set_context(FatStdTestContext(lib=lib, expected_version=expected_version))
+    if args.handle_stats is not None:
+        set_handle_tracking(args.handle_stats)
 
     python_tests_dir = Path(__file__).resolve().parent
     start_dir = python_tests_dir / "fatstd_tests"
@@ -136,6 +150,8 @@ def main(argv: list[str]) -> int:
     )
     runner = unittest.TextTestRunner(verbosity=2 if args.verbose else 1)
     result = runner.run(suite)
+    if args.handle_stats is not None:
+        print(dump_handle_stats(), file=sys.stderr)
     return 0 if result.wasSuccessful() else 1
 
 
@@ -0,0 +1,27 @@
+#include "fat/arena.h"
+
+#include "fatstd_go.h"
+
+fat_Arena fat_ArenaNew(void) {
+  return (fat_Arena)fatstd_go_arena_new();
+}
+
+void fat_ArenaPush(fat_Arena a) {
+  fatstd_go_arena_push((uintptr_t)a);
+}
+
+void fat_ArenaPop(fat_Arena a) {
+  fatstd_go_arena_pop((uintptr_t)a);
+}
+
+size_t fat_ArenaLen(fat_Arena a) {
+  return (size_t)fatstd_go_arena_len((uintptr_t)a);
+}
+
+void fat_ArenaRelease(fat_Arena a) {
+  fatstd_go_arena_release((uintptr_t)a);
+}
+
+void fat_ArenaFree(fat_Arena a) {
+  fatstd_go_arena_free((uintptr_t)a);
+}
@@ -20,12 +20,12 @@ fat_Status fat_Base64EncodingWithPadding(
                                                            (uintptr_t *)out_err);
 }
 
-int fat_Base64EncodedLen(fat_Base64Encoding enc, int n) {
-  return (int)fatstd_go_base64_encoded_len((uintptr_t)enc, n);
+size_t fat_Base64EncodedLen(fat_Base64Encoding enc, size_t n) {
+  return (size_t)fatstd_go_base64_encoded_len((uintptr_t)enc, n);
 }
 
-int fat_Base64DecodedLen(fat_Base64Encoding enc, int n) {
-  return (int)fatstd_go_base64_decoded_len((uintptr_t)enc, n);
+size_t fat_Base64DecodedLen(fat_Base64Encoding enc, size_t n) {
+  return (size_t)fatstd_go_base64_decoded_len((uintptr_t)enc, n);
 }
 
 fat_String fat_Base64EncodeToString(fat_Base64Encoding enc, fat_Bytes src) {
@@ -0,0 +1,7 @@
+#include "fat/borrow.h"
+
+#include "fatstd_go.h"
+
+void fat_BorrowRelease(fat_Borrow borrow) {
+  fatstd_go_borrow_release((uintptr_t)borrow);
+}
@@ -6,6 +6,15 @@ fat_Bytes fat_BytesNewN(const void *bytes, size_t len) {
   return (fat_Bytes)fatstd_go_bytes_new_n((char *)bytes, len);
 }
 
+fat_Bytes fat_BytesNewAdopt(const void *data, size_t len, fat_BytesReleaseFunc release,
+                            void *user_data) {
+  return (fat_Bytes)fatstd_go_bytes_new_adopt((void *)data, len, (uintptr_t)release, user_data);
+}
+
+fat_Status fat_BytesMapFileUTF8(const char *path, fat_Bytes *out_bytes, fat_Error *out_err) {
+  return (fat_Status)fatstd_go_bytes_map_file_utf8((char *)path, (uintptr_t *)out_bytes, (uintptr_t *)out_err);
+}
+
 size_t fat_BytesLen(fat_Bytes b) {
   return (size_t)fatstd_go_bytes_len((uintptr_t)b);
 }
@@ -14,6 +23,10 @@ size_t fat_BytesCopyOut(fat_Bytes b, void *dst, size_t dst_len) {
   return (size_t)fatstd_go_bytes_copy_out((uintptr_t)b, (char *)dst, dst_len);
 }
 
+const uint8_t *fat_BytesBorrow(fat_Bytes b, size_t *out_len, fat_Borrow *out_borrow) {
+  return (const uint8_t *)fatstd_go_bytes_borrow((uintptr_t)b, out_len, (uintptr_t *)out_borrow);
+}
+
 fat_Bytes fat_BytesClone(fat_Bytes b) {
   return (fat_Bytes)fatstd_go_bytes_clone((uintptr_t)b);
 }
@@ -102,24 +115,28 @@ fat_Bytes fat_BytesToUpper(fat_Bytes s) {
   return (fat_Bytes)fatstd_go_bytes_to_upper((uintptr_t)s);
 }
 
-int fat_BytesIndexByte(fat_Bytes b, uint8_t c) {
-  return (int)fatstd_go_bytes_index_byte((uintptr_t)b, c);
+int64_t fat_BytesIndexByte(fat_Bytes b, uint8_t c) {
+  return (int64_t)fatstd_go_bytes_index_byte((uintptr_t)b, c);
 }
 
-int fat_BytesIndexAny(fat_Bytes s, fat_String chars) {
-  return (int)fatstd_go_bytes_index_any((uintptr_t)s, (uintptr_t)chars);
+int64_t fat_BytesIndexAny(fat_Bytes s, fat_String chars) {
+  return (int64_t)fatstd_go_bytes_index_any((uintptr_t)s, (uintptr_t)chars);
 }
 
 fat_Bytes fat_BytesToValidUTF8(fat_Bytes s, fat_Bytes replacement) {
   return (fat_Bytes)fatstd_go_bytes_to_valid_utf8((uintptr_t)s, (uintptr_t)replacement);
 }
 
-int fat_BytesIndex(fat_Bytes s, fat_Bytes sep) {
-  return (int)fatstd_go_bytes_index((uintptr_t)s, (uintptr_t)sep);
+bool fat_BytesIsValidUTF8(fat_Bytes s) {
+  return (bool)fatstd_go_bytes_is_valid_utf8((uintptr_t)s);
+}
+
+int64_t fat_BytesIndex(fat_Bytes s, fat_Bytes sep) {
+  return (int64_t)fatstd_go_bytes_index((uintptr_t)s, (uintptr_t)sep);
 }
 
-int fat_BytesCount(fat_Bytes s, fat_Bytes sep) {
-  return (int)fatstd_go_bytes_count((uintptr_t)s, (uintptr_t)sep);
+int64_t fat_BytesCount(fat_Bytes s, fat_Bytes sep) {
+  return (int64_t)fatstd_go_bytes_count((uintptr_t)s, (uintptr_t)sep);
 }
 
 int fat_BytesCompare(fat_Bytes a, fat_Bytes b) {
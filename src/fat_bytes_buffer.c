@@ -22,6 +22,14 @@ void fat_BytesBufferFree(fat_BytesBuffer b) {
   fatstd_go_bytes_buffer_free((uintptr_t)b);
 }
 
+fat_BytesBuffer fat_BytesBufferAcquire(size_t min_cap) {
+  return (fat_BytesBuffer)fatstd_go_bytes_buffer_acquire(min_cap);
+}
+
+void fat_BytesBufferRelease(fat_BytesBuffer b) {
+  fatstd_go_bytes_buffer_release((uintptr_t)b);
+}
+
 size_t fat_BytesBufferLen(fat_BytesBuffer b) {
   return (size_t)fatstd_go_bytes_buffer_len((uintptr_t)b);
 }
@@ -58,6 +66,14 @@ size_t fat_BytesBufferWriteString(fat_BytesBuffer b, fat_String s) {
   return (size_t)fatstd_go_bytes_buffer_write_string((uintptr_t)b, (uintptr_t)s);
 }
 
+uint8_t *fat_BytesBufferReserve(fat_BytesBuffer b, size_t n) {
+  return (uint8_t *)fatstd_go_bytes_buffer_reserve((uintptr_t)b, n);
+}
+
+void fat_BytesBufferCommit(fat_BytesBuffer b, size_t n) {
+  fatstd_go_bytes_buffer_commit((uintptr_t)b, n);
+}
+
 fat_Bytes fat_BytesBufferBytes(fat_BytesBuffer b) {
   return (fat_Bytes)fatstd_go_bytes_buffer_bytes((uintptr_t)b);
 }
@@ -74,6 +90,14 @@ fat_Bytes fat_BytesBufferNext(fat_BytesBuffer b, size_t n) {
   return (fat_Bytes)fatstd_go_bytes_buffer_next((uintptr_t)b, n);
 }
 
+const uint8_t *fat_BytesBufferPeek(fat_BytesBuffer b, size_t *out_len) {
+  return (const uint8_t *)fatstd_go_bytes_buffer_peek((uintptr_t)b, out_len);
+}
+
+void fat_BytesBufferConsume(fat_BytesBuffer b, size_t n) {
+  fatstd_go_bytes_buffer_consume((uintptr_t)b, n);
+}
+
 bool fat_BytesBufferReadByte(fat_BytesBuffer b, uint8_t *byte_out, bool *eof_out) {
   return (bool)fatstd_go_bytes_buffer_read_byte((uintptr_t)b, byte_out, (_Bool *)eof_out);
 }
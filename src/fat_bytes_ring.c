@@ -0,0 +1,62 @@
+#include "fat/bytes_ring.h"
+
+#include "fatstd_go.h"
+
+fat_BytesRing fat_BytesRingNew(size_t capacity, bool blocking) {
+  return (fat_BytesRing)fatstd_go_bytes_ring_new(capacity, (_Bool)blocking);
+}
+
+void fat_BytesRingFree(fat_BytesRing r) {
+  fatstd_go_bytes_ring_free((uintptr_t)r);
+}
+
+size_t fat_BytesRingCap(fat_BytesRing r) {
+  return (size_t)fatstd_go_bytes_ring_cap((uintptr_t)r);
+}
+
+size_t fat_BytesRingLen(fat_BytesRing r) {
+  return (size_t)fatstd_go_bytes_ring_len((uintptr_t)r);
+}
+
+size_t fat_BytesRingWrite(fat_BytesRing r, const void *bytes, size_t len) {
+  return (size_t)fatstd_go_bytes_ring_write((uintptr_t)r, (char *)bytes, len);
+}
+
+size_t fat_BytesRingRead(fat_BytesRing r, void *dst, size_t len, bool *eof_out) {
+  return (size_t)fatstd_go_bytes_ring_read((uintptr_t)r, (char *)dst, len, (_Bool *)eof_out);
+}
+
+size_t fat_BytesRingPeek(fat_BytesRing r,
+                         const uint8_t **out_first,
+                         size_t *out_first_len,
+                         const uint8_t **out_second,
+                         size_t *out_second_len,
+                         bool *eof_out) {
+  return (size_t)fatstd_go_bytes_ring_peek((uintptr_t)r,
+                                           (void **)out_first,
+                                           out_first_len,
+                                           (void **)out_second,
+                                           out_second_len,
+                                           (_Bool *)eof_out);
+}
+
+void fat_BytesRingConsume(fat_BytesRing r, size_t n) {
+  fatstd_go_bytes_ring_consume((uintptr_t)r, n);
+}
+
+size_t fat_BytesRingReserve(fat_BytesRing r,
+                            uint8_t **out_first,
+                            size_t *out_first_len,
+                            uint8_t **out_second,
+                            size_t *out_second_len) {
+  return (size_t)fatstd_go_bytes_ring_reserve(
+      (uintptr_t)r, (void **)out_first, out_first_len, (void **)out_second, out_second_len);
+}
+
+void fat_BytesRingCommit(fat_BytesRing r, size_t n) {
+  fatstd_go_bytes_ring_commit((uintptr_t)r, n);
+}
+
+void fat_BytesRingClose(fat_BytesRing r) {
+  fatstd_go_bytes_ring_close((uintptr_t)r);
+}
@@ -70,6 +70,51 @@ fat_String fat_ConvFormatComplex(double re, double im, uint8_t fmt, int prec, in
   return (fat_String)fatstd_go_conv_format_complex(re, im, fmt, prec, bit_size);
 }
 
+size_t fat_ConvFormatIntInto(int64_t i, int base, char *dst, size_t dst_len) {
+  return (size_t)fatstd_go_conv_format_int_into((long long)i, base, dst, dst_len);
+}
+
+size_t fat_ConvFormatUintInto(uint64_t i, int base, char *dst, size_t dst_len) {
+  return (size_t)fatstd_go_conv_format_uint_into((unsigned long long)i, base, dst, dst_len);
+}
+
+size_t fat_ConvFormatFloatInto(double f, uint8_t fmt, int prec, int bit_size, char *dst, size_t dst_len) {
+  return (size_t)fatstd_go_conv_format_float_into(f, fmt, prec, bit_size, dst, dst_len);
+}
+
+size_t fat_ConvFormatBoolInto(bool b, char *dst, size_t dst_len) {
+  return (size_t)fatstd_go_conv_format_bool_into(b ? 1 : 0, dst, dst_len);
+}
+
+size_t fat_ConvQuoteInto(fat_String s, char *dst, size_t dst_len) {
+  return (size_t)fatstd_go_conv_quote_into((uintptr_t)s, dst, dst_len);
+}
+
+size_t fat_ConvWriteInt(fat_BytesBuffer dst, int64_t i, int base) {
+  return (size_t)fatstd_go_conv_write_int((uintptr_t)dst, (long long)i, base);
+}
+
+size_t fat_ConvWriteUint(fat_BytesBuffer dst, uint64_t i, int base) {
+  return (size_t)fatstd_go_conv_write_uint((uintptr_t)dst, (unsigned long long)i, base);
+}
+
+size_t fat_ConvWriteFloat(fat_BytesBuffer dst, double f, uint8_t fmt, int prec, int bit_size) {
+  return (size_t)fatstd_go_conv_write_float((uintptr_t)dst, f, fmt, prec, bit_size);
+}
+
+size_t fat_ConvWriteFloatArray(fat_BytesBuffer dst, const double *values, size_t n, uint8_t fmt, int prec, int bit_size,
+                               uint8_t sep) {
+  return (size_t)fatstd_go_conv_write_float_array((uintptr_t)dst, (double *)values, n, fmt, prec, bit_size, sep);
+}
+
+size_t fat_ConvWriteBool(fat_BytesBuffer dst, bool b) {
+  return (size_t)fatstd_go_conv_write_bool((uintptr_t)dst, b ? 1 : 0);
+}
+
+size_t fat_ConvWriteQuote(fat_BytesBuffer dst, fat_String s) {
+  return (size_t)fatstd_go_conv_write_quote((uintptr_t)dst, (uintptr_t)s);
+}
+
 bool fat_ConvIsGraphic(uint32_t r) {
   return (bool)fatstd_go_conv_is_graphic(r);
 }
@@ -132,6 +177,56 @@ fat_Status fat_ConvAtoi(fat_String s, int64_t *out_value, fat_Error *out_err) {
   return (fat_Status)fatstd_go_conv_atoi((uintptr_t)s, (long long *)out_value, (uintptr_t *)out_err);
 }
 
+size_t fat_ConvParseIntArray(fat_StringArray a, int base, int bit_size, int64_t *out, uint8_t *out_status, size_t out_len) {
+  return (size_t)fatstd_go_conv_parse_int_array((uintptr_t)a, base, bit_size, (long long *)out, out_status, out_len);
+}
+
+size_t fat_ConvParseFloatArray(fat_StringArray a, int bit_size, double *out, uint8_t *out_status, size_t out_len) {
+  return (size_t)fatstd_go_conv_parse_float_array((uintptr_t)a, bit_size, out, out_status, out_len);
+}
+
+size_t fat_ConvParseBoolArray(fat_StringArray a, uint8_t *out, uint8_t *out_status, size_t out_len) {
+  return (size_t)fatstd_go_conv_parse_bool_array((uintptr_t)a, out, out_status, out_len);
+}
+
+size_t fat_ConvParseIntDelimited(
+  fat_Bytes b,
+  uint8_t sep,
+  int base,
+  int bit_size,
+  int64_t *out,
+  uint8_t *out_status,
+  size_t out_len,
+  size_t *out_count
+) {
+  return (size_t)fatstd_go_conv_parse_int_delimited(
+    (uintptr_t)b, sep, base, bit_size, (long long *)out, out_status, out_len, out_count
+  );
+}
+
+size_t fat_ConvParseFloatDelimited(
+  fat_Bytes b,
+  uint8_t sep,
+  int bit_size,
+  double *out,
+  uint8_t *out_status,
+  size_t out_len,
+  size_t *out_count
+) {
+  return (size_t)fatstd_go_conv_parse_float_delimited((uintptr_t)b, sep, bit_size, out, out_status, out_len, out_count);
+}
+
+size_t fat_ConvParseBoolDelimited(
+  fat_Bytes b,
+  uint8_t sep,
+  uint8_t *out,
+  uint8_t *out_status,
+  size_t out_len,
+  size_t *out_count
+) {
+  return (size_t)fatstd_go_conv_parse_bool_delimited((uintptr_t)b, sep, out, out_status, out_len, out_count);
+}
+
 fat_Status fat_ConvUnquote(fat_String s, fat_String *out_value, fat_Error *out_err) {
   return (fat_Status)fatstd_go_conv_unquote((uintptr_t)s, (uintptr_t *)out_value, (uintptr_t *)out_err);
 }
@@ -6,3 +6,6 @@ int fat_GoAdd(int a, int b) {
   return (int)fatstd_go_add(a, b);
 }
 
+void fat_GoMemStats(uint64_t *out_allocs, uint64_t *out_bytes) {
+  fatstd_go_mem_stats(out_allocs, out_bytes);
+}
@@ -0,0 +1,24 @@
+#include "fat/handle.h"
+
+#include "fatstd_go.h"
+
+void fat_HandlesFree(const fat_Handle *handles, size_t n) {
+  fatstd_go_handles_free((uintptr_t *)handles, n);
+}
+
+void fat_HandleSetTracking(fat_HandleTrackMode mode) {
+  fatstd_go_handle_set_tracking((int)mode);
+}
+
+fat_HandleTrackMode fat_HandleTracking(void) {
+  return (fat_HandleTrackMode)fatstd_go_handle_tracking();
+}
+
+void fat_HandleStats(uint64_t *out_live, uint64_t *out_registered, uint64_t *out_freed,
+                     uint64_t *out_high_water) {
+  fatstd_go_handle_stats(out_live, out_registered, out_freed, out_high_water);
+}
+
+size_t fat_HandleStatsDump(char *dst, size_t dst_len) {
+  return (size_t)fatstd_go_handle_stats_dump(dst, dst_len);
+}
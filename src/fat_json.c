@@ -70,6 +70,14 @@ fat_StringArray fat_JsonObjectKeys(fat_JsonValue v) {
   return (fat_StringArray)fatstd_go_json_object_keys((uintptr_t)v);
 }
 
+size_t fat_JsonObjectLen(fat_JsonValue v) {
+  return (size_t)fatstd_go_json_object_len((uintptr_t)v);
+}
+
+void fat_JsonObjectKeysInterned(fat_JsonValue v, fat_StringInterner in, fat_String *out_keys, size_t keys_len) {
+  fatstd_go_json_object_keys_interned((uintptr_t)v, (uintptr_t)in, (uintptr_t *)out_keys, keys_len);
+}
+
 void fat_JsonObjectGet(fat_JsonValue v, fat_String key, bool *out_found, fat_JsonValue *out_value) {
   fatstd_go_json_object_get((uintptr_t)v, (uintptr_t)key, (_Bool *)out_found, (uintptr_t *)out_value);
 }
@@ -0,0 +1,39 @@
+#include "fat/matcher.h"
+
+#include "fatstd_go.h"
+
+fat_Status fat_MatcherNew(fat_StringArray patterns, fat_Matcher *out_matcher, fat_Error *out_err) {
+  return (fat_Status)fatstd_go_matcher_new((uintptr_t)patterns, (uintptr_t *)out_matcher, (uintptr_t *)out_err);
+}
+
+size_t fat_MatcherPatternCount(fat_Matcher m) {
+  return (size_t)fatstd_go_matcher_pattern_count((uintptr_t)m);
+}
+
+bool fat_MatcherContainsBytes(fat_Matcher m, fat_Bytes b) {
+  return (bool)fatstd_go_matcher_contains_bytes((uintptr_t)m, (uintptr_t)b);
+}
+
+bool fat_MatcherContainsString(fat_Matcher m, fat_String s) {
+  return (bool)fatstd_go_matcher_contains_string((uintptr_t)m, (uintptr_t)s);
+}
+
+size_t fat_MatcherCountBytes(fat_Matcher m, fat_Bytes b) {
+  return (size_t)fatstd_go_matcher_count_bytes((uintptr_t)m, (uintptr_t)b);
+}
+
+size_t fat_MatcherCountString(fat_Matcher m, fat_String s) {
+  return (size_t)fatstd_go_matcher_count_string((uintptr_t)m, (uintptr_t)s);
+}
+
+size_t fat_MatcherFindAllBytes(fat_Matcher m, fat_Bytes b, size_t *out_patterns, size_t *out_offsets, size_t cap) {
+  return (size_t)fatstd_go_matcher_find_all_bytes((uintptr_t)m, (uintptr_t)b, out_patterns, out_offsets, cap);
+}
+
+size_t fat_MatcherFindAllString(fat_Matcher m, fat_String s, size_t *out_patterns, size_t *out_offsets, size_t cap) {
+  return (size_t)fatstd_go_matcher_find_all_string((uintptr_t)m, (uintptr_t)s, out_patterns, out_offsets, cap);
+}
+
+void fat_MatcherFree(fat_Matcher m) {
+  fatstd_go_matcher_free((uintptr_t)m);
+}
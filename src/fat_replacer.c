@@ -0,0 +1,27 @@
+#include "fat/replacer.h"
+
+#include "fatstd_go.h"
+
+fat_Replacer fat_ReplacerNew(fat_StringArray oldnew) {
+  return (fat_Replacer)fatstd_go_replacer_new((uintptr_t)oldnew);
+}
+
+void fat_ReplacerFree(fat_Replacer r) {
+  fatstd_go_replacer_free((uintptr_t)r);
+}
+
+fat_String fat_ReplacerReplace(fat_Replacer r, fat_String s) {
+  return (fat_String)fatstd_go_replacer_replace((uintptr_t)r, (uintptr_t)s);
+}
+
+fat_Bytes fat_ReplacerReplaceBytes(fat_Replacer r, fat_Bytes b) {
+  return (fat_Bytes)fatstd_go_replacer_replace_bytes((uintptr_t)r, (uintptr_t)b);
+}
+
+size_t fat_ReplacerWriteString(fat_Replacer r, fat_BytesBuffer dst, fat_String s) {
+  return (size_t)fatstd_go_replacer_write_string((uintptr_t)r, (uintptr_t)dst, (uintptr_t)s);
+}
+
+size_t fat_ReplacerWriteBytes(fat_Replacer r, fat_BytesBuffer dst, fat_Bytes b) {
+  return (size_t)fatstd_go_replacer_write_bytes((uintptr_t)r, (uintptr_t)dst, (uintptr_t)b);
+}
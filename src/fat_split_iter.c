@@ -0,0 +1,31 @@
+#include "fat/split_iter.h"
+
+#include "fatstd_go.h"
+
+fat_SplitIter fat_StringSplitIterNew(fat_String s, fat_String sep, int n) {
+  return (fat_SplitIter)fatstd_go_string_split_iter_new((uintptr_t)s, (uintptr_t)sep, n);
+}
+
+fat_SplitIter fat_StringFieldsIterNew(fat_String s) {
+  return (fat_SplitIter)fatstd_go_string_fields_iter_new((uintptr_t)s);
+}
+
+fat_SplitIter fat_BytesSplitIterNew(fat_Bytes b, fat_Bytes sep, int n) {
+  return (fat_SplitIter)fatstd_go_bytes_split_iter_new((uintptr_t)b, (uintptr_t)sep, n);
+}
+
+fat_SplitIter fat_BytesFieldsIterNew(fat_Bytes b) {
+  return (fat_SplitIter)fatstd_go_bytes_fields_iter_new((uintptr_t)b);
+}
+
+bool fat_SplitIterNext(fat_SplitIter it, size_t *out_offset, size_t *out_len) {
+  return (bool)fatstd_go_split_iter_next((uintptr_t)it, out_offset, out_len);
+}
+
+size_t fat_SplitIterNextBatch(fat_SplitIter it, size_t *out_offsets, size_t *out_lens, size_t cap) {
+  return (size_t)fatstd_go_split_iter_next_batch((uintptr_t)it, out_offsets, out_lens, cap);
+}
+
+void fat_SplitIterFree(fat_SplitIter it) {
+  fatstd_go_split_iter_free((uintptr_t)it);
+}
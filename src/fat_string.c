@@ -35,10 +35,22 @@ size_t fat_StringCopyOutCStr(fat_String s, char *dst, size_t dst_len) {
   return copied;
 }
 
+const char *fat_StringBorrow(fat_String s, size_t *out_len, fat_Borrow *out_borrow) {
+  return (const char *)fatstd_go_string_borrow((uintptr_t)s, out_len, (uintptr_t *)out_borrow);
+}
+
 fat_String fat_StringClone(fat_String s) {
   return (fat_String)fatstd_go_string_clone((uintptr_t)s);
 }
 
+fat_String fat_StringSlice(fat_String s, size_t off, size_t n) {
+  return (fat_String)fatstd_go_string_slice((uintptr_t)s, off, n);
+}
+
+bool fat_StringOffsetIn(fat_String s, fat_String parent, size_t *out_off) {
+  return (bool)fatstd_go_string_offset_in((uintptr_t)s, (uintptr_t)parent, out_off);
+}
+
 bool fat_StringContains(fat_String s, fat_String substr) {
   return (bool)fatstd_go_string_contains((uintptr_t)s, (uintptr_t)substr);
 }
@@ -79,6 +91,50 @@ void fat_StringArrayFree(fat_StringArray a) {
   fatstd_go_string_array_free((uintptr_t)a);
 }
 
+size_t fat_StringArrayTotalBytes(fat_StringArray a) {
+  return (size_t)fatstd_go_string_array_total_bytes((uintptr_t)a);
+}
+
+const char *fat_StringArrayBorrow(fat_StringArray a, const size_t **out_offsets, size_t *out_count, fat_Borrow *out_borrow) {
+  return (const char *)fatstd_go_string_array_borrow((uintptr_t)a, (size_t **)out_offsets, out_count, (uintptr_t *)out_borrow);
+}
+
+size_t fat_StringArrayCopyOutAll(fat_StringArray a, char *dst, size_t dst_len, size_t *out_offsets, size_t offsets_len) {
+  return (size_t)fatstd_go_string_array_copy_out_all((uintptr_t)a, dst, dst_len, out_offsets, offsets_len);
+}
+
+fat_StringArray fat_StringArrayToLower(fat_StringArray a) {
+  return (fat_StringArray)fatstd_go_string_array_to_lower((uintptr_t)a);
+}
+
+fat_StringArray fat_StringArrayToUpper(fat_StringArray a) {
+  return (fat_StringArray)fatstd_go_string_array_to_upper((uintptr_t)a);
+}
+
+fat_StringArray fat_StringArrayTrimSpace(fat_StringArray a) {
+  return (fat_StringArray)fatstd_go_string_array_trim_space((uintptr_t)a);
+}
+
+size_t fat_StringArrayHasPrefix(fat_StringArray a, fat_String prefix, bool *out, size_t out_len) {
+  return (size_t)fatstd_go_string_array_has_prefix((uintptr_t)a, (uintptr_t)prefix, out, out_len);
+}
+
+size_t fat_StringArrayHasSuffix(fat_StringArray a, fat_String suffix, bool *out, size_t out_len) {
+  return (size_t)fatstd_go_string_array_has_suffix((uintptr_t)a, (uintptr_t)suffix, out, out_len);
+}
+
+size_t fat_StringArrayContains(fat_StringArray a, fat_String substr, bool *out, size_t out_len) {
+  return (size_t)fatstd_go_string_array_contains((uintptr_t)a, (uintptr_t)substr, out, out_len);
+}
+
+size_t fat_StringArrayEqualFold(fat_StringArray a, fat_String t, bool *out, size_t out_len) {
+  return (size_t)fatstd_go_string_array_equal_fold((uintptr_t)a, (uintptr_t)t, out, out_len);
+}
+
+size_t fat_StringArrayIndex(fat_StringArray a, fat_String substr, int64_t *out, size_t out_len) {
+  return (size_t)fatstd_go_string_array_index((uintptr_t)a, (uintptr_t)substr, out, out_len);
+}
+
 fat_String fat_StringJoin(fat_StringArray elems, fat_String sep) {
   return (fat_String)fatstd_go_string_join((uintptr_t)elems, (uintptr_t)sep);
 }
@@ -99,12 +155,12 @@ fat_String fat_StringToUpper(fat_String s) {
   return (fat_String)fatstd_go_string_to_upper((uintptr_t)s);
 }
 
-int fat_StringIndex(fat_String s, fat_String substr) {
-  return (int)fatstd_go_string_index((uintptr_t)s, (uintptr_t)substr);
+int64_t fat_StringIndex(fat_String s, fat_String substr) {
+  return (int64_t)fatstd_go_string_index((uintptr_t)s, (uintptr_t)substr);
 }
 
-int fat_StringCount(fat_String s, fat_String substr) {
-  return (int)fatstd_go_string_count((uintptr_t)s, (uintptr_t)substr);
+int64_t fat_StringCount(fat_String s, fat_String substr) {
+  return (int64_t)fatstd_go_string_count((uintptr_t)s, (uintptr_t)substr);
 }
 
 int fat_StringCompare(fat_String a, fat_String b) {
@@ -156,6 +212,10 @@ fat_String fat_StringToValidUTF8(fat_String s, fat_String replacement) {
   return (fat_String)fatstd_go_string_to_valid_utf8((uintptr_t)s, (uintptr_t)replacement);
 }
 
+bool fat_StringIsValidUTF8(fat_String s) {
+  return (bool)fatstd_go_string_is_valid_utf8((uintptr_t)s);
+}
+
 void fat_StringFree(fat_String s) {
   fatstd_go_string_free((uintptr_t)s);
 }
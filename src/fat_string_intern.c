@@ -0,0 +1,35 @@
+#include "fat/string_intern.h"
+
+#include "fatstd_go.h"
+
+fat_StringInterner fat_StringInternerNew(size_t capacity) {
+  return (fat_StringInterner)fatstd_go_string_interner_new(capacity);
+}
+
+fat_String fat_StringIntern(fat_StringInterner in, fat_String s) {
+  return (fat_String)fatstd_go_string_intern((uintptr_t)in, (uintptr_t)s);
+}
+
+fat_String fat_StringInternUTF8N(fat_StringInterner in, const char *bytes, size_t len) {
+  return (fat_String)fatstd_go_string_intern_utf8_n((uintptr_t)in, (char *)bytes, len);
+}
+
+fat_String fat_StringArrayGetInterned(fat_StringArray a, size_t idx, fat_StringInterner in) {
+  return (fat_String)fatstd_go_string_array_get_interned((uintptr_t)a, idx, (uintptr_t)in);
+}
+
+size_t fat_StringInternerLen(fat_StringInterner in) {
+  return (size_t)fatstd_go_string_interner_len((uintptr_t)in);
+}
+
+void fat_StringInternerStats(fat_StringInterner in, uint64_t *out_hits, uint64_t *out_misses, uint64_t *out_evictions) {
+  fatstd_go_string_interner_stats((uintptr_t)in, out_hits, out_misses, out_evictions);
+}
+
+void fat_StringInternerReset(fat_StringInterner in) {
+  fatstd_go_string_interner_reset((uintptr_t)in);
+}
+
+void fat_StringInternerFree(fat_StringInterner in) {
+  fatstd_go_string_interner_free((uintptr_t)in);
+}
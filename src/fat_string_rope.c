@@ -0,0 +1,39 @@
+#include "fat/string_rope.h"
+
+#include "fatstd_go.h"
+
+fat_StringRope fat_StringRopeNew(void) {
+  return (fat_StringRope)fatstd_go_string_rope_new();
+}
+
+fat_StringRope fat_StringRopeNewString(fat_String s) {
+  return (fat_StringRope)fatstd_go_string_rope_new_string((uintptr_t)s);
+}
+
+void fat_StringRopeFree(fat_StringRope r) {
+  fatstd_go_string_rope_free((uintptr_t)r);
+}
+
+size_t fat_StringRopeLen(fat_StringRope r) {
+  return (size_t)fatstd_go_string_rope_len((uintptr_t)r);
+}
+
+void fat_StringRopeInsert(fat_StringRope r, size_t off, fat_String s) {
+  fatstd_go_string_rope_insert((uintptr_t)r, off, (uintptr_t)s);
+}
+
+void fat_StringRopeInsertUTF8N(fat_StringRope r, size_t off, const char *bytes, size_t len) {
+  fatstd_go_string_rope_insert_utf8_n((uintptr_t)r, off, (char *)bytes, len);
+}
+
+void fat_StringRopeDelete(fat_StringRope r, size_t off, size_t n) {
+  fatstd_go_string_rope_delete((uintptr_t)r, off, n);
+}
+
+fat_StringRope fat_StringRopeSlice(fat_StringRope r, size_t off, size_t n) {
+  return (fat_StringRope)fatstd_go_string_rope_slice((uintptr_t)r, off, n);
+}
+
+fat_String fat_StringRopeString(fat_StringRope r) {
+  return (fat_String)fatstd_go_string_rope_string((uintptr_t)r);
+}
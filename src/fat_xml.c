@@ -50,6 +50,14 @@ fat_String fat_XmlTokenNameSpace(fat_XmlToken tok) {
   return (fat_String)fatstd_go_xml_token_name_space((uintptr_t)tok);
 }
 
+fat_String fat_XmlTokenNameLocalInterned(fat_XmlToken tok, fat_StringInterner in) {
+  return (fat_String)fatstd_go_xml_token_name_local_interned((uintptr_t)tok, (uintptr_t)in);
+}
+
+fat_String fat_XmlTokenNameSpaceInterned(fat_XmlToken tok, fat_StringInterner in) {
+  return (fat_String)fatstd_go_xml_token_name_space_interned((uintptr_t)tok, (uintptr_t)in);
+}
+
 size_t fat_XmlStartElementAttrCount(fat_XmlToken tok) {
   return (size_t)fatstd_go_xml_start_element_attr_count((uintptr_t)tok);
 }